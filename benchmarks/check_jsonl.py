@@ -0,0 +1,110 @@
+"""Benchmark `check_file` on a generated conversation dataset.
+
+Usage:
+    python benchmarks/check_jsonl.py --size-gb 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from together.constants import NUM_BYTES_IN_GB
+from together.utils.files import _check_utf8, check_file
+
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog model token dataset training "
+    "fine tune prompt answer question assistant user system résumé naïve 東京"
+).split()
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def generate_conversation_dataset(path: Path, size_bytes: int, seed: int = 0) -> int:
+    """Write conversation samples to `path` until it reaches `size_bytes`.
+
+    Returns:
+        int: Number of samples written.
+    """
+    rng = random.Random(seed)
+    # Pre-render a pool of samples so generation is bounded by disk speed.
+    pool = []
+    for _ in range(1024):
+        messages = [{"role": "system", "content": _sentence(rng, 12)}]
+        for _ in range(rng.randint(1, 4)):
+            messages.append({"role": "user", "content": _sentence(rng, 40)})
+            messages.append({"role": "assistant", "content": _sentence(rng, 80)})
+        pool.append((json.dumps({"messages": messages}) + "\n").encode("utf-8"))
+
+    written = 0
+    num_samples = 0
+    with path.open("wb", buffering=16 * 1024 * 1024) as f:
+        while written < size_bytes:
+            line = pool[num_samples % len(pool)]
+            f.write(line)
+            written += len(line)
+            num_samples += 1
+    return num_samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-gb", type=float, default=5.0)
+    parser.add_argument(
+        "--file", type=Path, default=None, help="Reuse or create the dataset here."
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the generated dataset."
+    )
+    parser.add_argument(
+        "--num-workers", type=int, default=1, help="Processes passed to check_file."
+    )
+    args = parser.parse_args()
+
+    tmp_dir = None
+    file = args.file
+    if file is None:
+        tmp_dir = tempfile.mkdtemp()
+        file = Path(tmp_dir) / "conversations.jsonl"
+
+    if not file.exists():
+        start = time.perf_counter()
+        num_samples = generate_conversation_dataset(
+            file, int(args.size_gb * NUM_BYTES_IN_GB)
+        )
+        print(
+            f"Generated {num_samples} samples in {time.perf_counter() - start:.1f}s: {file}"
+        )
+
+    size_mb = os.stat(file).st_size / 2**20
+
+    try:
+        # The decoding pass that used to run before JSON validation.
+        start = time.perf_counter()
+        _check_utf8(file)
+        utf8_secs = time.perf_counter() - start
+        print(f"separate UTF-8 pass: {utf8_secs:.1f}s ({size_mb / utf8_secs:.1f} MB/s)")
+
+        start = time.perf_counter()
+        report = check_file(file, num_workers=args.num_workers, use_cache=False)
+        check_secs = time.perf_counter() - start
+        print(
+            f"check_file (num_workers={args.num_workers}): {check_secs:.1f}s ({size_mb / check_secs:.1f} MB/s), "
+            f"passed={report['is_check_passed']}, samples={report.get('num_samples')}"
+        )
+    finally:
+        if tmp_dir is not None and not args.keep:
+            file.unlink()
+            os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmarks of the client against the local mock server of `mock_server.py`.
+
+They need pytest-benchmark (`poetry install --with benchmarks`) and no network:
+
+    pytest benchmarks/
+    pytest benchmarks/ --benchmark-save=baseline
+    pytest benchmarks/ --benchmark-compare=0001_baseline --benchmark-compare-fail=mean:10%
+
+Throughputs are added to the `extra_info` of the results, such as requests, events or
+bytes per second.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Iterator
+
+import pytest
+from mock_server import MockConfig, MockServer
+
+from together import AsyncTogether, Together
+
+
+def add_extra_info(benchmark: Any, name: str, value: Callable[[float], float]) -> None:
+    """
+    Add a value computed from the mean time of a benchmark to its `extra_info`.
+
+    Nothing is added when the benchmark did not collect timings, as with
+    `--benchmark-disable`, which runs each benchmark once to check that it works.
+
+    Example:
+        add_extra_info(benchmark, "requests_per_second", lambda mean: 1 / mean)
+    """
+    if benchmark.stats is None:
+        return
+    benchmark.extra_info[name] = value(benchmark.stats.stats.mean)
+
+
+@pytest.fixture(scope="session")
+def _server() -> Iterator[MockServer]:
+    with MockServer() as server:
+        yield server
+
+
+@pytest.fixture
+def server(_server: MockServer) -> MockServer:
+    """Mock server with the default config, which tests can change."""
+    _server.config = MockConfig()
+    return _server
+
+
+@pytest.fixture
+def client(server: MockServer) -> Together:
+    return Together(api_key="fake", base_url=server.base_url, max_retries=10)
+
+
+@pytest.fixture
+def async_client(server: MockServer) -> AsyncTogether:
+    return AsyncTogether(api_key="fake", base_url=server.base_url, max_retries=10)
+
+
+@pytest.fixture
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Event loop of the async benchmarks, which pytest-benchmark calls synchronously."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep validation reports cached by `check_file` out of the user's cache directory"""
+    monkeypatch.setenv("TOGETHER_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
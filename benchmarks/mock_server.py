@@ -0,0 +1,399 @@
+"""Local aiohttp server emulating the Together API, for offline benchmarks.
+
+Emulates chat completions and completions (streamed or not), embeddings, rerank, file
+uploads (single and multipart), file downloads and file deletion. The latency, token
+rate and error rate are set with `MockConfig` and can be changed while it runs.
+
+Usage:
+    python benchmarks/mock_server.py --port 8000 --latency 0.05 --token-rate 100
+
+    TOGETHER_BASE_URL=http://127.0.0.1:8000/v1 TOGETHER_API_KEY=fake python ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
+
+from aiohttp import web
+
+
+MODEL = "mock/model"
+
+
+@dataclass
+class MockConfig:
+    # seconds before the response headers of each request
+    latency: float = 0.0
+    # events per second of streams, unlimited when 0
+    token_rate: float = 0.0
+    # tokens generated for completions, one per stream event
+    tokens: int = 32
+    # length of embeddings
+    embedding_dim: int = 1024
+    # share of the model requests answered with `error_status`
+    error_rate: float = 0.0
+    error_status: int = 503
+    # sent as the `retry-after-ms` header of errors
+    retry_after_ms: int = 1
+    seed: int = 0
+
+
+class MockServer:
+    """
+    Runs the mock API on a background thread.
+
+    Example:
+
+        with MockServer(MockConfig(latency=0.01)) as server:
+            client = Together(api_key="fake", base_url=server.base_url)
+    """
+
+    def __init__(
+        self, config: MockConfig | None = None, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self.config = config or MockConfig()
+        self.host = host
+        self.port = port
+        # requests answered, by path
+        self.requests: Dict[str, int] = {}
+        self._rng = random.Random(self.config.seed)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1/"
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=0, middlewares=[self._middleware])
+        app.add_routes(
+            [
+                web.post("/v1/chat/completions", self._chat_completions),
+                web.post("/v1/completions", self._completions),
+                web.post("/v1/embeddings", self._embeddings),
+                web.post("/v1/rerank", self._rerank),
+                web.post("/v1/files", self._upload_url),
+                web.put("/upload/{file_id}", self._upload),
+                web.post("/v1/files/{file_id}/preprocess", self._preprocess),
+                web.post("/v1/files/multipart/initiate", self._initiate_multipart),
+                web.put("/upload/{file_id}/{part}", self._upload_part),
+                web.post("/v1/files/multipart/complete", self._complete_multipart),
+                web.post("/v1/files/multipart/abort", self._abort_multipart),
+                web.get("/v1/files/{file_id}/content", self._download),
+                web.delete("/v1/files/{file_id}", self._delete),
+            ]
+        )
+        return app
+
+    def start(self) -> MockServer:
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        async def start() -> None:
+            self._runner = web.AppRunner(self.app(), access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, self.host, self.port)
+            await site.start()
+            self.port = self._runner.addresses[0][1]
+
+        def run() -> None:
+            assert self._loop is not None
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is None or self._runner is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        assert self._thread is not None
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def __enter__(self) -> MockServer:
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: Any
+    ) -> web.StreamResponse:
+        self.requests[request.path] = self.requests.get(request.path, 0) + 1
+        config = self.config
+        if config.latency:
+            await asyncio.sleep(config.latency)
+        if (
+            config.error_rate
+            and request.path.startswith("/v1/")
+            and not request.path.startswith("/v1/files")
+            and self._rng.random() < config.error_rate
+        ):
+            await request.read()
+            return web.json_response(
+                {"error": {"message": "injected error", "type": "server_error"}},
+                status=config.error_status,
+                headers={"retry-after-ms": str(config.retry_after_ms)},
+            )
+        return await handler(request)
+
+    def _usage(self, prompt_tokens: int = 8) -> Dict[str, int]:
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": self.config.tokens,
+            "total_tokens": prompt_tokens + self.config.tokens,
+        }
+
+    async def _stream(
+        self, request: web.Request, chunk: Any, object: str
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        interval = 1 / self.config.token_rate if self.config.token_rate else 0
+        start = time.perf_counter()
+        for i in range(self.config.tokens):
+            if interval:
+                # paced from the start of the stream, so that slow writes catch up
+                delay = start + (i + 1) * interval - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            last = i == self.config.tokens - 1
+            event = {
+                "id": "mock-stream",
+                "object": object,
+                "created": 0,
+                "model": MODEL,
+                "choices": [chunk(i, last)],
+                "usage": self._usage() if last else None,
+            }
+            await response.write(b"data: %s\n\n" % json.dumps(event).encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def _chat_completions(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        if body.get("stream"):
+            return await self._stream(
+                request,
+                lambda i, last: {
+                    "index": 0,
+                    "delta": {"role": "assistant", "content": f" token{i}"},
+                    "finish_reason": "length" if last else None,
+                },
+                "chat.completion.chunk",
+            )
+        return web.json_response(
+            {
+                "id": "mock-chat",
+                "object": "chat.completion",
+                "created": 0,
+                "model": MODEL,
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "length",
+                        "message": {
+                            "role": "assistant",
+                            "content": " token" * self.config.tokens,
+                        },
+                    }
+                ],
+                "usage": self._usage(),
+            }
+        )
+
+    async def _completions(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        if body.get("stream"):
+            return await self._stream(
+                request,
+                lambda i, last: {
+                    "index": 0,
+                    "text": f" token{i}",
+                    "finish_reason": "length" if last else None,
+                },
+                "completion.chunk",
+            )
+        return web.json_response(
+            {
+                "id": "mock-completion",
+                "object": "text.completion",
+                "created": 0,
+                "model": MODEL,
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "length",
+                        "text": " token" * self.config.tokens,
+                    }
+                ],
+                "usage": self._usage(),
+            }
+        )
+
+    async def _embeddings(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        inputs = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        embedding = [0.001 * i for i in range(self.config.embedding_dim)]
+        return web.json_response(
+            {
+                "object": "list",
+                "model": MODEL,
+                "data": [
+                    {"index": i, "object": "embedding", "embedding": embedding}
+                    for i in range(len(inputs))
+                ],
+            }
+        )
+
+    async def _rerank(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        documents = body["documents"]
+        top_n = body.get("top_n") or len(documents)
+        return web.json_response(
+            {
+                "id": "mock-rerank",
+                "object": "rerank",
+                "model": MODEL,
+                "results": [
+                    {"index": i, "relevance_score": 1 / (i + 1)}
+                    for i in range(min(top_n, len(documents)))
+                ],
+                "usage": self._usage(),
+            }
+        )
+
+    def _file(self, file_id: str, size: int = 0) -> Dict[str, Any]:
+        return {
+            "id": file_id,
+            "object": "file",
+            "created_at": 0,
+            "type": "jsonl",
+            "purpose": "fine-tune",
+            "filename": f"{file_id}.jsonl",
+            "bytes": size,
+            "Processed": True,
+        }
+
+    async def _upload_url(self, request: web.Request) -> web.Response:
+        await request.read()
+        file_id = f"file-{self.requests[request.path]}"
+        return web.Response(
+            status=302,
+            headers={
+                "Location": f"http://{self.host}:{self.port}/upload/{file_id}",
+                "X-Together-File-Id": file_id,
+            },
+        )
+
+    @staticmethod
+    async def _drain(request: web.Request) -> int:
+        size = 0
+        async for chunk in request.content.iter_any():
+            size += len(chunk)
+        return size
+
+    async def _upload(self, request: web.Request) -> web.Response:
+        await self._drain(request)
+        return web.Response()
+
+    async def _preprocess(self, request: web.Request) -> web.Response:
+        return web.json_response(self._file(request.match_info["file_id"]))
+
+    async def _initiate_multipart(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        file_id = f"file-{self.requests[request.path]}"
+        return web.json_response(
+            {
+                "upload_id": f"upload-{file_id}",
+                "file_id": file_id,
+                "parts": [
+                    {
+                        "PartNumber": part,
+                        "URL": f"http://{self.host}:{self.port}/upload/{file_id}/{part}",
+                        "Headers": {},
+                    }
+                    for part in range(1, body["num_parts"] + 1)
+                ],
+            }
+        )
+
+    async def _upload_part(self, request: web.Request) -> web.Response:
+        await self._drain(request)
+        return web.Response(headers={"ETag": f'"etag-{request.match_info["part"]}"'})
+
+    async def _complete_multipart(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        return web.json_response({"file": self._file(body["file_id"])})
+
+    async def _abort_multipart(self, request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({})
+
+    async def _download(self, request: web.Request) -> web.StreamResponse:
+        # files are named after their size, like `file-1048576`
+        size = int(request.match_info["file_id"].rsplit("-", 1)[-1])
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Length": str(size),
+            }
+        )
+        await response.prepare(request)
+        block = b'{"text": "mock"}\n' * 4096
+        sent = 0
+        while sent < size:
+            data = block[: size - sent]
+            await response.write(data)
+            sent += len(data)
+        await response.write_eof()
+        return response
+
+    async def _delete(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {"id": request.match_info["file_id"], "object": "file", "deleted": True}
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--token-rate", type=float, default=0.0)
+    parser.add_argument("--tokens", type=int, default=32)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    args = parser.parse_args()
+
+    config = MockConfig(
+        latency=args.latency,
+        token_rate=args.token_rate,
+        tokens=args.tokens,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+    )
+    server = MockServer(config, args.host, args.port)
+    web.run_app(server.app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
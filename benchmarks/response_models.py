@@ -0,0 +1,114 @@
+"""Benchmark building response models from JSON response bodies.
+
+Compares, per payload:
+    - dict: `json.loads` then `Model(**data)`, how responses used to be built
+    - parse: `TogetherResponse.parse`, which decodes JSON straight into the model
+    - construct: `json.loads` then `Model.model_construct`, skipping validation (reference)
+
+Usage:
+    python benchmarks/response_models.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+from together.together_response import TogetherResponse
+from together.types import (
+    ChatCompletionChunk,
+    CompletionResponse,
+    EmbeddingResponse,
+)
+
+
+CHAT_CHUNK: Dict[str, Any] = {
+    "id": "8f0c2a1e3b4d5f6a",
+    "object": "chat.completion.chunk",
+    "created": 1718000000,
+    "model": "meta-llama/Llama-3.3-70B-Instruct-Turbo",
+    "choices": [
+        {
+            "index": 0,
+            "text": " world",
+            "logprobs": None,
+            "finish_reason": None,
+            "seed": None,
+            "delta": {"token_id": 1917, "role": "assistant", "content": " world"},
+        }
+    ],
+}
+
+COMPLETION: Dict[str, Any] = {
+    "id": "8f0c2a1e3b4d5f6b",
+    "object": "text.completion",
+    "created": 1718000000,
+    "model": "meta-llama/Llama-3.3-70B-Instruct-Turbo",
+    "choices": [
+        {
+            "index": 0,
+            "text": "Hello world " * 50,
+            "finish_reason": "length",
+            "logprobs": {
+                "tokens": ["Hello", " world"] * 50,
+                "token_logprobs": [-0.1, -0.2] * 50,
+            },
+        }
+    ],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 100, "total_tokens": 110},
+}
+
+EMBEDDINGS: Dict[str, Any] = {
+    "id": "8f0c2a1e3b4d5f6c",
+    "object": "list",
+    "model": "BAAI/bge-large-en-v1.5",
+    "data": [
+        {
+            "object": "embedding",
+            "index": i,
+            "embedding": [0.01 * j for j in range(1024)],
+        }
+        for i in range(8)
+    ],
+}
+
+
+def _time(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    cases = [
+        ("chat chunk", ChatCompletionChunk, CHAT_CHUNK, args.iterations),
+        ("completion", CompletionResponse, COMPLETION, args.iterations),
+        # embeddings are large, so fewer iterations keep the run short
+        ("embeddings (8x1024)", EmbeddingResponse, EMBEDDINGS, args.iterations // 20),
+    ]
+
+    print(f"{'payload':<22}{'dict':>12}{'parse':>12}{'construct':>12}{'speedup':>10}")
+    for name, model, data, iterations in cases:
+        body = json.dumps(data)
+        validated = _time(lambda: model(**json.loads(body)), iterations)
+        parsed = _time(
+            lambda: TogetherResponse.from_json(body, {}).parse(model), iterations
+        )
+        constructed = _time(
+            lambda: model.model_construct(**json.loads(body)), iterations
+        )
+        print(
+            f"{name:<22}{validated * 1e6:>9.1f} us{parsed * 1e6:>9.1f} us"
+            f"{constructed * 1e6:>9.1f} us{validated / parsed:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Bandwidth of file uploads and downloads, and rate of dataset validation."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+from check_jsonl import generate_conversation_dataset
+from conftest import add_extra_info
+
+from together import AsyncTogether, Together
+from together.filemanager import MultipartUploadManager
+from together.types import FilePurpose
+from together.utils.files import check_file
+
+
+pytest.importorskip("pytest_benchmark")
+
+# size of the files uploaded, downloaded and validated
+FILE_SIZE = 64 * 1024 * 1024
+
+PART_SIZE = 8 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("files") / "dataset.jsonl"
+    generate_conversation_dataset(path, FILE_SIZE)
+    return path
+
+
+class _SmallPartsUploadManager(MultipartUploadManager):
+    """Uploads in parts of `PART_SIZE` bytes, to upload small files in several parts."""
+
+    def _calculate_parts(self, file_size: int) -> tuple[int, int]:
+        return PART_SIZE, -(-file_size // PART_SIZE)
+
+
+def test_upload(benchmark, client: Together, dataset: Path) -> None:
+    response = benchmark.pedantic(
+        client.files.upload, args=(dataset,), kwargs={"check": False}, rounds=5
+    )
+
+    assert response.id
+    megabytes = os.stat(dataset).st_size / 1024 / 1024
+    add_extra_info(benchmark, "megabytes_per_second", lambda mean: megabytes / mean)
+
+
+def test_async_upload(
+    benchmark,
+    async_client: AsyncTogether,
+    dataset: Path,
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    response = benchmark.pedantic(
+        lambda: loop.run_until_complete(
+            async_client.files.upload(dataset, check=False)
+        ),
+        rounds=5,
+    )
+
+    assert response.id
+    megabytes = os.stat(dataset).st_size / 1024 / 1024
+    add_extra_info(benchmark, "megabytes_per_second", lambda mean: megabytes / mean)
+
+
+def test_multipart_upload(benchmark, client: Together, dataset: Path) -> None:
+    manager = _SmallPartsUploadManager(client.client)
+
+    response = benchmark.pedantic(
+        manager.upload, args=("files", dataset, FilePurpose.FineTune), rounds=5
+    )
+
+    assert response.id
+    benchmark.extra_info["parts"] = -(-os.stat(dataset).st_size // PART_SIZE)
+    megabytes = os.stat(dataset).st_size / 1024 / 1024
+    add_extra_info(benchmark, "megabytes_per_second", lambda mean: megabytes / mean)
+
+
+def test_download(benchmark, client: Together, tmp_path: Path) -> None:
+    output = tmp_path / "download.jsonl"
+
+    response = benchmark.pedantic(
+        client.files.retrieve_content,
+        args=(f"file-{FILE_SIZE}",),
+        kwargs={"output": output},
+        rounds=5,
+    )
+
+    assert response.size == os.stat(output).st_size == FILE_SIZE
+    megabytes = FILE_SIZE / 1024 / 1024
+    add_extra_info(benchmark, "megabytes_per_second", lambda mean: megabytes / mean)
+
+
+@pytest.mark.parametrize("num_workers", [1, 4])
+def test_check_file(benchmark, dataset: Path, num_workers: int) -> None:
+    report = benchmark.pedantic(
+        check_file,
+        args=(dataset,),
+        kwargs={"num_workers": num_workers, "use_cache": False},
+        rounds=3,
+    )
+
+    assert report["is_check_passed"], report
+    megabytes = os.stat(dataset).st_size / 1024 / 1024
+    add_extra_info(benchmark, "megabytes_per_second", lambda mean: megabytes / mean)
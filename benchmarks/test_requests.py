@@ -0,0 +1,112 @@
+"""Throughput of the model endpoints, sync and async, without network latency."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from conftest import add_extra_info
+
+from together import AsyncTogether, Together
+
+
+pytest.importorskip("pytest_benchmark")
+
+MESSAGES = [{"role": "user", "content": "Say hello"}]
+
+# requests in flight in the async benchmarks
+CONCURRENCY = 32
+
+
+def test_chat_completion(benchmark, client: Together) -> None:
+    response = benchmark(
+        client.chat.completions.create, model="mock/model", messages=MESSAGES
+    )
+
+    assert response.choices[0].message.content
+    add_extra_info(benchmark, "requests_per_second", lambda mean: 1 / mean)
+
+
+def test_completion(benchmark, client: Together) -> None:
+    response = benchmark(client.completions.create, model="mock/model", prompt="hi")
+
+    assert response.choices[0].text
+    add_extra_info(benchmark, "requests_per_second", lambda mean: 1 / mean)
+
+
+@pytest.mark.parametrize("inputs", [1, 64])
+def test_embeddings(benchmark, client: Together, inputs: int) -> None:
+    response = benchmark(
+        client.embeddings.create, model="mock/model", input=["some text"] * inputs
+    )
+
+    assert len(response.data) == inputs
+    add_extra_info(benchmark, "embeddings_per_second", lambda mean: inputs / mean)
+
+
+def test_rerank(benchmark, client: Together) -> None:
+    documents = [f"document {i}" for i in range(100)]
+    response = benchmark(
+        client.rerank.create, model="mock/model", query="query", documents=documents
+    )
+
+    assert len(response.results) == 100
+    add_extra_info(benchmark, "requests_per_second", lambda mean: 1 / mean)
+
+
+def test_chat_completion_threads(benchmark, client: Together) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(CONCURRENCY) as executor:
+
+        def batch() -> None:
+            futures = [
+                executor.submit(
+                    client.chat.completions.create,
+                    model="mock/model",
+                    messages=MESSAGES,
+                )
+                for _ in range(CONCURRENCY)
+            ]
+            for future in futures:
+                future.result()
+
+        benchmark(batch)
+
+    add_extra_info(benchmark, "requests_per_second", lambda mean: CONCURRENCY / mean)
+
+
+def test_async_chat_completion(
+    benchmark, async_client: AsyncTogether, loop: asyncio.AbstractEventLoop
+) -> None:
+    async def batch() -> None:
+        await asyncio.gather(
+            *[
+                async_client.chat.completions.create(
+                    model="mock/model", messages=MESSAGES
+                )
+                for _ in range(CONCURRENCY)
+            ]
+        )
+
+    benchmark(lambda: loop.run_until_complete(batch()))
+
+    add_extra_info(benchmark, "requests_per_second", lambda mean: CONCURRENCY / mean)
+
+
+def test_retries(benchmark, server, client: Together) -> None:
+    """Requests of which a fifth are answered with a 503 and retried."""
+    server.config.error_rate = 0.2
+
+    benchmark(client.chat.completions.create, model="mock/model", messages=MESSAGES)
+
+    add_extra_info(benchmark, "requests_per_second", lambda mean: 1 / mean)
+
+
+def test_latency_overhead(benchmark, server, client: Together) -> None:
+    """Requests answered after 10ms, to compare the client overhead with a wait."""
+    server.config.latency = 0.01
+
+    benchmark(client.chat.completions.create, model="mock/model", messages=MESSAGES)
+
+    add_extra_info(benchmark, "overhead_seconds", lambda mean: mean - 0.01)
@@ -0,0 +1,109 @@
+"""Parse rate of server-sent event streams, alone and through the clients."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from conftest import add_extra_info
+
+from together import AsyncTogether, Together
+from together.abstract.api_requestor import parse_stream
+from together.together_response import TogetherResponse
+from together.types import ChatCompletionChunk
+
+
+pytest.importorskip("pytest_benchmark")
+
+MESSAGES = [{"role": "user", "content": "Say hello"}]
+
+# events of the streams
+TOKENS = 1000
+
+
+def _lines(events: int) -> list[bytes]:
+    chunk = {
+        "id": "mock-stream",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "mock/model",
+        "choices": [{"index": 0, "delta": {"content": " token"}}],
+    }
+    lines = []
+    for _ in range(events):
+        lines += [b"data: " + json.dumps(chunk).encode(), b""]
+    return lines + [b"data: [DONE]", b""]
+
+
+def test_parse_stream(benchmark) -> None:
+    """Splitting the lines of a stream into events, without building models."""
+    lines = _lines(TOKENS)
+
+    events = benchmark(lambda: list(parse_stream(iter(lines))))
+
+    assert len(events) == TOKENS
+    add_extra_info(benchmark, "events_per_second", lambda mean: TOKENS / mean)
+
+
+def test_parse_chunks(benchmark) -> None:
+    """Splitting the lines of a stream and building the model of each event."""
+    lines = _lines(TOKENS)
+
+    def parse() -> list[ChatCompletionChunk]:
+        return [
+            TogetherResponse.from_json(event, {}).parse(ChatCompletionChunk)
+            for event in parse_stream(iter(lines))
+        ]
+
+    chunks = benchmark(parse)
+
+    assert len(chunks) == TOKENS
+    add_extra_info(benchmark, "events_per_second", lambda mean: TOKENS / mean)
+
+
+def test_stream(benchmark, server, client: Together) -> None:
+    server.config.tokens = TOKENS
+
+    def stream() -> int:
+        return sum(
+            1
+            for _ in client.chat.completions.create(
+                model="mock/model", messages=MESSAGES, stream=True
+            )
+        )
+
+    assert benchmark(stream) == TOKENS
+    add_extra_info(benchmark, "events_per_second", lambda mean: TOKENS / mean)
+
+
+def test_async_stream(
+    benchmark, server, async_client: AsyncTogether, loop: asyncio.AbstractEventLoop
+) -> None:
+    server.config.tokens = TOKENS
+
+    async def stream() -> int:
+        response = await async_client.chat.completions.create(
+            model="mock/model", messages=MESSAGES, stream=True
+        )
+        return len([chunk async for chunk in response])
+
+    assert benchmark(lambda: loop.run_until_complete(stream())) == TOKENS
+    add_extra_info(benchmark, "events_per_second", lambda mean: TOKENS / mean)
+
+
+def test_paced_stream(benchmark, server, client: Together) -> None:
+    """Stream at 2000 tokens per second, to check the client keeps up with the server."""
+    server.config.tokens = 200
+    server.config.token_rate = 2000
+
+    def stream() -> int:
+        return sum(
+            1
+            for _ in client.chat.completions.create(
+                model="mock/model", messages=MESSAGES, stream=True
+            )
+        )
+
+    assert benchmark.pedantic(stream, rounds=5) == 200
+    add_extra_info(benchmark, "events_per_second", lambda mean: 200 / mean)
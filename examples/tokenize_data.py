@@ -2,8 +2,9 @@ import argparse
 import logging
 from functools import partial
 from multiprocessing import cpu_count
-from typing import Dict, List
+from typing import Dict
 
+import numpy as np
 from datasets import Dataset, load_dataset  # type: ignore
 from transformers import (  # type: ignore
     AutoTokenizer,
@@ -11,6 +12,8 @@ from transformers import (  # type: ignore
     PreTrainedTokenizerBase,
 )
 
+from together.utils.packing import pack_sequences as pack_sequences_
+
 
 # see default of ignore_index
 # for https://pytorch.org/docs/stable/generated/torch.nn.CrossEntropyLoss.html#torch.nn.CrossEntropyLoss
@@ -62,59 +65,20 @@ def pack_sequences(
     pad_token_id: int,
     eos_token_id: int,
     add_labels: bool,
-    cutoff_size: int = 0,
-) -> Dict[str, List[List[int]]]:
+) -> Dict[str, np.ndarray]:
     """
-    cutoff_size = max_seq_len means that we will drop any non-full sequences
-        (full packing without padding)
-    Example:
-        Sequence 1:
-        ['<s>', '▁usually', '▁,', '▁he', '▁would', '▁be', '▁t', 'earing']
-        Sequence 2:
-        ['▁around', '▁the', '▁living', '▁room', '▁,', '▁playing', '▁with', '▁his']
-        Sequence 3:
-        ['▁toys', '▁.', '</s>', '<s>', '▁but', '▁just', '▁one', '▁look']
+    Packs a batch of tokenized sequences with `together.utils.packing.pack_sequences`,
+    dropping the trailing tokens that don't fill a sequence.
+    The same packing is available from the command line with `together data pack`.
     """
-    packed_sequences = []
-    buffer = []
-
-    for input_ids in batch["input_ids"]:
-        # Add the current sequence to the buffer
-        buffer.extend(input_ids)
-        buffer.append(eos_token_id)  # Add EOS at the end of each sequence
-
-        # Check if buffer needs to be split into chunks
-        while len(buffer) > max_seq_len:
-            # Take a full chunk from the buffer and append it to packed_sequences
-            packed_sequences.append(buffer[:max_seq_len])
-            # Remove the processed chunk from the buffer
-            buffer = buffer[max_seq_len:]
-
-    # Add the last buffer if it's exactly chunk_size
-    if len(buffer) == max_seq_len:
-        packed_sequences.append(buffer)
-    elif len(buffer) > cutoff_size:
-        # if the buffer is larger than the cutoff size, pad it to the chunk_size
-        # if not, we do not include in the packed_sequences
-        buffer.extend([pad_token_id] * (max_seq_len - len(buffer)))
-        packed_sequences.append(buffer)
-
-    output = {"input_ids": packed_sequences}
-    if add_labels:
-        output["labels"] = [
-            [
-                LOSS_IGNORE_INDEX if token_id == pad_token_id else token_id
-                for token_id in example
-            ]
-            for example in output["input_ids"]
-        ]
-
-    # mask attention for padding tokens, a better version would also mask cross-sequence dependencies
-    output["attention_mask"] = [
-        [0 if token_id == pad_token_id else 1 for token_id in example]
-        for example in output["input_ids"]
-    ]
-    return output
+    return pack_sequences_(
+        batch["input_ids"],
+        max_seq_len=max_seq_len,
+        pad_token_id=pad_token_id,
+        eos_token_id=eos_token_id,
+        add_labels=add_labels,
+        drop_incomplete=True,
+    )
 
 
 def process_fast_packing(
@@ -142,7 +106,6 @@ def process_fast_packing(
             tokenizer.pad_token_id,
             tokenizer.eos_token_id,
             add_labels=add_labels,
-            cutoff_size=max_sequence_length,
         ),
         batched=True,
         num_proc=cpu_count() if len(tokenized_dataset) > 10000 else 1,
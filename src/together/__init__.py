@@ -60,7 +60,11 @@ from together import (
     constants,
     error,
     filemanager,
+    hooks,
+    metrics,
+    profiling,
     resources,
+    streaming,
     together_response,
     types,
     utils,
@@ -108,6 +112,9 @@ __all__ = [
     "types",
     "abstract",
     "filemanager",
+    "hooks",
+    "metrics",
+    "profiling",
     "error",
     "together_response",
     "client",
@@ -12,9 +12,11 @@ from typing import (
     Any,
     AsyncContextManager,
     AsyncGenerator,
+    AsyncIterator,
     Dict,
     Iterator,
     Tuple,
+    TypeVar,
     overload,
 )
 from urllib.parse import urlencode, urlsplit, urlunsplit
@@ -30,7 +32,14 @@ else:
     from typing_extensions import Literal
 
 import together
-from together import error, utils
+from together import error, profiling, utils
+from together.abstract.multipart import MultipartEncoder
+from together.abstract.tracing import (
+    RequestTrace,
+    TimingAdapter,
+    _current,
+    trace_config,
+)
 from together.constants import (
     BASE_URL,
     INITIAL_RETRY_DELAY,
@@ -40,14 +49,19 @@ from together.constants import (
     MAX_SESSION_LIFETIME_SECS,
     TIMEOUT_SECS,
 )
-from together.together_response import TogetherResponse
-from together.types import TogetherClient, TogetherRequest
+from together.together_response import RawResponse, TogetherResponse
+from together.types import Deadlines, TogetherClient, TogetherRequest
 from together.types.error import TogetherErrorResponse
 
 
 # Has one attribute per thread, 'session'.
 _thread_context = threading.local()
 
+# slack when telling whether a timeout was caused by a deadline
+_DEADLINE_TOLERANCE = 0.01
+
+T = TypeVar("T")
+
 
 def _build_api_url(url: str, query: str) -> str:
     scheme, netloc, path, base_query, fragment = urlsplit(url)
@@ -66,8 +80,9 @@ def _make_session(max_retries: int | None = None) -> requests.Session:
     s = requests.Session()
     s.mount(
         "https://",
-        requests.adapters.HTTPAdapter(max_retries=max_retries),
+        TimingAdapter(max_retries=max_retries),
     )
+    s.mount("http://", TimingAdapter())
     return s
 
 
@@ -101,6 +116,133 @@ async def parse_stream_async(rbody: aiohttp.StreamReader) -> AsyncGenerator[str,
             yield _line
 
 
+def parse_retry_after_header(
+    response_headers: Dict[str, Any] | None = None,
+) -> float | None:
+    """
+    Returns a float of the number of seconds (not milliseconds)
+    to wait after retrying, or None if unspecified.
+
+    About the Retry-After header:
+        https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After
+    See also
+        https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After#syntax
+    """
+    if not response_headers:
+        return None
+
+    # First, try the non-standard `retry-after-ms` header for milliseconds,
+    # which is more precise than integer-seconds `retry-after`
+    try:
+        retry_ms_header = response_headers.get("retry-after-ms", None)
+        return float(retry_ms_header) / 1000
+    except (TypeError, ValueError):
+        pass
+
+    # Next, try parsing `retry-after` header as seconds (allowing nonstandard floats).
+    retry_header = str(response_headers.get("retry-after"))
+    try:
+        # note: the spec indicates that this should only ever be an integer
+        # but if someone sends a float there's no reason for us to not respect it
+        return float(retry_header)
+    except (TypeError, ValueError):
+        pass
+
+    # Last, try parsing `retry-after` as a date.
+    retry_date_tuple = email.utils.parsedate_tz(retry_header)
+    if retry_date_tuple is None:
+        return None
+
+    retry_date = email.utils.mktime_tz(retry_date_tuple)
+    return float(retry_date - time.time())
+
+
+class _DeadlineClock:
+    """Deadlines of one call, across its attempts and the events of its stream."""
+
+    def __init__(self, deadlines: Deadlines | None) -> None:
+        self.deadlines = deadlines or Deadlines()
+        self.total_at = (
+            None
+            if self.deadlines.total is None
+            else time.monotonic() + self.deadlines.total
+        )
+        self.first_event_at: float | None = None
+        # arrival of the last event of the stream, None until the first one
+        self.last_event_at: float | None = None
+
+    @property
+    def active(self) -> bool:
+        return any(
+            limit is not None
+            for limit in (
+                self.deadlines.total,
+                self.deadlines.first_event,
+                self.deadlines.idle,
+            )
+        )
+
+    def start_attempt(self) -> None:
+        self.check()
+        self.last_event_at = None
+        if self.deadlines.first_event is not None:
+            self.first_event_at = time.monotonic() + self.deadlines.first_event
+
+    def event(self) -> None:
+        self.last_event_at = time.monotonic()
+
+    def _deadlines(self) -> Iterator[Tuple[float, error.Timeout]]:
+        if self.total_at is not None:
+            yield self.total_at, error.DeadlineExceededError(
+                f"Request did not complete within its {self.deadlines.total}s deadline"
+            )
+        if self.last_event_at is None:
+            if self.first_event_at is not None:
+                yield self.first_event_at, error.FirstEventTimeoutError(
+                    f"No response within {self.deadlines.first_event}s"
+                )
+        elif self.deadlines.idle is not None:
+            yield self.last_event_at + self.deadlines.idle, error.StreamIdleTimeoutError(
+                f"No event received from the stream for {self.deadlines.idle}s"
+            )
+
+    def expired(self) -> error.Timeout | None:
+        """The error for the first deadline that has passed, if any."""
+        now = time.monotonic() + _DEADLINE_TOLERANCE
+        for deadline, exc in self._deadlines():
+            if now >= deadline:
+                return exc
+        return None
+
+    def check(self) -> None:
+        exc = self.expired()
+        if exc is not None:
+            raise exc
+
+    def remaining(self) -> float | None:
+        """Seconds until the nearest deadline for the next read, or None."""
+        deadlines = [deadline for deadline, _ in self._deadlines()]
+        if not deadlines:
+            return None
+        self.check()
+        return min(deadlines) - time.monotonic()
+
+    def can_wait(self, seconds: float) -> bool:
+        return self.total_at is None or time.monotonic() + seconds < self.total_at
+
+
+def _read_timeout(timeout: float | Tuple[float, float]) -> float:
+    return timeout[1] if isinstance(timeout, tuple) else timeout
+
+
+def _set_read_timeout(result: requests.Response, timeout: float) -> None:
+    """Change the timeout of the next socket reads of a streamed response."""
+    connection = getattr(result.raw, "connection", None)
+    sock = getattr(connection, "sock", None)
+    if sock is not None:
+        sock.settimeout(timeout)
+
+
 class APIRequestor:
     def __init__(self, client: TogetherClient):
         self.api_base = client.base_url or BASE_URL
@@ -108,46 +250,24 @@ class APIRequestor:
         self.retries = MAX_RETRIES if client.max_retries is None else client.max_retries
         self.supplied_headers = client.supplied_headers
         self.timeout = client.timeout or TIMEOUT_SECS
+        self.deadlines = client.deadlines
+        self.hooks = client.hooks
+
+    def _trace(self, options: TogetherRequest) -> RequestTrace | None:
+        """Trace of a call, only when hooks are registered."""
+        if not self.hooks:
+            return None
+        model = (
+            options.params.get("model") if isinstance(options.params, dict) else None
+        )
+        return RequestTrace(
+            self.hooks, options.method, model if isinstance(model, str) else None
+        )
 
     def _parse_retry_after_header(
         self, response_headers: Dict[str, Any] | None = None
     ) -> float | None:
-        """
-        Returns a float of the number of seconds (not milliseconds)
-        to wait after retrying, or None if unspecified.
-
-        About the Retry-After header:
-            https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After
-        See also
-            https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After#syntax
-        """
-        if not response_headers:
-            return None
-
-        # First, try the non-standard `retry-after-ms` header for milliseconds,
-        # which is more precise than integer-seconds `retry-after`
-        try:
-            retry_ms_header = response_headers.get("retry-after-ms", None)
-            return float(retry_ms_header) / 1000
-        except (TypeError, ValueError):
-            pass
-
-        # Next, try parsing `retry-after` header as seconds (allowing nonstandard floats).
-        retry_header = str(response_headers.get("retry-after"))
-        try:
-            # note: the spec indicates that this should only ever be an integer
-            # but if someone sends a float there's no reason for us to not respect it
-            return float(retry_header)
-        except (TypeError, ValueError):
-            pass
-
-        # Last, try parsing `retry-after` as a date.
-        retry_date_tuple = email.utils.parsedate_tz(retry_header)
-        if retry_date_tuple is None:
-            return None
-
-        retry_date = email.utils.mktime_tz(retry_date_tuple)
-        return float(retry_date - time.time())
+        return parse_retry_after_header(response_headers)
 
     def _calculate_retry_timeout(
         self,
@@ -177,6 +297,10 @@ class APIRequestor:
         *,
         stream: bool,
         request_timeout: float | Tuple[float, float] | None = None,
+        clock: _DeadlineClock | None = None,
+        trace: RequestTrace | None = None,
+        exc: BaseException | None = None,
+        encoder: MultipartEncoder | None = None,
     ) -> requests.Response:
         remaining = remaining_retries - 1
         if remaining == 1:
@@ -187,6 +311,15 @@ class APIRequestor:
         timeout = self._calculate_retry_timeout(remaining, response_headers)
         ("Retrying request to %s in %f seconds", options.url, timeout)
 
+        if clock is not None and not clock.can_wait(timeout):
+            raise error.DeadlineExceededError(
+                f"Request could not be retried within its {clock.deadlines.total}s "
+                "deadline"
+            )
+
+        if trace is not None:
+            trace.retry(timeout, exc)
+
         # In a synchronous context we are blocking the entire thread. Up to the library user to run the client in a
         # different thread if necessary.
         time.sleep(timeout)
@@ -196,6 +329,9 @@ class APIRequestor:
             stream=stream,
             request_timeout=request_timeout,
             remaining_retries=remaining,
+            clock=clock,
+            trace=trace,
+            encoder=encoder,
         )
 
     @overload
@@ -239,16 +375,100 @@ class APIRequestor:
         bool,
         str | None,
     ]:
-        result = self.request_raw(
-            options=options,
-            remaining_retries=remaining_retries or self.retries,
-            stream=stream,
-            request_timeout=request_timeout,
-        )
+        if profiling.enabled:
+            profiling.record_since_call_start("build_request")
+        clock = _DeadlineClock(options.deadlines or self.deadlines)
+        trace = self._trace(options)
+        try:
+            result = self.request_raw(
+                options=options,
+                remaining_retries=remaining_retries or self.retries,
+                stream=stream,
+                request_timeout=request_timeout,
+                clock=clock,
+                trace=trace,
+            )
 
-        resp, got_stream = self._interpret_response(result, stream)
+            resp, got_stream = self._interpret_response(
+                result,
+                stream,
+                clock=clock,
+                read_timeout=_read_timeout(request_timeout or self.timeout),
+                trace=trace,
+            )
+        except Exception as e:
+            if trace is not None:
+                trace.fail(e)
+            raise
         return resp, got_stream, self.api_key
 
+    def request_passthrough(
+        self,
+        options: TogetherRequest,
+        stream: bool = False,
+        request_timeout: float | Tuple[float, float] | None = None,
+    ) -> RawResponse:
+        """
+        Sends a request with retries, authentication and connection pooling, and returns the
+        response body without decoding it. Error responses raise as with `request`.
+        """
+        clock = _DeadlineClock(options.deadlines or self.deadlines)
+        trace = self._trace(options)
+        try:
+            result = self.request_raw(
+                options=options,
+                remaining_retries=self.retries,
+                stream=stream,
+                request_timeout=request_timeout,
+                clock=clock,
+                trace=trace,
+            )
+            headers = dict(result.headers)
+
+            if result.status_code >= 400:
+                self._interpret_response_line(
+                    result.content.decode("utf-8", errors="replace"),
+                    result.status_code,
+                    result.headers,
+                    stream=False,
+                )
+        except Exception as e:
+            if trace is not None:
+                trace.fail(e)
+            raise
+
+        if not stream:
+            content = result.content
+            if trace is not None:
+                trace.finish()
+            return RawResponse(result.status_code, headers, content=content)
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                body: Iterator[bytes] = result.iter_content(chunk_size=None)
+                if clock.active:
+                    body = self._read_stream(
+                        result,
+                        body,
+                        clock,
+                        _read_timeout(request_timeout or self.timeout),
+                    )
+                for chunk in body:
+                    if chunk:
+                        if trace is not None:
+                            trace.stream_event()
+                        yield chunk
+            except Exception as e:
+                if trace is not None:
+                    trace.fail(e)
+                raise
+            finally:
+                result.close()
+                if trace is not None:
+                    trace.finish()
+
+        return RawResponse(result.status_code, headers, chunks=chunks())
+
     @overload
     async def arequest(
         self,
@@ -292,17 +512,30 @@ class APIRequestor:
         stream: bool = False,
         request_timeout: float | Tuple[float, float] | None = None,
     ) -> Tuple[TogetherResponse | AsyncGenerator[TogetherResponse, None], bool, str]:
-        ctx = AioHTTPSession()
+        if profiling.enabled:
+            profiling.record_since_call_start("build_request")
+        clock = _DeadlineClock(options.deadlines or self.deadlines)
+        trace = self._trace(options)
+        ctx = AioHTTPSession(trace=trace is not None)
+        started = time.perf_counter_ns() if profiling.enabled else 0
         session = await ctx.__aenter__()
+        if started:
+            profiling.record("session", started)
         result = None
         try:
             result = await self.arequest_raw(
                 options,
                 session,
                 request_timeout=request_timeout,
+                clock=clock,
+                trace=trace,
+            )
+            resp, got_stream = await self._interpret_async_response(
+                result, stream, clock=clock, trace=trace
             )
-            resp, got_stream = await self._interpret_async_response(result, stream)
-        except Exception:
+        except BaseException as e:
+            if trace is not None and isinstance(e, Exception):
+                trace.fail(e)
             # Close the request before exiting session context.
             if result is not None:
                 result.release()
@@ -328,6 +561,84 @@ class APIRequestor:
             await ctx.__aexit__(None, None, None)
             return resp, got_stream, self.api_key  # type: ignore
 
+    async def arequest_passthrough(
+        self,
+        options: TogetherRequest,
+        stream: bool = False,
+        request_timeout: float | Tuple[float, float] | None = None,
+    ) -> RawResponse:
+        """Async version of `request_passthrough`, sending the request once like `arequest`."""
+        clock = _DeadlineClock(options.deadlines or self.deadlines)
+        trace = self._trace(options)
+        ctx = AioHTTPSession(trace=trace is not None)
+        session = await ctx.__aenter__()
+        result = None
+        try:
+            result = await self.arequest_raw(
+                options,
+                session,
+                request_timeout=request_timeout,
+                clock=clock,
+                trace=trace,
+            )
+            headers = dict(result.headers)
+
+            if result.status >= 400:
+                content = await result.read()
+                self._interpret_response_line(
+                    content.decode("utf-8", errors="replace"),
+                    result.status,
+                    result.headers,
+                    stream=False,
+                )
+
+            if not stream:
+                content = await result.read()
+                if trace is not None:
+                    trace.finish()
+        except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
+            if result is not None:
+                result.release()
+            await ctx.__aexit__(None, None, None)
+            timeout_error = clock.expired() or error.Timeout("Request timed out")
+            if trace is not None:
+                trace.fail(timeout_error)
+            raise timeout_error from e
+        except Exception as e:
+            if trace is not None:
+                trace.fail(e)
+            if result is not None:
+                result.release()
+            await ctx.__aexit__(None, None, None)
+            raise
+
+        if not stream:
+            result.release()
+            await ctx.__aexit__(None, None, None)
+            return RawResponse(result.status, headers, content=content)
+
+        async def chunks() -> AsyncGenerator[bytes, None]:
+            assert result is not None
+            body: AsyncIterator[bytes] = result.content.iter_any()
+            if clock.active:
+                body = self._aread_stream(body, clock)
+            try:
+                async for chunk in body:
+                    if trace is not None:
+                        trace.stream_event()
+                    yield chunk
+            except Exception as e:
+                if trace is not None:
+                    trace.fail(e)
+                raise
+            finally:
+                if trace is not None:
+                    trace.finish()
+                result.release()
+                await ctx.__aexit__(None, None, None)
+
+        return RawResponse(result.status, headers, chunks=chunks())
+
     @classmethod
     def handle_error_response(
         cls,
@@ -438,10 +749,16 @@ class APIRequestor:
                 )
                 abs_url = _build_api_url(abs_url, encoded_params)
         elif options.method.lower() in {"post", "put", "patch"}:
-            if options.params and (options.files or options.override_headers):
+            if options.body is not None:
+                data_bytes = options.body
+                headers["Content-Type"] = "application/json"
+            elif options.params and (options.files or options.override_headers):
                 data = options.params
             elif options.params and not options.files:
+                started = time.perf_counter_ns() if profiling.enabled else 0
                 data_bytes = json.dumps(options.params).encode()
+                if started:
+                    profiling.record("encode_body", started)
                 headers["Content-Type"] = "application/json"
 
         else:
@@ -452,7 +769,10 @@ class APIRequestor:
             )
 
         if not options.override_headers:
+            started = time.perf_counter_ns() if profiling.enabled else 0
             headers = utils.get_headers(options.method, self.api_key, headers)
+            if started:
+                profiling.record("build_headers", started)
 
         utils.log_debug(
             "Request to Together API",
@@ -472,9 +792,28 @@ class APIRequestor:
         stream: bool = False,
         request_timeout: float | Tuple[float, float] | None = None,
         absolute: bool = False,
+        clock: _DeadlineClock | None = None,
+        trace: RequestTrace | None = None,
+        encoder: MultipartEncoder | None = None,
     ) -> requests.Response:
+        if clock is None:
+            clock = _DeadlineClock(options.deadlines or self.deadlines)
+        clock.start_attempt()
         abs_url, headers, data = self._prepare_request_raw(options, absolute)
+        if trace is not None:
+            trace.start_attempt(abs_url)
 
+        body: Any = data
+        if options.files:
+            if encoder is None:
+                # built once per call, so that retries send files from their original
+                # position rather than from where the previous attempt stopped
+                encoder = MultipartEncoder(options.files, data)  # type: ignore[arg-type]
+            body = encoder
+            headers["Content-Type"] = encoder.content_type
+            headers["Content-Length"] = str(len(encoder))
+
+        started = time.perf_counter_ns() if profiling.enabled else 0
         if not hasattr(_thread_context, "session"):
             _thread_context.session = _make_session(MAX_CONNECTION_RETRIES)
             _thread_context.session_create_time = time.time()
@@ -485,23 +824,40 @@ class APIRequestor:
             _thread_context.session.close()
             _thread_context.session = _make_session(MAX_CONNECTION_RETRIES)
             _thread_context.session_create_time = time.time()
+        if started:
+            profiling.record("session", started)
+
+        timeout = request_timeout or self.timeout
+        limit = clock.remaining()
+        if limit is not None:
+            connect_timeout, read_timeout = (
+                timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            )
+            timeout = (min(connect_timeout, limit), min(read_timeout, limit))
 
         result = None
+        _current.trace = trace
+        started = time.perf_counter_ns() if profiling.enabled else 0
         try:
             result = _thread_context.session.request(
                 options.method,
                 abs_url,
                 headers=headers,
-                data=data,
-                files=options.files,
+                data=body,
                 stream=stream,
-                timeout=request_timeout or self.timeout,
+                timeout=timeout,
                 proxies=_thread_context.session.proxies,
                 allow_redirects=options.allow_redirects,
             )
+            if started:
+                profiling.record("send", started)
         except requests.exceptions.Timeout as e:
             utils.log_debug("Encountered requests.exceptions.Timeout")
 
+            deadline_error = clock.expired()
+            if deadline_error is not None:
+                raise deadline_error from e
+
             result_headers = dict(result.headers) if result is not None else {}
 
             if remaining_retries > 0:
@@ -511,6 +867,10 @@ class APIRequestor:
                     response_headers=result_headers,
                     stream=stream,
                     request_timeout=request_timeout,
+                    clock=clock,
+                    trace=trace,
+                    exc=e,
+                    encoder=encoder,
                 )
 
             raise error.Timeout("Request timed out: {}".format(e)) from e
@@ -526,11 +886,21 @@ class APIRequestor:
                     response_headers=result_headers,
                     stream=stream,
                     request_timeout=request_timeout,
+                    clock=clock,
+                    trace=trace,
+                    exc=e,
+                    encoder=encoder,
                 )
 
             raise error.APIConnectionError(
                 "Error communicating with API: {}".format(e)
             ) from e
+        finally:
+            _current.trace = None
+
+        if trace is not None:
+            # when the adapter of the session did not record it already
+            trace.response_started(result.status_code, result.headers)
 
         # retry on 5XX error or rate-limit
         if result is not None:
@@ -548,6 +918,9 @@ class APIRequestor:
                         response_headers=result_headers,
                         stream=stream,
                         request_timeout=request_timeout,
+                        clock=clock,
+                        trace=trace,
+                        encoder=encoder,
                     )
 
         status_code = result.status_code if result is not None else 0
@@ -570,32 +943,52 @@ class APIRequestor:
         *,
         request_timeout: float | Tuple[float, float] | None = None,
         absolute: bool = False,
+        clock: _DeadlineClock | None = None,
+        trace: RequestTrace | None = None,
     ) -> aiohttp.ClientResponse:
+        if clock is None:
+            clock = _DeadlineClock(options.deadlines or self.deadlines)
+        clock.start_attempt()
         abs_url, headers, data = self._prepare_request_raw(options, absolute)
+        if trace is not None:
+            trace.start_attempt(abs_url)
 
         if isinstance(request_timeout, tuple):
-            timeout = aiohttp.ClientTimeout(
-                connect=request_timeout[0],
-                total=request_timeout[1],
-            )
+            connect_timeout: float | None = request_timeout[0]
+            total_timeout = request_timeout[1]
         else:
-            timeout = aiohttp.ClientTimeout(total=request_timeout or self.timeout)
-
+            connect_timeout = None
+            total_timeout = request_timeout or self.timeout
+        if clock.total_at is not None:
+            # the total deadline also covers reading the body of a stream
+            total_timeout = min(total_timeout, clock.total_at - time.monotonic())
+        timeout = aiohttp.ClientTimeout(connect=connect_timeout, total=total_timeout)
+
+        body: Any = data
         if options.files:
-            data, content_type = requests.models.RequestEncodingMixin._encode_files(  # type: ignore
-                options.files, data
-            )
-            headers["Content-Type"] = content_type
+            encoder = MultipartEncoder(options.files, data)  # type: ignore[arg-type]
+            headers["Content-Type"] = encoder.content_type
+            headers["Content-Length"] = str(len(encoder))
+            body = encoder.aiter()
 
+        started = time.perf_counter_ns() if profiling.enabled else 0
         try:
-            result = await session.request(
-                method=options.method,
-                url=abs_url,
-                headers=headers,
-                data=data,
-                timeout=timeout,
-                allow_redirects=options.allow_redirects,
+            result = await asyncio.wait_for(
+                session.request(
+                    method=options.method,
+                    url=abs_url,
+                    headers=headers,
+                    data=body,
+                    timeout=timeout,
+                    allow_redirects=options.allow_redirects,
+                    trace_request_ctx=trace,
+                ),
+                clock.remaining(),
             )
+            if started:
+                profiling.record("send", started)
+            if trace is not None:
+                trace.response_started(result.status, result.headers)
             utils.log_debug(
                 "Together API response",
                 path=abs_url,
@@ -610,24 +1003,48 @@ class APIRequestor:
                 )
             return result
         except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
-            raise error.Timeout("Request timed out") from e
+            raise clock.expired() or error.Timeout("Request timed out") from e
         except aiohttp.ClientError as e:
             raise error.APIConnectionError("Error communicating with Together") from e
 
     def _interpret_response(
-        self, result: requests.Response, stream: bool
+        self,
+        result: requests.Response,
+        stream: bool,
+        clock: _DeadlineClock | None = None,
+        read_timeout: float | None = None,
+        trace: RequestTrace | None = None,
     ) -> Tuple[TogetherResponse | Iterator[TogetherResponse], bool]:
         """Returns the response(s) and a bool indicating whether it is a stream."""
         content_type = result.headers.get("Content-Type", "")
 
         if stream and "text/event-stream" in content_type:
             # SSE format streaming
-            return (
-                self._interpret_response_line(
-                    line, result.status_code, result.headers, stream=True
-                )
-                for line in parse_stream(result.iter_lines())
-            ), True
+            def event_stream_generator() -> Iterator[TogetherResponse]:
+                try:
+                    lines = parse_stream(result.iter_lines())
+                    if clock is not None and clock.active:
+                        lines = self._read_stream(
+                            result, lines, clock, read_timeout or self.timeout
+                        )
+                    for line in lines:
+                        resp = self._interpret_response_line(
+                            line, result.status_code, result.headers, stream=True
+                        )
+                        if trace is not None:
+                            trace.stream_event(resp)
+                        yield resp
+                except Exception as e:
+                    if trace is not None:
+                        trace.fail(e)
+                    raise
+                finally:
+                    # release the connection even if the stream is not read to the end
+                    result.close()
+                    if trace is not None:
+                        trace.finish()
+
+            return event_stream_generator(), True
         elif stream and content_type in [
             "audio/wav",
             "audio/mpeg",
@@ -635,9 +1052,26 @@ class APIRequestor:
         ]:
             # Binary audio streaming - return chunks as binary data
             def binary_stream_generator() -> Iterator[TogetherResponse]:
-                for chunk in result.iter_content(chunk_size=8192):
-                    if chunk:  # Skip empty chunks
-                        yield TogetherResponse(chunk, dict(result.headers))
+                try:
+                    chunks = result.iter_content(chunk_size=8192)
+                    if clock is not None and clock.active:
+                        chunks = self._read_stream(
+                            result, chunks, clock, read_timeout or self.timeout
+                        )
+                    for chunk in chunks:
+                        if chunk:  # Skip empty chunks
+                            resp = TogetherResponse(chunk, dict(result.headers))
+                            if trace is not None:
+                                trace.stream_event(resp)
+                            yield resp
+                except Exception as e:
+                    if trace is not None:
+                        trace.fail(e)
+                    raise
+                finally:
+                    result.close()
+                    if trace is not None:
+                        trace.finish()
 
             return binary_stream_generator(), True
         else:
@@ -646,18 +1080,65 @@ class APIRequestor:
                 content = result.content
             else:
                 content = result.content.decode("utf-8")
-            return (
-                self._interpret_response_line(
-                    content,
-                    result.status_code,
-                    result.headers,
-                    stream=False,
-                ),
-                False,
+            resp = self._interpret_response_line(
+                content,
+                result.status_code,
+                result.headers,
+                stream=False,
             )
+            if trace is not None:
+                trace.finish(resp)
+            return resp, False
+
+    @staticmethod
+    def _read_stream(
+        result: requests.Response,
+        events: Iterator[T],
+        clock: _DeadlineClock,
+        read_timeout: float,
+    ) -> Iterator[T]:
+        """Reads `events` from a streamed response, enforcing the deadlines of `clock`."""
+        while True:
+            limit = clock.remaining()
+            _set_read_timeout(
+                result, read_timeout if limit is None else min(limit, read_timeout)
+            )
+            try:
+                event = next(events)
+            except StopIteration:
+                return
+            except requests.exceptions.RequestException as e:
+                deadline_error = clock.expired()
+                if deadline_error is not None:
+                    raise deadline_error from e
+                raise
+            clock.event()
+            yield event
+
+    @staticmethod
+    async def _aread_stream(
+        events: AsyncIterator[T], clock: _DeadlineClock
+    ) -> AsyncGenerator[T, None]:
+        """Reads `events` from a streamed response, enforcing the deadlines of `clock`."""
+        while True:
+            try:
+                event = await asyncio.wait_for(events.__anext__(), clock.remaining())
+            except StopAsyncIteration:
+                return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                deadline_error = clock.expired()
+                if deadline_error is not None:
+                    raise deadline_error from e
+                raise
+            clock.event()
+            yield event
 
     async def _interpret_async_response(
-        self, result: aiohttp.ClientResponse, stream: bool
+        self,
+        result: aiohttp.ClientResponse,
+        stream: bool,
+        clock: _DeadlineClock | None = None,
+        trace: RequestTrace | None = None,
     ) -> (
         tuple[AsyncGenerator[TogetherResponse, None], bool]
         | tuple[TogetherResponse, bool]
@@ -667,12 +1148,35 @@ class APIRequestor:
 
         if stream and "text/event-stream" in content_type:
             # SSE format streaming
-            return (
-                self._interpret_response_line(
-                    line, result.status, result.headers, stream=True
-                )
-                async for line in parse_stream_async(result.content)
-            ), True
+            lines: AsyncIterator[str] = parse_stream_async(result.content)
+            if clock is not None and clock.active:
+                lines = self._aread_stream(lines, clock)
+            if trace is None:
+                return (
+                    self._interpret_response_line(
+                        line, result.status, result.headers, stream=True
+                    )
+                    async for line in lines
+                ), True
+
+            async def event_stream_generator() -> (
+                AsyncGenerator[TogetherResponse, None]
+            ):
+                assert trace is not None
+                try:
+                    async for line in lines:
+                        resp = self._interpret_response_line(
+                            line, result.status, result.headers, stream=True
+                        )
+                        trace.stream_event(resp)
+                        yield resp
+                except Exception as e:
+                    trace.fail(e)
+                    raise
+                finally:
+                    trace.finish()
+
+            return event_stream_generator(), True
         elif stream and content_type in [
             "audio/wav",
             "audio/mpeg",
@@ -682,19 +1186,36 @@ class APIRequestor:
             async def binary_stream_generator() -> (
                 AsyncGenerator[TogetherResponse, None]
             ):
-                async for chunk in result.content.iter_chunked(8192):
-                    if chunk:  # Skip empty chunks
-                        yield TogetherResponse(chunk, dict(result.headers))
+                chunks: AsyncIterator[bytes] = result.content.iter_chunked(8192)
+                if clock is not None and clock.active:
+                    chunks = self._aread_stream(chunks, clock)
+                try:
+                    async for chunk in chunks:
+                        if chunk:  # Skip empty chunks
+                            resp = TogetherResponse(chunk, dict(result.headers))
+                            if trace is not None:
+                                trace.stream_event(resp)
+                            yield resp
+                except Exception as e:
+                    if trace is not None:
+                        trace.fail(e)
+                    raise
+                finally:
+                    if trace is not None:
+                        trace.finish()
 
             return binary_stream_generator(), True
         else:
             # Non-streaming response
+            started = time.perf_counter_ns() if profiling.enabled else 0
             try:
                 content = await result.read()
             except (aiohttp.ServerTimeoutError, asyncio.TimeoutError) as e:
                 raise error.Timeout("Request timed out") from e
             except aiohttp.ClientError as e:
                 utils.log_warn(e, body=result.content)
+            if started:
+                profiling.record("receive_body", started)
 
             if content_type in ["application/octet-stream", "audio/wav", "audio/mpeg"]:
                 # Binary content - keep as bytes
@@ -703,61 +1224,79 @@ class APIRequestor:
                 # Text content - decode to string
                 response_content = content.decode("utf-8")
 
-            return (
-                self._interpret_response_line(
-                    response_content,
-                    result.status,
-                    result.headers,
-                    stream=False,
-                ),
-                False,
+            resp = self._interpret_response_line(
+                response_content,
+                result.status,
+                result.headers,
+                stream=False,
             )
+            if trace is not None:
+                trace.finish(resp)
+            return resp, False
 
     def _interpret_response_line(
         self, rbody: str | bytes, rcode: int, rheaders: Any, stream: bool
     ) -> TogetherResponse:
-        # HTTP 204 response code does not have any content in the body.
-        if rcode == 204:
-            return TogetherResponse({}, rheaders)
-
-        if rcode == 503:
-            raise error.ServiceUnavailableError(
-                "The server is overloaded or not ready yet.",
-                http_status=rcode,
-                headers=rheaders,
-            )
-
+        started = time.perf_counter_ns() if profiling.enabled else 0
         try:
+            # HTTP 204 response code does not have any content in the body.
+            if rcode == 204:
+                return TogetherResponse({}, rheaders)
+
+            if rcode == 503:
+                raise error.ServiceUnavailableError(
+                    "The server is overloaded or not ready yet.",
+                    http_status=rcode,
+                    headers=rheaders,
+                )
+
             content_type = rheaders.get("Content-Type", "")
-            if isinstance(rbody, bytes):
-                data: Dict[str, Any] | bytes = rbody
-            elif "text/plain" in content_type:
-                data = {"message": rbody}
-            else:
-                data = json.loads(rbody)
-        except (JSONDecodeError, UnicodeDecodeError) as e:
-            raise error.APIError(
-                f"Error code: {rcode} -{rbody if isinstance(rbody, str) else rbody.decode()}",
-                http_status=rcode,
-                headers=rheaders,
-            ) from e
-        resp = TogetherResponse(data, rheaders)
+            if (
+                200 <= rcode < 300
+                and isinstance(rbody, str)
+                and "text/plain" not in content_type
+            ):
+                # Successful JSON bodies are decoded when used, see `TogetherResponse.parse`
+                return TogetherResponse.from_json(rbody, rheaders)
 
-        # Handle streaming errors
-        if not 200 <= rcode < 300:
-            raise self.handle_error_response(resp, rcode, stream_error=stream)
-        return resp
+            try:
+                if isinstance(rbody, bytes):
+                    data: Dict[str, Any] | bytes = rbody
+                elif "text/plain" in content_type:
+                    data = {"message": rbody}
+                else:
+                    data = json.loads(rbody)
+            except (JSONDecodeError, UnicodeDecodeError) as e:
+                raise error.APIError(
+                    f"Error code: {rcode} -{rbody if isinstance(rbody, str) else rbody.decode()}",
+                    http_status=rcode,
+                    headers=rheaders,
+                ) from e
+            resp = TogetherResponse(data, rheaders)
+
+            # Handle streaming errors
+            if not 200 <= rcode < 300:
+                raise self.handle_error_response(resp, rcode, stream_error=stream)
+            return resp
+        finally:
+            if started:
+                profiling.record("decode_response", started)
 
 
 class AioHTTPSession(AsyncContextManager[aiohttp.ClientSession]):
-    def __init__(self) -> None:
+    def __init__(self, trace: bool = False) -> None:
         self._session: aiohttp.ClientSession | None = None
         self._should_close_session: bool = False
+        # time the connections of the requests, unless a shared session is used
+        self._trace = trace
 
     async def __aenter__(self) -> aiohttp.ClientSession:
         self._session = together.aiosession.get()
         if self._session is None:
-            self._session = await aiohttp.ClientSession().__aenter__()
+            trace_configs = [trace_config()] if self._trace else None
+            self._session = await aiohttp.ClientSession(
+                trace_configs=trace_configs
+            ).__aenter__()
             self._should_close_session = True
 
         return self._session
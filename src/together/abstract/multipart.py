@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
+
+from together.constants import UPLOAD_BLOCK_SIZE
+
+
+def _quote(value: str) -> str:
+    """Quote a multipart header parameter like browsers (and urllib3) do."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _guess_filename(obj: Any) -> str | None:
+    name = getattr(obj, "name", None)
+    if isinstance(name, str) and name and name[0] != "<" and name[-1] != ">":
+        return os.path.basename(name)
+    return None
+
+
+class _FilePart:
+    """File object sent from its current position, which is restored on every read."""
+
+    def __init__(self, fileobj: Any) -> None:
+        self.fileobj = fileobj
+        self.offset = fileobj.tell()
+        self.size = fileobj.seek(0, os.SEEK_END) - self.offset
+        fileobj.seek(self.offset)
+
+
+class MultipartEncoder:
+    """
+    multipart/form-data body that reads files in blocks while it is sent.
+
+    Accepts the `data` and `files` arguments of `requests`, with the same encoding, but never
+    holds a whole file in memory. The length of the body is known up front, so it is sent
+    with a Content-Length header rather than chunked. Seekable files are read again from
+    their original position on each iteration, so the body can be resent on retries.
+
+    Args:
+        files (Dict[str, Any]): Files, as file objects or `(filename, fileobj_or_content[,
+            content_type[, headers]])` tuples. A `None` filename sends a plain form field.
+        fields (Dict[str, Any], optional): Form fields sent before the files.
+        block_size (int, optional): Size of the blocks read from files.
+        boundary (str, optional): Part boundary. Defaults to a random one.
+    """
+
+    def __init__(
+        self,
+        files: Dict[str, Any],
+        fields: Dict[str, Any] | None = None,
+        block_size: int = UPLOAD_BLOCK_SIZE,
+        boundary: str | None = None,
+    ) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.block_size = block_size
+        # header of each part, followed by its content
+        self._parts: List[Tuple[bytes, bytes | _FilePart]] = []
+
+        for name, values in (fields or {}).items():
+            if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+                values = [values]
+            for value in values:
+                if value is None:
+                    continue
+                if not isinstance(value, bytes):
+                    value = str(value).encode()
+                self._add_part(name, None, None, None, value)
+
+        for name, value in files.items():
+            content_type = None
+            headers = None
+            if isinstance(value, (tuple, list)):
+                if len(value) == 2:
+                    filename, content = value
+                elif len(value) == 3:
+                    filename, content, content_type = value
+                else:
+                    filename, content, content_type, headers = value
+            else:
+                filename = _guess_filename(value) or name
+                content = value
+
+            if content is None:
+                continue
+            if isinstance(content, str):
+                content = content.encode()
+            elif isinstance(content, bytearray):
+                content = bytes(content)
+            elif hasattr(content, "read"):
+                seekable = getattr(content, "seekable", None)
+                content = (
+                    _FilePart(content)
+                    if seekable is not None and seekable()
+                    else content.read()
+                )
+            self._add_part(name, filename, content_type, headers, content)
+
+        self._closing = f"--{self.boundary}--\r\n".encode()
+
+    def _add_part(
+        self,
+        name: str,
+        filename: str | None,
+        content_type: str | None,
+        headers: Dict[str, str] | None,
+        content: bytes | _FilePart,
+    ) -> None:
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        lines = [f"--{self.boundary}", f"Content-Disposition: {disposition}"]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        for key, value in (headers or {}).items():
+            lines.append(f"{key}: {value}")
+        header = ("\r\n".join(lines) + "\r\n\r\n").encode()
+        self._parts.append((header, content))
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        size = len(self._closing)
+        for header, content in self._parts:
+            size += len(header) + 2
+            size += content.size if isinstance(content, _FilePart) else len(content)
+        return size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, content in self._parts:
+            yield header
+            if isinstance(content, _FilePart):
+                content.fileobj.seek(content.offset)
+                remaining = content.size
+                while remaining > 0:
+                    block = content.fileobj.read(min(self.block_size, remaining))
+                    if not block:
+                        raise IOError("File changed size while it was being sent")
+                    remaining -= len(block)
+                    yield block
+            else:
+                yield content
+            yield b"\r\n"
+        yield self._closing
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """Iterate over the body with file reads run in a thread, off the event loop."""
+        for header, content in self._parts:
+            yield header
+            if isinstance(content, _FilePart):
+                fileobj = content.fileobj
+                await asyncio.to_thread(fileobj.seek, content.offset)
+                remaining = content.size
+                while remaining > 0:
+                    block = await asyncio.to_thread(
+                        fileobj.read, min(self.block_size, remaining)
+                    )
+                    if not block:
+                        raise IOError("File changed size while it was being sent")
+                    remaining -= len(block)
+                    yield block
+            else:
+                yield content
+            yield b"\r\n"
+        yield self._closing
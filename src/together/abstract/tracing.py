@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Mapping
+
+import aiohttp
+import requests
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from together.hooks import RequestEvent, RequestHooks, RequestTiming
+from together.together_response import TogetherResponse
+
+
+# Has one attribute per thread, 'trace', set while a traced request is sent.
+_current = threading.local()
+
+
+class RequestTrace:
+    """Emits the hooks of one call and times each of its attempts."""
+
+    def __init__(
+        self, hooks: RequestHooks, method: str, model: str | None = None
+    ) -> None:
+        self.hooks = hooks
+        self.method = method.upper()
+        self.model = model
+        self.url = ""
+        self.state: Dict[str, Any] = {}
+        self.attempt = -1
+        self.timing = RequestTiming(start_time=time.perf_counter())
+        self.status_code: int | None = None
+        self.request_id: str | None = None
+        self.processed_by: str | None = None
+        self.stream_events = 0
+        self.finished = False
+
+    def _event(self, **kwargs: Any) -> RequestEvent:
+        return RequestEvent(
+            self.method,
+            self.url,
+            self.timing,
+            state=self.state,
+            model=self.model,
+            attempt=max(self.attempt, 0),
+            status_code=self.status_code,
+            request_id=self.request_id,
+            processed_by=self.processed_by,
+            **kwargs,
+        )
+
+    def start_attempt(self, url: str) -> None:
+        self.url = url
+        self.attempt += 1
+        self.timing = RequestTiming(
+            start_time=time.perf_counter(), retries=self.attempt
+        )
+        self.status_code = None
+        self.request_id = None
+        self.processed_by = None
+        self.stream_events = 0
+        self.hooks.emit("on_request", self._event())
+
+    def response_started(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Records the arrival of the response headers, once per attempt."""
+        if self.timing.time_to_first_byte is not None:
+            return
+        self.timing.time_to_first_byte = time.perf_counter() - self.timing.start_time
+        self.status_code = status_code
+        self.request_id = headers.get("cf-ray")
+        self.processed_by = headers.get("x-hostname")
+        try:
+            # reported in milliseconds
+            self.timing.server_time = float(headers["x-total-time"]) / 1000
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    def retry(self, delay: float, error: BaseException | None = None) -> None:
+        self.hooks.emit("on_retry", self._event(retry_delay=delay, error=error))
+
+    def stream_event(self, response: TogetherResponse | None = None) -> None:
+        self.hooks.emit(
+            "on_stream_event",
+            self._event(stream_event=self.stream_events, response=response),
+        )
+        self.stream_events += 1
+
+    def _end(self) -> bool:
+        """Records the end of the call, returning False if it had already ended."""
+        if self.finished:
+            return False
+        self.finished = True
+        timing = self.timing
+        timing.total = time.perf_counter() - timing.start_time
+        if timing.time_to_first_byte is not None:
+            timing.transfer = timing.total - timing.time_to_first_byte
+        return True
+
+    def finish(self, response: TogetherResponse | None = None) -> None:
+        """Emits `on_response` once the response is read, unless the call failed."""
+        if self._end():
+            self.hooks.emit("on_response", self._event(response=response))
+
+    def fail(self, error: BaseException) -> None:
+        """Emits `on_error`, unless the call already ended."""
+        if self._end():
+            self.hooks.emit("on_error", self._event(error=error))
+
+
+def emit_file_transfer(
+    hooks: RequestHooks | None, method: str, url: str, size: int, start_time: float
+) -> None:
+    """Emits `on_file_transfer` for a file of `size` bytes sent or received from
+    `start_time`, a `time.perf_counter` value."""
+    if not hooks:
+        return
+    timing = RequestTiming(
+        start_time=start_time, total=time.perf_counter() - start_time
+    )
+    hooks.emit(
+        "on_file_transfer",
+        RequestEvent(method, url, timing, file_bytes=size),
+    )
+
+
+def _new_conn(connection: HTTPConnection) -> socket.socket:
+    """Opens the socket of `connection`, timing it for the traced request if any."""
+    trace = getattr(_current, "trace", None)
+    if trace is None:
+        return HTTPConnection._new_conn(connection)
+    start = time.perf_counter()
+    sock = HTTPConnection._new_conn(connection)
+    trace.timing.connect = time.perf_counter() - start
+    return sock
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    _new_conn = _new_conn
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    _new_conn = _new_conn
+
+    def connect(self) -> None:
+        trace = getattr(_current, "trace", None)
+        if trace is None:
+            return super().connect()
+        start = time.perf_counter()
+        super().connect()
+        if trace.timing.connect is not None:
+            # the handshake follows opening the socket
+            elapsed = time.perf_counter() - start
+            trace.timing.tls = elapsed - trace.timing.connect
+
+
+def _get_conn(pool: HTTPConnectionPool, timeout: float | None = None) -> Any:
+    """Takes a connection from `pool`, timing the wait for the traced request if any."""
+    trace = getattr(_current, "trace", None)
+    if trace is None:
+        return HTTPConnectionPool._get_conn(pool, timeout)
+    start = time.perf_counter()
+    connection = HTTPConnectionPool._get_conn(pool, timeout)
+    trace.timing.pool_wait = time.perf_counter() - start
+    return connection
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+    _get_conn = _get_conn
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+    _get_conn = _get_conn
+
+
+class TimingAdapter(requests.adapters.HTTPAdapter):
+    """
+    Adapter timing the connection and the response headers of traced requests, which
+    are the requests sent while `_current.trace` is set on the thread.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        response = super().send(request, *args, **kwargs)
+        trace = getattr(_current, "trace", None)
+        if trace is not None:
+            trace.response_started(response.status_code, response.headers)
+        return response
+
+
+async def _on_connection_queued_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    context.queued_start = time.perf_counter()
+
+
+async def _on_connection_queued_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    trace = context.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        trace.timing.pool_wait = time.perf_counter() - context.queued_start
+
+
+async def _on_dns_resolvehost_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    context.dns_start = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    trace = context.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        trace.timing.dns = time.perf_counter() - context.dns_start
+
+
+async def _on_connection_create_start(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    context.connect_start = time.perf_counter()
+
+
+async def _on_connection_create_end(
+    session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+) -> None:
+    trace = context.trace_request_ctx
+    if isinstance(trace, RequestTrace):
+        # resolving the host is part of creating the connection
+        elapsed = time.perf_counter() - context.connect_start
+        trace.timing.connect = elapsed - (trace.timing.dns or 0)
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """Config timing the connection of requests sent with a `RequestTrace` as their
+    `trace_request_ctx`."""
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(_on_connection_queued_start)
+    config.on_connection_queued_end.append(_on_connection_queued_end)
+    config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    config.on_connection_create_start.append(_on_connection_create_start)
+    config.on_connection_create_end.append(_on_connection_create_end)
+    return config
@@ -0,0 +1,118 @@
+import json
+import pathlib
+from typing import Any, Dict
+
+import click
+
+from together.utils import check_file
+from together.utils.packing import pack_dataset
+
+
+@click.group()
+@click.pass_context
+def data(ctx: click.Context) -> None:
+    """Local dataset preparation commands"""
+    pass
+
+
+@data.command()
+@click.pass_context
+@click.argument(
+    "input_file",
+    type=click.Path(
+        exists=True, file_okay=True, resolve_path=True, readable=True, dir_okay=False
+    ),
+    required=True,
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    required=True,
+    help="Parquet file to write.",
+)
+@click.option(
+    "--max-seq-length",
+    type=click.IntRange(min=1),
+    required=True,
+    help="Number of tokens in each packed sequence.",
+)
+@click.option(
+    "--tokenizer",
+    type=str,
+    default=None,
+    help="Hugging Face tokenizer used to tokenize text samples. Requires `transformers`.",
+)
+@click.option(
+    "--text-field", type=str, default="text", help="Field holding the text samples."
+)
+@click.option(
+    "--eos-token-id",
+    type=int,
+    default=None,
+    help="Token appended to each sample. Defaults to the tokenizer's EOS token.",
+)
+@click.option(
+    "--pad-token-id",
+    type=int,
+    default=None,
+    help="Padding token. Defaults to the EOS token.",
+)
+@click.option(
+    "--labels/--no-labels", default=True, help="Whether to write a `labels` column."
+)
+@click.option(
+    "--pad-last/--drop-last",
+    default=False,
+    help="Whether to pad or drop the trailing tokens that don't fill a sequence.",
+)
+@click.option(
+    "--mask-document-boundaries",
+    is_flag=True,
+    help="Exclude the first token of each sample from the loss.",
+)
+@click.option(
+    "--num-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes used to tokenize and pack the dataset.",
+)
+@click.option(
+    "--check/--no-check",
+    default=True,
+    help="Whether to check the packed file for fine-tuning.",
+)
+def pack(
+    ctx: click.Context,
+    input_file: pathlib.Path,
+    output: str,
+    max_seq_length: int,
+    tokenizer: str | None,
+    text_field: str,
+    eos_token_id: int | None,
+    pad_token_id: int | None,
+    labels: bool,
+    pad_last: bool,
+    mask_document_boundaries: bool,
+    num_workers: int,
+    check: bool,
+) -> None:
+    """Pack a JSONL or Parquet dataset into fixed-length sequences for fine-tuning"""
+
+    stats: Dict[str, Any] = pack_dataset(
+        input_file,
+        output,
+        max_seq_len=max_seq_length,
+        pad_token_id=pad_token_id,
+        eos_token_id=eos_token_id,
+        tokenizer=tokenizer,
+        text_field=text_field,
+        add_labels=labels,
+        drop_incomplete=not pad_last,
+        mask_document_boundaries=mask_document_boundaries,
+        num_workers=num_workers,
+    )
+
+    if check:
+        stats["check"] = check_file(output)
+
+    click.echo(json.dumps(stats, indent=4))
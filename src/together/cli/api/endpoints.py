@@ -8,7 +8,7 @@ from typing import Any, Callable, Dict, List, Literal, TypeVar, Union
 import click
 
 from together import Together
-from together.error import InvalidRequestError
+from together.error import InvalidRequestError, JobStateError
 from together.types import DedicatedEndpoint, ListEndpoint
 
 
@@ -64,6 +64,10 @@ def handle_api_errors(f: F) -> F:
         except InvalidRequestError as e:
             print_api_error(e)
             sys.exit(1)
+        except JobStateError as e:
+            # an endpoint waited for with --wait failed instead of reaching its state
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
         except Exception as e:
             click.echo(f"Error: An unexpected error occurred - {str(e)}", err=True)
             sys.exit(1)
@@ -214,11 +218,8 @@ def create(
     click.echo(f"Endpoint created successfully, id: {response.id}", err=True)
 
     if wait:
-        import time
-
         click.echo("Waiting for endpoint to be ready...", err=True)
-        while client.endpoints.get(response.id).state != "STARTED":
-            time.sleep(1)
+        client.endpoints.wait_until(response.id, "STARTED")
         click.echo("Endpoint ready", err=True)
 
     # Print only the endpoint ID to stdout
@@ -295,11 +296,8 @@ def stop(client: Together, endpoint_id: str, wait: bool) -> None:
     click.echo("Successfully marked endpoint as stopping", err=True)
 
     if wait:
-        import time
-
         click.echo("Waiting for endpoint to stop...", err=True)
-        while client.endpoints.get(endpoint_id).state != "STOPPED":
-            time.sleep(1)
+        client.endpoints.wait_until(endpoint_id, "STOPPED")
         click.echo("Endpoint stopped", err=True)
 
     click.echo(endpoint_id)
@@ -320,11 +318,8 @@ def start(client: Together, endpoint_id: str, wait: bool) -> None:
     click.echo("Successfully marked endpoint as starting", err=True)
 
     if wait:
-        import time
-
         click.echo("Waiting for endpoint to start...", err=True)
-        while client.endpoints.get(endpoint_id).state != "STARTED":
-            time.sleep(1)
+        client.endpoints.wait_until(endpoint_id, "STARTED")
         click.echo("Endpoint started", err=True)
 
     click.echo(endpoint_id)
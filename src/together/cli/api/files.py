@@ -37,12 +37,22 @@ def files(ctx: click.Context) -> None:
     default=True,
     help="Whether to check the file before uploading.",
 )
-def upload(ctx: click.Context, file: pathlib.Path, purpose: str, check: bool) -> None:
+@click.option(
+    "--num-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes used to check large JSONL files.",
+)
+def upload(
+    ctx: click.Context, file: pathlib.Path, purpose: str, check: bool, num_workers: int
+) -> None:
     """Upload file"""
 
     client: Together = ctx.obj
 
-    response = client.files.upload(file=file, purpose=purpose, check=check)
+    response = client.files.upload(
+        file=file, purpose=purpose, check=check, check_num_workers=num_workers
+    )
 
     click.echo(json.dumps(response.model_dump(exclude_none=True), indent=4))
 
@@ -122,9 +132,22 @@ def delete(ctx: click.Context, id: str) -> None:
     ),
     required=True,
 )
-def check(ctx: click.Context, file: pathlib.Path) -> None:
+@click.option(
+    "--num-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of processes used to check large JSONL files.",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Whether to reuse the report of a previous check of the unchanged file.",
+)
+def check(
+    ctx: click.Context, file: pathlib.Path, num_workers: int, cache: bool
+) -> None:
     """Check file for issues"""
 
-    report = check_file(file)
+    report = check_file(file, num_workers=num_workers, use_cache=cache)
 
     click.echo(json.dumps(report, indent=4))
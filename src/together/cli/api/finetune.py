@@ -498,10 +498,22 @@ def cancel(ctx: click.Context, fine_tune_id: str, quiet: bool = False) -> None:
 @fine_tuning.command()
 @click.pass_context
 @click.argument("fine_tune_id", type=str, required=True)
-def list_events(ctx: click.Context, fine_tune_id: str) -> None:
+@click.option(
+    "--follow",
+    "-f",
+    is_flag=True,
+    help="Print new events as they are logged, until the job finishes",
+)
+def list_events(ctx: click.Context, fine_tune_id: str, follow: bool) -> None:
     """List fine-tuning events"""
     client: Together = ctx.obj
 
+    if follow:
+        for event in client.fine_tuning.follow_events(fine_tune_id):
+            event_type = event.type.value if event.type else ""
+            click.echo(f"{event.created_at or ''}\t{event_type}\t{event.message or ''}")
+        return
+
     response = client.fine_tuning.list_events(fine_tune_id)
 
     response.data = response.data or []
@@ -8,6 +8,7 @@ import click
 import together
 from together.cli.api.chat import chat, interactive
 from together.cli.api.completions import completions
+from together.cli.api.data import data
 from together.cli.api.endpoints import endpoints
 from together.cli.api.evaluation import evaluation
 from together.cli.api.files import files
@@ -76,6 +77,7 @@ main.add_command(fine_tuning)
 main.add_command(models)
 main.add_command(endpoints)
 main.add_command(evaluation)
+main.add_command(data)
 
 if __name__ == "__main__":
     main()
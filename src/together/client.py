@@ -7,8 +7,10 @@ from typing import Dict, TYPE_CHECKING
 from together import resources
 from together.constants import BASE_URL, MAX_RETRIES, TIMEOUT_SECS
 from together.error import AuthenticationError
-from together.resources.code_interpreter import CodeInterpreter
-from together.types import TogetherClient
+from together.hooks import RequestHooks
+from together.metrics import MetricsRegistry
+from together.resources.code_interpreter import AsyncCodeInterpreter, CodeInterpreter
+from together.types import Deadlines, TogetherClient
 from together.utils import enforce_trailing_slash
 from together.utils.api_helpers import get_google_colab_secret
 
@@ -30,6 +32,10 @@ class Together:
 
     # client options
     client: TogetherClient
+    # callbacks on the lifecycle of requests
+    hooks: RequestHooks
+    # in-process metrics of requests, if enabled
+    metrics: MetricsRegistry | None
 
     def __init__(
         self,
@@ -39,6 +45,9 @@ class Together:
         timeout: float | None = None,
         max_retries: int | None = None,
         supplied_headers: Dict[str, str] | None = None,
+        deadlines: Deadlines | None = None,
+        hooks: RequestHooks | None = None,
+        metrics: MetricsRegistry | bool = False,
     ) -> None:
         """Construct a new synchronous together client instance.
 
@@ -73,6 +82,17 @@ class Together:
         if max_retries is None:
             max_retries = MAX_RETRIES
 
+        # hooks can also be registered after the client is created
+        self.hooks = hooks if hooks is not None else RequestHooks()
+
+        # metrics=True records into a registry of its own
+        if isinstance(metrics, MetricsRegistry):
+            self.metrics = metrics
+        else:
+            self.metrics = MetricsRegistry() if metrics else None
+        if self.metrics is not None:
+            self.metrics.register(self.hooks)
+
         # TogetherClient object
         self.client = TogetherClient(
             api_key=api_key,
@@ -80,6 +100,8 @@ class Together:
             timeout=timeout,
             max_retries=max_retries,
             supplied_headers=supplied_headers,
+            deadlines=deadlines,
+            hooks=self.hooks,
         )
 
         self.completions = resources.Completions(self.client)
@@ -108,12 +130,16 @@ class AsyncTogether:
     fine_tuning: resources.AsyncFineTuning
     rerank: resources.AsyncRerank
     audio: resources.AsyncAudio
-    code_interpreter: CodeInterpreter
+    code_interpreter: AsyncCodeInterpreter
     batches: resources.AsyncBatches
     evaluation: resources.AsyncEvaluation
     videos: resources.AsyncVideos
     # client options
     client: TogetherClient
+    # callbacks on the lifecycle of requests
+    hooks: RequestHooks
+    # in-process metrics of requests, if enabled
+    metrics: MetricsRegistry | None
 
     def __init__(
         self,
@@ -123,6 +149,9 @@ class AsyncTogether:
         timeout: float | None = None,
         max_retries: int | None = None,
         supplied_headers: Dict[str, str] | None = None,
+        deadlines: Deadlines | None = None,
+        hooks: RequestHooks | None = None,
+        metrics: MetricsRegistry | bool = False,
     ) -> None:
         """Construct a new async together client instance.
 
@@ -157,6 +186,17 @@ class AsyncTogether:
         if max_retries is None:
             max_retries = MAX_RETRIES
 
+        # hooks can also be registered after the client is created
+        self.hooks = hooks if hooks is not None else RequestHooks()
+
+        # metrics=True records into a registry of its own
+        if isinstance(metrics, MetricsRegistry):
+            self.metrics = metrics
+        else:
+            self.metrics = MetricsRegistry() if metrics else None
+        if self.metrics is not None:
+            self.metrics.register(self.hooks)
+
         # TogetherClient object
         self.client = TogetherClient(
             api_key=api_key,
@@ -164,6 +204,8 @@ class AsyncTogether:
             timeout=timeout,
             max_retries=max_retries,
             supplied_headers=supplied_headers,
+            deadlines=deadlines,
+            hooks=self.hooks,
         )
 
         self.completions = resources.AsyncCompletions(self.client)
@@ -175,7 +217,7 @@ class AsyncTogether:
         self.fine_tuning = resources.AsyncFineTuning(self.client)
         self.rerank = resources.AsyncRerank(self.client)
         self.audio = resources.AsyncAudio(self.client)
-        self.code_interpreter = CodeInterpreter(self.client)
+        self.code_interpreter = AsyncCodeInterpreter(self.client)
         self.batches = resources.AsyncBatches(self.client)
         self.evaluation = resources.AsyncEvaluation(self.client)
         self.videos = resources.AsyncVideos(self.client)
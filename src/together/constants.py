@@ -18,6 +18,7 @@ DISABLE_TQDM = False
 
 # Upload defaults
 MAX_CONCURRENT_PARTS = 4  # Maximum concurrent parts for multipart upload
+UPLOAD_BLOCK_SIZE = 8 * 1024 * 1024  # 8 MB read size when streaming file bodies
 
 # Multipart upload constants
 MIN_PART_SIZE_MB = 5  # Minimum part size (S3 requirement)
@@ -26,6 +27,14 @@ MAX_MULTIPART_PARTS = 250  # Maximum parts per upload
 MULTIPART_UPLOAD_TIMEOUT = 300  # Timeout in seconds for uploading each part
 MULTIPART_THRESHOLD_GB = 5.0  # threshold for switching to multipart upload
 
+# File validation defaults
+VALIDATION_BLOCK_SIZE = 8 * 1024 * 1024  # 8 MB read size when validating datasets
+# Bump when validation rules change so that cached reports are invalidated
+VALIDATOR_VERSION = 3
+VALIDATION_CACHE_MAX_ENTRIES = 1000
+VALIDATION_CACHE_FINGERPRINT_BLOCKS = 16  # blocks hashed to fingerprint a file
+VALIDATION_CACHE_FINGERPRINT_BLOCK_SIZE = 64 * 1024
+
 # maximum number of GB sized files we support finetuning for
 MAX_FILE_SIZE_GB = 50.1
 
@@ -50,6 +59,39 @@ MAX_BASE64_IMAGE_LENGTH = len("data:image/jpeg;base64,") + 4 * MAX_IMAGE_BYTES /
 # expected columns for Parquet files
 PARQUET_EXPECTED_COLUMNS = ["input_ids", "attention_mask", "labels"]
 
+# label value for tokens excluded from the loss, the default `ignore_index` of torch.nn.CrossEntropyLoss
+LOSS_IGNORE_INDEX = -100
+
+# approximate size of the JSONL shards packed by each worker of `together data pack`
+PACKING_SHARD_SIZE = 64 * 1024 * 1024
+
+# Chunked transcription of long audio, durations in seconds
+AUDIO_CHUNK_DURATION = 300.0
+# audio shared by consecutive chunks, used to match speakers across chunks
+AUDIO_CHUNK_OVERLAP = 2.0
+AUDIO_CHUNK_CONCURRENCY = 4
+# window before each chunk boundary searched for silence, and the frames compared in it
+AUDIO_SILENCE_SEARCH = 15.0
+AUDIO_SILENCE_FRAME = 0.05
+# sample rate of audio converted to WAV with ffmpeg
+AUDIO_CHUNK_SAMPLE_RATE = 16000
+
+# Code interpreter session pools
+CODE_INTERPRETER_MAX_SESSIONS = 4  # per workload key
+CODE_INTERPRETER_SESSION_IDLE_TIMEOUT = 30 * 60  # seconds
+
+# number of prompts generated at the same time by `images.generate_many`
+IMAGE_GENERATION_CONCURRENCY = 8
+
+# chunks read ahead by `PrefetchingStream` before the reader thread waits
+STREAM_PREFETCH_SIZE = 256
+
+# Job waiters
+WAITER_CONCURRENCY = 8  # status requests in flight at once
+
+# event keys remembered by `fine_tuning.follow_events` to skip events already yielded
+FINETUNE_EVENTS_DEDUP_WINDOW = 1000
+
 
 class DatasetFormat(enum.Enum):
     """Dataset format enum."""
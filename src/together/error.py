@@ -192,3 +192,58 @@ class DownloadError(TogetherException):
         **kwargs: Any,
     ) -> None:
         super().__init__(message=message, **kwargs)
+
+
+class WaitTimeoutError(Timeout):
+    def __init__(
+        self,
+        message: (
+            TogetherErrorResponse | Exception | str | RequestException | None
+        ) = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(message=message, **kwargs)
+
+
+class JobStateError(TogetherException):
+    def __init__(
+        self,
+        message: (
+            TogetherErrorResponse | Exception | str | RequestException | None
+        ) = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(message=message, **kwargs)
+
+
+class DeadlineExceededError(Timeout):
+    def __init__(
+        self,
+        message: (
+            TogetherErrorResponse | Exception | str | RequestException | None
+        ) = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(message=message, **kwargs)
+
+
+class FirstEventTimeoutError(Timeout):
+    def __init__(
+        self,
+        message: (
+            TogetherErrorResponse | Exception | str | RequestException | None
+        ) = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(message=message, **kwargs)
+
+
+class StreamIdleTimeoutError(Timeout):
+    def __init__(
+        self,
+        message: (
+            TogetherErrorResponse | Exception | str | RequestException | None
+        ) = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(message=message, **kwargs)
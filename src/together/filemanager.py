@@ -1,22 +1,26 @@
 from __future__ import annotations
 
+import asyncio
 import math
 import os
 import shutil
 import stat
 import tempfile
+import time
 import uuid
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from functools import partial
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Tuple
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, List, Tuple
 
+import aiohttp
 import requests
 from filelock import FileLock
 from requests.structures import CaseInsensitiveDict
 from tqdm import tqdm
 
 from together.abstract import api_requestor
+from together.abstract.tracing import emit_file_transfer
 from together.constants import (
     DISABLE_TQDM,
     DOWNLOAD_BLOCK_SIZE,
@@ -28,13 +32,16 @@ from together.constants import (
     TARGET_PART_SIZE_MB,
     MAX_MULTIPART_PARTS,
     MULTIPART_UPLOAD_TIMEOUT,
+    UPLOAD_BLOCK_SIZE,
 )
 from together.error import (
+    APIConnectionError,
     APIError,
     AuthenticationError,
     DownloadError,
     FileTypeError,
     ResponseError,
+    Timeout,
 )
 from together.together_response import TogetherResponse
 from together.types import (
@@ -121,6 +128,51 @@ def _prepare_output(
     return Path(remote_name)
 
 
+def _get_upload_file_type(file: Path) -> FileType:
+    """
+    Maps file extension to the upload file type
+    """
+    if file.suffix == ".jsonl":
+        return FileType.jsonl
+    elif file.suffix == ".parquet":
+        return FileType.parquet
+    elif file.suffix == ".csv":
+        return FileType.csv
+    else:
+        raise FileTypeError(
+            f"Unknown extension of file {file}. "
+            "Only files with extensions .jsonl and .parquet are supported."
+        )
+
+
+async def _aread_file_chunks(
+    file: Path,
+    offset: int = 0,
+    length: int | None = None,
+    progress_callback: Callable[[int], None] | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Reads `length` bytes of a file starting at `offset` in blocks, off the event loop
+    """
+    if length is None:
+        length = os.stat(file).st_size - offset
+
+    f = await asyncio.to_thread(file.open, "rb")
+    try:
+        await asyncio.to_thread(f.seek, offset)
+        remaining = length
+        while remaining > 0:
+            chunk = await asyncio.to_thread(f.read, min(UPLOAD_BLOCK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            if progress_callback is not None:
+                progress_callback(len(chunk))
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
+
+
 class DownloadManager:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
@@ -187,6 +239,7 @@ class DownloadManager:
         remote_name: str | None = None,
         fetch_metadata: bool = False,
     ) -> Tuple[str, int]:
+        start_time = time.perf_counter()
         requestor = api_requestor.APIRequestor(
             client=self._client,
         )
@@ -249,6 +302,8 @@ class DownloadManager:
 
         os.remove(lock_path)
 
+        emit_file_transfer(self._client.hooks, "GET", url, file_size, start_time)
+
         return str(file_path.resolve()), file_size
 
 
@@ -334,6 +389,7 @@ class UploadManager:
         redirect: bool = False,
     ) -> FileResponse:
         file_id = None
+        start_time = time.perf_counter()
 
         requestor = api_requestor.APIRequestor(
             client=self._client,
@@ -341,17 +397,7 @@ class UploadManager:
 
         redirect_url = None
         if redirect:
-            if file.suffix == ".jsonl":
-                filetype = FileType.jsonl
-            elif file.suffix == ".parquet":
-                filetype = FileType.parquet
-            elif file.suffix == ".csv":
-                filetype = FileType.csv
-            else:
-                raise FileTypeError(
-                    f"Unknown extension of file {file}. "
-                    "Only files with extensions .jsonl and .parquet are supported."
-                )
+            filetype = _get_upload_file_type(file)
             redirect_url, file_id = self.get_upload_url(url, file, purpose, filetype)
 
         file_size = os.stat(file).st_size
@@ -399,57 +445,181 @@ class UploadManager:
 
         assert isinstance(response, TogetherResponse)
 
+        emit_file_transfer(self._client.hooks, "PUT", url, file_size, start_time)
+
         return FileResponse(**response.data)
 
 
-class MultipartUploadManager:
-    """Handles multipart uploads for large files"""
-
+class AsyncUploadManager:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
-        self.max_concurrent_parts = MAX_CONCURRENT_PARTS
 
-    def upload(
+    async def get_upload_url(
         self,
+        session: aiohttp.ClientSession,
         url: str,
         file: Path,
         purpose: FilePurpose,
-    ) -> FileResponse:
-        """Upload large file using multipart upload"""
+        filetype: FileType,
+    ) -> Tuple[str, str]:
+        data = {
+            "purpose": purpose.value,
+            "file_name": file.name,
+            "file_type": filetype.value,
+        }
 
-        file_size = os.stat(file).st_size
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
 
-        file_size_gb = file_size / NUM_BYTES_IN_GB
-        if file_size_gb > MAX_FILE_SIZE_GB:
-            raise FileTypeError(
-                f"File size {file_size_gb:.1f}GB exceeds maximum supported size of {MAX_FILE_SIZE_GB}GB"
-            )
+        method = "POST"
 
-        part_size, num_parts = self._calculate_parts(file_size)
+        headers = together.utils.get_headers(method, requestor.api_key)
 
-        file_type = self._get_file_type(file)
-        upload_info = None
+        response = await requestor.arequest_raw(
+            options=TogetherRequest(
+                method=method,
+                url=url,
+                params=data,
+                allow_redirects=False,
+                override_headers=True,
+                headers=headers,
+            ),
+            session=session,
+        )
 
         try:
-            upload_info = self._initiate_upload(
-                url, file, file_size, num_parts, purpose, file_type
-            )
+            if response.status == 401:
+                raise AuthenticationError(
+                    "This job would exceed your free trial credits. "
+                    "Please upgrade to a paid account through "
+                    "Settings -> Billing on api.together.ai to continue.",
+                )
+            elif response.status != 302:
+                raise APIError(
+                    f"Unexpected error raised by endpoint: {await response.text()}, headers: {response.headers}",
+                    http_status=response.status,
+                )
 
-            completed_parts = self._upload_parts_concurrent(
-                file, upload_info, part_size
-            )
+            redirect_url = response.headers["Location"]
+            file_id = response.headers["X-Together-File-Id"]
+        finally:
+            response.release()
 
-            return self._complete_upload(
-                url, upload_info["upload_id"], upload_info["file_id"], completed_parts
-            )
+        return redirect_url, file_id
 
-        except Exception as e:
-            # Cleanup on failure
-            if upload_info is not None:
-                self._abort_upload(
-                    url, upload_info["upload_id"], upload_info["file_id"]
+    async def callback(self, url: str) -> TogetherResponse:
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
+
+        response, _, _ = await requestor.arequest(
+            options=TogetherRequest(
+                method="POST",
+                url=url,
+            ),
+        )
+
+        assert isinstance(response, TogetherResponse)
+
+        return response
+
+    async def upload(
+        self,
+        url: str,
+        file: Path,
+        purpose: FilePurpose,
+        redirect: bool = False,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> FileResponse:
+        """
+        Uploads a file without blocking the event loop.
+
+        Args:
+            url (str): Files endpoint to upload to.
+            file (Path): Local file to upload.
+            purpose (FilePurpose): Purpose of the uploaded file.
+            redirect (bool, optional): Upload through a presigned URL obtained from `url`.
+                Defaults to False.
+            progress_callback (Callable[[int], None], optional): Called with the number of bytes
+                sent after every block read from the file.
+                Defaults to None.
+
+        Returns:
+            FileResponse: Uploaded file metadata.
+        """
+        start_time = time.perf_counter()
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
+
+        file_size = (await asyncio.to_thread(os.stat, file)).st_size
+        timeout = aiohttp.ClientTimeout(total=requestor.timeout)
+
+        async with api_requestor.AioHTTPSession() as session:
+            if redirect:
+                filetype = _get_upload_file_type(file)
+                redirect_url, file_id = await self.get_upload_url(
+                    session, url, file, purpose, filetype
                 )
-            raise e
+                put_url = redirect_url
+                headers = {"Content-Length": str(file_size)}
+            else:
+                put_url = "%s%s" % (requestor.api_base, url)
+                headers = together.utils.get_headers(
+                    "PUT", requestor.api_key, {"Content-Length": str(file_size)}
+                )
+
+            try:
+                put_response = await session.put(
+                    put_url,
+                    data=_aread_file_chunks(file, progress_callback=progress_callback),
+                    headers=headers,
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError as e:
+                raise Timeout("Request timed out") from e
+            except aiohttp.ClientError as e:
+                raise APIConnectionError("Error communicating with Together") from e
+
+            try:
+                if redirect:
+                    if not put_response.status == 200:
+                        raise APIError(
+                            f"Error during file upload: {await put_response.text()}, headers: {put_response.headers}",
+                            http_status=put_response.status,
+                        )
+                else:
+                    response, _ = await requestor._interpret_async_response(
+                        put_response, False
+                    )
+            finally:
+                put_response.release()
+
+        if redirect:
+            response = await self.callback(f"{url}/{file_id}/preprocess")
+
+        assert isinstance(response, TogetherResponse)
+
+        emit_file_transfer(self._client.hooks, "PUT", url, file_size, start_time)
+
+        return FileResponse(**response.data)
+
+
+class BaseMultipartUploadManager:
+    """Shared part planning for sync and async multipart uploads"""
+
+    def __init__(self, client: TogetherClient) -> None:
+        self._client = client
+        self.max_concurrent_parts = MAX_CONCURRENT_PARTS
+
+    def _check_file_size(self, file_size: int) -> None:
+        """Raise FileTypeError if the file exceeds the maximum supported size"""
+        file_size_gb = file_size / NUM_BYTES_IN_GB
+        if file_size_gb > MAX_FILE_SIZE_GB:
+            raise FileTypeError(
+                f"File size {file_size_gb:.1f}GB exceeds maximum supported size of {MAX_FILE_SIZE_GB}GB"
+            )
 
     def _get_file_type(self, file: Path) -> str:
         """Get file type from extension, raising ValueError for unsupported extensions"""
@@ -482,6 +652,69 @@ class MultipartUploadManager:
 
         return part_size, num_parts
 
+    def _initiate_payload(
+        self,
+        file: Path,
+        file_size: int,
+        num_parts: int,
+        purpose: FilePurpose,
+        file_type: str,
+    ) -> Dict[str, Any]:
+        return {
+            "file_name": file.name,
+            "file_size": file_size,
+            "num_parts": num_parts,
+            "purpose": purpose.value,
+            "file_type": file_type,
+        }
+
+
+class MultipartUploadManager(BaseMultipartUploadManager):
+    """Handles multipart uploads for large files"""
+
+    def upload(
+        self,
+        url: str,
+        file: Path,
+        purpose: FilePurpose,
+    ) -> FileResponse:
+        """Upload large file using multipart upload"""
+
+        start_time = time.perf_counter()
+        file_size = os.stat(file).st_size
+
+        self._check_file_size(file_size)
+
+        part_size, num_parts = self._calculate_parts(file_size)
+
+        file_type = self._get_file_type(file)
+        upload_info = None
+
+        try:
+            upload_info = self._initiate_upload(
+                url, file, file_size, num_parts, purpose, file_type
+            )
+
+            completed_parts = self._upload_parts_concurrent(
+                file, upload_info, part_size
+            )
+
+            file_response = self._complete_upload(
+                url, upload_info["upload_id"], upload_info["file_id"], completed_parts
+            )
+
+        except Exception as e:
+            # Cleanup on failure
+            if upload_info is not None:
+                self._abort_upload(
+                    url, upload_info["upload_id"], upload_info["file_id"]
+                )
+            raise e
+
+        emit_file_transfer(self._client.hooks, "PUT", url, file_size, start_time)
+
+        return file_response
+
     def _initiate_upload(
         self,
         url: str,
@@ -495,13 +728,7 @@ class MultipartUploadManager:
 
         requestor = api_requestor.APIRequestor(client=self._client)
 
-        payload = {
-            "file_name": file.name,
-            "file_size": file_size,
-            "num_parts": num_parts,
-            "purpose": purpose.value,
-            "file_type": file_type,
-        }
+        payload = self._initiate_payload(file, file_size, num_parts, purpose, file_type)
 
         response, _, _ = requestor.request(
             options=TogetherRequest(
@@ -633,3 +860,203 @@ class MultipartUploadManager:
                 params=payload,
             ),
         )
+
+
+class AsyncMultipartUploadManager(BaseMultipartUploadManager):
+    """Handles multipart uploads for large files on the event loop"""
+
+    async def upload(
+        self,
+        url: str,
+        file: Path,
+        purpose: FilePurpose,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> FileResponse:
+        """Upload large file using multipart upload, with at most
+        `max_concurrent_parts` parts in flight"""
+
+        start_time = time.perf_counter()
+        file_size = (await asyncio.to_thread(os.stat, file)).st_size
+
+        self._check_file_size(file_size)
+
+        part_size, num_parts = self._calculate_parts(file_size)
+
+        file_type = self._get_file_type(file)
+        upload_info = None
+
+        try:
+            upload_info = await self._initiate_upload(
+                url, file, file_size, num_parts, purpose, file_type
+            )
+
+            completed_parts = await self._upload_parts_concurrent(
+                file, upload_info, part_size, file_size, progress_callback
+            )
+
+            file_response = await self._complete_upload(
+                url, upload_info["upload_id"], upload_info["file_id"], completed_parts
+            )
+
+        except Exception as e:
+            # Cleanup on failure
+            if upload_info is not None:
+                await self._abort_upload(
+                    url, upload_info["upload_id"], upload_info["file_id"]
+                )
+            raise e
+
+        emit_file_transfer(self._client.hooks, "PUT", url, file_size, start_time)
+
+        return file_response
+
+    async def _initiate_upload(
+        self,
+        url: str,
+        file: Path,
+        file_size: int,
+        num_parts: int,
+        purpose: FilePurpose,
+        file_type: str,
+    ) -> Any:
+        """Initiate multipart upload with backend"""
+
+        requestor = api_requestor.APIRequestor(client=self._client)
+
+        payload = self._initiate_payload(file, file_size, num_parts, purpose, file_type)
+
+        response, _, _ = await requestor.arequest(
+            options=TogetherRequest(
+                method="POST",
+                url="files/multipart/initiate",
+                params=payload,
+            ),
+        )
+
+        assert isinstance(response, TogetherResponse)
+
+        return response.data
+
+    async def _upload_parts_concurrent(
+        self,
+        file: Path,
+        upload_info: Dict[str, Any],
+        part_size: int,
+        file_size: int,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Upload file parts concurrently, bounded by a semaphore"""
+
+        parts = upload_info["parts"]
+        semaphore = asyncio.Semaphore(self.max_concurrent_parts)
+
+        async with api_requestor.AioHTTPSession() as session:
+
+            async def upload_part(part_info: Dict[str, Any]) -> Dict[str, Any]:
+                part_number = part_info["PartNumber"]
+                async with semaphore:
+                    try:
+                        etag = await self._upload_single_part(
+                            session,
+                            file,
+                            part_info,
+                            part_size,
+                            file_size,
+                            progress_callback,
+                        )
+                    except Exception as e:
+                        raise Exception(f"Failed to upload part {part_number}: {e}")
+                return {"part_number": part_number, "etag": etag}
+
+            tasks = [asyncio.ensure_future(upload_part(p)) for p in parts]
+            try:
+                # Fail fast: stop the remaining parts as soon as one of them errors
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                for task in done:
+                    task.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        completed_parts = [task.result() for task in tasks]
+        completed_parts.sort(key=lambda x: x["part_number"])
+        return completed_parts
+
+    async def _upload_single_part(
+        self,
+        session: aiohttp.ClientSession,
+        file: Path,
+        part_info: Dict[str, Any],
+        part_size: int,
+        file_size: int,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> str:
+        """Stream a single part from disk and return ETag"""
+
+        offset = (part_info["PartNumber"] - 1) * part_size
+        length = min(part_size, file_size - offset)
+
+        headers = dict(part_info.get("Headers", {}))
+        headers["Content-Length"] = str(length)
+
+        async with session.put(
+            part_info["URL"],
+            data=_aread_file_chunks(file, offset, length, progress_callback),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=MULTIPART_UPLOAD_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            etag = response.headers.get("ETag", "").strip('"')
+
+        if not etag:
+            raise ResponseError(f"No ETag returned for part {part_info['PartNumber']}")
+
+        return etag
+
+    async def _complete_upload(
+        self,
+        url: str,
+        upload_id: str,
+        file_id: str,
+        completed_parts: List[Dict[str, Any]],
+    ) -> FileResponse:
+        """Complete the multipart upload"""
+
+        requestor = api_requestor.APIRequestor(client=self._client)
+
+        payload = {
+            "upload_id": upload_id,
+            "file_id": file_id,
+            "parts": completed_parts,
+        }
+
+        response, _, _ = await requestor.arequest(
+            options=TogetherRequest(
+                method="POST",
+                url="files/multipart/complete",
+                params=payload,
+            ),
+        )
+
+        assert isinstance(response, TogetherResponse)
+
+        return FileResponse(**response.data.get("file", response.data))
+
+    async def _abort_upload(self, url: str, upload_id: str, file_id: str) -> None:
+        """Abort the multipart upload"""
+
+        requestor = api_requestor.APIRequestor(client=self._client)
+
+        payload = {
+            "upload_id": upload_id,
+            "file_id": file_id,
+        }
+
+        await requestor.arequest(
+            options=TogetherRequest(
+                method="POST",
+                url="files/multipart/abort",
+                params=payload,
+            ),
+        )
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+from urllib.parse import urlsplit
+
+from together.utils import log_warn
+
+
+if TYPE_CHECKING:
+    from together.together_response import TogetherResponse
+
+
+# usage object of a response, matched without decoding the whole body
+_USAGE_PATTERN = re.compile(r'"usage"\s*:\s*(\{[^{}]*\})')
+
+# first segments of endpoints that are only named by their second segment as well
+_NAMESPACES = ("chat", "audio", "images")
+
+HOOK_NAMES = (
+    "on_request",
+    "on_response",
+    "on_retry",
+    "on_stream_event",
+    "on_error",
+    "on_file_transfer",
+)
+
+
+@dataclass
+class RequestTiming:
+    """Timing breakdown of one attempt of a request.
+
+    All times are in seconds and measured with `time.perf_counter`. Phases that were not
+    measured are None: `dns` is only measured on the async client, where `tls` is part of
+    `connect`, and none of `dns`, `connect` and `tls` are set when a pooled connection is
+    reused. The async client only sets `pool_wait` when all its connections were busy.
+    """
+
+    # when the attempt started
+    start_time: float
+    # waiting for a connection from the pool
+    pool_wait: float | None = None
+    # resolving the host name
+    dns: float | None = None
+    # opening the TCP connection
+    connect: float | None = None
+    # TLS handshake
+    tls: float | None = None
+    # from the start of the attempt to the response headers
+    time_to_first_byte: float | None = None
+    # reading the response body, up to the end of a stream
+    transfer: float | None = None
+    # from the start of the attempt to the end of the response
+    total: float | None = None
+    # processing time reported by the server in the `x-total-time` header
+    server_time: float | None = None
+    # number of attempts that were retried before this one
+    retries: int = 0
+
+    @property
+    def client_overhead(self) -> float | None:
+        """Time of the attempt not spent processing on the server."""
+        if self.total is None or self.server_time is None:
+            return None
+        return self.total - self.server_time
+
+
+@dataclass
+class RequestEvent:
+    """Passed to every hook, describing the request and the step it is at."""
+
+    method: str
+    url: str
+    timing: RequestTiming
+    # shared by all the events of a call, for hooks to keep their own state in
+    state: Dict[str, Any] = field(default_factory=dict)
+    # model named in the request body, if any
+    model: str | None = None
+    # 0 for the first attempt, increased by each retry
+    attempt: int = 0
+    status_code: int | None = None
+    request_id: str | None = None
+    # server that processed the request, from the `x-hostname` header
+    processed_by: str | None = None
+    # the response, for `on_response`, or the event of the stream, for `on_stream_event`
+    response: TogetherResponse | None = None
+    # seconds until the next attempt, for `on_retry`
+    retry_delay: float | None = None
+    # position of the event in the stream, for `on_stream_event`
+    stream_event: int | None = None
+    # the error that failed the attempt or the call, for `on_retry` and `on_error`
+    error: BaseException | None = None
+    # size of the file uploaded or downloaded, for `on_file_transfer`
+    file_bytes: int | None = None
+
+    @property
+    def endpoint(self) -> str:
+        """Path of the URL relative to the API version, like `fine-tunes/ft-1/events`."""
+        return urlsplit(self.url).path.rsplit("/v1/", 1)[-1].strip("/")
+
+    @property
+    def resource(self) -> str:
+        """API resource of the request, like `chat/completions` or `fine-tunes`, without
+        the IDs of `endpoint`."""
+        segments = self.endpoint.split("/")
+        if segments[0] in _NAMESPACES:
+            return "/".join(segments[:2])
+        return segments[0]
+
+    def usage(self) -> Dict[str, Any] | None:
+        """Token usage sent with `response`, if any.
+
+        The usage object is found without decoding the rest of the body when possible.
+        """
+        if self.response is None:
+            return None
+        text = self.response.text
+        if text is not None:
+            if '"usage"' not in text:
+                return None
+            match = _USAGE_PATTERN.search(text)
+            if match is not None:
+                usage = json.loads(match.group(1))
+                return usage if isinstance(usage, dict) else None
+        data = self.response.data
+        usage = data.get("usage") if isinstance(data, dict) else None
+        return usage if isinstance(usage, dict) else None
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+@dataclass
+class RequestHooks:
+    """
+    Callbacks on the lifecycle of API requests, called with a `RequestEvent`:
+
+    - `on_request` before each attempt is sent,
+    - `on_retry` when an attempt failed and is retried,
+    - `on_stream_event` for each event or chunk of a streamed response,
+    - `on_response` once the response is fully read, with the timing of the attempt,
+    - `on_error` when the call raises, instead of `on_response`,
+    - `on_file_transfer` when a file upload or download completes.
+
+    Hooks run inline on the thread or event loop of the request, so they should return
+    quickly. Errors raised by a hook are logged and ignored. Requests do no timing at all
+    while no hook is registered.
+
+    Each `on_*` method registers a hook and returns it, so it can be used as a decorator:
+
+        hooks = RequestHooks()
+
+        @hooks.on_response
+        def log_timing(event):
+            print(event.url, event.timing.time_to_first_byte)
+
+        client = Together(hooks=hooks)
+    """
+
+    hooks: Dict[str, List[Hook]] = field(
+        default_factory=lambda: {name: [] for name in HOOK_NAMES}
+    )
+
+    def __bool__(self) -> bool:
+        return any(self.hooks.values())
+
+    def on_request(self, hook: Hook) -> Hook:
+        self.hooks["on_request"].append(hook)
+        return hook
+
+    def on_response(self, hook: Hook) -> Hook:
+        self.hooks["on_response"].append(hook)
+        return hook
+
+    def on_retry(self, hook: Hook) -> Hook:
+        self.hooks["on_retry"].append(hook)
+        return hook
+
+    def on_stream_event(self, hook: Hook) -> Hook:
+        self.hooks["on_stream_event"].append(hook)
+        return hook
+
+    def on_error(self, hook: Hook) -> Hook:
+        self.hooks["on_error"].append(hook)
+        return hook
+
+    def on_file_transfer(self, hook: Hook) -> Hook:
+        self.hooks["on_file_transfer"].append(hook)
+        return hook
+
+    def emit(self, name: str, event: RequestEvent) -> None:
+        """Calls the hooks registered under `name` with `event`."""
+        for hook in self.hooks[name]:
+            try:
+                hook(event)
+            except Exception as e:
+                log_warn("Request hook raised an error", hook=name, error=repr(e))
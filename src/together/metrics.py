@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Tuple
+
+from together.hooks import RequestEvent, RequestHooks
+
+
+# Buckets per power of two of histograms, bounding the error of percentiles to 1/32
+_SUB_BUCKETS = 16
+
+# Quantiles exported by `MetricsRegistry.to_prometheus`
+PROMETHEUS_QUANTILES = (0.5, 0.9, 0.99)
+
+# resource, model and status of a call
+Labels = Tuple[str, str, str]
+
+
+def _bucket(value: float) -> int:
+    mantissa, exponent = math.frexp(value)
+    return exponent * _SUB_BUCKETS + int((mantissa * 2 - 1) * _SUB_BUCKETS)
+
+
+def _bucket_bounds(bucket: int) -> Tuple[float, float]:
+    exponent, sub_bucket = divmod(bucket, _SUB_BUCKETS)
+    base = math.ldexp(1.0, exponent - 1)
+    return (
+        base * (1 + sub_bucket / _SUB_BUCKETS),
+        base * (1 + (sub_bucket + 1) / _SUB_BUCKETS),
+    )
+
+
+class _Histogram:
+    """Log-linear histogram of positive values, in the style of HdrHistogram."""
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        if value <= 0:
+            # kept in the lowest bucket
+            value = 5e-324
+        bucket = _bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Distribution of the values recorded by a histogram, with a relative error of
+    1/32 on percentiles."""
+
+    count: int = 0
+    sum: float = 0.0
+    min: float | None = None
+    max: float | None = None
+    # number of values in each non-empty bucket, by bucket index
+    buckets: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def mean(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+    def percentile(self, percentile: float) -> float | None:
+        """Nearest-rank percentile of the recorded values, `percentile` in [0, 100]."""
+        if not self.count:
+            return None
+        assert self.min is not None and self.max is not None
+        rank = max(math.ceil(percentile / 100 * self.count), 1)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                lower, upper = _bucket_bounds(bucket)
+                return min(max((lower + upper) / 2, self.min), self.max)
+        return self.max
+
+    def _merge(self, histogram: _Histogram) -> None:
+        if not histogram.count:
+            return
+        for bucket, count in dict(histogram.counts).items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += histogram.count
+        self.sum += histogram.sum
+        self.min = histogram.min if self.min is None else min(self.min, histogram.min)
+        self.max = histogram.max if self.max is None else max(self.max, histogram.max)
+
+
+class _Series:
+    """Metrics of the calls with the same labels, recorded by one thread."""
+
+    __slots__ = (
+        "requests",
+        "retries",
+        "rate_limited",
+        "latency",
+        "time_to_first_token",
+        "inter_token_latency",
+        "output_tokens_per_second",
+        "pool_wait",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.latency = _Histogram()
+        self.time_to_first_token = _Histogram()
+        self.inter_token_latency = _Histogram()
+        self.output_tokens_per_second = _Histogram()
+        self.pool_wait = _Histogram()
+
+
+@dataclass
+class SeriesSnapshot:
+    """Metrics of the calls to a resource and model that ended with the same status.
+
+    Latencies are in seconds. `status` is the HTTP status code of the last response, or
+    `error` when the call failed without one.
+    """
+
+    resource: str
+    model: str
+    status: str
+    # completed calls
+    requests: int = 0
+    # retried attempts
+    retries: int = 0
+    # attempts answered with a 429 status
+    rate_limited: int = 0
+    # duration of calls, including retries
+    latency: HistogramSnapshot = field(default_factory=HistogramSnapshot)
+    # from the start of calls to the first event of their stream
+    time_to_first_token: HistogramSnapshot = field(default_factory=HistogramSnapshot)
+    # gaps between the events of streams
+    inter_token_latency: HistogramSnapshot = field(default_factory=HistogramSnapshot)
+    # output tokens per second of streams, after their first event
+    output_tokens_per_second: HistogramSnapshot = field(
+        default_factory=HistogramSnapshot
+    )
+    # waiting for a connection from the pool, for each attempt
+    pool_wait: HistogramSnapshot = field(default_factory=HistogramSnapshot)
+
+    @property
+    def rate_limited_ratio(self) -> float:
+        """Share of the attempts answered with a 429 status."""
+        attempts = self.requests + self.retries
+        return self.rate_limited / attempts if attempts else 0.0
+
+
+# Histograms of `SeriesSnapshot`, with their Prometheus name and help
+_HISTOGRAMS = {
+    "latency": (
+        "together_client_request_duration_seconds",
+        "Duration of API calls, including retries.",
+    ),
+    "time_to_first_token": (
+        "together_client_time_to_first_token_seconds",
+        "Time from the start of API calls to the first event of their stream.",
+    ),
+    "inter_token_latency": (
+        "together_client_inter_token_latency_seconds",
+        "Time between the events of streams.",
+    ),
+    "output_tokens_per_second": (
+        "together_client_output_tokens_per_second",
+        "Output tokens per second of streams, after their first event.",
+    ),
+    "pool_wait": (
+        "together_client_pool_wait_seconds",
+        "Time waiting for a connection from the pool.",
+    ),
+}
+
+_COUNTERS = {
+    "requests": ("together_client_requests_total", "Completed API calls."),
+    "retries": ("together_client_retries_total", "Retried attempts of API calls."),
+    "rate_limited": (
+        "together_client_rate_limited_total",
+        "Attempts of API calls answered with a 429 status.",
+    ),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class MetricsRegistry:
+    """
+    In-process metrics of the API calls of Together clients, recorded through their
+    request hooks, by resource, model and status.
+
+    Each thread records into its own series, so recording takes no lock; `snapshot` adds
+    up the series of all threads.
+
+    Example:
+
+        client = Together(metrics=True)
+        ...
+        for series in client.metrics.snapshot():
+            print(series.resource, series.model, series.latency.percentile(99))
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # series of each thread, by labels
+        self._shards: List[Dict[Labels, _Series]] = []
+        # only taken when a thread records for the first time
+        self._shards_lock = threading.Lock()
+
+    def register(self, hooks: RequestHooks) -> None:
+        """Records the calls made by the clients using `hooks`."""
+        for name, hook in [
+            ("on_request", self._on_request),
+            ("on_retry", self._on_retry),
+            ("on_stream_event", self._on_stream_event),
+            ("on_response", self._on_end),
+            ("on_error", self._on_end),
+        ]:
+            if hook not in hooks.hooks[name]:
+                hooks.hooks[name].append(hook)
+
+    def _shard(self) -> Dict[Labels, _Series]:
+        shard: Dict[Labels, _Series] | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _on_request(self, event: RequestEvent) -> None:
+        if event.attempt == 0:
+            event.state["metrics"] = _CallMetrics(event.timing.start_time)
+
+    def _on_retry(self, event: RequestEvent) -> None:
+        call: _CallMetrics | None = event.state.get("metrics")
+        if call is not None:
+            call.end_attempt(event)
+
+    def _on_stream_event(self, event: RequestEvent) -> None:
+        call: _CallMetrics | None = event.state.get("metrics")
+        if call is None:
+            return
+        now = time.perf_counter()
+        if call.last_event_time is None:
+            call.first_event_time = now
+        else:
+            call.inter_token_latencies.append(now - call.last_event_time)
+        call.last_event_time = now
+        usage = event.usage()
+        if usage is not None:
+            call.output_tokens = usage.get("completion_tokens")
+
+    def _on_end(self, event: RequestEvent) -> None:
+        call: _CallMetrics | None = event.state.pop("metrics", None)
+        if call is None:
+            return
+        end_time = time.perf_counter()
+        call.end_attempt(event)
+        if call.last_event_time is None:
+            usage = event.usage()
+            if usage is not None:
+                call.output_tokens = usage.get("completion_tokens")
+
+        status = str(event.status_code) if event.status_code is not None else "error"
+        labels = (event.resource, event.model or "", status)
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            series = shard[labels] = _Series()
+        series.requests += 1
+        series.retries += event.attempt
+        series.rate_limited += call.rate_limited
+        series.latency.record(end_time - call.start_time)
+        for pool_wait in call.pool_waits:
+            series.pool_wait.record(pool_wait)
+        if call.first_event_time is not None:
+            series.time_to_first_token.record(call.first_event_time - call.start_time)
+            for latency in call.inter_token_latencies:
+                series.inter_token_latency.record(latency)
+            elapsed = end_time - call.first_event_time
+            if isinstance(call.output_tokens, int) and elapsed > 0:
+                series.output_tokens_per_second.record(call.output_tokens / elapsed)
+
+    def snapshot(self) -> List[SeriesSnapshot]:
+        """Metrics recorded so far, by resource, model and status."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        snapshots: Dict[Labels, SeriesSnapshot] = {}
+        for shard in shards:
+            for labels, series in list(shard.items()):
+                snapshot = snapshots.get(labels)
+                if snapshot is None:
+                    snapshot = snapshots[labels] = SeriesSnapshot(*labels)
+                snapshot.requests += series.requests
+                snapshot.retries += series.retries
+                snapshot.rate_limited += series.rate_limited
+                for name in _HISTOGRAMS:
+                    getattr(snapshot, name)._merge(getattr(series, name))
+        return [snapshots[labels] for labels in sorted(snapshots)]
+
+    def to_prometheus(self) -> str:
+        """Metrics recorded so far, in the Prometheus text exposition format.
+
+        Histograms are exported as summaries with the `PROMETHEUS_QUANTILES` quantiles.
+        """
+        return "".join(self._prometheus_lines(self.snapshot()))
+
+    @staticmethod
+    def _prometheus_lines(snapshots: List[SeriesSnapshot]) -> Iterator[str]:
+        def labels(series: SeriesSnapshot, **extra: str) -> str:
+            return _format_labels(
+                {
+                    "resource": series.resource,
+                    "model": series.model,
+                    "status": series.status,
+                    **extra,
+                }
+            )
+
+        for attribute, (name, help) in _COUNTERS.items():
+            yield f"# HELP {name} {help}\n# TYPE {name} counter\n"
+            for series in snapshots:
+                yield f"{name}{{{labels(series)}}} {getattr(series, attribute)}\n"
+        for attribute, (name, help) in _HISTOGRAMS.items():
+            yield f"# HELP {name} {help}\n# TYPE {name} summary\n"
+            for series in snapshots:
+                histogram: HistogramSnapshot = getattr(series, attribute)
+                if not histogram.count:
+                    continue
+                for quantile in PROMETHEUS_QUANTILES:
+                    value = histogram.percentile(quantile * 100)
+                    yield f"{name}{{{labels(series, quantile=str(quantile))}}} {value}\n"
+                yield f"{name}_sum{{{labels(series)}}} {histogram.sum}\n"
+                yield f"{name}_count{{{labels(series)}}} {histogram.count}\n"
+
+
+class _CallMetrics:
+    """Metrics of one call, added to its series once it ends."""
+
+    __slots__ = (
+        "start_time",
+        "rate_limited",
+        "pool_waits",
+        "first_event_time",
+        "last_event_time",
+        "inter_token_latencies",
+        "output_tokens",
+    )
+
+    def __init__(self, start_time: float) -> None:
+        self.start_time = start_time
+        self.rate_limited = 0
+        self.pool_waits: List[float] = []
+        self.first_event_time: float | None = None
+        self.last_event_time: float | None = None
+        self.inter_token_latencies: List[float] = []
+        self.output_tokens: Any = None
+
+    def end_attempt(self, event: RequestEvent) -> None:
+        if event.status_code == 429:
+            self.rate_limited += 1
+        if event.timing.pool_wait is not None:
+            self.pool_waits.append(event.timing.pool_wait)
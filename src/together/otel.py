@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Dict
+from urllib.parse import urlsplit
+
+
+try:
+    # OpenTelemetry is optional, installed with `pip install together[otel]`
+    from opentelemetry import metrics, trace
+    from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+except ImportError:
+    raise ImportError(
+        "opentelemetry is not installed and is required to use together.otel. Please install it via `pip install together[otel]`"
+    )
+
+from together.hooks import HOOK_NAMES, Hook, RequestEvent
+from together.version import VERSION
+
+
+if TYPE_CHECKING:
+    from together.client import AsyncTogether, Together
+
+
+PROVIDER_NAME = "together_ai"
+
+# `gen_ai.operation.name` of the endpoints serving models
+_OPERATIONS = {
+    "chat/completions": "chat",
+    "completions": "text_completion",
+    "embeddings": "embeddings",
+}
+
+
+class TogetherInstrumentor:
+    """
+    Records OpenTelemetry spans and metrics for the API calls of Together clients, through
+    their request hooks.
+
+    Each call is a client span named after its operation and model, such as
+    `chat meta-llama/Llama-3.3-70B-Instruct-Turbo`, with the GenAI and HTTP semantic
+    convention attributes: model, endpoint, status code, retries and token usage, plus
+    `together.request_id` and `together.processed_by`.
+
+    Metrics recorded:
+
+    - `gen_ai.client.operation.duration`: duration of calls, including retries, in seconds.
+    - `gen_ai.client.token.usage`: input and output tokens of calls.
+    - `together.client.time_to_first_token`: seconds until the first event of streams.
+    - `together.client.output_tokens_per_second`: output tokens per second of streams,
+      after the first event.
+    - `together.client.file.transferred`: bytes of files uploaded and downloaded.
+
+    Args:
+        tracer_provider (TracerProvider, optional): Provider of the tracer. Defaults to the
+            global tracer provider.
+        meter_provider (MeterProvider, optional): Provider of the meter. Defaults to the
+            global meter provider.
+    """
+
+    def __init__(
+        self,
+        tracer_provider: trace.TracerProvider | None = None,
+        meter_provider: metrics.MeterProvider | None = None,
+    ) -> None:
+        self._tracer = trace.get_tracer(__name__, VERSION, tracer_provider)
+        meter = metrics.get_meter(__name__, VERSION, meter_provider)
+        self._duration = meter.create_histogram(
+            "gen_ai.client.operation.duration",
+            unit="s",
+            description="Duration of API calls",
+        )
+        self._token_usage = meter.create_histogram(
+            "gen_ai.client.token.usage",
+            unit="{token}",
+            description="Number of input and output tokens used",
+        )
+        self._time_to_first_token = meter.create_histogram(
+            "together.client.time_to_first_token",
+            unit="s",
+            description="Time until the first event of a streamed response",
+        )
+        self._output_tokens_per_second = meter.create_histogram(
+            "together.client.output_tokens_per_second",
+            unit="{token}/s",
+            description="Output tokens per second of a streamed response",
+        )
+        self._file_transferred = meter.create_counter(
+            "together.client.file.transferred",
+            unit="By",
+            description="Bytes of files uploaded and downloaded",
+        )
+        self._hooks: Dict[str, Hook] = {
+            "on_request": self._on_request,
+            "on_response": self._on_response,
+            "on_retry": self._on_retry,
+            "on_stream_event": self._on_stream_event,
+            "on_error": self._on_error,
+            "on_file_transfer": self._on_file_transfer,
+        }
+
+    def instrument(self, client: Together | AsyncTogether) -> None:
+        """Records the calls of `client`, including its file uploads and downloads."""
+        for name in HOOK_NAMES:
+            hooks = client.hooks.hooks[name]
+            if self._hooks[name] not in hooks:
+                hooks.append(self._hooks[name])
+
+    def uninstrument(self, client: Together | AsyncTogether) -> None:
+        """Stops recording the calls of `client`."""
+        for name in HOOK_NAMES:
+            hooks = client.hooks.hooks[name]
+            if self._hooks[name] in hooks:
+                hooks.remove(self._hooks[name])
+
+    def _attributes(self, event: RequestEvent) -> Dict[str, Any]:
+        """Attributes of the metrics of a call."""
+        url = urlsplit(event.url)
+        attributes: Dict[str, Any] = {
+            "gen_ai.provider.name": PROVIDER_NAME,
+            "server.address": url.hostname or "",
+        }
+        operation = _OPERATIONS.get(event.resource)
+        if operation is not None:
+            attributes["gen_ai.operation.name"] = operation
+        if event.model is not None:
+            attributes["gen_ai.request.model"] = event.model
+        return attributes
+
+    def _on_request(self, event: RequestEvent) -> None:
+        if event.attempt > 0:
+            span: Span | None = event.state.get("otel.span")
+            if span is not None:
+                span.set_attribute("http.request.resend_count", event.attempt)
+            return
+
+        url = urlsplit(event.url)
+        metric_attributes = self._attributes(event)
+        operation = metric_attributes.get("gen_ai.operation.name")
+        if operation is not None:
+            name = f"{operation} {event.model}" if event.model else operation
+        else:
+            # only the resource, as the rest of the path can hold IDs
+            name = f"{event.method} {event.resource}"
+        attributes = {
+            **metric_attributes,
+            "http.request.method": event.method,
+            "url.full": event.url,
+        }
+        if url.port is not None:
+            attributes["server.port"] = url.port
+        event.state["otel.span"] = self._tracer.start_span(
+            name, kind=SpanKind.CLIENT, attributes=attributes
+        )
+        event.state["otel.attributes"] = metric_attributes
+        event.state["otel.start_time"] = event.timing.start_time
+
+    def _on_retry(self, event: RequestEvent) -> None:
+        span: Span | None = event.state.get("otel.span")
+        if span is None:
+            return
+        attributes: Dict[str, Any] = {"together.retry_delay": event.retry_delay or 0}
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__qualname__
+        span.add_event("retry", attributes)
+
+    def _on_stream_event(self, event: RequestEvent) -> None:
+        state = event.state
+        if event.stream_event == 0 and "otel.start_time" in state:
+            state["otel.first_event_time"] = time.perf_counter()
+            self._time_to_first_token.record(
+                state["otel.first_event_time"] - state["otel.start_time"],
+                state["otel.attributes"],
+            )
+        if event.response is None or event.response.text is None:
+            return
+        if event.stream_event == 0:
+            state["otel.event"] = event.response
+        usage = event.usage()
+        if usage is not None:
+            # sent with the last event of the stream
+            state["otel.usage"] = usage
+            state["otel.event"] = event.response
+
+    def _end_span(self, event: RequestEvent, span: Span) -> None:
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        if event.request_id is not None:
+            span.set_attribute("together.request_id", event.request_id)
+        if event.processed_by is not None:
+            span.set_attribute("together.processed_by", event.processed_by)
+        span.end()
+
+    def _on_response(self, event: RequestEvent) -> None:
+        state = event.state
+        span: Span | None = state.pop("otel.span", None)
+        if span is None:
+            return
+        end_time = time.perf_counter()
+        attributes = state["otel.attributes"]
+
+        streamed = "otel.first_event_time" in state
+        if streamed:
+            response = state.get("otel.event")
+            usage = state.get("otel.usage")
+        else:
+            response = event.response
+            usage = event.usage()
+        data = response.data if response is not None else None
+        if isinstance(data, dict):
+            if isinstance(data.get("id"), str):
+                span.set_attribute("gen_ai.response.id", data["id"])
+            if isinstance(data.get("model"), str):
+                span.set_attribute("gen_ai.response.model", data["model"])
+
+        if usage is not None:
+            input_tokens = usage.get("prompt_tokens")
+            output_tokens = usage.get("completion_tokens")
+            for token_type, tokens in [
+                ("input", input_tokens),
+                ("output", output_tokens),
+            ]:
+                if isinstance(tokens, int):
+                    span.set_attribute(f"gen_ai.usage.{token_type}_tokens", tokens)
+                    self._token_usage.record(
+                        tokens, {**attributes, "gen_ai.token.type": token_type}
+                    )
+            if streamed and isinstance(output_tokens, int):
+                elapsed = end_time - state["otel.first_event_time"]
+                if elapsed > 0:
+                    self._output_tokens_per_second.record(
+                        output_tokens / elapsed, attributes
+                    )
+
+        self._duration.record(end_time - state["otel.start_time"], attributes)
+        self._end_span(event, span)
+
+    def _on_error(self, event: RequestEvent) -> None:
+        state = event.state
+        span: Span | None = state.pop("otel.span", None)
+        if span is None:
+            return
+        assert event.error is not None
+        error_type = type(event.error).__qualname__
+        span.record_exception(event.error)
+        span.set_status(Status(StatusCode.ERROR, str(event.error)))
+        span.set_attribute("error.type", error_type)
+        self._duration.record(
+            time.perf_counter() - state["otel.start_time"],
+            {**state["otel.attributes"], "error.type": error_type},
+        )
+        self._end_span(event, span)
+
+    def _on_file_transfer(self, event: RequestEvent) -> None:
+        self._file_transferred.add(
+            event.file_bytes or 0,
+            {
+                "gen_ai.provider.name": PROVIDER_NAME,
+                "together.file.direction": (
+                    "download" if event.method == "GET" else "upload"
+                ),
+            },
+        )
+
+
+def instrument(
+    client: Together | AsyncTogether,
+    *,
+    tracer_provider: trace.TracerProvider | None = None,
+    meter_provider: metrics.MeterProvider | None = None,
+) -> TogetherInstrumentor:
+    """
+    Records OpenTelemetry spans and metrics for the API calls of `client`, see
+    `TogetherInstrumentor`.
+
+    Args:
+        client (Together | AsyncTogether): Client to instrument.
+        tracer_provider (TracerProvider, optional): Provider of the tracer. Defaults to the
+            global tracer provider.
+        meter_provider (MeterProvider, optional): Provider of the meter. Defaults to the
+            global meter provider.
+
+    Returns:
+        TogetherInstrumentor: Instrumentor recording the calls, which can also instrument
+            other clients.
+    """
+    instrumentor = TogetherInstrumentor(tracer_provider, meter_provider)
+    instrumentor.instrument(client)
+    return instrumentor
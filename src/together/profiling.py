@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import inspect
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Tuple, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Set while a profiler records; checked before timing anything so that profiling costs a
+# global lookup per phase when disabled
+enabled = False
+
+_profiler: Profiler | None = None
+
+# profiled call running in the current thread or task
+_call: ContextVar[_Call | None] = ContextVar("together-profiled-call", default=None)
+
+# method of the phases recorded outside of a profiled method
+OTHER = "other"
+
+# phase covering the whole profiled call
+CALL = "call"
+
+# phases waiting on the network, which are not overhead of the SDK
+NETWORK_PHASES = ("send", "receive_body")
+
+
+@dataclass
+class PhaseStats:
+    """Time spent in one phase of a method, in nanoseconds."""
+
+    count: int = 0
+    total_ns: int = 0
+    min_ns: int = 0
+    max_ns: int = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def _add(self, elapsed_ns: int) -> None:
+        if not self.count or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+
+class Profiler:
+    """
+    Time spent in the internal phases of SDK calls, aggregated by method and phase.
+
+    Methods are the profiled resource methods, like `chat.completions.create`. Their
+    phases are:
+
+    - `call`: the whole call, until the response or stream is returned.
+    - `build_request`: validating the parameters into the request model and dumping it.
+    - `session`: getting the HTTP session of the thread, or opening an aiohttp session.
+    - `build_headers`, `encode_body`: the headers and JSON body of each attempt.
+    - `send`: sending each attempt that got a response until that response, including
+      its body when it is not streamed.
+    - `receive_body`: reading the body of responses of the async client.
+    - `decode_response`: checking the status and headers of the response, or of each
+      event of a stream.
+    - `parse_response`: building the response model, or the model of each event.
+
+    `send` and `receive_body` wait on the network; the other phases are overhead of the
+    SDK.
+    """
+
+    def __init__(self) -> None:
+        self._stats: Dict[Tuple[str, str], PhaseStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, method: str, phase: str, elapsed_ns: int) -> None:
+        with self._lock:
+            stats = self._stats.get((method, phase))
+            if stats is None:
+                stats = self._stats[method, phase] = PhaseStats()
+            stats._add(elapsed_ns)
+
+    def stats(self) -> Dict[str, Dict[str, PhaseStats]]:
+        """Stats recorded so far, by method and phase."""
+        stats: Dict[str, Dict[str, PhaseStats]] = {}
+        with self._lock:
+            for (method, phase), phase_stats in self._stats.items():
+                stats.setdefault(method, {})[phase] = PhaseStats(**phase_stats.__dict__)
+        return stats
+
+    def overhead_ns(self, method: str) -> float:
+        """Mean time spent in the SDK phases of each call of `method`."""
+        phases = self.stats().get(method, {})
+        calls = phases.get(CALL)
+        if calls is None or not calls.count:
+            return 0.0
+        sdk_ns = sum(
+            stats.total_ns
+            for phase, stats in phases.items()
+            if phase != CALL and phase not in NETWORK_PHASES
+        )
+        return sdk_ns / calls.count
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> str:
+        """Table of the stats by method and phase, in microseconds."""
+        lines = [
+            f"{'method':<32} {'phase':<16} {'count':>8} {'mean':>10} "
+            f"{'min':>10} {'max':>10} {'total':>12}"
+        ]
+        for method, phases in sorted(self.stats().items()):
+            for phase, stats in phases.items():
+                lines.append(
+                    f"{method:<32} {phase:<16} {stats.count:>8} "
+                    f"{stats.mean_ns / 1000:>10.1f} {stats.min_ns / 1000:>10.1f} "
+                    f"{stats.max_ns / 1000:>10.1f} {stats.total_ns / 1000:>12.1f}"
+                )
+            if CALL in phases:
+                lines.append(
+                    f"{method:<32} {'sdk overhead':<16} {phases[CALL].count:>8} "
+                    f"{self.overhead_ns(method) / 1000:>10.1f}"
+                )
+        return "\n".join(lines)
+
+
+class _Call:
+    """Profiled method being called."""
+
+    __slots__ = ("method", "start_ns")
+
+    def __init__(self, method: str, start_ns: int) -> None:
+        self.method = method
+        self.start_ns = start_ns
+
+
+def enable(profiler: Profiler | None = None) -> Profiler:
+    """Starts profiling SDK calls in all threads, into `profiler` or a new one."""
+    global enabled, _profiler
+    _profiler = profiler if profiler is not None else Profiler()
+    enabled = True
+    return _profiler
+
+
+def disable() -> None:
+    """Stops profiling SDK calls."""
+    global enabled, _profiler
+    enabled = False
+    _profiler = None
+
+
+def get_profiler() -> Profiler | None:
+    """Profiler recording SDK calls, if profiling is enabled."""
+    return _profiler
+
+
+@contextmanager
+def profile(profiler: Profiler | None = None) -> Iterator[Profiler]:
+    """
+    Profiles the SDK calls made while the block runs, in all threads.
+
+    Example:
+
+        with together.profiling.profile() as profiler:
+            client.chat.completions.create(...)
+        print(profiler.report())
+
+    Args:
+        profiler (Profiler, optional): Profiler to record into. Defaults to a new one.
+
+    Returns:
+        Profiler: Profiler recording the calls.
+    """
+    previous = _profiler
+    try:
+        yield enable(profiler)
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
+
+
+def record(phase: str, start_ns: int) -> None:
+    """Records the time since `start_ns`, a `perf_counter_ns` value, as `phase` of the
+    current profiled call."""
+    profiler = _profiler
+    if profiler is None:
+        return
+    call = _call.get()
+    profiler.record(
+        call.method if call is not None else OTHER,
+        phase,
+        perf_counter_ns() - start_ns,
+    )
+
+
+def record_since_call_start(phase: str) -> None:
+    """Records the time since the current profiled call started as `phase`."""
+    call = _call.get()
+    if call is not None:
+        record(phase, call.start_ns)
+
+
+def profiled(method: str) -> Callable[[F], F]:
+    """Decorates a resource method to attribute the phases of its calls to `method`.
+
+    Streams returned by the method are attributed to it as they are read.
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not enabled:
+                    return await func(*args, **kwargs)
+                call = _Call(method, perf_counter_ns())
+                token = _call.set(call)
+                try:
+                    result = await func(*args, **kwargs)
+                finally:
+                    record(CALL, call.start_ns)
+                    _call.reset(token)
+                if inspect.isasyncgen(result):
+                    return _profile_async_stream(call, result)
+                return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not enabled:
+                return func(*args, **kwargs)
+            call = _Call(method, perf_counter_ns())
+            token = _call.set(call)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                record(CALL, call.start_ns)
+                _call.reset(token)
+            if inspect.isgenerator(result):
+                return _profile_stream(call, result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _profile_stream(call: _Call, stream: Iterator[Any]) -> Iterator[Any]:
+    """Reads `stream` as part of `call`."""
+    try:
+        while True:
+            token = _call.set(call)
+            try:
+                item = next(stream)
+            except StopIteration:
+                return
+            finally:
+                _call.reset(token)
+            yield item
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+
+
+async def _profile_async_stream(
+    call: _Call, stream: AsyncIterator[Any]
+) -> AsyncIterator[Any]:
+    """Reads `stream` as part of `call`."""
+    try:
+        while True:
+            token = _call.set(call)
+            try:
+                item = await stream.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _call.reset(token)
+            yield item
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _report_at_exit(profiler: Profiler) -> None:
+    print(profiler.report(), file=sys.stderr)
+
+
+if os.environ.get("TOGETHER_PROFILE"):
+    # profiles the whole process and prints the stats when it exits
+    atexit.register(_report_at_exit, enable())
@@ -12,6 +12,7 @@ from together.types import (
     AudioSpeechStreamChunk,
     AudioSpeechStreamEvent,
     AudioSpeechStreamResponse,
+    Deadlines,
     TogetherClient,
     TogetherRequest,
 )
@@ -32,6 +33,7 @@ class Speech:
         response_encoding: str = "pcm_f32le",
         sample_rate: int | None = None,
         stream: bool = False,
+        deadlines: Deadlines | None = None,
         **kwargs: Any,
     ) -> AudioSpeechStreamResponse:
         """
@@ -52,6 +54,8 @@ class Speech:
                 Defaults to None. If not provided, the default sampling rate for the model will be used.
             stream (bool, optional): If true, output is streamed for several characters at a time.
                 Defaults to False.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                streamed event, instead of those of the client. Defaults to None.
 
         Returns:
             Union[bytes, Iterator[AudioSpeechStreamChunk]]: The generated audio as bytes or an iterator over audio stream chunks.
@@ -84,11 +88,17 @@ class Speech:
                 method="POST",
                 url="audio/speech",
                 params=parameter_payload,
+                deadlines=deadlines,
             ),
             stream=stream,
         )
 
-        return AudioSpeechStreamResponse(response=response)
+        return AudioSpeechStreamResponse(
+            response=response,
+            response_format=response_format,
+            response_encoding=response_encoding,
+            sample_rate=sample_rate,
+        )
 
 
 class AsyncSpeech:
@@ -106,6 +116,7 @@ class AsyncSpeech:
         response_encoding: str = "pcm_f32le",
         sample_rate: int = 44100,
         stream: bool = False,
+        deadlines: Deadlines | None = None,
         **kwargs: Any,
     ) -> AudioSpeechStreamResponse:
         """
@@ -126,6 +137,8 @@ class AsyncSpeech:
                 Defaults to 44100.
             stream (bool, optional): If true, output is streamed for several characters at a time.
                 Defaults to False.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                streamed event, instead of those of the client. Defaults to None.
 
         Returns:
             Union[bytes, AsyncGenerator[AudioSpeechStreamChunk, None]]: The generated audio as bytes or an async generator over audio stream chunks.
@@ -152,8 +165,14 @@ class AsyncSpeech:
                 method="POST",
                 url="audio/speech",
                 params=parameter_payload,
+                deadlines=deadlines,
             ),
             stream=stream,
         )
 
-        return AudioSpeechStreamResponse(response=response)
+        return AudioSpeechStreamResponse(
+            response=response,
+            response_format=response_format,
+            response_encoding=response_encoding,
+            sample_rate=sample_rate,
+        )
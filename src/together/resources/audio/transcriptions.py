@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import io
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
 
 from together.abstract import api_requestor
+from together.constants import (
+    AUDIO_CHUNK_CONCURRENCY,
+    AUDIO_CHUNK_DURATION,
+    AUDIO_CHUNK_OVERLAP,
+)
 from together.types import (
     AudioTimestampGranularities,
     AudioTranscriptionResponse,
@@ -12,6 +21,13 @@ from together.types import (
     TogetherClient,
     TogetherRequest,
 )
+from together.utils.audio import (
+    AudioChunk,
+    merge_transcriptions,
+    prepare_wav,
+    read_audio_chunk,
+    split_audio,
+)
 
 
 class Transcriptions:
@@ -150,6 +166,82 @@ class Transcriptions:
         else:
             return AudioTranscriptionResponse(**response.data)
 
+    def create_long(
+        self,
+        *,
+        file: Union[str, BinaryIO, Path],
+        model: str = "openai/whisper-large-v3",
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: float = 0.0,
+        timestamp_granularities: Optional[
+            Union[str, AudioTimestampGranularities]
+        ] = None,
+        diarize: bool = False,
+        chunk_duration: float = AUDIO_CHUNK_DURATION,
+        overlap: float = AUDIO_CHUNK_OVERLAP,
+        split_on_silence: bool = True,
+        max_concurrency: int = AUDIO_CHUNK_CONCURRENCY,
+        **kwargs: Any,
+    ) -> AudioTranscriptionVerboseResponse:
+        """
+        Transcribes a long audio file in chunks, sent in parallel.
+
+        The file is split into chunks of at most `chunk_duration` seconds, cut at silence
+        where possible, which are transcribed concurrently and stitched back together
+        with corrected timestamps. WAV files are split with the `wave` module; other
+        formats are converted with ffmpeg, which must be installed.
+
+        Args:
+            file: Local audio file path (str/Path) or file object (BinaryIO).
+            model: ID of the model to use. Defaults to "openai/whisper-large-v3".
+            language: The language of the input audio, in ISO-639-1 format.
+            prompt: An optional text to guide the model's style, sent with every chunk.
+            temperature: The sampling temperature, between 0 and 1.
+            timestamp_granularities: The timestamp granularities to populate: word, or segment.
+            diarize: Whether to enable speaker diarization. Speakers are matched across chunks
+                by the words transcribed in their overlap; speakers that can't be matched get
+                IDs suffixed with the chunk index.
+            chunk_duration: Longest chunk, in seconds. Defaults to 300.
+            overlap: Seconds of audio shared by consecutive chunks. Defaults to 2.
+            split_on_silence: Whether to cut chunks at the quietest point before each
+                boundary instead of at fixed windows. Defaults to True.
+            max_concurrency: Number of chunks transcribed at the same time. Defaults to 4.
+        Returns:
+            The verbose transcription of the whole file.
+        """
+
+        if isinstance(file, str) and file.startswith(("http://", "https://")):
+            raise ValueError(
+                "Chunked transcription requires a local file or file object"
+            )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = prepare_wav(file, directory)
+            chunks = split_audio(path, chunk_duration, overlap, split_on_silence)
+
+            def transcribe(chunk: AudioChunk) -> AudioTranscriptionVerboseResponse:
+                buffer = io.BytesIO(read_audio_chunk(path, chunk))
+                buffer.name = f"chunk_{chunk.index}.wav"
+                response = self.create(
+                    file=buffer,
+                    model=model,
+                    language=language,
+                    prompt=prompt,
+                    response_format="verbose_json",
+                    temperature=temperature,
+                    timestamp_granularities=timestamp_granularities,
+                    diarize=diarize,
+                    **kwargs,
+                )
+                assert isinstance(response, AudioTranscriptionVerboseResponse)
+                return response
+
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                responses = list(executor.map(transcribe, chunks))
+
+        return merge_transcriptions(chunks, responses)
+
 
 class AsyncTranscriptions:
     def __init__(self, client: TogetherClient) -> None:
@@ -294,3 +386,87 @@ class AsyncTranscriptions:
             return AudioTranscriptionVerboseResponse.model_validate(response.data)
         else:
             return AudioTranscriptionResponse(**response.data)
+
+    async def create_long(
+        self,
+        *,
+        file: Union[str, BinaryIO, Path],
+        model: str = "openai/whisper-large-v3",
+        language: Optional[str] = None,
+        prompt: Optional[str] = None,
+        temperature: float = 0.0,
+        timestamp_granularities: Optional[
+            Union[str, AudioTimestampGranularities]
+        ] = None,
+        diarize: bool = False,
+        chunk_duration: float = AUDIO_CHUNK_DURATION,
+        overlap: float = AUDIO_CHUNK_OVERLAP,
+        split_on_silence: bool = True,
+        max_concurrency: int = AUDIO_CHUNK_CONCURRENCY,
+        **kwargs: Any,
+    ) -> AudioTranscriptionVerboseResponse:
+        """
+        Async version of transcribing a long audio file in chunks.
+
+        The file is split into chunks of at most `chunk_duration` seconds, cut at silence
+        where possible, which are transcribed concurrently and stitched back together
+        with corrected timestamps. WAV files are split with the `wave` module; other
+        formats are converted with ffmpeg, which must be installed.
+
+        Args:
+            file: Local audio file path (str/Path) or file object (BinaryIO).
+            model: ID of the model to use. Defaults to "openai/whisper-large-v3".
+            language: The language of the input audio, in ISO-639-1 format.
+            prompt: An optional text to guide the model's style, sent with every chunk.
+            temperature: The sampling temperature, between 0 and 1.
+            timestamp_granularities: The timestamp granularities to populate: word, or segment.
+            diarize: Whether to enable speaker diarization. Speakers are matched across chunks
+                by the words transcribed in their overlap; speakers that can't be matched get
+                IDs suffixed with the chunk index.
+            chunk_duration: Longest chunk, in seconds. Defaults to 300.
+            overlap: Seconds of audio shared by consecutive chunks. Defaults to 2.
+            split_on_silence: Whether to cut chunks at the quietest point before each
+                boundary instead of at fixed windows. Defaults to True.
+            max_concurrency: Number of chunks transcribed at the same time. Defaults to 4.
+        Returns:
+            The verbose transcription of the whole file.
+        """
+
+        if isinstance(file, str) and file.startswith(("http://", "https://")):
+            raise ValueError(
+                "Chunked transcription requires a local file or file object"
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = await asyncio.to_thread(prepare_wav, file, directory)
+            chunks = await asyncio.to_thread(
+                split_audio, path, chunk_duration, overlap, split_on_silence
+            )
+
+            async def transcribe(
+                chunk: AudioChunk,
+            ) -> AudioTranscriptionVerboseResponse:
+                async with semaphore:
+                    buffer = io.BytesIO(
+                        await asyncio.to_thread(read_audio_chunk, path, chunk)
+                    )
+                    buffer.name = f"chunk_{chunk.index}.wav"
+                    response = await self.create(
+                        file=buffer,
+                        model=model,
+                        language=language,
+                        prompt=prompt,
+                        response_format="verbose_json",
+                        temperature=temperature,
+                        timestamp_granularities=timestamp_granularities,
+                        diarize=diarize,
+                        **kwargs,
+                    )
+                assert isinstance(response, AudioTranscriptionVerboseResponse)
+                return response
+
+            responses = await asyncio.gather(*(transcribe(chunk) for chunk in chunks))
+
+        return merge_transcriptions(chunks, responses)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Iterable, List
 
 from together.abstract import api_requestor
 from together.together_response import TogetherResponse
@@ -9,6 +9,12 @@ from together.types import (
     TogetherRequest,
     BatchJob,
 )
+from together.utils.waiters import (
+    BATCH_JOB,
+    PollingPolicy,
+    async_wait_for_job,
+    wait_for_job,
+)
 
 
 class Batches:
@@ -55,6 +61,65 @@ class Batches:
         assert isinstance(response, TogetherResponse)
         return BatchJob(**response.data)
 
+    def wait(
+        self,
+        batch_job_id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> BatchJob:
+        """
+        Waits for a batch job to complete, fail, expire or be cancelled.
+
+        Args:
+            batch_job_id (str): ID of the batch job.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds at
+                first, backing off to once a minute.
+
+        Returns:
+            BatchJob: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return wait_for_job(
+            batch_job_id, self.get_batch, BATCH_JOB, timeout=timeout, policy=policy
+        )
+
+    def wait_until(
+        self,
+        batch_job_id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> BatchJob:
+        """
+        Waits for a batch job to reach one of `states`.
+
+        Args:
+            batch_job_id (str): ID of the batch job.
+            states (str | Iterable[str]): Job statuses, like `"IN_PROGRESS"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            BatchJob: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return wait_for_job(
+            batch_job_id,
+            self.get_batch,
+            BATCH_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     def list_batches(self) -> List[BatchJob]:
         requestor = api_requestor.APIRequestor(
             client=self._client,
@@ -132,6 +197,65 @@ class AsyncBatches:
         assert isinstance(response, TogetherResponse)
         return BatchJob(**response.data)
 
+    async def wait(
+        self,
+        batch_job_id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> BatchJob:
+        """
+        Waits for a batch job to complete, fail, expire or be cancelled.
+
+        Args:
+            batch_job_id (str): ID of the batch job.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds at
+                first, backing off to once a minute.
+
+        Returns:
+            BatchJob: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return await async_wait_for_job(
+            batch_job_id, self.get_batch, BATCH_JOB, timeout=timeout, policy=policy
+        )
+
+    async def wait_until(
+        self,
+        batch_job_id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> BatchJob:
+        """
+        Waits for a batch job to reach one of `states`.
+
+        Args:
+            batch_job_id (str): ID of the batch job.
+            states (str | Iterable[str]): Job statuses, like `"IN_PROGRESS"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            BatchJob: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return await async_wait_for_job(
+            batch_job_id,
+            self.get_batch,
+            BATCH_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     async def list_batches(self) -> List[BatchJob]:
         requestor = api_requestor.APIRequestor(
             client=self._client,
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from typing import Any, AsyncGenerator, Dict, Iterator, List
 
+from together import profiling
 from together.abstract import api_requestor
-from together.together_response import TogetherResponse
+from together.together_response import RawResponse, TogetherResponse
 from together.types import (
     ChatCompletionChunk,
     ChatCompletionRequest,
     ChatCompletionResponse,
+    Deadlines,
     TogetherClient,
     TogetherRequest,
 )
@@ -17,6 +19,7 @@ class ChatCompletions:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("chat.completions.create")
     def create(
         self,
         *,
@@ -41,6 +44,7 @@ class ChatCompletions:
         response_format: Dict[str, Any] | None = None,
         tools: List[Dict[str, Any]] | None = None,
         tool_choice: str | Dict[str, str | Dict[str, str]] | None = None,
+        deadlines: Deadlines | None = None,
         **kwargs: Any,
     ) -> ChatCompletionResponse | Iterator[ChatCompletionChunk]:
         """
@@ -103,6 +107,8 @@ class ChatCompletions:
                     via {"type": "function", "function": {"name": "my_function"}} forces the model to call that function.
                     Sets to `auto` if None.
                 Defaults to None.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                streamed event, instead of those of the client. Defaults to None.
 
         Returns:
             ChatCompletionResponse | Iterator[ChatCompletionChunk]: Object containing the completions
@@ -143,6 +149,7 @@ class ChatCompletions:
                 method="POST",
                 url="chat/completions",
                 params=parameter_payload,
+                deadlines=deadlines,
             ),
             stream=stream,
         )
@@ -150,15 +157,67 @@ class ChatCompletions:
         if stream:
             # must be an iterator
             assert not isinstance(response, TogetherResponse)
-            return (ChatCompletionChunk(**line.data) for line in response)
+            lines = response
+
+            def parse_chunks() -> Iterator[ChatCompletionChunk]:
+                # close the response even if the caller stops early
+                try:
+                    for line in lines:
+                        yield line.parse(ChatCompletionChunk)
+                finally:
+                    close = getattr(lines, "close", None)
+                    if close is not None:
+                        close()
+
+            return parse_chunks()
         assert isinstance(response, TogetherResponse)
-        return ChatCompletionResponse(**response.data)
+        return response.parse(ChatCompletionResponse)
+
+    def create_raw(
+        self,
+        body: bytes | str,
+        *,
+        stream: bool = False,
+        deadlines: Deadlines | None = None,
+    ) -> RawResponse:
+        """
+        Method to forward a pre-serialized chat completion request, for proxies.
+
+        The body is sent as is and the response is returned undecoded, skipping request and
+        response models while keeping retries, authentication and connection pooling.
+
+        Args:
+            body (bytes | str): JSON request body.
+            stream (bool, optional): Whether the body requests a streamed response, in which case
+                the raw server-sent event bytes are returned as an iterator in `chunks`.
+                Defaults to False.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                chunk of a stream, instead of those of the client. Defaults to None.
+
+        Returns:
+            RawResponse: Status code, headers and undecoded body of the response.
+        """
+
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
+
+        return requestor.request_passthrough(
+            options=TogetherRequest(
+                method="POST",
+                url="chat/completions",
+                body=body.encode() if isinstance(body, str) else body,
+                deadlines=deadlines,
+            ),
+            stream=stream,
+        )
 
 
 class AsyncChatCompletions:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("chat.completions.create")
     async def create(
         self,
         *,
@@ -183,6 +242,7 @@ class AsyncChatCompletions:
         response_format: Dict[str, Any] | None = None,
         tools: Dict[str, str | Dict[str, str | Dict[str, Any]]] | None = None,
         tool_choice: str | Dict[str, str | Dict[str, str]] | None = None,
+        deadlines: Deadlines | None = None,
         **kwargs: Any,
     ) -> AsyncGenerator[ChatCompletionChunk, None] | ChatCompletionResponse:
         """
@@ -245,6 +305,8 @@ class AsyncChatCompletions:
                     via {"type": "function", "function": {"name": "my_function"}} forces the model to call that function.
                     Sets to `auto` if None.
                 Defaults to None.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                streamed event, instead of those of the client. Defaults to None.
 
         Returns:
             AsyncGenerator[ChatCompletionChunk, None] | ChatCompletionResponse: Object containing the completions
@@ -285,6 +347,7 @@ class AsyncChatCompletions:
                 method="POST",
                 url="chat/completions",
                 params=parameter_payload,
+                deadlines=deadlines,
             ),
             stream=stream,
         )
@@ -292,6 +355,56 @@ class AsyncChatCompletions:
         if stream:
             # must be an iterator
             assert not isinstance(response, TogetherResponse)
-            return (ChatCompletionChunk(**line.data) async for line in response)
+            lines = response
+
+            async def parse_chunks() -> AsyncGenerator[ChatCompletionChunk, None]:
+                # close the response even if the caller stops early
+                try:
+                    async for line in lines:
+                        yield line.parse(ChatCompletionChunk)
+                finally:
+                    await lines.aclose()
+
+            return parse_chunks()
         assert isinstance(response, TogetherResponse)
-        return ChatCompletionResponse(**response.data)
+        return response.parse(ChatCompletionResponse)
+
+    async def create_raw(
+        self,
+        body: bytes | str,
+        *,
+        stream: bool = False,
+        deadlines: Deadlines | None = None,
+    ) -> RawResponse:
+        """
+        Method to forward a pre-serialized chat completion request, for proxies.
+
+        The body is sent as is and the response is returned undecoded, skipping request and
+        response models while keeping authentication and connection pooling. As with the other
+        async methods, failed requests are not retried.
+
+        Args:
+            body (bytes | str): JSON request body.
+            stream (bool, optional): Whether the body requests a streamed response, in which case
+                the raw server-sent event bytes are returned as an async iterator in `chunks`.
+                Defaults to False.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                chunk of a stream, instead of those of the client. Defaults to None.
+
+        Returns:
+            RawResponse: Status code, headers and undecoded body of the response.
+        """
+
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
+
+        return await requestor.arequest_passthrough(
+            options=TogetherRequest(
+                method="POST",
+                url="chat/completions",
+                body=body.encode() if isinstance(body, str) else body,
+                deadlines=deadlines,
+            ),
+            stream=stream,
+        )
@@ -1,14 +1,77 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 from pydantic import ValidationError
 
 from together.abstract import api_requestor
+from together.constants import (
+    CODE_INTERPRETER_MAX_SESSIONS,
+    CODE_INTERPRETER_SESSION_IDLE_TIMEOUT,
+)
 from together.together_response import TogetherResponse
 from together.types import TogetherClient, TogetherRequest
 from together.types.code_interpreter import ExecuteResponse, FileInput
 
 
+def _validate_files(files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    serialized_files = []
+    try:
+        for file_dict in files:
+            # Validate the dictionary by creating a FileInput instance
+            validated_file = FileInput(**file_dict)
+            # Serialize the validated model back to a dict for the API call
+            serialized_files.append(validated_file.model_dump())
+    except ValidationError as e:
+        raise ValueError(f"Invalid file input format: {e}") from e
+    except TypeError as e:
+        raise ValueError(
+            f"Invalid file input: Each item in 'files' must be a dictionary. Error: {e}"
+        ) from e
+    return serialized_files
+
+
+def _execute_request(
+    code: str,
+    language: str,
+    session_id: Optional[str],
+    files: Optional[List[Dict[str, Any]]],
+) -> TogetherRequest:
+    data: Dict[str, Any] = {
+        "code": code,
+        "language": language,
+    }
+
+    if session_id is not None:
+        data["session_id"] = session_id
+
+    if files is not None:
+        data["files"] = _validate_files(files)
+
+    # Use absolute URL to bypass the /v1 prefix
+    return TogetherRequest(
+        method="POST",
+        url="/tci/execute",
+        params=data,
+    )
+
+
 class CodeInterpreter:
     """Code Interpreter resource for executing code snippets."""
 
@@ -41,38 +104,8 @@ class CodeInterpreter:
             client=self._client,
         )
 
-        data: Dict[str, Any] = {
-            "code": code,
-            "language": language,
-        }
-
-        if session_id is not None:
-            data["session_id"] = session_id
-
-        if files is not None:
-            serialized_files = []
-            try:
-                for file_dict in files:
-                    # Validate the dictionary by creating a FileInput instance
-                    validated_file = FileInput(**file_dict)
-                    # Serialize the validated model back to a dict for the API call
-                    serialized_files.append(validated_file.model_dump())
-            except ValidationError as e:
-                raise ValueError(f"Invalid file input format: {e}") from e
-            except TypeError as e:
-                raise ValueError(
-                    f"Invalid file input: Each item in 'files' must be a dictionary. Error: {e}"
-                ) from e
-
-            data["files"] = serialized_files
-
-        # Use absolute URL to bypass the /v1 prefix
         response, _, _ = requestor.request(
-            options=TogetherRequest(
-                method="POST",
-                url="/tci/execute",
-                params=data,
-            ),
+            options=_execute_request(code, language, session_id, files),
             stream=False,
         )
 
@@ -80,3 +113,374 @@ class CodeInterpreter:
 
         # Return the response data directly since our types match the API structure
         return ExecuteResponse(**response.data)
+
+
+class AsyncCodeInterpreter:
+    """Async Code Interpreter resource for executing code snippets."""
+
+    def __init__(self, client: TogetherClient) -> None:
+        self._client = client
+
+    async def run(
+        self,
+        code: str,
+        language: Literal["python"],
+        session_id: Optional[str] = None,
+        files: Optional[List[Dict[str, Any]]] = None,
+    ) -> ExecuteResponse:
+        """Async version of executing a code snippet, optionally with files.
+
+        Args:
+            code (str): Code snippet to execute
+            language (str): Programming language for the code to execute. Currently only supports Python.
+            session_id (str, optional): Identifier of the current session. Used to make follow-up calls.
+            files (List[Dict], optional): Files to upload to the session before executing the code.
+
+        Returns:
+            ExecuteResponse: Object containing execution results and outputs
+        """
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
+
+        response, _, _ = await requestor.arequest(
+            options=_execute_request(code, language, session_id, files),
+            stream=False,
+        )
+
+        assert isinstance(response, TogetherResponse)
+
+        return ExecuteResponse(**response.data)
+
+
+class _Session:
+    """A code interpreter session and the files uploaded to it."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        # set by the first execution
+        self.session_id: str | None = None
+        # hashes of the files uploaded to the session
+        self.uploaded: Set[str] = set()
+        self.last_used = time.monotonic()
+
+
+def _file_hash(file: Dict[str, Any]) -> str:
+    digest = hashlib.sha256()
+    for part in (file["name"], file["encoding"], file["content"]):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class _SessionPoolBase:
+    def __init__(
+        self,
+        max_sessions_per_key: int,
+        idle_timeout: float | None,
+    ) -> None:
+        if max_sessions_per_key < 1:
+            raise ValueError("max_sessions_per_key must be at least 1")
+        self.max_sessions_per_key = max_sessions_per_key
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[str, List[_Session]] = {}
+        self._num_sessions: Dict[str, int] = {}
+
+    def _take_idle(self, key: str) -> _Session | None:
+        """Pop the most recently used idle session of `key`, dropping expired ones.
+
+        Must be called with the pool lock held.
+        """
+        idle = self._idle.get(key, [])
+        now = time.monotonic()
+        while idle:
+            session = idle.pop()
+            if self.idle_timeout is None or now - session.last_used < self.idle_timeout:
+                return session
+            self._num_sessions[key] -= 1
+        if self._num_sessions.get(key, 0) < self.max_sessions_per_key:
+            self._num_sessions[key] = self._num_sessions.get(key, 0) + 1
+            return _Session(key)
+        return None
+
+    def _put_back(self, session: _Session, discard: bool) -> None:
+        """Must be called with the pool lock held."""
+        if discard:
+            self._num_sessions[session.key] -= 1
+        else:
+            self._idle.setdefault(session.key, []).append(session)
+
+    @staticmethod
+    def _pending_files(
+        session: _Session, files: Optional[List[Dict[str, Any]]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Files not uploaded to `session` yet, and their hashes."""
+        pending: List[Dict[str, Any]] = []
+        hashes: List[str] = []
+        for file in _validate_files(files or []):
+            file_hash = _file_hash(file)
+            if file_hash not in session.uploaded and file_hash not in hashes:
+                pending.append(file)
+                hashes.append(file_hash)
+        return pending, hashes
+
+    @staticmethod
+    def _record(
+        session: _Session, response: ExecuteResponse, hashes: List[str]
+    ) -> bool:
+        """Record an execution in `session`, and return whether the server replaced it."""
+        # the session expired on the server and was replaced by a new one
+        replaced = session.session_id not in (None, response.data.session_id)
+        if replaced:
+            session.uploaded.clear()
+        session.session_id = response.data.session_id
+        session.uploaded.update(hashes)
+        session.last_used = time.monotonic()
+        return replaced
+
+    def _rerun_files(
+        self,
+        session: _Session,
+        response: ExecuteResponse,
+        files: Optional[List[Dict[str, Any]]],
+        hashes: List[str],
+    ) -> Tuple[List[Dict[str, Any]], List[str]] | None:
+        """
+        Record an execution, and return all files and their hashes when it ran in a new
+        session without some of them, as they were only uploaded to the replaced one.
+        """
+        if not self._record(session, response, hashes):
+            return None
+        if not self._pending_files(session, files)[0]:
+            return None
+        session.uploaded.clear()
+        return self._pending_files(session, files)
+
+
+class PooledSession:
+    """A session checked out of a `CodeInterpreterSessionPool`."""
+
+    def __init__(self, pool: CodeInterpreterSessionPool, session: _Session) -> None:
+        self._pool = pool
+        self._session = session
+
+    @property
+    def session_id(self) -> str | None:
+        return self._session.session_id
+
+    def run(
+        self,
+        code: str,
+        files: Optional[List[Dict[str, Any]]] = None,
+        language: Literal["python"] = "python",
+    ) -> ExecuteResponse:
+        """Execute a code snippet in this session, uploading the files it doesn't have yet."""
+        return self._pool._execute(self._session, code, files, language)
+
+
+class CodeInterpreterSessionPool(_SessionPoolBase):
+    """
+    Keeps warm code interpreter sessions per workload key and reuses them across calls.
+
+    Each session runs one snippet at a time, so snippets for the same key run concurrently
+    on up to `max_sessions_per_key` sessions. Input files are uploaded once per session;
+    files already uploaded, identified by a hash of their name and content, are not sent
+    again. If the server replaces an expired session, a snippet that ran in the new session
+    without the files uploaded to the old one is run again with all of them.
+
+    Example:
+        >>> pool = CodeInterpreterSessionPool(client.code_interpreter)
+        >>> pool.run("import pandas as pd", key="analysis", files=[data_file])
+        >>> with pool.session("analysis") as session:  # snippets that share state
+        ...     session.run("x = 1")
+        ...     session.run("print(x)")
+
+    Args:
+        interpreter (CodeInterpreter): Interpreter used to execute the snippets.
+        max_sessions_per_key (int, optional): Most sessions kept for each key. Defaults to 4.
+        idle_timeout (float, optional): Seconds after which an idle session is replaced, as
+            the server may have ended it. Defaults to 30 minutes; None keeps sessions forever.
+    """
+
+    def __init__(
+        self,
+        interpreter: CodeInterpreter,
+        max_sessions_per_key: int = CODE_INTERPRETER_MAX_SESSIONS,
+        idle_timeout: float | None = CODE_INTERPRETER_SESSION_IDLE_TIMEOUT,
+    ) -> None:
+        super().__init__(max_sessions_per_key, idle_timeout)
+        self._interpreter = interpreter
+        self._available = threading.Condition()
+
+    def _execute(
+        self,
+        session: _Session,
+        code: str,
+        files: Optional[List[Dict[str, Any]]],
+        language: Literal["python"],
+    ) -> ExecuteResponse:
+        pending, hashes = self._pending_files(session, files)
+        response = self._interpreter.run(
+            code,
+            language,
+            session_id=session.session_id,
+            files=pending or None,
+        )
+        rerun = self._rerun_files(session, response, files, hashes)
+        if rerun is not None:
+            pending, hashes = rerun
+            response = self._interpreter.run(
+                code, language, session_id=session.session_id, files=pending
+            )
+            self._record(session, response, hashes)
+        return response
+
+    @contextmanager
+    def session(self, key: str = "default") -> Iterator[PooledSession]:
+        """Check out a session of `key` for snippets that depend on each other."""
+        with self._available:
+            session = self._take_idle(key)
+            while session is None:
+                self._available.wait()
+                session = self._take_idle(key)
+
+        discard = True
+        try:
+            yield PooledSession(self, session)
+            discard = False
+        finally:
+            with self._available:
+                self._put_back(session, discard)
+                self._available.notify_all()
+
+    def run(
+        self,
+        code: str,
+        key: str = "default",
+        files: Optional[List[Dict[str, Any]]] = None,
+        language: Literal["python"] = "python",
+    ) -> ExecuteResponse:
+        """Execute a code snippet in an idle session of `key`, waiting for one if needed."""
+        with self.session(key) as session:
+            return session.run(code, files, language)
+
+    def run_many(
+        self,
+        codes: Sequence[str],
+        key: str = "default",
+        files: Optional[List[Dict[str, Any]]] = None,
+        language: Literal["python"] = "python",
+    ) -> List[ExecuteResponse]:
+        """Execute independent snippets concurrently on the sessions of `key`."""
+        with ThreadPoolExecutor(max_workers=self.max_sessions_per_key) as executor:
+            return list(
+                executor.map(lambda code: self.run(code, key, files, language), codes)
+            )
+
+
+class AsyncPooledSession:
+    """A session checked out of an `AsyncCodeInterpreterSessionPool`."""
+
+    def __init__(
+        self, pool: AsyncCodeInterpreterSessionPool, session: _Session
+    ) -> None:
+        self._pool = pool
+        self._session = session
+
+    @property
+    def session_id(self) -> str | None:
+        return self._session.session_id
+
+    async def run(
+        self,
+        code: str,
+        files: Optional[List[Dict[str, Any]]] = None,
+        language: Literal["python"] = "python",
+    ) -> ExecuteResponse:
+        """Execute a code snippet in this session, uploading the files it doesn't have yet."""
+        return await self._pool._execute(self._session, code, files, language)
+
+
+class AsyncCodeInterpreterSessionPool(_SessionPoolBase):
+    """Async version of `CodeInterpreterSessionPool`.
+
+    Example:
+        >>> pool = AsyncCodeInterpreterSessionPool(async_client.code_interpreter)
+        >>> results = await pool.run_many(snippets, key="analysis", files=[data_file])
+    """
+
+    def __init__(
+        self,
+        interpreter: AsyncCodeInterpreter,
+        max_sessions_per_key: int = CODE_INTERPRETER_MAX_SESSIONS,
+        idle_timeout: float | None = CODE_INTERPRETER_SESSION_IDLE_TIMEOUT,
+    ) -> None:
+        super().__init__(max_sessions_per_key, idle_timeout)
+        self._interpreter = interpreter
+        self._available = asyncio.Condition()
+
+    async def _execute(
+        self,
+        session: _Session,
+        code: str,
+        files: Optional[List[Dict[str, Any]]],
+        language: Literal["python"],
+    ) -> ExecuteResponse:
+        pending, hashes = self._pending_files(session, files)
+        response = await self._interpreter.run(
+            code,
+            language,
+            session_id=session.session_id,
+            files=pending or None,
+        )
+        rerun = self._rerun_files(session, response, files, hashes)
+        if rerun is not None:
+            pending, hashes = rerun
+            response = await self._interpreter.run(
+                code, language, session_id=session.session_id, files=pending
+            )
+            self._record(session, response, hashes)
+        return response
+
+    @asynccontextmanager
+    async def session(self, key: str = "default") -> AsyncIterator[AsyncPooledSession]:
+        """Check out a session of `key` for snippets that depend on each other."""
+        async with self._available:
+            session = self._take_idle(key)
+            while session is None:
+                await self._available.wait()
+                session = self._take_idle(key)
+
+        discard = True
+        try:
+            yield AsyncPooledSession(self, session)
+            discard = False
+        finally:
+            async with self._available:
+                self._put_back(session, discard)
+                self._available.notify_all()
+
+    async def run(
+        self,
+        code: str,
+        key: str = "default",
+        files: Optional[List[Dict[str, Any]]] = None,
+        language: Literal["python"] = "python",
+    ) -> ExecuteResponse:
+        """Execute a code snippet in an idle session of `key`, waiting for one if needed."""
+        async with self.session(key) as session:
+            return await session.run(code, files, language)
+
+    async def run_many(
+        self,
+        codes: Sequence[str],
+        key: str = "default",
+        files: Optional[List[Dict[str, Any]]] = None,
+        language: Literal["python"] = "python",
+    ) -> List[ExecuteResponse]:
+        """Execute independent snippets concurrently on the sessions of `key`."""
+        return list(
+            await asyncio.gather(
+                *(self.run(code, key, files, language) for code in codes)
+            )
+        )
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 from typing import AsyncGenerator, Dict, Iterator, List, Any
 
+from together import profiling
 from together.abstract import api_requestor
-from together.together_response import TogetherResponse
+from together.together_response import RawResponse, TogetherResponse
 from together.types import (
     CompletionChunk,
     CompletionRequest,
     CompletionResponse,
+    Deadlines,
     TogetherClient,
     TogetherRequest,
 )
@@ -17,6 +19,7 @@ class Completions:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("completions.create")
     def create(
         self,
         *,
@@ -38,6 +41,7 @@ class Completions:
         echo: bool | None = None,
         n: int | None = None,
         safety_model: str | None = None,
+        deadlines: Deadlines | None = None,
         **kwargs: Any,
     ) -> CompletionResponse | Iterator[CompletionChunk]:
         """
@@ -88,6 +92,8 @@ class Completions:
             safety_model (str, optional): A moderation model to validate tokens. Choice between available moderation
                     models found [here](https://docs.together.ai/docs/inference-models#moderation-models).
                 Defaults to None.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                streamed event, instead of those of the client. Defaults to None.
 
         Returns:
             CompletionResponse | Iterator[CompletionChunk]: Object containing the completions
@@ -125,6 +131,7 @@ class Completions:
                 method="POST",
                 url="completions",
                 params=parameter_payload,
+                deadlines=deadlines,
             ),
             stream=stream,
         )
@@ -132,15 +139,67 @@ class Completions:
         if stream:
             # must be an iterator
             assert not isinstance(response, TogetherResponse)
-            return (CompletionChunk(**line.data) for line in response)
+            lines = response
+
+            def parse_chunks() -> Iterator[CompletionChunk]:
+                # close the response even if the caller stops early
+                try:
+                    for line in lines:
+                        yield line.parse(CompletionChunk)
+                finally:
+                    close = getattr(lines, "close", None)
+                    if close is not None:
+                        close()
+
+            return parse_chunks()
         assert isinstance(response, TogetherResponse)
-        return CompletionResponse(**response.data)
+        return response.parse(CompletionResponse)
+
+    def create_raw(
+        self,
+        body: bytes | str,
+        *,
+        stream: bool = False,
+        deadlines: Deadlines | None = None,
+    ) -> RawResponse:
+        """
+        Method to forward a pre-serialized completion request, for proxies.
+
+        The body is sent as is and the response is returned undecoded, skipping request and
+        response models while keeping retries, authentication and connection pooling.
+
+        Args:
+            body (bytes | str): JSON request body.
+            stream (bool, optional): Whether the body requests a streamed response, in which case
+                the raw server-sent event bytes are returned as an iterator in `chunks`.
+                Defaults to False.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                chunk of a stream, instead of those of the client. Defaults to None.
+
+        Returns:
+            RawResponse: Status code, headers and undecoded body of the response.
+        """
+
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
+
+        return requestor.request_passthrough(
+            options=TogetherRequest(
+                method="POST",
+                url="completions",
+                body=body.encode() if isinstance(body, str) else body,
+                deadlines=deadlines,
+            ),
+            stream=stream,
+        )
 
 
 class AsyncCompletions:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("completions.create")
     async def create(
         self,
         *,
@@ -162,6 +221,7 @@ class AsyncCompletions:
         echo: bool | None = None,
         n: int | None = None,
         safety_model: str | None = None,
+        deadlines: Deadlines | None = None,
         **kwargs: Any,
     ) -> AsyncGenerator[CompletionChunk, None] | CompletionResponse:
         """
@@ -212,6 +272,8 @@ class AsyncCompletions:
             safety_model (str, optional): A moderation model to validate tokens. Choice between available moderation
                     models found [here](https://docs.together.ai/docs/inference-models#moderation-models).
                 Defaults to None.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                streamed event, instead of those of the client. Defaults to None.
 
         Returns:
             AsyncGenerator[CompletionChunk, None] | CompletionResponse: Object containing the completions
@@ -249,6 +311,7 @@ class AsyncCompletions:
                 method="POST",
                 url="completions",
                 params=parameter_payload,
+                deadlines=deadlines,
             ),
             stream=stream,
         )
@@ -256,6 +319,56 @@ class AsyncCompletions:
         if stream:
             # must be an iterator
             assert not isinstance(response, TogetherResponse)
-            return (CompletionChunk(**line.data) async for line in response)
+            lines = response
+
+            async def parse_chunks() -> AsyncGenerator[CompletionChunk, None]:
+                # close the response even if the caller stops early
+                try:
+                    async for line in lines:
+                        yield line.parse(CompletionChunk)
+                finally:
+                    await lines.aclose()
+
+            return parse_chunks()
         assert isinstance(response, TogetherResponse)
-        return CompletionResponse(**response.data)
+        return response.parse(CompletionResponse)
+
+    async def create_raw(
+        self,
+        body: bytes | str,
+        *,
+        stream: bool = False,
+        deadlines: Deadlines | None = None,
+    ) -> RawResponse:
+        """
+        Method to forward a pre-serialized completion request, for proxies.
+
+        The body is sent as is and the response is returned undecoded, skipping request and
+        response models while keeping authentication and connection pooling. As with the other
+        async methods, failed requests are not retried.
+
+        Args:
+            body (bytes | str): JSON request body.
+            stream (bool, optional): Whether the body requests a streamed response, in which case
+                the raw server-sent event bytes are returned as an async iterator in `chunks`.
+                Defaults to False.
+            deadlines (Deadlines, optional): Time limits of the call, such as the time to the first
+                chunk of a stream, instead of those of the client. Defaults to None.
+
+        Returns:
+            RawResponse: Status code, headers and undecoded body of the response.
+        """
+
+        requestor = api_requestor.APIRequestor(
+            client=self._client,
+        )
+
+        return await requestor.arequest_passthrough(
+            options=TogetherRequest(
+                method="POST",
+                url="completions",
+                body=body.encode() if isinstance(body, str) else body,
+                deadlines=deadlines,
+            ),
+            stream=stream,
+        )
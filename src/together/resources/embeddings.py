@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import List, Any
 
+from together import profiling
 from together.abstract import api_requestor
 from together.together_response import TogetherResponse
 from together.types import (
@@ -16,6 +17,7 @@ class Embeddings:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("embeddings.create")
     def create(
         self,
         *,
@@ -55,13 +57,14 @@ class Embeddings:
 
         assert isinstance(response, TogetherResponse)
 
-        return EmbeddingResponse(**response.data)
+        return response.parse(EmbeddingResponse)
 
 
 class AsyncEmbeddings:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("embeddings.create")
     async def create(
         self,
         *,
@@ -101,4 +104,4 @@ class AsyncEmbeddings:
 
         assert isinstance(response, TogetherResponse)
 
-        return EmbeddingResponse(**response.data)
+        return response.parse(EmbeddingResponse)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, List, Literal, Optional, Union
+from typing import Dict, Iterable, List, Literal, Optional, Union
 
 from together.abstract import api_requestor
 from together.together_response import TogetherResponse
 from together.types import TogetherClient, TogetherRequest
 from together.types.endpoints import DedicatedEndpoint, HardwareWithStatus, ListEndpoint
+from together.utils.waiters import (
+    ENDPOINT,
+    PollingPolicy,
+    async_wait_for_job,
+    wait_for_job,
+)
 
 
 class Endpoints:
@@ -160,6 +166,70 @@ class Endpoints:
 
         return DedicatedEndpoint(**response.data)
 
+    def wait(
+        self,
+        endpoint_id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> DedicatedEndpoint:
+        """
+        Waits for an endpoint to finish starting or stopping, or to fail.
+
+        The endpoint is only returned as started or stopped once it has been seen pending,
+        starting or stopping, so that waiting right after `update` does not return its
+        state from before the update. Use `wait_until` to wait for a state it may
+        already be in.
+
+        Args:
+            endpoint_id (str): ID of the endpoint.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds at
+                first, backing off to every 15 seconds.
+
+        Returns:
+            DedicatedEndpoint: The endpoint in a settled state.
+
+        Raises:
+            WaitTimeoutError: If the endpoint does not settle within `timeout`.
+        """
+        return wait_for_job(
+            endpoint_id, self.get, ENDPOINT, timeout=timeout, policy=policy
+        )
+
+    def wait_until(
+        self,
+        endpoint_id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> DedicatedEndpoint:
+        """
+        Waits for an endpoint to reach one of `states`.
+
+        Args:
+            endpoint_id (str): ID of the endpoint.
+            states (str | Iterable[str]): Endpoint states, like `"STARTED"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            DedicatedEndpoint: The endpoint in one of `states`.
+
+        Raises:
+            JobStateError: If the endpoint fails in another state.
+            WaitTimeoutError: If the endpoint does not reach `states` within `timeout`.
+        """
+        return wait_for_job(
+            endpoint_id,
+            self.get,
+            ENDPOINT,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     def delete(self, endpoint_id: str) -> None:
         """
         Delete a specific endpoint.
@@ -453,6 +523,70 @@ class AsyncEndpoints:
 
         return DedicatedEndpoint(**response.data)
 
+    async def wait(
+        self,
+        endpoint_id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> DedicatedEndpoint:
+        """
+        Waits for an endpoint to finish starting or stopping, or to fail.
+
+        The endpoint is only returned as started or stopped once it has been seen pending,
+        starting or stopping, so that waiting right after `update` does not return its
+        state from before the update. Use `wait_until` to wait for a state it may
+        already be in.
+
+        Args:
+            endpoint_id (str): ID of the endpoint.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds at
+                first, backing off to every 15 seconds.
+
+        Returns:
+            DedicatedEndpoint: The endpoint in a settled state.
+
+        Raises:
+            WaitTimeoutError: If the endpoint does not settle within `timeout`.
+        """
+        return await async_wait_for_job(
+            endpoint_id, self.get, ENDPOINT, timeout=timeout, policy=policy
+        )
+
+    async def wait_until(
+        self,
+        endpoint_id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> DedicatedEndpoint:
+        """
+        Waits for an endpoint to reach one of `states`.
+
+        Args:
+            endpoint_id (str): ID of the endpoint.
+            states (str | Iterable[str]): Endpoint states, like `"STARTED"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            DedicatedEndpoint: The endpoint in one of `states`.
+
+        Raises:
+            JobStateError: If the endpoint fails in another state.
+            WaitTimeoutError: If the endpoint does not reach `states` within `timeout`.
+        """
+        return await async_wait_for_job(
+            endpoint_id,
+            self.get,
+            ENDPOINT,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     async def delete(self, endpoint_id: str) -> None:
         """
         Delete a specific endpoint.
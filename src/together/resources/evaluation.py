@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from together.abstract import api_requestor
 from together.together_response import TogetherResponse
@@ -18,6 +18,12 @@ from together.types.evaluation import (
     ModelRequest,
     ScoreParameters,
 )
+from together.utils.waiters import (
+    EVALUATION_JOB,
+    PollingPolicy,
+    async_wait_for_job,
+    wait_for_job,
+)
 
 
 class Evaluation:
@@ -388,6 +394,65 @@ class Evaluation:
         assert isinstance(response, TogetherResponse)
         return EvaluationJob(**response.data)
 
+    def wait(
+        self,
+        evaluation_id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> EvaluationJob:
+        """
+        Waits for an evaluation job to complete or fail.
+
+        Args:
+            evaluation_id (str): The workflow ID of the evaluation job.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds at
+                first, backing off to every 30 seconds.
+
+        Returns:
+            EvaluationJob: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return wait_for_job(
+            evaluation_id, self.retrieve, EVALUATION_JOB, timeout=timeout, policy=policy
+        )
+
+    def wait_until(
+        self,
+        evaluation_id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> EvaluationJob:
+        """
+        Waits for an evaluation job to reach one of `states`.
+
+        Args:
+            evaluation_id (str): The workflow ID of the evaluation job.
+            states (str | Iterable[str]): Job statuses, like `"running"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            EvaluationJob: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return wait_for_job(
+            evaluation_id,
+            self.retrieve,
+            EVALUATION_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     def status(self, evaluation_id: str) -> EvaluationStatusResponse:
         """
         Get the status and results of a specific evaluation job.
@@ -782,6 +847,65 @@ class AsyncEvaluation:
         assert isinstance(response, TogetherResponse)
         return EvaluationJob(**response.data)
 
+    async def wait(
+        self,
+        evaluation_id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> EvaluationJob:
+        """
+        Waits for an evaluation job to complete or fail.
+
+        Args:
+            evaluation_id (str): The workflow ID of the evaluation job.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds at
+                first, backing off to every 30 seconds.
+
+        Returns:
+            EvaluationJob: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return await async_wait_for_job(
+            evaluation_id, self.retrieve, EVALUATION_JOB, timeout=timeout, policy=policy
+        )
+
+    async def wait_until(
+        self,
+        evaluation_id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> EvaluationJob:
+        """
+        Waits for an evaluation job to reach one of `states`.
+
+        Args:
+            evaluation_id (str): The workflow ID of the evaluation job.
+            states (str | Iterable[str]): Job statuses, like `"running"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            EvaluationJob: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return await async_wait_for_job(
+            evaluation_id,
+            self.retrieve,
+            EVALUATION_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     async def status(self, evaluation_id: str) -> EvaluationStatusResponse:
         """
         Get the status and results of a specific evaluation job.
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
 from pprint import pformat
+from typing import Callable
 
 from together.abstract import api_requestor
 from together.constants import MULTIPART_THRESHOLD_GB, NUM_BYTES_IN_GB
 from together.error import FileTypeError
-from together.filemanager import DownloadManager, UploadManager, MultipartUploadManager
+from together.filemanager import (
+    AsyncMultipartUploadManager,
+    AsyncUploadManager,
+    DownloadManager,
+    MultipartUploadManager,
+    UploadManager,
+)
 from together.together_response import TogetherResponse
 from together.types import (
     FileDeleteResponse,
@@ -31,10 +39,26 @@ class Files:
         *,
         purpose: FilePurpose | str = FilePurpose.FineTune,
         check: bool = True,
+        check_num_workers: int = 1,
     ) -> FileResponse:
+        """
+        Uploads a file.
+
+        Args:
+            file (Path | str): Local file to upload.
+            purpose (FilePurpose | str, optional): Purpose of the file.
+                Defaults to FilePurpose.FineTune.
+            check (bool, optional): Validate the file before uploading.
+                Defaults to True.
+            check_num_workers (int, optional): Number of processes used to validate large JSONL files.
+                Defaults to 1.
+
+        Returns:
+            FileResponse: Uploaded file metadata.
+        """
 
         if check and purpose == FilePurpose.FineTune:
-            report_dict = check_file(file)
+            report_dict = check_file(file, num_workers=check_num_workers)
             if not report_dict["is_check_passed"]:
                 raise FileTypeError(
                     f"Invalid file supplied, failed to upload. Report:\n{pformat(report_dict)}"
@@ -134,9 +158,67 @@ class AsyncFiles:
         self._client = client
 
     async def upload(
-        self, file: Path | str, *, purpose: FilePurpose | str = FilePurpose.FineTune
-    ) -> None:
-        raise NotImplementedError()
+        self,
+        file: Path | str,
+        *,
+        purpose: FilePurpose | str = FilePurpose.FineTune,
+        check: bool = True,
+        check_num_workers: int = 1,
+        progress_callback: Callable[[int], None] | None = None,
+    ) -> FileResponse:
+        """
+        Uploads a file without blocking the event loop.
+
+        Args:
+            file (Path | str): Local file to upload.
+            purpose (FilePurpose | str, optional): Purpose of the file.
+                Defaults to FilePurpose.FineTune.
+            check (bool, optional): Validate the file before uploading.
+                Defaults to True.
+            check_num_workers (int, optional): Number of processes used to validate large JSONL files.
+                Defaults to 1.
+            progress_callback (Callable[[int], None], optional): Called with the number of bytes
+                sent each time a block of the file is uploaded.
+                Defaults to None.
+
+        Returns:
+            FileResponse: Uploaded file metadata.
+        """
+
+        if check and purpose == FilePurpose.FineTune:
+            report_dict = await asyncio.to_thread(
+                check_file, file, num_workers=check_num_workers
+            )
+            if not report_dict["is_check_passed"]:
+                raise FileTypeError(
+                    f"Invalid file supplied, failed to upload. Report:\n{pformat(report_dict)}"
+                )
+
+        if isinstance(file, str):
+            file = Path(file)
+
+        if isinstance(purpose, str):
+            purpose = FilePurpose(purpose)
+
+        assert isinstance(purpose, FilePurpose)
+
+        file_size = (await asyncio.to_thread(os.stat, file)).st_size
+        file_size_gb = file_size / NUM_BYTES_IN_GB
+
+        if file_size_gb > MULTIPART_THRESHOLD_GB:
+            multipart_manager = AsyncMultipartUploadManager(self._client)
+            return await multipart_manager.upload(
+                "files", file, purpose, progress_callback=progress_callback
+            )
+        else:
+            upload_manager = AsyncUploadManager(self._client)
+            return await upload_manager.upload(
+                "files",
+                file,
+                purpose=purpose,
+                redirect=True,
+                progress_callback=progress_callback,
+            )
 
     async def list(self) -> FileList:
         requestor = api_requestor.APIRequestor(
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Literal
+from typing import (
+    AsyncIterator,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Set,
+)
 
 from rich import print as rprint
 
 from together.abstract import api_requestor
+from together.constants import FINETUNE_EVENTS_DEDUP_WINDOW
 from together.filemanager import DownloadManager
 from together.together_response import TogetherResponse
 from together.types import (
@@ -34,12 +49,71 @@ from together.types import (
     TrainingMethodSFT,
     TrainingType,
 )
-from together.types.finetune import DownloadCheckpointType, TrainingMethod
-from together.utils import log_warn_once, normalize_key
+from together.types.finetune import (
+    DownloadCheckpointType,
+    FinetuneEvent,
+    TrainingMethod,
+)
+from together.utils import log_warn_once, normalize_key, parse_timestamp
+from together.utils.waiters import (
+    FINE_TUNE_JOB,
+    PollingPolicy,
+    async_wait_for_job,
+    wait_for_job,
+)
 
 
 _FT_JOB_WITH_STEP_REGEX = r"^ft-[\dabcdef-]+:\d+$"
 
+# polling of `follow_events`, fast while events arrive and slower while the job is quiet
+_FOLLOW_EVENTS_POLICY = PollingPolicy(initial_interval=2.0, max_interval=30.0)
+
+
+class _EventCursor:
+    """
+    Picks the events not seen yet out of successive full event lists.
+
+    The events endpoint has no filter for new events, so each poll returns all of them.
+    Events older than the newest one seen are skipped, and events at the same time are
+    told apart by their hash. Only the last `window` hashes are kept.
+    """
+
+    def __init__(self, window: int = FINETUNE_EVENTS_DEDUP_WINDOW) -> None:
+        self._latest: datetime | None = None
+        self._window = window
+        self._order: Deque[Hashable] = deque()
+        self._seen: Set[Hashable] = set()
+
+    @staticmethod
+    def _time(event: FinetuneEvent) -> datetime | None:
+        try:
+            return parse_timestamp(event.created_at or "")
+        except ValueError:
+            return None
+
+    def new_events(self, events: Iterable[FinetuneEvent]) -> List[FinetuneEvent]:
+        new = []
+        for event in events:
+            created_at = self._time(event)
+            if (
+                created_at is not None
+                and self._latest is not None
+                and created_at < self._latest
+            ):
+                continue
+            key = event.hash or (event.created_at, event.type, event.message)
+            if key in self._seen:
+                continue
+
+            self._seen.add(key)
+            self._order.append(key)
+            if len(self._order) > self._window:
+                self._seen.discard(self._order.popleft())
+            if created_at is not None:
+                self._latest = max(created_at, self._latest or created_at)
+            new.append(event)
+        return new
+
 
 AVAILABLE_TRAINING_METHODS = {
     TrainingMethodSFT().method,
@@ -664,6 +738,65 @@ class FineTuning:
 
         return FinetuneResponse(**response.data)
 
+    def wait(
+        self,
+        id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> FinetuneResponse:
+        """
+        Waits for a fine-tune job to complete, fail or be cancelled.
+
+        Args:
+            id (str): Fine-tune ID. A string that starts with `ft-`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 5 seconds at
+                first, backing off to once a minute.
+
+        Returns:
+            FinetuneResponse: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return wait_for_job(
+            id, self.retrieve, FINE_TUNE_JOB, timeout=timeout, policy=policy
+        )
+
+    def wait_until(
+        self,
+        id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> FinetuneResponse:
+        """
+        Waits for a fine-tune job to reach one of `states`.
+
+        Args:
+            id (str): Fine-tune ID. A string that starts with `ft-`.
+            states (str | Iterable[str]): Job statuses, like `"running"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            FinetuneResponse: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return wait_for_job(
+            id,
+            self.retrieve,
+            FINE_TUNE_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     def cancel(self, id: str) -> FinetuneResponse:
         """
         Method to cancel a running fine-tuning job
@@ -748,6 +881,46 @@ class FineTuning:
 
         return FinetuneListEvents(**response.data)
 
+    def follow_events(
+        self,
+        id: str,
+        *,
+        stop_when_done: bool = True,
+        policy: PollingPolicy | None = None,
+    ) -> Iterator[FinetuneEvent]:
+        """
+        Follows the events of a fine-tune job, like `tail -f`
+
+        The events already logged are yielded first, then new events as they are logged.
+        The job is polled often while events arrive, and less often while it is quiet.
+
+        Args:
+            id (str): Fine-tune ID. A string that starts with `ft-`.
+            stop_when_done (bool, optional): Whether to stop once the job has finished and
+                its last events were yielded. Defaults to True.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds,
+                backing off to every 30 seconds while there are no new events.
+
+        Yields:
+            FinetuneEvent: Each event of the job, once.
+        """
+        policy = policy or _FOLLOW_EVENTS_POLICY
+        cursor = _EventCursor()
+        idle_polls = 0
+        while True:
+            # the job status is only checked while there are no new events
+            finished = (
+                stop_when_done
+                and idle_polls > 0
+                and FINE_TUNE_JOB.state(self.retrieve(id)) in FINE_TUNE_JOB.final_states
+            )
+            events = cursor.new_events(self.list_events(id).data or [])
+            yield from events
+            if finished:
+                return
+            idle_polls = 0 if events else idle_polls + 1
+            time.sleep(policy.interval(idle_polls))
+
     def list_checkpoints(self, id: str) -> List[FinetuneCheckpoint]:
         """
         List available checkpoints for a fine-tuning job
@@ -1237,6 +1410,65 @@ class AsyncFineTuning:
 
         return FinetuneResponse(**response.data)
 
+    async def wait(
+        self,
+        id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> FinetuneResponse:
+        """
+        Waits for a fine-tune job to complete, fail or be cancelled.
+
+        Args:
+            id (str): Fine-tune ID. A string that starts with `ft-`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 5 seconds at
+                first, backing off to once a minute.
+
+        Returns:
+            FinetuneResponse: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return await async_wait_for_job(
+            id, self.retrieve, FINE_TUNE_JOB, timeout=timeout, policy=policy
+        )
+
+    async def wait_until(
+        self,
+        id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> FinetuneResponse:
+        """
+        Waits for a fine-tune job to reach one of `states`.
+
+        Args:
+            id (str): Fine-tune ID. A string that starts with `ft-`.
+            states (str | Iterable[str]): Job statuses, like `"running"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            FinetuneResponse: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return await async_wait_for_job(
+            id,
+            self.retrieve,
+            FINE_TUNE_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
     async def cancel(self, id: str) -> FinetuneResponse:
         """
         Async method to cancel a running fine-tuning job
@@ -1321,6 +1553,44 @@ class AsyncFineTuning:
 
         return FinetuneListEvents(**events_response.data)
 
+    async def follow_events(
+        self,
+        id: str,
+        *,
+        stop_when_done: bool = True,
+        policy: PollingPolicy | None = None,
+    ) -> AsyncIterator[FinetuneEvent]:
+        """
+        Follows the events of a fine-tune job, like `tail -f`
+
+        Args:
+            id (str): Fine-tune ID. A string that starts with `ft-`.
+            stop_when_done (bool, optional): Whether to stop once the job has finished and
+                its last events were yielded. Defaults to True.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every 2 seconds,
+                backing off to every 30 seconds while there are no new events.
+
+        Yields:
+            FinetuneEvent: Each event of the job, once.
+        """
+        policy = policy or _FOLLOW_EVENTS_POLICY
+        cursor = _EventCursor()
+        idle_polls = 0
+        while True:
+            finished = (
+                stop_when_done
+                and idle_polls > 0
+                and FINE_TUNE_JOB.state(await self.retrieve(id))
+                in FINE_TUNE_JOB.final_states
+            )
+            events = cursor.new_events((await self.list_events(id)).data or [])
+            for event in events:
+                yield event
+            if finished:
+                return
+            idle_polls = 0 if events else idle_polls + 1
+            await asyncio.sleep(policy.interval(idle_polls))
+
     async def list_checkpoints(self, id: str) -> List[FinetuneCheckpoint]:
         """
         List available checkpoints for a fine-tuning job
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import base64
+import inspect
+import itertools
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, List, Sequence, Set
 
+import aiohttp
+
+from together import profiling
 from together.abstract import api_requestor
+from together.constants import DOWNLOAD_BLOCK_SIZE, IMAGE_GENERATION_CONCURRENCY
 from together.together_response import TogetherResponse
 from together.types import (
+    GeneratedImage,
     ImageRequest,
     ImageResponse,
     TogetherClient,
@@ -12,10 +23,101 @@ from together.types import (
 )
 
 
+def _image_extension(head: bytes) -> str:
+    """File extension of an image from its first bytes."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"RIFF") and head[8:12] == b"WEBP":
+        return "webp"
+    if head.startswith(b"GIF8"):
+        return "gif"
+    return "png"
+
+
+def _seeds(num_prompts: int, seed: int | Sequence[int] | None) -> List[int | None]:
+    if seed is None:
+        return [None] * num_prompts
+    if isinstance(seed, int):
+        # distinct but reproducible seeds for the prompts of a batch
+        return [seed + i for i in range(num_prompts)]
+    if len(seed) != num_prompts:
+        raise ValueError(f"Expected {num_prompts} seeds, got {len(seed)}")
+    return list(seed)
+
+
+class _ImageBatch:
+    """Naming and bookkeeping shared by `Images.generate_many` and its async version."""
+
+    def __init__(
+        self,
+        prompts: Sequence[str],
+        seed: int | Sequence[int] | None,
+        output_dir: str | Path | None,
+    ) -> None:
+        self.prompts = prompts
+        self.seeds = _seeds(len(prompts), seed)
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        if self.output_dir is not None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._digits = len(str(max(len(prompts) - 1, 0)))
+
+    def image(self, prompt_index: int, **kwargs: Any) -> GeneratedImage:
+        return GeneratedImage(
+            prompt_index=prompt_index,
+            prompt=self.prompts[prompt_index],
+            seed=self.seeds[prompt_index],
+            **kwargs,
+        )
+
+    def path(self, image: GeneratedImage, head: bytes) -> Path:
+        """`{prompt index}[-seed{seed}]-{image index}.{ext}` in the output directory."""
+        assert self.output_dir is not None
+        name = f"{image.prompt_index:0{self._digits}d}"
+        if image.seed is not None:
+            name += f"-seed{image.seed}"
+        return self.output_dir / f"{name}-{image.image_index}.{_image_extension(head)}"
+
+    def write(self, image: GeneratedImage, data: bytes) -> None:
+        """Write decoded image data to the output directory, or keep it on the image."""
+        if self.output_dir is None:
+            image.data = data
+            return
+        path = self.path(image, data[:16])
+        with open(path, "wb") as f:
+            f.write(data)
+        image.path = str(path)
+
+    def write_chunks(self, image: GeneratedImage, chunks: Iterator[bytes]) -> None:
+        """Write a downloaded image as its chunks arrive."""
+        chunks = (chunk for chunk in chunks if chunk)
+        first = next(chunks, b"")
+        if self.output_dir is None:
+            image.data = b"".join(itertools.chain([first], chunks))
+            return
+        path = self.path(image, first)
+        try:
+            with open(path, "wb") as f:
+                f.write(first)
+                for chunk in chunks:
+                    f.write(chunk)
+        except BaseException:
+            # don't leave a truncated image behind when the download fails
+            path.unlink(missing_ok=True)
+            raise
+        image.path = str(path)
+
+    @staticmethod
+    def finish(image: GeneratedImage, has_callback: bool) -> None:
+        if has_callback:
+            # the callback owns the data now, don't keep every image in memory
+            image.data = None
+
+
 class Images:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("images.generate")
     def generate(
         self,
         *,
@@ -83,11 +185,109 @@ class Images:
 
         return ImageResponse(**response.data)
 
+    def generate_many(
+        self,
+        prompts: Sequence[str],
+        *,
+        model: str,
+        output_dir: str | Path | None = None,
+        callback: Callable[[GeneratedImage], Any] | None = None,
+        seed: int | Sequence[int] | None = None,
+        n: int | None = 1,
+        max_concurrency: int = IMAGE_GENERATION_CONCURRENCY,
+        **kwargs: Any,
+    ) -> List[GeneratedImage]:
+        """
+        Generate images for many prompts concurrently.
+
+        Requests run on a thread pool, which also decodes base64 results and downloads URL
+        results. Images are written to `output_dir` and/or passed to `callback` as they
+        finish, so only the images of the requests in flight are held in memory. Files are
+        named `{prompt index}[-seed{seed}]-{image index}.{ext}`, with the extension taken
+        from the image data.
+
+        Args:
+            prompts (Sequence[str]): Descriptions of the desired images.
+            model (str): The model to use for image generation.
+            output_dir (str | Path, optional): Directory to write the images to. Defaults to
+                None, which keeps the image bytes on the results.
+            callback (Callable[[GeneratedImage], Any], optional): Called on the calling thread
+                with each image as it finishes, including failed ones. The image bytes are
+                available as `data` when no `output_dir` is given.
+            seed (int | Sequence[int], optional): Seed of each prompt, or a base seed that is
+                incremented for each prompt. Defaults to None.
+            n (int, optional): Number of images to generate per prompt. Defaults to 1.
+            max_concurrency (int, optional): Number of requests in flight. Defaults to 8.
+            **kwargs: Additional parameters of `generate`.
+
+        Returns:
+            List[GeneratedImage]: The images, ordered by prompt and image index. A prompt that
+                failed has a single result with `error` set.
+        """
+        batch = _ImageBatch(prompts, seed, output_dir)
+        # downloads go through the pooled sessions of the client, with its timeout,
+        # retries and proxies, but without its API key
+        requestor = api_requestor.APIRequestor(client=self._client)
+
+        def generate(index: int) -> List[GeneratedImage]:
+            try:
+                response = self.generate(
+                    prompt=prompts[index],
+                    model=model,
+                    seed=batch.seeds[index],
+                    n=n,
+                    **kwargs,
+                )
+                images = []
+                for choice in response.data or []:
+                    image = batch.image(index, image_index=choice.index, url=choice.url)
+                    if choice.b64_json is not None:
+                        batch.write(image, base64.b64decode(choice.b64_json))
+                    elif choice.url is not None:
+                        with requestor.request_raw(
+                            options=TogetherRequest(
+                                method="GET", url=choice.url, override_headers=True
+                            ),
+                            remaining_retries=requestor.retries,
+                            stream=True,
+                            absolute=True,
+                        ) as download:
+                            download.raise_for_status()
+                            batch.write_chunks(
+                                image, download.iter_content(DOWNLOAD_BLOCK_SIZE)
+                            )
+                    images.append(image)
+                return images
+            except Exception as e:
+                return [batch.image(index, error=str(e))]
+
+        results: List[GeneratedImage] = []
+        indices = iter(range(len(prompts)))
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending: Set[Future[List[GeneratedImage]]] = set()
+            while True:
+                for index in itertools.islice(indices, max_concurrency - len(pending)):
+                    pending.add(executor.submit(generate, index))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for image in future.result():
+                        if callback is not None:
+                            callback(image)
+                        batch.finish(image, callback is not None)
+                        results.append(image)
+
+        return sorted(
+            results, key=lambda image: (image.prompt_index, image.image_index)
+        )
+
 
 class AsyncImages:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("images.generate")
     async def generate(
         self,
         *,
@@ -154,3 +354,108 @@ class AsyncImages:
         assert isinstance(response, TogetherResponse)
 
         return ImageResponse(**response.data)
+
+    async def generate_many(
+        self,
+        prompts: Sequence[str],
+        *,
+        model: str,
+        output_dir: str | Path | None = None,
+        callback: Callable[[GeneratedImage], Any | Awaitable[Any]] | None = None,
+        seed: int | Sequence[int] | None = None,
+        n: int | None = 1,
+        max_concurrency: int = IMAGE_GENERATION_CONCURRENCY,
+        **kwargs: Any,
+    ) -> List[GeneratedImage]:
+        """
+        Async version of generating images for many prompts concurrently.
+
+        Base64 decoding and file writes run in worker threads, off the event loop. `callback`
+        may be a coroutine function. See `Images.generate_many` for the arguments.
+
+        Returns:
+            List[GeneratedImage]: The images, ordered by prompt and image index.
+        """
+        batch = _ImageBatch(prompts, seed, output_dir)
+        results: List[GeneratedImage] = []
+        indices = iter(range(len(prompts)))
+
+        requestor = api_requestor.APIRequestor(client=self._client)
+
+        async def download(
+            session: aiohttp.ClientSession, image: GeneratedImage, url: str
+        ) -> None:
+            response = await requestor.arequest_raw(
+                TogetherRequest(method="GET", url=url, override_headers=True),
+                session,
+                absolute=True,
+            )
+            async with response:
+                response.raise_for_status()
+                if batch.output_dir is None:
+                    image.data = await response.read()
+                    return
+                first = await response.content.read(DOWNLOAD_BLOCK_SIZE)
+                path = batch.path(image, first)
+                try:
+                    f = await asyncio.to_thread(open, path, "wb")
+                    try:
+                        await asyncio.to_thread(f.write, first)
+                        async for chunk in response.content.iter_chunked(
+                            DOWNLOAD_BLOCK_SIZE
+                        ):
+                            await asyncio.to_thread(f.write, chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
+                except BaseException:
+                    # don't leave a truncated image behind when the download fails
+                    await asyncio.to_thread(path.unlink, missing_ok=True)
+                    raise
+                image.path = str(path)
+
+        async def generate(
+            session: aiohttp.ClientSession, index: int
+        ) -> List[GeneratedImage]:
+            try:
+                response = await self.generate(
+                    prompt=prompts[index],
+                    model=model,
+                    seed=batch.seeds[index],
+                    n=n,
+                    **kwargs,
+                )
+                images = []
+                for choice in response.data or []:
+                    image = batch.image(index, image_index=choice.index, url=choice.url)
+                    if choice.b64_json is not None:
+                        data = await asyncio.to_thread(
+                            base64.b64decode, choice.b64_json
+                        )
+                        await asyncio.to_thread(batch.write, image, data)
+                    elif choice.url is not None:
+                        await download(session, image, choice.url)
+                    images.append(image)
+                return images
+            except Exception as e:
+                return [batch.image(index, error=str(e))]
+
+        async def worker(session: aiohttp.ClientSession) -> None:
+            # workers share the iterator, so at most `max_concurrency` prompts are in flight
+            for index in indices:
+                for image in await generate(session, index):
+                    if callback is not None:
+                        result = callback(image)
+                        if inspect.isawaitable(result):
+                            await result
+                    batch.finish(image, callback is not None)
+                    results.append(image)
+
+        # one session for all downloads, or the one set as `together.aiosession`
+        async with api_requestor.AioHTTPSession() as session:
+            await asyncio.gather(
+                *(worker(session) for _ in range(min(max_concurrency, len(prompts))))
+            )
+
+        return sorted(
+            results, key=lambda image: (image.prompt_index, image.image_index)
+        )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import List, Dict, Any
 
+from together import profiling
 from together.abstract import api_requestor
 from together.together_response import TogetherResponse
 from together.types import (
@@ -16,6 +17,7 @@ class Rerank:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("rerank.create")
     def create(
         self,
         *,
@@ -74,6 +76,7 @@ class AsyncRerank:
     def __init__(self, client: TogetherClient) -> None:
         self._client = client
 
+    @profiling.profiled("rerank.create")
     async def create(
         self,
         *,
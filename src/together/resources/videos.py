@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 import sys
 
 from together.abstract import api_requestor
@@ -15,6 +15,13 @@ from together.types.videos import (
     VideoJob,
 )
 
+from together.utils.waiters import (
+    VIDEO_JOB,
+    PollingPolicy,
+    async_wait_for_job,
+    wait_for_job,
+)
+
 if sys.version_info >= (3, 8):
     from typing import Literal
 else:
@@ -161,6 +168,65 @@ class Videos:
 
         return VideoJob(**response.data)
 
+    def wait(
+        self,
+        id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> VideoJob:
+        """
+        Waits for a video creation job to complete, fail or be cancelled.
+
+        Args:
+            id (str): The ID of the video creation job.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every second at first,
+                backing off to every 10 seconds.
+
+        Returns:
+            VideoJob: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return wait_for_job(
+            id, self.retrieve, VIDEO_JOB, timeout=timeout, policy=policy
+        )
+
+    def wait_until(
+        self,
+        id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> VideoJob:
+        """
+        Waits for a video creation job to reach one of `states`.
+
+        Args:
+            id (str): The ID of the video creation job.
+            states (str | Iterable[str]): Job statuses, like `"in_progress"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            VideoJob: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return wait_for_job(
+            id,
+            self.retrieve,
+            VIDEO_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
+
 
 class AsyncVideos:
     def __init__(self, client: TogetherClient) -> None:
@@ -301,3 +367,62 @@ class AsyncVideos:
         assert isinstance(response, TogetherResponse)
 
         return VideoJob(**response.data)
+
+    async def wait(
+        self,
+        id: str,
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> VideoJob:
+        """
+        Waits for a video creation job to complete, fail or be cancelled.
+
+        Args:
+            id (str): The ID of the video creation job.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll. Defaults to every second at first,
+                backing off to every 10 seconds.
+
+        Returns:
+            VideoJob: The job in a final state.
+
+        Raises:
+            WaitTimeoutError: If the job does not settle within `timeout`.
+        """
+        return await async_wait_for_job(
+            id, self.retrieve, VIDEO_JOB, timeout=timeout, policy=policy
+        )
+
+    async def wait_until(
+        self,
+        id: str,
+        states: str | Iterable[str],
+        *,
+        timeout: float | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> VideoJob:
+        """
+        Waits for a video creation job to reach one of `states`.
+
+        Args:
+            id (str): The ID of the video creation job.
+            states (str | Iterable[str]): Job statuses, like `"in_progress"`.
+            timeout (float, optional): Seconds to wait. Defaults to no limit.
+            policy (PollingPolicy, optional): How often to poll.
+
+        Returns:
+            VideoJob: The job in one of `states`.
+
+        Raises:
+            JobStateError: If the job ends in another state.
+            WaitTimeoutError: If the job does not reach `states` within `timeout`.
+        """
+        return await async_wait_for_job(
+            id,
+            self.retrieve,
+            VIDEO_JOB,
+            until=states,
+            timeout=timeout,
+            policy=policy,
+        )
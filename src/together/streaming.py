@@ -0,0 +1,681 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+from together.constants import STREAM_PREFETCH_SIZE
+from together.error import Timeout
+from together.types import ChatCompletionChunk, ChatCompletionResponse
+from together.types.chat_completions import (
+    ChatCompletionChoicesData,
+    ChatCompletionMessage,
+    FunctionCall,
+    MessageRole,
+    ToolCalls,
+)
+from together.types.common import FinishReason, LogprobsPart, ObjectType, UsageData
+from together.utils.incremental_json import IncrementalJSONParser, JSONEvent
+
+
+@dataclass
+class StreamStats:
+    """Timing of a streamed response.
+
+    All times are in seconds and measured with `time.perf_counter`.
+    """
+
+    # when the request was sent, or when the accumulator was created
+    start_time: float
+    # arrival of the first chunk carrying tokens, relative to `start_time`
+    time_to_first_token: float | None = None
+    # gaps between consecutive chunks carrying tokens
+    inter_token_latencies: List[float] = field(default_factory=list)
+    # duration of the whole stream, set once it is exhausted
+    total_time: float | None = None
+    num_chunks: int = 0
+    completion_tokens: int | None = None
+
+    @property
+    def mean_inter_token_latency(self) -> float | None:
+        if not self.inter_token_latencies:
+            return None
+        return sum(self.inter_token_latencies) / len(self.inter_token_latencies)
+
+    def inter_token_latency_percentile(self, percentile: float) -> float | None:
+        """Nearest-rank percentile of the inter-token latencies, `percentile` in [0, 100]."""
+        if not self.inter_token_latencies:
+            return None
+        latencies = sorted(self.inter_token_latencies)
+        rank = round(percentile / 100 * (len(latencies) - 1))
+        return latencies[min(max(rank, 0), len(latencies) - 1)]
+
+    @property
+    def output_tokens_per_second(self) -> float | None:
+        """Completion tokens per second after the first token, if usage was streamed."""
+        if (
+            self.completion_tokens is None
+            or self.total_time is None
+            or self.time_to_first_token is None
+            or self.total_time <= self.time_to_first_token
+        ):
+            return None
+        return self.completion_tokens / (self.total_time - self.time_to_first_token)
+
+
+class _ChoiceState:
+    """Deltas received so far for one choice. Text is kept as a list of parts and
+    joined once, so accumulation is linear in the length of the output."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.role: str | None = None
+        self.content_parts: List[str] = []
+        self.tool_calls: Dict[int, Dict[str, Any]] = {}
+        self.finish_reason: FinishReason | None = None
+        self.seed: int | None = None
+        self.tokens: List[str | None] = []
+        self.token_logprobs: List[float | None] = []
+
+
+class _ChatCompletionAccumulator:
+    def __init__(self, start_time: float | None = None) -> None:
+        self.stats = StreamStats(
+            start_time=time.perf_counter() if start_time is None else start_time
+        )
+        self._choices: Dict[int, _ChoiceState] = {}
+        self._id: str | None = None
+        self._created: int | None = None
+        self._model: str | None = None
+        self._usage: UsageData | None = None
+        self._last_token_time: float | None = None
+
+    def add(self, chunk: ChatCompletionChunk) -> None:
+        """Merge a chunk into the response being built."""
+        now = time.perf_counter()
+        self.stats.num_chunks += 1
+
+        self._id = self._id or chunk.id
+        self._created = self._created or chunk.created
+        self._model = self._model or chunk.model
+        if chunk.usage is not None:
+            self._usage = chunk.usage
+            self.stats.completion_tokens = chunk.usage.completion_tokens
+
+        has_tokens = False
+        for choice in chunk.choices or []:
+            index = choice.index or 0
+            state = self._choices.get(index)
+            if state is None:
+                state = self._choices[index] = _ChoiceState(index)
+
+            if choice.finish_reason is not None:
+                state.finish_reason = choice.finish_reason
+            if choice.seed is not None:
+                state.seed = choice.seed
+
+            delta = choice.delta
+            if delta is None:
+                continue
+            role = getattr(delta, "role", None)
+            if role:
+                state.role = role
+            if delta.content:
+                state.content_parts.append(delta.content)
+                has_tokens = True
+                if choice.logprobs is not None:
+                    state.tokens.append(delta.content)
+                    state.token_logprobs.append(choice.logprobs)
+            for tool_call in getattr(delta, "tool_calls", None) or []:
+                self._add_tool_call(state, tool_call)
+                has_tokens = True
+
+        if chunk.finish_reason is not None:
+            for state in self._choices.values():
+                state.finish_reason = state.finish_reason or chunk.finish_reason
+
+        if has_tokens:
+            if self._last_token_time is None:
+                self.stats.time_to_first_token = now - self.stats.start_time
+            else:
+                self.stats.inter_token_latencies.append(now - self._last_token_time)
+            self._last_token_time = now
+
+    @staticmethod
+    def _add_tool_call(state: _ChoiceState, tool_call: Any) -> None:
+        if not isinstance(tool_call, dict):
+            tool_call = tool_call.model_dump()
+        index = tool_call.get("index") or 0
+        call = state.tool_calls.get(index)
+        if call is None:
+            call = state.tool_calls[index] = {
+                "id": None,
+                "type": None,
+                "name_parts": [],
+                "argument_parts": [],
+            }
+        call["id"] = call["id"] or tool_call.get("id")
+        call["type"] = call["type"] or tool_call.get("type")
+        function = tool_call.get("function") or {}
+        if function.get("name"):
+            call["name_parts"].append(function["name"])
+        if function.get("arguments"):
+            call["argument_parts"].append(function["arguments"])
+
+    def _finish(self) -> None:
+        if self.stats.total_time is None:
+            self.stats.total_time = time.perf_counter() - self.stats.start_time
+
+    @property
+    def response(self) -> ChatCompletionResponse:
+        """The response assembled from the chunks received so far."""
+        choices = []
+        for index in sorted(self._choices):
+            state = self._choices[index]
+            tool_calls = [
+                ToolCalls(
+                    id=call["id"],
+                    type=call["type"] or "function",
+                    function=FunctionCall(
+                        name="".join(call["name_parts"]) or None,
+                        arguments="".join(call["argument_parts"]),
+                    ),
+                )
+                for _, call in sorted(state.tool_calls.items())
+            ]
+            choices.append(
+                ChatCompletionChoicesData(
+                    index=index,
+                    seed=state.seed,
+                    finish_reason=state.finish_reason,
+                    logprobs=(
+                        LogprobsPart(
+                            tokens=state.tokens, token_logprobs=state.token_logprobs
+                        )
+                        if state.token_logprobs
+                        else None
+                    ),
+                    message=ChatCompletionMessage(
+                        role=state.role or MessageRole.ASSISTANT,
+                        content="".join(state.content_parts),
+                        tool_calls=tool_calls or None,
+                    ),
+                )
+            )
+
+        return ChatCompletionResponse(
+            id=self._id,
+            object=ObjectType.ChatCompletion,
+            created=self._created,
+            model=self._model,
+            choices=choices,
+            usage=self._usage,
+        )
+
+
+class ChatCompletionStreamAccumulator(_ChatCompletionAccumulator):
+    """Wraps a chat completion stream and builds the full response as chunks are consumed.
+
+    Example:
+        >>> stream = client.chat.completions.create(..., stream=True)
+        >>> accumulator = ChatCompletionStreamAccumulator(stream)
+        >>> for chunk in accumulator:
+        ...     print(chunk.choices[0].delta.content, end="")
+        >>> accumulator.response.choices[0].message.content
+        >>> accumulator.stats.time_to_first_token
+
+    Args:
+        stream (Iterable[ChatCompletionChunk]): Stream returned by
+            `chat.completions.create(..., stream=True)`.
+        start_time (float, optional): `time.perf_counter()` taken before the request was sent,
+            so that the time to first token includes the time to the response headers.
+            Defaults to the time the accumulator is created.
+    """
+
+    def __init__(
+        self,
+        stream: Iterable[ChatCompletionChunk],
+        start_time: float | None = None,
+    ) -> None:
+        super().__init__(start_time)
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[ChatCompletionChunk]:
+        for chunk in self._stream:
+            self.add(chunk)
+            yield chunk
+        self._finish()
+
+    def consume(self) -> ChatCompletionResponse:
+        """Read the rest of the stream and return the full response."""
+        for _ in self:
+            pass
+        self._finish()
+        return self.response
+
+
+class AsyncChatCompletionStreamAccumulator(_ChatCompletionAccumulator):
+    """Async version of `ChatCompletionStreamAccumulator`.
+
+    Example:
+        >>> stream = await async_client.chat.completions.create(..., stream=True)
+        >>> accumulator = AsyncChatCompletionStreamAccumulator(stream)
+        >>> async for chunk in accumulator:
+        ...     ...
+        >>> accumulator.response
+    """
+
+    def __init__(
+        self,
+        stream: AsyncIterable[ChatCompletionChunk],
+        start_time: float | None = None,
+    ) -> None:
+        super().__init__(start_time)
+        self._stream = stream
+
+    async def __aiter__(self) -> AsyncIterator[ChatCompletionChunk]:
+        async for chunk in self._stream:
+            self.add(chunk)
+            yield chunk
+        self._finish()
+
+    async def consume(self) -> ChatCompletionResponse:
+        """Read the rest of the stream and return the full response."""
+        async for _ in self:
+            pass
+        self._finish()
+        return self.response
+
+
+def _chunk_content(chunk: ChatCompletionChunk, choice_index: int) -> str:
+    for choice in chunk.choices or []:
+        if (choice.index or 0) == choice_index and choice.delta is not None:
+            return choice.delta.content or ""
+    return ""
+
+
+def iter_json_events(
+    stream: Iterable[ChatCompletionChunk],
+    choice_index: int = 0,
+    parser: IncrementalJSONParser | None = None,
+) -> Iterator[JSONEvent]:
+    """Parse the JSON content of a chat completion stream as it arrives.
+
+    Use with `response_format` of type `json_object` or `json_schema`. Malformed output
+    produces a single "error" event instead of raising.
+
+    Example:
+        >>> stream = client.chat.completions.create(..., response_format=..., stream=True)
+        >>> for event in iter_json_events(stream):
+        ...     if event.type == "field":
+        ...         render(event.path, event.value)
+
+    Args:
+        stream (Iterable[ChatCompletionChunk]): Stream returned by
+            `chat.completions.create(..., stream=True)`, or an accumulator wrapping it.
+        choice_index (int, optional): Choice to parse. Defaults to 0.
+        parser (IncrementalJSONParser, optional): Parser to feed, so that the caller can read
+            `parser.partial` between events. Defaults to a new parser.
+
+    Yields:
+        JSONEvent: Completed fields and array items, then "done" or "error".
+    """
+    if parser is None:
+        parser = IncrementalJSONParser()
+    for chunk in stream:
+        content = _chunk_content(chunk, choice_index)
+        if content:
+            yield from parser.feed(content)
+    yield from parser.close()
+
+
+async def aiter_json_events(
+    stream: AsyncIterable[ChatCompletionChunk],
+    choice_index: int = 0,
+    parser: IncrementalJSONParser | None = None,
+) -> AsyncIterator[JSONEvent]:
+    """Async version of `iter_json_events`."""
+    if parser is None:
+        parser = IncrementalJSONParser()
+    async for chunk in stream:
+        content = _chunk_content(chunk, choice_index)
+        if content:
+            for event in parser.feed(content):
+                yield event
+    for event in parser.close():
+        yield event
+
+
+@dataclass
+class _MultiplexedStream:
+    key: Hashable
+    # None until the awaitable passed to `add` returns the stream
+    stream: AsyncIterator[Any] | None
+    # pending stream creation or `__anext__` call
+    task: asyncio.Future[Any]
+    deadline: float | None
+
+
+class AsyncStreamMultiplexer:
+    """Merge many async streams, yielding each chunk as soon as any stream produces it.
+
+    One chunk is read ahead from each stream, so a slow consumer slows the streams down
+    rather than buffering their output. Streams that are cancelled, pass their deadline or
+    are left unread when the consumer stops are closed at once, which releases their HTTP
+    connections.
+
+    Example:
+        >>> async with AsyncStreamMultiplexer() as streams:
+        ...     for name, messages in conversations.items():
+        ...         streams.add(
+        ...             name,
+        ...             async_client.chat.completions.create(
+        ...                 model=..., messages=messages, stream=True
+        ...             ),
+        ...         )
+        ...     async for name, chunk in streams:
+        ...         ...
+
+    Args:
+        return_exceptions (bool, optional): Whether an error of a stream, including passing
+            its deadline, is yielded as `(key, exception)` and only ends that stream. By
+            default the first error closes all streams and is raised.
+    """
+
+    def __init__(self, return_exceptions: bool = False) -> None:
+        self.return_exceptions = return_exceptions
+        self._streams: Dict[Hashable, _MultiplexedStream] = {}
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._streams
+
+    def add(
+        self,
+        key: Hashable,
+        stream: AsyncIterable[Any] | Awaitable[AsyncIterable[Any]],
+        timeout: float | None = None,
+    ) -> None:
+        """Add a stream, which is read from right away.
+
+        Args:
+            key (Hashable): Key yielded with the chunks of the stream.
+            stream (AsyncIterable | Awaitable[AsyncIterable]): The stream, or an awaitable
+                returning it such as the coroutine of `create(..., stream=True)`, so that
+                the requests are sent concurrently.
+            timeout (float, optional): Seconds from now by which the stream must end,
+                including sending the request. Defaults to no limit.
+        """
+        if key in self._streams:
+            raise ValueError(f"A stream with key {key!r} was already added")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if isinstance(stream, AsyncIterable):
+            iterator = stream.__aiter__()
+            self._streams[key] = _MultiplexedStream(
+                key, iterator, asyncio.ensure_future(iterator.__anext__()), deadline
+            )
+        else:
+            self._streams[key] = _MultiplexedStream(
+                key, None, asyncio.ensure_future(stream), deadline
+            )
+
+    async def cancel(self, key: Hashable) -> None:
+        """Stop reading a stream and close it. Its chunks read ahead are dropped."""
+        entry = self._streams.get(key)
+        if entry is not None:
+            await self._close(entry)
+
+    async def aclose(self) -> None:
+        """Close all streams."""
+        for entry in list(self._streams.values()):
+            await self._close(entry)
+
+    async def __aenter__(self) -> AsyncStreamMultiplexer:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def _close(self, entry: _MultiplexedStream) -> None:
+        self._streams.pop(entry.key, None)
+        if not entry.task.done():
+            entry.task.cancel()
+            # asyncio.wait doesn't raise, but still lets cancellation of the caller through
+            await asyncio.wait([entry.task])
+        if not entry.task.cancelled() and entry.task.exception() is None:
+            if entry.stream is None:
+                entry.stream = entry.task.result().__aiter__()
+        aclose = getattr(entry.stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def _timeout(self) -> float | None:
+        deadlines = [
+            e.deadline for e in self._streams.values() if e.deadline is not None
+        ]
+        if not deadlines:
+            return None
+        return max(min(deadlines) - time.monotonic(), 0.0)
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[Hashable, Any]]:
+        try:
+            while self._streams:
+                done, _ = await asyncio.wait(
+                    [entry.task for entry in self._streams.values()],
+                    timeout=self._timeout(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                now = time.monotonic()
+                for entry in list(self._streams.values()):
+                    # streams may be cancelled by the consumer between two chunks
+                    if self._streams.get(entry.key) is not entry:
+                        continue
+
+                    if entry.task not in done:
+                        if entry.deadline is not None and entry.deadline <= now:
+                            await self._close(entry)
+                            error = Timeout(
+                                f"Stream {entry.key!r} did not end before its deadline"
+                            )
+                            if not self.return_exceptions:
+                                raise error
+                            yield entry.key, error
+                        continue
+
+                    try:
+                        result = entry.task.result()
+                    except StopAsyncIteration:
+                        del self._streams[entry.key]
+                        continue
+                    except Exception as e:
+                        await self._close(entry)
+                        if not self.return_exceptions:
+                            raise
+                        yield entry.key, e
+                        continue
+
+                    if entry.stream is None:
+                        entry.stream = result.__aiter__()
+                        entry.task = asyncio.ensure_future(entry.stream.__anext__())
+                        continue
+                    entry.task = asyncio.ensure_future(entry.stream.__anext__())
+                    yield entry.key, result
+        finally:
+            await self.aclose()
+
+
+T = TypeVar("T")
+
+# kinds of entries put in the queue of a `PrefetchingStream`
+_ITEM, _END, _ERROR = range(3)
+# how often a reader thread blocked on a full queue checks whether it should stop
+_PREFETCH_STOP_CHECK_INTERVAL = 0.1
+
+
+@dataclass
+class PrefetchStats:
+    """Backpressure of a `PrefetchingStream`."""
+
+    # chunks read ahead and not consumed yet
+    buffered: int = 0
+    # most chunks buffered at once
+    max_buffered: int = 0
+    # times the reader found the buffer full and waited for the consumer
+    stalls: int = 0
+    # seconds the reader spent waiting for the consumer
+    stall_time: float = 0.0
+
+
+def _prefetch(
+    stream: Iterable[Any],
+    chunks: queue.Queue[Tuple[int, Any]],
+    stop: threading.Event,
+    stats: PrefetchStats,
+    on_stall: Callable[[PrefetchStats], None] | None,
+) -> None:
+    """Read `stream` into `chunks` until it ends or `stop` is set.
+
+    This runs on the reader thread, which holds no reference to the `PrefetchingStream`
+    so that the stream can be garbage collected, and stopped, once it is abandoned.
+    """
+
+    def put(entry: Tuple[int, Any], notify: bool = True) -> bool:
+        if stop.is_set():
+            return False
+        try:
+            chunks.put_nowait(entry)
+        except queue.Full:
+            stats.stalls += 1
+            if notify and on_stall is not None:
+                on_stall(stats)
+            stalled_at = time.perf_counter()
+            while True:
+                if stop.is_set():
+                    return False
+                try:
+                    chunks.put(entry, timeout=_PREFETCH_STOP_CHECK_INTERVAL)
+                    break
+                except queue.Full:
+                    continue
+            stats.stall_time += time.perf_counter() - stalled_at
+        stats.buffered = chunks.qsize()
+        stats.max_buffered = max(stats.max_buffered, stats.buffered)
+        return True
+
+    iterator = iter(stream)
+    try:
+        for chunk in iterator:
+            if not put((_ITEM, chunk)):
+                return
+        put((_END, None))
+    except Exception as e:
+        # also raised by `on_stall`, which is not called again so that the error is queued
+        put((_ERROR, e), notify=False)
+    finally:
+        # releases the HTTP connection of streams returned by the client
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+class PrefetchingStream(Generic[T]):
+    """Iterator reading a synchronous stream ahead on a background thread.
+
+    Without it, the socket is only read while the consumer asks for the next chunk, so a
+    slow consumer lets the connection buffers fill up and stalls the server. Here, chunks
+    are read and decoded as they arrive, into a buffer of `max_buffered` chunks. When the
+    buffer is full the reader waits, which is reported through `stats` and `on_stall`.
+
+    The reader stops, and the stream is closed, when the stream ends, on `close()`, or
+    once the iterator is garbage collected. Errors of the stream are raised by `next()`
+    after the chunks read before them.
+
+    Example:
+        >>> stream = client.chat.completions.create(..., stream=True)
+        >>> with PrefetchingStream(stream) as chunks:
+        ...     for chunk in chunks:
+        ...         slow_callback(chunk)
+
+    Args:
+        stream (Iterable[T]): Stream returned by `create(..., stream=True)` of chat
+            completions or completions, or `iter_audio_bytes()` of a speech response.
+        max_buffered (int, optional): Chunks read ahead before the reader waits for the
+            consumer. Defaults to 256.
+        on_stall (Callable[[PrefetchStats], None], optional): Called from the reader thread
+            each time it finds the buffer full. Its errors end the stream and are raised
+            by `next()`.
+    """
+
+    def __init__(
+        self,
+        stream: Iterable[T],
+        max_buffered: int = STREAM_PREFETCH_SIZE,
+        on_stall: Callable[[PrefetchStats], None] | None = None,
+    ) -> None:
+        if max_buffered < 1:
+            raise ValueError("max_buffered must be at least 1")
+        self.stats = PrefetchStats()
+        self._chunks: queue.Queue[Tuple[int, Any]] = queue.Queue(max_buffered)
+        self._stop = threading.Event()
+        self._done = False
+        self._thread = threading.Thread(
+            target=_prefetch,
+            args=(stream, self._chunks, self._stop, self.stats, on_stall),
+            name="together-stream-prefetch",
+            daemon=True,
+        )
+        self._finalizer = weakref.finalize(self, self._stop.set)
+        self._thread.start()
+
+    def __iter__(self) -> PrefetchingStream[T]:
+        return self
+
+    def __next__(self) -> T:
+        if self._done:
+            raise StopIteration
+        kind, value = self._chunks.get()
+        self.stats.buffered = self._chunks.qsize()
+        if kind == _ITEM:
+            return value  # type: ignore[no-any-return]
+        self._done = True
+        if kind == _ERROR:
+            raise value
+        raise StopIteration
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop reading ahead and close the stream.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the reader thread, which only
+                notices once its current read returns. Defaults to not waiting.
+        """
+        self._done = True
+        self._stop.set()
+        if timeout is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self) -> PrefetchingStream[T]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
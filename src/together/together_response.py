@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import json
+from json import JSONDecodeError
+from time import perf_counter_ns
+from typing import Any, AsyncIterator, Dict, Iterator, Type, TypeVar
+
+import pydantic
+
+from together import profiling
+
+
+M = TypeVar("M", bound=pydantic.BaseModel)
+
+# Marks a response whose JSON body has not been decoded yet
+_NOT_DECODED: Any = object()
 
 
 class TogetherResponse:
@@ -8,9 +21,56 @@ class TogetherResponse:
     API Response class. Stores headers and response data.
     """
 
-    def __init__(self, data: Any, headers: Dict[str, Any]):
+    def __init__(self, data: Any, headers: Dict[str, Any], text: str | None = None):
         self._headers = headers
-        self.data = data
+        self._data = data
+        # JSON body, kept when decoding is deferred until `data` or `parse` is used
+        self.text = text
+
+    @classmethod
+    def from_json(cls, text: str, headers: Dict[str, Any]) -> TogetherResponse:
+        """Response with a JSON body that is only decoded when it is used."""
+        return cls(_NOT_DECODED, headers, text=text)
+
+    @property
+    def data(self) -> Any:
+        if self._data is _NOT_DECODED:
+            assert self.text is not None
+            try:
+                self._data = json.loads(self.text)
+            except JSONDecodeError as e:
+                # imported here as together.error depends on together.types
+                from together.error import APIError
+
+                raise APIError(
+                    f"Invalid JSON in response body: {self.text}", headers=self._headers
+                ) from e
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+
+    def parse(self, model: Type[M]) -> M:
+        """
+        Builds `model` from the response data.
+
+        An undecoded JSON body is parsed straight into the model by pydantic-core, which
+        skips building the intermediate Python objects of `json.loads`. The result is the
+        same as `model(**response.data)`.
+        """
+        started = perf_counter_ns() if profiling.enabled else 0
+        try:
+            if self._data is _NOT_DECODED:
+                try:
+                    return model.model_validate_json(self.text)  # type: ignore[arg-type]
+                except pydantic.ValidationError:
+                    # Decode and validate again to raise the same errors as `model(**data)`
+                    pass
+            return model(**self.data)
+        finally:
+            if started:
+                profiling.record("parse_response", started)
 
     @property
     def request_id(self) -> str | None:
@@ -48,3 +108,25 @@ class TogetherResponse:
             h = self._headers["x-total-time"]
             return None if h is None else round(float(h))
         return None
+
+
+class RawResponse:
+    """
+    Undecoded API response, for proxies that forward responses as they are.
+
+    Non-streamed responses have the body in `content`. Streamed responses have the raw
+    server-sent event bytes, as received, in `chunks` (an iterator, or an async iterator for
+    async clients); the connection is released once it is exhausted or closed.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Dict[str, Any],
+        content: bytes | None = None,
+        chunks: Iterator[bytes] | AsyncIterator[bytes] | None = None,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.chunks = chunks
@@ -1,4 +1,4 @@
-from together.types.abstract import TogetherClient
+from together.types.abstract import Deadlines, TogetherClient
 from together.types.audio_speech import (
     AudioLanguage,
     AudioResponseEncoding,
@@ -77,7 +77,7 @@ from together.types.finetune import (
     TrainingMethodSFT,
     TrainingType,
 )
-from together.types.images import ImageRequest, ImageResponse
+from together.types.images import GeneratedImage, ImageRequest, ImageResponse
 from together.types.models import ModelObject, ModelUploadRequest, ModelUploadResponse
 from together.types.rerank import RerankRequest, RerankResponse
 from together.types.videos import CreateVideoBody, CreateVideoResponse, VideoJob
@@ -85,6 +85,7 @@ from together.types.videos import CreateVideoBody, CreateVideoResponse, VideoJob
 
 __all__ = [
     "TogetherClient",
+    "Deadlines",
     "TogetherRequest",
     "CompletionChunk",
     "CompletionRequest",
@@ -115,6 +116,7 @@ __all__ = [
     "FileObject",
     "FilePurpose",
     "FileType",
+    "GeneratedImage",
     "ImageRequest",
     "ImageResponse",
     "ModelObject",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
 import pydantic
 from pydantic import ConfigDict
@@ -10,9 +10,34 @@ from typing_extensions import ClassVar
 from together.constants import BASE_URL, MAX_RETRIES, TIMEOUT_SECS
 
 
+if TYPE_CHECKING:
+    from together.hooks import RequestHooks
+
+
 PYDANTIC_V2 = pydantic.VERSION.startswith("2.")
 
 
+@dataclass(frozen=True)
+class Deadlines:
+    """
+    Time limits of an API call, in seconds. Each limit raises its own subclass of
+    `together.error.Timeout`.
+
+    Args:
+        total (float, optional): Limit on the whole call, including retries and reading a
+            streamed response to the end. Raises `DeadlineExceededError`.
+        first_event (float, optional): Limit on the wait for the response headers, and for
+            the first event or audio chunk of a stream, from the start of each attempt.
+            Raises `FirstEventTimeoutError`, without retrying.
+        idle (float, optional): Limit on the gap between two events or audio chunks of a
+            stream. Raises `StreamIdleTimeoutError`.
+    """
+
+    total: float | None = None
+    first_event: float | None = None
+    idle: float | None = None
+
+
 @dataclass
 class TogetherClient:
     api_key: str | None = None
@@ -20,6 +45,10 @@ class TogetherClient:
     timeout: float | None = TIMEOUT_SECS
     max_retries: int | None = MAX_RETRIES
     supplied_headers: Dict[str, str] | None = None
+    # default time limits of calls, see `Deadlines`
+    deadlines: Deadlines | None = None
+    # callbacks on the lifecycle of requests, see `together.hooks.RequestHooks`
+    hooks: RequestHooks | None = None
 
 
 class BaseModel(pydantic.BaseModel):
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 import base64
+import itertools
+import struct
 from enum import Enum
 from re import S
-from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict
 
 from together.together_response import TogetherResponse
 
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
 class AudioResponseFormat(str, Enum):
     MP3 = "mp3"
     WAV = "wav"
@@ -78,11 +84,176 @@ class AudioSpeechStreamEventResponse(BaseModel):
     response: AudioSpeechStreamEvent | StreamSentinel
 
 
+# WAV format tag and bits per sample of each response encoding
+_WAV_FORMATS = {
+    AudioResponseEncoding.PCM_F32LE: (3, 32),  # IEEE float
+    AudioResponseEncoding.PCM_S16LE: (1, 16),  # PCM
+    AudioResponseEncoding.PCM_MULAW: (7, 8),  # G.711 mu-law
+    AudioResponseEncoding.PCM_ALAW: (6, 8),  # G.711 A-law
+}
+_WAV_HEADER_SIZE = 44
+# Format of streamed audio when the response doesn't record the request parameters
+_DEFAULT_SAMPLE_RATE = 24000
+_DEFAULT_ENCODING = AudioResponseEncoding.PCM_S16LE
+
+
+def _wav_header(
+    data_size: int,
+    sample_rate: int,
+    encoding: AudioResponseEncoding,
+    num_channels: int = 1,
+) -> bytes:
+    """Header of a WAV file holding `data_size` bytes of audio in `encoding`."""
+    audio_format, bits_per_sample = _WAV_FORMATS[encoding]
+    block_align = num_channels * bits_per_sample // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size + data_size % 2,  # file size - 8, including the pad byte
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        audio_format,
+        num_channels,
+        sample_rate,
+        sample_rate * block_align,  # byte rate
+        block_align,
+        bits_per_sample,
+        b"data",
+        data_size,
+    )
+
+
+def _g711_table(encoding: AudioResponseEncoding) -> np.ndarray:
+    """16-bit linear value of each of the 256 mu-law or A-law code words."""
+    import numpy as np
+
+    if encoding == AudioResponseEncoding.PCM_MULAW:
+        code = ~np.arange(256, dtype=np.int32) & 0xFF
+        exponent = (code >> 4) & 0x07
+        magnitude = ((((code & 0x0F) << 3) + 0x84) << exponent) - 0x84
+        values = np.where(code & 0x80, -magnitude, magnitude)
+    else:
+        code = np.arange(256, dtype=np.int32) ^ 0x55
+        exponent = (code >> 4) & 0x07
+        mantissa = (code & 0x0F) << 4
+        magnitude = np.where(
+            exponent == 0,
+            mantissa + 8,
+            (mantissa + 0x108) << np.maximum(exponent - 1, 0),
+        )
+        values = np.where(code & 0x80, magnitude, -magnitude)
+    return values.astype(np.int16)
+
+
+def _skip_wav_header(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Drop the RIFF header of a streamed WAV file, yielding only the sample data."""
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        position = 12
+        while position + 8 <= len(buffer):
+            chunk_id, chunk_size = struct.unpack_from("<4sI", buffer, position)
+            if chunk_id == b"data":
+                yield buffer[position + 8 :]
+                yield from chunks
+                return
+            position += 8 + chunk_size + chunk_size % 2
+
+
 class AudioSpeechStreamResponse(BaseModel):
     response: TogetherResponse | Iterator[TogetherResponse]
+    # format of the audio, as requested
+    response_format: AudioResponseFormat | None = None
+    response_encoding: AudioResponseEncoding | None = None
+    sample_rate: int | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    def iter_audio_bytes(self) -> Iterator[bytes]:
+        """
+        Iterate over the audio as it is received.
+
+        Streamed chunks are decoded from base64 when the server sends them as events.
+        The stream can only be consumed once.
+
+        Yields:
+            bytes: Audio data, in the requested format and encoding.
+        """
+        if isinstance(self.response, TogetherResponse):
+            yield self.response.data
+            return
+
+        for chunk in self.response:
+            if isinstance(chunk.data, bytes):
+                yield chunk.data
+            elif isinstance(chunk.data, dict):
+                # SSE format with JSON/base64
+                try:
+                    stream_event = AudioSpeechStreamEventResponse(
+                        response={"data": chunk.data}
+                    )
+                except Exception:
+                    continue  # Skip malformed chunks
+                if isinstance(stream_event.response, StreamSentinel):
+                    break
+                yield base64.b64decode(stream_event.response.data.b64)
+
+    def iter_pcm_frames(self, frame_size: int | None = None) -> Iterator[np.ndarray]:
+        """
+        Iterate over the decoded samples as they are received, e.g. for real-time playback.
+
+        Samples split across chunks are carried over to the next frame. A WAV header sent
+        by the server is skipped.
+
+        Args:
+            frame_size (int, optional): Number of samples in each frame; the last frame may
+                be shorter. Defaults to None, which yields the samples of each chunk.
+
+        Yields:
+            np.ndarray: float32 samples for `pcm_f32le` audio, int16 samples otherwise
+                (mu-law and A-law are expanded to 16-bit linear PCM).
+        """
+        import numpy as np
+
+        if self.response_format == AudioResponseFormat.MP3:
+            raise ValueError("PCM frames are only available for wav and raw audio.")
+
+        encoding = AudioResponseEncoding(self.response_encoding or _DEFAULT_ENCODING)
+        sample_width = _WAV_FORMATS[encoding][1] // 8
+        block_size = sample_width * (frame_size or 1)
+        table = (
+            _g711_table(encoding)
+            if encoding
+            in (AudioResponseEncoding.PCM_MULAW, AudioResponseEncoding.PCM_ALAW)
+            else None
+        )
+
+        def decode(data: bytes) -> np.ndarray:
+            if table is not None:
+                return table[np.frombuffer(data, dtype=np.uint8)]
+            dtype = "<f4" if encoding == AudioResponseEncoding.PCM_F32LE else "<i2"
+            return np.frombuffer(data, dtype=dtype).astype(dtype[1:])
+
+        chunks = self.iter_audio_bytes()
+        first = next(chunks, b"")
+        chunks = itertools.chain([first], chunks)
+        if first.startswith(b"RIFF"):
+            chunks = _skip_wav_header(chunks)
+
+        pending = bytearray()
+        for chunk in chunks:
+            pending += chunk
+            size = len(pending) - len(pending) % block_size
+            if size:
+                yield decode(bytes(pending[:size]))
+                del pending[:size]
+
+        # last, incomplete frame; a trailing partial sample is dropped
+        size = len(pending) - len(pending) % sample_width
+        if size:
+            yield decode(bytes(pending[:size]))
+
     def stream_to_file(
         self, file_path: str, response_format: AudioResponseFormat | str | None = None
     ) -> None:
@@ -90,8 +261,10 @@ class AudioSpeechStreamResponse(BaseModel):
         Save the audio response to a file.
 
         For non-streaming responses, writes the complete file as received.
-        For streaming responses, collects binary chunks and constructs a valid
-        file format based on the response_format parameter.
+        For streaming responses, writes each chunk as it arrives and constructs a valid
+        file format based on the response_format parameter. Raw PCM saved as WAV gets a
+        header for the requested sample rate and encoding, with sizes filled in once the
+        stream ends.
 
         Args:
             file_path: Path where the audio file should be saved.
@@ -119,90 +292,70 @@ class AudioSpeechStreamResponse(BaseModel):
             # Non-streaming: save complete file
             with open(file_path, "wb") as f:
                 f.write(self.response.data)
-
-        elif isinstance(self.response, Iterator):
-            # Streaming: collect binary chunks
-            audio_chunks = []
-            for chunk in self.response:
-                if isinstance(chunk.data, bytes):
-                    audio_chunks.append(chunk.data)
-                elif isinstance(chunk.data, dict):
-                    # SSE format with JSON/base64
-                    try:
-                        stream_event = AudioSpeechStreamEventResponse(
-                            response={"data": chunk.data}
-                        )
-                        if isinstance(stream_event.response, StreamSentinel):
-                            break
-                        audio_chunks.append(
-                            base64.b64decode(stream_event.response.data.b64)
-                        )
-                    except Exception:
-                        continue  # Skip malformed chunks
-
-            if not audio_chunks:
-                raise ValueError("No audio data received in streaming response")
-
-            # Concatenate all chunks
-            audio_data = b"".join(audio_chunks)
-
-            with open(file_path, "wb") as f:
-                if response_format == AudioResponseFormat.WAV:
-                    if audio_data.startswith(b"RIFF"):
-                        # Already a valid WAV file
-                        f.write(audio_data)
-                    else:
-                        # Raw PCM - add WAV header
-                        self._write_wav_header(f, audio_data)
-                elif response_format == AudioResponseFormat.MP3:
-                    # MP3 format: Check if data is actually MP3 or raw PCM
-                    # MP3 files start with ID3 tag or sync word (0xFF 0xFB/0xFA/0xF3/0xF2)
-                    is_mp3 = audio_data.startswith(b"ID3") or (
-                        len(audio_data) > 0
-                        and audio_data[0:1] == b"\xff"
-                        and len(audio_data) > 1
-                        and audio_data[1] & 0xE0 == 0xE0
-                    )
-
-                    if is_mp3:
-                        f.write(audio_data)
-                    else:
-                        raise ValueError("Invalid MP3 data received.")
-                else:
-                    # RAW format: write PCM data as-is
-                    f.write(audio_data)
+            return
+
+        chunks = self.iter_audio_bytes()
+        audio_data = b""
+        for audio_data in chunks:
+            if audio_data:
+                break
+        if not audio_data:
+            raise ValueError("No audio data received in streaming response")
+
+        if response_format == AudioResponseFormat.MP3:
+            # MP3 files start with ID3 tag or sync word (0xFF 0xFB/0xFA/0xF3/0xF2)
+            is_mp3 = audio_data.startswith(b"ID3") or (
+                len(audio_data) > 1
+                and audio_data[0:1] == b"\xff"
+                and audio_data[1] & 0xE0 == 0xE0
+            )
+            if not is_mp3:
+                raise ValueError("Invalid MP3 data received.")
+
+        # Raw PCM - add WAV header
+        add_header = (
+            response_format == AudioResponseFormat.WAV
+            and not audio_data.startswith(b"RIFF")
+        )
+        sample_rate = self.sample_rate or _DEFAULT_SAMPLE_RATE
+        encoding = AudioResponseEncoding(self.response_encoding or _DEFAULT_ENCODING)
+
+        with open(file_path, "wb") as f:
+            if add_header:
+                # sizes are unknown until the stream ends
+                f.write(_wav_header(0, sample_rate, encoding))
+
+            data_size = 0
+            for audio_data in itertools.chain([audio_data], chunks):
+                f.write(audio_data)
+                data_size += len(audio_data)
+
+            if add_header:
+                if data_size % 2:
+                    f.write(b"\x00")  # RIFF chunks are padded to an even size
+                f.seek(0)
+                f.write(_wav_header(data_size, sample_rate, encoding))
 
     @staticmethod
-    def _write_wav_header(file_handle: BinaryIO, audio_data: bytes) -> None:
+    def _write_wav_header(
+        file_handle: BinaryIO,
+        audio_data: bytes,
+        sample_rate: int = _DEFAULT_SAMPLE_RATE,
+        response_encoding: AudioResponseEncoding | str = _DEFAULT_ENCODING,
+    ) -> None:
         """
-        Write WAV file header for raw PCM audio data.
+        Write WAV file header for raw PCM audio data, followed by the data.
 
-        Uses default TTS parameters: 16-bit PCM, mono, 24000 Hz sample rate.
+        Defaults to 16-bit PCM, mono, 24000 Hz sample rate.
         """
-        import struct
-
-        sample_rate = 24000
-        num_channels = 1
-        bits_per_sample = 16
-        byte_rate = sample_rate * num_channels * bits_per_sample // 8
-        block_align = num_channels * bits_per_sample // 8
-        data_size = len(audio_data)
-
-        # Write WAV header
-        file_handle.write(b"RIFF")
-        file_handle.write(struct.pack("<I", 36 + data_size))  # File size - 8
-        file_handle.write(b"WAVE")
-        file_handle.write(b"fmt ")
-        file_handle.write(struct.pack("<I", 16))  # fmt chunk size
-        file_handle.write(struct.pack("<H", 1))  # Audio format (1 = PCM)
-        file_handle.write(struct.pack("<H", num_channels))
-        file_handle.write(struct.pack("<I", sample_rate))
-        file_handle.write(struct.pack("<I", byte_rate))
-        file_handle.write(struct.pack("<H", block_align))
-        file_handle.write(struct.pack("<H", bits_per_sample))
-        file_handle.write(b"data")
-        file_handle.write(struct.pack("<I", data_size))
+        file_handle.write(
+            _wav_header(
+                len(audio_data), sample_rate, AudioResponseEncoding(response_encoding)
+            )
+        )
         file_handle.write(audio_data)
+        if len(audio_data) % 2:
+            file_handle.write(b"\x00")
 
 
 class AudioTranscriptionResponseFormat(str, Enum):
@@ -6,7 +6,7 @@ from typing import Any, Dict, List
 from pydantic import ConfigDict
 from tqdm.utils import CallbackIOWrapper
 
-from together.types.abstract import BaseModel
+from together.types.abstract import BaseModel, Deadlines
 
 
 # Generation finish reason
@@ -63,5 +63,9 @@ class TogetherRequest(BaseModel):
     headers: Dict[str, str] | None = None
     params: Dict[str, Any] | CallbackIOWrapper | None = None
     files: Dict[str, Any] | None = None
+    # pre-serialized JSON body, sent as is instead of `params`
+    body: bytes | None = None
     allow_redirects: bool = True
     override_headers: bool = False
+    # time limits of this call, instead of those of the client
+    deadlines: Deadlines | None = None
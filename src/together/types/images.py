@@ -40,3 +40,20 @@ class ImageResponse(BaseModel):
     object: Literal["list"] | None = None
     # list of embedding choices
     data: List[ImageChoicesData] | None = None
+
+
+class GeneratedImage(BaseModel):
+    # position of the prompt in the batch
+    prompt_index: int
+    # position of the image among the `n` results of the prompt
+    image_index: int = 0
+    prompt: str
+    seed: int | None = None
+    # file the image was written to
+    path: str | None = None
+    # image bytes, kept when the image is not written to disk or passed to a callback
+    data: bytes | None = None
+    # URL of the image, for results returned as URLs
+    url: str | None = None
+    # error of a failed generation
+    error: str | None = None
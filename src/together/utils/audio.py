@@ -0,0 +1,382 @@
+from __future__ import annotations
+
+import io
+import math
+import shutil
+import subprocess
+import wave
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Sequence, Tuple
+
+from together.constants import (
+    AUDIO_CHUNK_DURATION,
+    AUDIO_CHUNK_OVERLAP,
+    AUDIO_CHUNK_SAMPLE_RATE,
+    AUDIO_SILENCE_FRAME,
+    AUDIO_SILENCE_SEARCH,
+)
+from together.error import FileTypeError
+from together.types.audio_speech import (
+    AudioSpeakerSegment,
+    AudioTranscriptionSegment,
+    AudioTranscriptionVerboseResponse,
+    AudioTranscriptionWord,
+)
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# largest difference between the start times of a word transcribed in two chunks
+_WORD_MATCH_TOLERANCE = 0.3
+
+
+@dataclass
+class AudioChunk:
+    """A window of a WAV file that is transcribed as a separate request.
+
+    Times are in seconds from the start of the file. The chunk spans [start, end), and the
+    parts of its transcript starting in [keep_start, keep_end) are kept; the rest overlaps
+    the neighbouring chunks.
+    """
+
+    index: int
+    start: float
+    end: float
+    keep_start: float
+    keep_end: float
+
+
+def prepare_wav(file: str | Path | BinaryIO, directory: str | Path) -> Path:
+    """
+    Get a WAV file readable by the `wave` module for `file`.
+
+    PCM WAV files are used as they are. Other formats are converted to 16 kHz mono WAV
+    with ffmpeg, which must be installed.
+
+    Args:
+        file (str | Path | BinaryIO): Audio file path, or binary file object.
+        directory (str | Path): Directory for the copies of file objects and converted files.
+
+    Returns:
+        Path: The WAV file.
+    """
+    if isinstance(file, (str, Path)):
+        path = Path(file)
+    else:
+        path = Path(directory) / "input"
+        with open(path, "wb") as f:
+            shutil.copyfileobj(file, f)
+
+    try:
+        with wave.open(str(path), "rb"):
+            return path
+    except (wave.Error, EOFError):
+        pass
+
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise FileTypeError(
+            f"{path.name} is not a PCM WAV file. Install ffmpeg to transcribe other "
+            "audio formats in chunks."
+        )
+
+    output = Path(directory) / "input.wav"
+    result = subprocess.run(
+        [
+            ffmpeg,
+            "-nostdin",
+            "-v",
+            "error",
+            "-y",
+            "-i",
+            str(path),
+            "-ac",
+            "1",
+            "-ar",
+            str(AUDIO_CHUNK_SAMPLE_RATE),
+            "-c:a",
+            "pcm_s16le",
+            str(output),
+        ],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise FileTypeError(
+            f"Could not convert {path.name} to WAV: "
+            f"{result.stderr.decode(errors='replace').strip()}"
+        )
+    return output
+
+
+def _to_mono(data: bytes, sample_width: int, num_channels: int) -> np.ndarray:
+    """Samples of WAV frames as floats, averaged over channels."""
+    import numpy as np
+
+    if sample_width == 1:
+        samples = np.frombuffer(data, dtype=np.uint8).astype(np.float64) - 128
+    elif sample_width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = np.where(values & 0x800000, values - (1 << 24), values).astype(
+            np.float64
+        )
+    else:
+        samples = np.frombuffer(data, dtype=f"<i{sample_width}").astype(np.float64)
+    mono: np.ndarray = samples.reshape(-1, num_channels).mean(axis=1)
+    return mono
+
+
+def _quietest_point(audio: wave.Wave_read, start: float, end: float) -> float:
+    """Middle of the quietest frame between `start` and `end`, preferring later frames."""
+    import numpy as np
+
+    rate = audio.getframerate()
+    audio.setpos(int(start * rate))
+    samples = _to_mono(
+        audio.readframes(int((end - start) * rate)),
+        audio.getsampwidth(),
+        audio.getnchannels(),
+    )
+    frame = max(int(rate * AUDIO_SILENCE_FRAME), 1)
+    num_frames = len(samples) // frame
+    if num_frames == 0:
+        return end
+
+    energy = np.square(samples[: num_frames * frame].reshape(num_frames, frame)).mean(
+        axis=1
+    )
+    quietest = num_frames - 1 - int(np.argmin(energy[::-1]))
+    return start + (quietest + 0.5) * frame / rate
+
+
+def split_audio(
+    path: str | Path,
+    chunk_duration: float = AUDIO_CHUNK_DURATION,
+    overlap: float = AUDIO_CHUNK_OVERLAP,
+    split_on_silence: bool = True,
+) -> List[AudioChunk]:
+    """
+    Split a WAV file into chunks for transcription.
+
+    Args:
+        path (str | Path): WAV file, see `prepare_wav`.
+        chunk_duration (float, optional): Longest span between two boundaries, in seconds.
+            Defaults to 300.
+        overlap (float, optional): Seconds of audio shared by consecutive chunks, split evenly
+            around each boundary. Defaults to 2.
+        split_on_silence (bool, optional): Whether to move each boundary to the quietest point
+            in the seconds before it, so that words are not cut. Defaults to True.
+
+    Returns:
+        List[AudioChunk]: Chunks covering the whole file.
+    """
+    if chunk_duration <= 0:
+        raise ValueError("chunk_duration must be positive")
+    if overlap < 0 or overlap >= chunk_duration:
+        raise ValueError("overlap must be non-negative and shorter than chunk_duration")
+
+    with wave.open(str(path), "rb") as audio:
+        duration = audio.getnframes() / audio.getframerate()
+        boundaries = [0.0]
+        while duration - boundaries[-1] > chunk_duration:
+            boundary = boundaries[-1] + chunk_duration
+            if split_on_silence:
+                search = min(AUDIO_SILENCE_SEARCH, chunk_duration / 4)
+                boundary = _quietest_point(audio, boundary - search, boundary)
+            boundaries.append(boundary)
+        boundaries.append(duration)
+
+    return [
+        AudioChunk(
+            index=index,
+            start=max(keep_start - overlap / 2, 0.0),
+            end=min(keep_end + overlap / 2, duration),
+            keep_start=keep_start,
+            keep_end=keep_end,
+        )
+        for index, (keep_start, keep_end) in enumerate(zip(boundaries, boundaries[1:]))
+    ]
+
+
+def read_audio_chunk(path: str | Path, chunk: AudioChunk) -> bytes:
+    """Audio of `chunk` as a WAV file with the format of `path`."""
+    with wave.open(str(path), "rb") as audio:
+        rate = audio.getframerate()
+        first = int(chunk.start * rate)
+        last = min(int(chunk.end * rate), audio.getnframes())
+        audio.setpos(first)
+        frames = audio.readframes(last - first)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as output:
+            output.setparams(audio.getparams())
+            output.writeframes(frames)
+    return buffer.getvalue()
+
+
+def _match_speakers(
+    previous_words: Sequence[Tuple[float, str, str | None]],
+    words: Sequence[AudioTranscriptionWord],
+    offset: float,
+    chunk_index: int,
+) -> Dict[str, str]:
+    """
+    Map the speakers of a chunk to the speakers of the previous chunks.
+
+    Speakers are matched by the words transcribed in both chunks, in their overlap. Speakers
+    that can't be matched get an ID of their own.
+    """
+    votes: Counter[Tuple[str, str]] = Counter()
+    for word in words:
+        if word.speaker_id is None:
+            continue
+        text = word.word.strip().lower()
+        for start, previous_text, previous_speaker in previous_words:
+            if (
+                previous_speaker is not None
+                and previous_text == text
+                and abs(start - (word.start + offset)) <= _WORD_MATCH_TOLERANCE
+            ):
+                votes[(word.speaker_id, previous_speaker)] += 1
+                break
+
+    mapping: Dict[str, str] = {}
+    for (speaker, previous_speaker), _ in votes.most_common():
+        if speaker not in mapping and previous_speaker not in mapping.values():
+            mapping[speaker] = previous_speaker
+
+    for word in words:
+        if word.speaker_id is not None and word.speaker_id not in mapping:
+            mapping[word.speaker_id] = (
+                word.speaker_id
+                if chunk_index == 0
+                else f"{word.speaker_id}-{chunk_index}"
+            )
+    return mapping
+
+
+def merge_transcriptions(
+    chunks: Sequence[AudioChunk],
+    responses: Sequence[AudioTranscriptionVerboseResponse],
+) -> AudioTranscriptionVerboseResponse:
+    """
+    Stitch the transcriptions of chunks into the transcription of the whole file.
+
+    Timestamps are shifted by the start of each chunk, and segments and words from the
+    overlap between chunks are kept once. Diarization speaker IDs are made consistent
+    across chunks, see `_match_speakers`.
+
+    Args:
+        chunks (Sequence[AudioChunk]): Chunks from `split_audio`.
+        responses (Sequence[AudioTranscriptionVerboseResponse]): `verbose_json`
+            transcription of each chunk.
+
+    Returns:
+        AudioTranscriptionVerboseResponse: The transcription of the whole file.
+    """
+    texts: List[str] = []
+    segments: List[AudioTranscriptionSegment] = []
+    words: List[AudioTranscriptionWord] = []
+    speaker_segments: List[AudioSpeakerSegment] = []
+    has_segments = has_words = has_speaker_segments = False
+    previous_words: List[Tuple[float, str, str | None]] = []
+
+    for chunk, response in zip(chunks, responses):
+        offset = chunk.start
+        keep_start = chunk.keep_start if chunk.index > 0 else -math.inf
+        keep_end = chunk.keep_end if chunk.index < len(chunks) - 1 else math.inf
+
+        def kept(start: float) -> bool:
+            return keep_start <= start + offset < keep_end
+
+        speakers = _match_speakers(
+            previous_words, response.words or [], offset, chunk.index
+        )
+
+        def shift_word(word: AudioTranscriptionWord) -> AudioTranscriptionWord:
+            return word.model_copy(
+                update={
+                    "start": word.start + offset,
+                    "end": word.end + offset,
+                    "speaker_id": (
+                        speakers.get(word.speaker_id, word.speaker_id)
+                        if word.speaker_id is not None
+                        else None
+                    ),
+                }
+            )
+
+        chunk_text: List[str] = []
+        if response.segments is not None:
+            has_segments = True
+            for segment in response.segments:
+                if kept(segment.start):
+                    segments.append(
+                        segment.model_copy(
+                            update={
+                                "id": len(segments),
+                                "start": segment.start + offset,
+                                "end": segment.end + offset,
+                            }
+                        )
+                    )
+                    chunk_text.append(segment.text.strip())
+
+        if response.words is not None:
+            has_words = True
+            for word in response.words:
+                if kept(word.start):
+                    shifted = shift_word(word)
+                    if word.id is not None:
+                        shifted.id = len(words)
+                    words.append(shifted)
+                    if response.segments is None:
+                        chunk_text.append(word.word.strip())
+
+        if response.speaker_segments is not None:
+            has_speaker_segments = True
+            for speaker_segment in response.speaker_segments:
+                if kept(speaker_segment.start):
+                    speaker_segments.append(
+                        speaker_segment.model_copy(
+                            update={
+                                "id": len(speaker_segments),
+                                "speaker_id": speakers.get(
+                                    speaker_segment.speaker_id,
+                                    speaker_segment.speaker_id,
+                                ),
+                                "start": speaker_segment.start + offset,
+                                "end": speaker_segment.end + offset,
+                                "words": [
+                                    shift_word(word) for word in speaker_segment.words
+                                ],
+                            }
+                        )
+                    )
+
+        if response.segments is None and response.words is None:
+            # no timestamps to drop the overlap by
+            chunk_text.append(response.text.strip())
+        texts.extend(text for text in chunk_text if text)
+
+        previous_words = [
+            (
+                word.start + offset,
+                word.word.strip().lower(),
+                speakers.get(word.speaker_id) if word.speaker_id is not None else None,
+            )
+            for word in response.words or []
+        ]
+
+    return AudioTranscriptionVerboseResponse(
+        language=next((r.language for r in responses if r.language), None),
+        duration=chunks[-1].end if chunks else None,
+        text=" ".join(texts),
+        segments=segments if has_segments else None,
+        words=words if has_words else None,
+        speaker_segments=speaker_segments if has_speaker_segments else None,
+    )
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import codecs
 import csv
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from traceback import format_exc
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 from tqdm import tqdm
 
 from together.constants import (
     JSONL_REQUIRED_COLUMNS_MAP,
+    LOSS_IGNORE_INDEX,
     MAX_BASE64_IMAGE_LENGTH,
     MAX_FILE_SIZE_GB,
     MAX_IMAGES_PER_EXAMPLE,
@@ -19,9 +22,11 @@ from together.constants import (
     PARQUET_EXPECTED_COLUMNS,
     POSSIBLE_ROLES_CONVERSATION,
     REQUIRED_COLUMNS_MESSAGE,
+    VALIDATION_BLOCK_SIZE,
     DatasetFormat,
 )
 from together.types import FilePurpose
+from together.utils.validation_cache import ValidationCache, get_file_identity
 
 
 # MessageContent is a string or a list of dicts with 'type': 'text' or 'image_url', and 'text' or 'image_url.url'
@@ -52,7 +57,27 @@ class InvalidFileFormatError(ValueError):
 def check_file(
     file: Path | str,
     purpose: FilePurpose | str = FilePurpose.FineTune,
+    num_workers: int = 1,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
+    """Check that a dataset file can be used for the given purpose.
+
+    Reports are cached locally (see `together.utils.validation_cache`), so checking a file
+    again is instant as long as its size, modification time, inode and content fingerprint
+    are unchanged.
+
+    Args:
+        file (Path | str): Path to the file to check.
+        purpose (FilePurpose | str, optional): Purpose of the file.
+            Defaults to FilePurpose.FineTune.
+        num_workers (int, optional): Number of processes used to validate large JSONL files.
+            Defaults to 1, which validates the file in the current process.
+        use_cache (bool, optional): Reuse the report of a previous check of the same file.
+            Defaults to True.
+
+    Returns:
+        Dict[str, Any]: Report of the checks. `is_check_passed` is False if any check failed.
+    """
     if not isinstance(file, Path):
         file = Path(file)
 
@@ -93,10 +118,20 @@ def check_file(
     else:
         report_dict["file_size"] = file_size
 
+    cache = None
+    identity = None
+    purpose_key = purpose.value if isinstance(purpose, FilePurpose) else str(purpose)
+    if use_cache:
+        cache = ValidationCache()
+        identity = get_file_identity(file)
+        cached_report = cache.get(identity, purpose_key)
+        if cached_report is not None:
+            return cached_report
+
     data_report_dict = {}
     if file.suffix == ".jsonl":
         report_dict["filetype"] = "jsonl"
-        data_report_dict = _check_jsonl(file, purpose)
+        data_report_dict = _check_jsonl(file, purpose, num_workers)
     elif file.suffix == ".parquet":
         report_dict["filetype"] = "parquet"
         data_report_dict = _check_parquet(file, purpose)
@@ -112,6 +147,11 @@ def check_file(
 
     report_dict.update(data_report_dict)
 
+    # Don't cache a report for a file that changed while it was being checked.
+    if cache is not None and identity is not None:
+        if get_file_identity(file) == identity:
+            cache.set(identity, purpose_key, report_dict)
+
     return report_dict
 
 
@@ -637,123 +677,219 @@ def _check_csv(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
     return report_dict
 
 
-def _check_jsonl(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
-    report_dict: Dict[str, Any] = {}
-    report_dict.update(_check_utf8(file))
-    if not report_dict["utf8"]:
-        return report_dict
+def read_jsonl_lines(
+    file: Path,
+    block_size: int = VALIDATION_BLOCK_SIZE,
+    start: int = 0,
+    end: int | None = None,
+) -> Iterator[str]:
+    """Read a file once in binary blocks and yield its lines decoded as strict UTF-8.
 
-    dataset_format = None
-    with file.open() as f:
-        idx = -1
-        try:
-            for idx, line in tqdm(enumerate(f), desc="Validating file", unit=" lines"):
-                json_line = json.loads(line)
+    Lines are split the same way as iterating over a file opened in text mode
+    (universal newlines), so line numbers match what users see in their editors.
+
+    Args:
+        file (Path): Path to the file to read.
+        block_size (int): Number of bytes to read at a time.
+        start (int): Byte offset to start reading at. Must be at a line boundary.
+        end (int, optional): Byte offset to stop reading at. Reads to the end of the file if None.
+
+    Raises:
+        UnicodeDecodeError: If the file is not UTF-8 encoded.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="strict")
+    pending: List[str] = []
+    carry = ""
+    remaining = end - start if end is not None else -1
+
+    with file.open("rb") as f:
+        f.seek(start)
+        while True:
+            if remaining < 0:
+                block = f.read(block_size)
+            else:
+                block = f.read(min(block_size, remaining))
+                remaining -= len(block)
+            final = not block
+            text = carry + decoder.decode(block, final=final)
+            carry = ""
+
+            # A trailing "\r" may be the first half of a "\r\n" split across blocks.
+            if not final and text.endswith("\r"):
+                carry = "\r"
+                text = text[:-1]
+
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+            lines = text.split("\n")
+            if len(lines) == 1:
+                if text:
+                    pending.append(text)
+            else:
+                if pending:
+                    pending.append(lines[0])
+                    lines[0] = "".join(pending)
+                    pending = []
+                if lines[-1]:
+                    pending.append(lines[-1])
+                lines.pop()
+                yield from lines
 
-                if not isinstance(json_line, dict):
+            if final:
+                break
+
+    if pending:
+        yield "".join(pending)
+
+
+def _check_jsonl_line(
+    json_line: Any, idx: int, purpose: FilePurpose | str
+) -> DatasetFormat | None:
+    """Validate a single parsed JSONL sample.
+
+    Args:
+        json_line (Any): The parsed line.
+        idx (int): Line index in the file.
+        purpose (FilePurpose | str): Purpose of the file.
+
+    Returns:
+        DatasetFormat | None: The detected format of the sample, or None for eval files.
+
+    Raises:
+        InvalidFileFormatError: If the sample is invalid.
+    """
+    if not isinstance(json_line, dict):
+        raise InvalidFileFormatError(
+            message=(
+                f"Error parsing file. Invalid format on line {idx + 1} of the input file. "
+                "Datasets must follow text, conversational, or instruction format. For more"
+                "information, see https://docs.together.ai/docs/fine-tuning-data-preparation"
+            ),
+            line_number=idx + 1,
+            error_source="line_type",
+        )
+    # In evals, we don't check the format of the dataset.
+    if purpose == FilePurpose.Eval:
+        return None
+
+    current_format = None
+    for possible_format in JSONL_REQUIRED_COLUMNS_MAP:
+        if all(
+            column in json_line
+            for column in JSONL_REQUIRED_COLUMNS_MAP[possible_format]
+        ):
+            if current_format is None:
+                current_format = possible_format
+            elif current_format != possible_format:
+                raise InvalidFileFormatError(
+                    message="Found multiple dataset formats in the input file. "
+                    f"Got {current_format} and {possible_format} on line {idx + 1}.",
+                    line_number=idx + 1,
+                    error_source="format",
+                )
+
+            # Check that there are no extra columns
+            for column in json_line:
+                if column not in JSONL_REQUIRED_COLUMNS_MAP[possible_format]:
                     raise InvalidFileFormatError(
-                        message=(
-                            f"Error parsing file. Invalid format on line {idx + 1} of the input file. "
-                            "Datasets must follow text, conversational, or instruction format. For more"
-                            "information, see https://docs.together.ai/docs/fine-tuning-data-preparation"
-                        ),
+                        message=f'Found extra column "{column}" in the line {idx + 1}.',
                         line_number=idx + 1,
-                        error_source="line_type",
+                        error_source="format",
                     )
-                # In evals, we don't check the format of the dataset.
-                if purpose != FilePurpose.Eval:
-                    current_format = None
-                    for possible_format in JSONL_REQUIRED_COLUMNS_MAP:
-                        if all(
-                            column in json_line
-                            for column in JSONL_REQUIRED_COLUMNS_MAP[possible_format]
-                        ):
-                            if current_format is None:
-                                current_format = possible_format
-                            elif current_format != possible_format:
-                                raise InvalidFileFormatError(
-                                    message="Found multiple dataset formats in the input file. "
-                                    f"Got {current_format} and {possible_format} on line {idx + 1}.",
-                                    line_number=idx + 1,
-                                    error_source="format",
-                                )
-
-                            # Check that there are no extra columns
-                            for column in json_line:
-                                if (
-                                    column
-                                    not in JSONL_REQUIRED_COLUMNS_MAP[possible_format]
-                                ):
-                                    raise InvalidFileFormatError(
-                                        message=f'Found extra column "{column}" in the line {idx + 1}.',
-                                        line_number=idx + 1,
-                                        error_source="format",
-                                    )
-
-                    if current_format is None:
-                        raise InvalidFileFormatError(
-                            message=(
-                                f"Error parsing file. Could not detect a format for the line {idx + 1} with the columns:\n"
-                                f"{json_line.keys()}"
-                            ),
-                            line_number=idx + 1,
-                            error_source="format",
-                        )
-                    if current_format == DatasetFormat.PREFERENCE_OPENAI:
-                        validate_preference_openai(json_line, idx)
-                    elif current_format == DatasetFormat.CONVERSATION:
-                        message_column = JSONL_REQUIRED_COLUMNS_MAP[
-                            DatasetFormat.CONVERSATION
-                        ][0]
-                        require_assistant = purpose != FilePurpose.Eval
-                        validate_messages(
-                            json_line[message_column],
-                            idx,
-                            require_assistant_role=require_assistant,
-                        )
-                    else:
-                        for column in JSONL_REQUIRED_COLUMNS_MAP[current_format]:
-                            role = "assistant" if column in {"completion"} else "user"
-                            _check_message_content(
-                                json_line[column], role=role, idx=idx
-                            )
-
-                    if dataset_format is None:
-                        dataset_format = current_format
-                    elif current_format is not None:
-                        if current_format != dataset_format:
-                            raise InvalidFileFormatError(
-                                message="All samples in the dataset must have the same dataset format. "
-                                f"Got {dataset_format} for the first line and {current_format} "
-                                f"for the line {idx + 1}.",
-                                line_number=idx + 1,
-                                error_source="format",
-                            )
 
-            report_dict.update(_check_samples_count(file, report_dict, idx))
+    if current_format is None:
+        raise InvalidFileFormatError(
+            message=(
+                f"Error parsing file. Could not detect a format for the line {idx + 1} with the columns:\n"
+                f"{json_line.keys()}"
+            ),
+            line_number=idx + 1,
+            error_source="format",
+        )
+    if current_format == DatasetFormat.PREFERENCE_OPENAI:
+        validate_preference_openai(json_line, idx)
+    elif current_format == DatasetFormat.CONVERSATION:
+        message_column = JSONL_REQUIRED_COLUMNS_MAP[DatasetFormat.CONVERSATION][0]
+        require_assistant = purpose != FilePurpose.Eval
+        validate_messages(
+            json_line[message_column],
+            idx,
+            require_assistant_role=require_assistant,
+        )
+    else:
+        for column in JSONL_REQUIRED_COLUMNS_MAP[current_format]:
+            role = "assistant" if column in {"completion"} else "user"
+            _check_message_content(json_line[column], role=role, idx=idx)
 
-            report_dict["load_json"] = True
+    return current_format
 
-        except InvalidFileFormatError as e:
-            report_dict["load_json"] = False
-            report_dict["is_check_passed"] = False
-            report_dict["message"] = e.message
-            if e.line_number is not None:
-                report_dict["line_number"] = e.line_number
-            if e.error_source is not None:
-                report_dict[e.error_source] = False
-        except ValueError:
-            report_dict["load_json"] = False
-            if idx < 0:
-                report_dict["message"] = (
-                    "Unable to decode file. File may be empty or in an unsupported format. "
-                )
-            else:
-                report_dict["message"] = (
-                    f"Error parsing json payload. Unexpected format on line {idx + 1}."
-                )
-            report_dict["is_check_passed"] = False
 
+def _check_jsonl_sample(
+    line: str,
+    idx: int,
+    purpose: FilePurpose | str,
+    dataset_format: DatasetFormat | None,
+) -> DatasetFormat | None:
+    """Parse and validate one line against the format of the first sample in the file.
+
+    Raises:
+        ValueError: If the line is not valid JSON.
+        InvalidFileFormatError: If the sample is invalid.
+    """
+    json_line = json.loads(line)
+
+    current_format = _check_jsonl_line(json_line, idx, purpose)
+
+    if dataset_format is not None and current_format is not None:
+        if current_format != dataset_format:
+            raise _dataset_format_mismatch_error(dataset_format, current_format, idx)
+
+    return current_format
+
+
+def _dataset_format_mismatch_error(
+    dataset_format: DatasetFormat, current_format: DatasetFormat, idx: int
+) -> InvalidFileFormatError:
+    return InvalidFileFormatError(
+        message="All samples in the dataset must have the same dataset format. "
+        f"Got {dataset_format} for the first line and {current_format} "
+        f"for the line {idx + 1}.",
+        line_number=idx + 1,
+        error_source="format",
+    )
+
+
+def _jsonl_error_report(error: ValueError, idx: int) -> Dict[str, Any]:
+    """Build the report entries for the first invalid line of a JSONL file."""
+    report_dict: Dict[str, Any] = {"load_json": False, "is_check_passed": False}
+    if isinstance(error, InvalidFileFormatError):
+        report_dict["message"] = error.message
+        if error.line_number is not None:
+            report_dict["line_number"] = error.line_number
+        if error.error_source is not None:
+            report_dict[error.error_source] = False
+    elif idx < 0:
+        report_dict["message"] = (
+            "Unable to decode file. File may be empty or in an unsupported format. "
+        )
+    else:
+        report_dict["message"] = (
+            f"Error parsing json payload. Unexpected format on line {idx + 1}."
+        )
+    return report_dict
+
+
+def _utf8_error_report(error: UnicodeDecodeError | str) -> Dict[str, Any]:
+    return {
+        "utf8": False,
+        "message": f"File is not UTF-8 encoded. Error raised: {error}.",
+        "is_check_passed": False,
+    }
+
+
+def _finalize_jsonl_report(report_dict: Dict[str, Any]) -> Dict[str, Any]:
+    report_dict["utf8"] = True
     if "text_field" not in report_dict:
         report_dict["text_field"] = True
     if "line_type" not in report_dict:
@@ -763,9 +899,212 @@ def _check_jsonl(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
     return report_dict
 
 
+def _check_jsonl(
+    file: Path, purpose: FilePurpose | str, num_workers: int = 1
+) -> Dict[str, Any]:
+    if num_workers > 1 and os.stat(file).st_size > VALIDATION_BLOCK_SIZE:
+        return _check_jsonl_parallel(file, purpose, num_workers)
+
+    report_dict: Dict[str, Any] = {}
+
+    # UTF-8 decoding, JSON parsing and format checks share a single read of the file.
+    lines = read_jsonl_lines(file)
+    try:
+        report_dict.update(_check_jsonl_lines(file, lines, purpose))
+        # Validation stops at the first invalid sample. Keep decoding the rest of the
+        # file so that encoding errors take precedence, as they would in a separate pass.
+        for _ in lines:
+            pass
+    except UnicodeDecodeError as e:
+        return _utf8_error_report(e)
+
+    return _finalize_jsonl_report(report_dict)
+
+
+def _check_jsonl_lines(
+    file: Path, lines: Iterator[str], purpose: FilePurpose | str
+) -> Dict[str, Any]:
+    report_dict: Dict[str, Any] = {}
+    dataset_format = None
+    idx = -1
+    try:
+        for idx, line in tqdm(enumerate(lines), desc="Validating file", unit=" lines"):
+            current_format = _check_jsonl_sample(line, idx, purpose, dataset_format)
+
+            if dataset_format is None:
+                dataset_format = current_format
+
+        report_dict.update(_check_samples_count(file, report_dict, idx))
+
+        report_dict["load_json"] = True
+
+    except UnicodeDecodeError:
+        raise
+    except ValueError as e:
+        report_dict.update(_jsonl_error_report(e, idx))
+
+    return report_dict
+
+
+def split_jsonl_ranges(file: Path, num_ranges: int) -> List[Tuple[int, int]]:
+    """Split a file into at most `num_ranges` byte ranges that end on a newline."""
+    file_size = os.stat(file).st_size
+    boundaries = [0]
+
+    with file.open("rb") as f:
+        for i in range(1, num_ranges):
+            position = max(file_size * i // num_ranges, boundaries[-1])
+            f.seek(position)
+            # Move the boundary right after the next "\n", scanning in small blocks
+            # so that very long lines are not loaded into memory.
+            while True:
+                block = f.read(64 * 1024)
+                if not block:
+                    position = file_size
+                    break
+                newline = block.find(b"\n")
+                if newline >= 0:
+                    position += newline + 1
+                    break
+                position += len(block)
+            if position >= file_size:
+                break
+            boundaries.append(position)
+
+    boundaries.append(file_size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def _check_jsonl_range(
+    file: Path, start: int, end: int, purpose: FilePurpose | str
+) -> Dict[str, Any]:
+    """Validate the lines in a byte range of a JSONL file. Runs in a worker process.
+
+    Line indices in the result are relative to the start of the range, since the
+    number of preceding lines is only known once all ranges have been read.
+
+    Returns:
+        Dict[str, Any]: Number of lines, the format of the first line, and the index and
+            content of the first invalid line or the UTF-8 decoding error, if any.
+    """
+    result: Dict[str, Any] = {
+        "num_lines": 0,
+        "first_format": None,
+        "error_idx": None,
+        "error_line": None,
+        "utf8_error": None,
+    }
+    dataset_format = None
+
+    try:
+        for idx, line in enumerate(read_jsonl_lines(file, start=start, end=end)):
+            result["num_lines"] = idx + 1
+            if result["error_idx"] is not None:
+                # Keep decoding: the line count and encoding errors are still needed.
+                continue
+            try:
+                current_format = _check_jsonl_sample(line, idx, purpose, dataset_format)
+            except UnicodeDecodeError:
+                raise
+            except ValueError:
+                result["error_idx"] = idx
+                result["error_line"] = line
+                continue
+            if dataset_format is None:
+                dataset_format = current_format
+                result["first_format"] = current_format
+    except UnicodeDecodeError as e:
+        result["utf8_error"] = str(e)
+
+    return result
+
+
+def _check_jsonl_parallel(
+    file: Path, purpose: FilePurpose | str, num_workers: int
+) -> Dict[str, Any]:
+    """Validate a JSONL file with a pool of processes.
+
+    The file is split at newlines into byte ranges which are validated independently.
+    The reports are merged so that the result is the same as `_check_jsonl` would give:
+    encoding errors take precedence, then the invalid line with the lowest line number,
+    including samples whose format differs from the first sample of the file.
+    """
+    # A few ranges per worker keeps all processes busy when ranges take uneven time.
+    ranges = split_jsonl_ranges(file, num_workers * 4)
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(_check_jsonl_range, file, start, end, purpose)
+            for start, end in ranges
+        ]
+        with tqdm(
+            total=ranges[-1][1], desc="Validating file", unit="B", unit_scale=True
+        ) as pbar:
+            future_sizes = {
+                future: end - start for future, (start, end) in zip(futures, ranges)
+            }
+            for future in as_completed(futures):
+                pbar.update(future_sizes[future])
+        results = [future.result() for future in futures]
+
+    for result in results:
+        if result["utf8_error"] is not None:
+            return _utf8_error_report(result["utf8_error"])
+
+    report_dict: Dict[str, Any] = {}
+    dataset_format = results[0]["first_format"]
+    line_offset = 0
+
+    for result in results:
+        idx = line_offset
+        try:
+            if result["error_idx"] == 0:
+                # An invalid first line is reported as is, before the format of the range
+                # is compared with the file, as `_check_jsonl` would stop at it.
+                _check_jsonl_sample(result["error_line"], idx, purpose, dataset_format)
+            # The first line of a range was validated without knowing the format of the
+            # first line of the file.
+            if (
+                dataset_format is not None
+                and result["first_format"] is not None
+                and result["first_format"] != dataset_format
+            ):
+                raise _dataset_format_mismatch_error(
+                    dataset_format, result["first_format"], idx
+                )
+            if result["error_idx"] is not None:
+                # Re-run the check with the line number in the whole file to get the message.
+                idx = line_offset + result["error_idx"]
+                _check_jsonl_sample(result["error_line"], idx, purpose, dataset_format)
+        except ValueError as e:
+            report_dict.update(_jsonl_error_report(e, idx))
+            return _finalize_jsonl_report(report_dict)
+
+        line_offset += result["num_lines"]
+
+    report_dict.update(_check_samples_count(file, report_dict, line_offset - 1))
+    report_dict["load_json"] = True
+
+    return _finalize_jsonl_report(report_dict)
+
+
 def _check_parquet(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
+    """Check if the file is a valid pre-tokenized Parquet file.
+
+    Only the file metadata is loaded up front; the token columns are then read and checked
+    one row group at a time with vectorized pyarrow compute kernels, so memory use is bounded
+    by the size of the largest row group.
+
+    Args:
+        file (Path): Path to the file to check.
+        purpose (FilePurpose | str): Purpose of the file.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the results of the check.
+    """
     try:
         # Pyarrow is optional as it's large (~80MB) and isn't compatible with older systems.
+        import pyarrow as pa
         from pyarrow import ArrowInvalid, parquet
     except ImportError:
         raise ImportError(
@@ -782,8 +1121,8 @@ def _check_parquet(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
         return report_dict
 
     try:
-        table = parquet.read_table(str(file), memory_map=True)
-    except ArrowInvalid:
+        parquet_file = parquet.ParquetFile(str(file))
+    except (ArrowInvalid, OSError):
         report_dict["load_parquet"] = (
             f"An exception has occurred when loading the Parquet file {file}. Please check the file for corruption. "
             f"Exception trace:\n{format_exc()}"
@@ -791,7 +1130,8 @@ def _check_parquet(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
         report_dict["is_check_passed"] = False
         return report_dict
 
-    column_names = table.schema.names
+    schema = parquet_file.schema_arrow
+    column_names = schema.names
     if "input_ids" not in column_names:
         report_dict["load_parquet"] = (
             f"Parquet file {file} does not contain the `input_ids` column."
@@ -809,7 +1149,7 @@ def _check_parquet(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
             report_dict["is_check_passed"] = False
             return report_dict
 
-    num_samples = len(table)
+    num_samples = parquet_file.metadata.num_rows
     if num_samples < MIN_SAMPLES:
         report_dict["has_min_samples"] = False
         report_dict["message"] = (
@@ -821,6 +1161,130 @@ def _check_parquet(file: Path, purpose: FilePurpose | str) -> Dict[str, Any]:
     else:
         report_dict["num_samples"] = num_samples
 
+    try:
+        for column_name in column_names:
+            column_type = schema.field(column_name).type
+            if not (
+                pa.types.is_list(column_type)
+                or pa.types.is_large_list(column_type)
+                or pa.types.is_fixed_size_list(column_type)
+            ) or not pa.types.is_integer(column_type.value_type):
+                raise InvalidFileFormatError(
+                    message=f"Column `{column_name}` of Parquet file {file} must be a list of integers, found {column_type}.",
+                    error_source="key_value",
+                )
+
+        max_sequence_length = 0
+        row_offset = 0
+        for row_group in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(row_group, columns=column_names)
+            max_sequence_length = max(
+                max_sequence_length,
+                _check_parquet_row_group(table, row_group, row_offset),
+            )
+            row_offset += table.num_rows
+    except InvalidFileFormatError as e:
+        report_dict["is_check_passed"] = False
+        report_dict["message"] = e.message
+        if e.line_number is not None:
+            report_dict["line_number"] = e.line_number
+            report_dict["row_group"] = row_group
+        if e.error_source is not None:
+            report_dict[e.error_source] = False
+        return report_dict
+    except (ArrowInvalid, OSError):
+        report_dict["load_parquet"] = (
+            f"An exception has occurred when reading row group {row_group} of the Parquet file {file}. "
+            f"Please check the file for corruption. Exception trace:\n{format_exc()}"
+        )
+        report_dict["is_check_passed"] = False
+        return report_dict
+
+    report_dict["max_sequence_length"] = max_sequence_length
     report_dict["is_check_passed"] = True
 
     return report_dict
+
+
+def _first_true(mask: Any) -> int:
+    """Index of the first true value of a boolean array, or -1."""
+    import pyarrow.compute as pc
+
+    index: int = pc.index(mask, True).as_py()
+    return index
+
+
+def _check_parquet_row_group(table: Any, row_group: int, row_offset: int) -> int:
+    """Check the token columns of one row group.
+
+    Args:
+        table (pyarrow.Table): Columns of the row group.
+        row_group (int): Index of the row group, used in error messages.
+        row_offset (int): Number of rows in the preceding row groups.
+
+    Returns:
+        int: Length of the longest sequence in the row group.
+
+    Raises:
+        InvalidFileFormatError: If a row is invalid. `line_number` is the 1-based row number
+            in the file.
+    """
+    import pyarrow.compute as pc
+
+    def row_error(message: str, row: int) -> InvalidFileFormatError:
+        return InvalidFileFormatError(
+            message=f"{message} on row {row_offset + row + 1} (row group {row_group}).",
+            line_number=row_offset + row + 1,
+            error_source="key_value",
+        )
+
+    columns = {name: table.column(name).combine_chunks() for name in table.column_names}
+    for name, column in columns.items():
+        if column.null_count > 0:
+            raise row_error(f"`{name}` is null", _first_true(pc.is_null(column)))
+        values = pc.list_flatten(column)
+        if values.null_count > 0:
+            row = pc.list_parent_indices(column)[_first_true(pc.is_null(values))]
+            raise row_error(f"`{name}` contains a null token", row.as_py())
+
+    lengths = pc.list_value_length(columns["input_ids"])
+    row = _first_true(pc.equal(lengths, 0))
+    if row >= 0:
+        raise row_error("`input_ids` is empty", row)
+
+    for name in ("attention_mask", "labels"):
+        if name in columns:
+            row = _first_true(
+                pc.not_equal(pc.list_value_length(columns[name]), lengths)
+            )
+            if row >= 0:
+                raise row_error(f"`{name}` and `input_ids` have different lengths", row)
+
+    # Rows have equal lengths from here on, so flattened values line up token by token.
+    if "attention_mask" in columns:
+        mask = columns["attention_mask"]
+        mask_values = pc.list_flatten(mask)
+        index = _first_true(pc.or_(pc.less(mask_values, 0), pc.greater(mask_values, 1)))
+        if index >= 0:
+            raise row_error(
+                "`attention_mask` must only contain 0 and 1",
+                pc.list_parent_indices(mask)[index].as_py(),
+            )
+
+    if "labels" in columns:
+        labels = columns["labels"]
+        label_values = pc.list_flatten(labels)
+        index = _first_true(
+            pc.and_(
+                pc.not_equal(label_values, pc.list_flatten(columns["input_ids"])),
+                pc.not_equal(label_values, LOSS_IGNORE_INDEX),
+            )
+        )
+        if index >= 0:
+            raise row_error(
+                f"`labels` must be equal to `input_ids` or to the ignore index {LOSS_IGNORE_INDEX}",
+                pc.list_parent_indices(labels)[index].as_py(),
+            )
+
+    max_length: int = pc.max(lengths).as_py() or 0
+    return max_length
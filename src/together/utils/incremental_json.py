@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import copy
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+
+# Characters that can appear in numbers, `true`, `false` and `null`
+_LITERAL_CHARS = frozenset("0123456789+-.eEtrufalsn")
+_WHITESPACE = frozenset(" \t\r\n")
+_STRING_SPECIAL = re.compile(r'["\\]')
+_DOCUMENT_START = re.compile(r"[{\[]")
+
+JSONPath = Tuple[str | int, ...]
+
+
+@dataclass
+class JSONEvent:
+    """A change in a JSON document being parsed incrementally.
+
+    `type` is one of:
+        - "field": the value of an object member is complete. `path` ends with the key.
+        - "item": an array item is complete. `path` ends with the item index.
+        - "done": the whole document is complete. `path` is empty.
+        - "error": the output is not valid JSON. `value` is the error message and `path`
+          the location of the error. No further events are emitted.
+    """
+
+    type: str
+    path: JSONPath
+    value: Any
+
+
+class _Frame:
+    __slots__ = ("container", "path", "key", "expect")
+
+    def __init__(self, container: Dict[str, Any] | List[Any], path: JSONPath) -> None:
+        self.container = container
+        self.path = path
+        self.key: str | None = None
+        self.expect = "key_or_end" if isinstance(container, dict) else "value_or_end"
+
+
+class IncrementalJSONParser:
+    """Parses a JSON object or array that arrives in arbitrary fragments.
+
+    Text before the first `{` or `[` (such as a Markdown code fence) and after the end of
+    the document is ignored. Strings are kept as lists of raw fragments and decoded once,
+    so parsing is linear in the size of the document.
+
+    Example:
+        >>> parser = IncrementalJSONParser()
+        >>> parser.feed('{"name": "Al')
+        []
+        >>> parser.partial
+        {'name': 'Al'}
+        >>> parser.feed('ice", "tags": ["a"')
+        [JSONEvent(type='field', path=('name',), value='Alice'), JSONEvent(type='item', path=('tags', 0), value='a')]
+    """
+
+    def __init__(self) -> None:
+        self._stack: List[_Frame] = []
+        self._root: Dict[str, Any] | List[Any] | None = None
+        self._started = False
+        self.done = False
+        self.error: str | None = None
+
+        self._in_string = False
+        self._string_is_key = False
+        self._string_parts: List[str] = []
+        self._escape_pending = False
+        self._literal_parts: List[str] | None = None
+
+    @property
+    def value(self) -> Any:
+        """The parsed document, or None until it is complete."""
+        return self._root if self.done else None
+
+    @property
+    def partial(self) -> Any:
+        """A copy of the document parsed so far, including the string being received.
+
+        Unfinished numbers and literals are left out. Returns None before the document starts.
+        """
+        if self._root is None:
+            return None
+
+        snapshot = copy.deepcopy(self._root)
+        if self._in_string and not self._string_is_key and self._stack:
+            frame = self._stack[-1]
+            container: Any = snapshot
+            for key in frame.path:
+                container = container[key]
+            value = self._decode_partial_string()
+            if isinstance(container, dict):
+                container[frame.key] = value
+            else:
+                container.append(value)
+        return snapshot
+
+    def feed(self, text: str) -> List[JSONEvent]:
+        """Parse the next fragment of the document.
+
+        Returns:
+            List[JSONEvent]: Events for the values completed by this fragment.
+        """
+        events: List[JSONEvent] = []
+        i = 0
+        n = len(text)
+        while i < n and not self.done and self.error is None:
+            if self._in_string:
+                i = self._scan_string(text, i, events)
+                continue
+
+            ch = text[i]
+            if self._literal_parts is not None:
+                if ch in _LITERAL_CHARS:
+                    self._literal_parts.append(ch)
+                    i += 1
+                    continue
+                self._finish_literal(events)
+                if self.error is not None:
+                    break
+
+            if not self._started:
+                match = _DOCUMENT_START.search(text, i)
+                if match is None:
+                    break
+                i = match.start()
+                ch = text[i]
+                self._started = True
+
+            i += 1
+            if ch not in _WHITESPACE:
+                self._handle(ch, events)
+
+        return events
+
+    def close(self) -> List[JSONEvent]:
+        """Signal the end of the output, reporting an error if the document is incomplete."""
+        events: List[JSONEvent] = []
+        if not self.done and self.error is None:
+            self._fail("Unexpected end of JSON output", events)
+        return events
+
+    def _path(self) -> JSONPath:
+        if not self._stack:
+            return ()
+        frame = self._stack[-1]
+        if isinstance(frame.container, dict):
+            return frame.path + ((frame.key,) if frame.key is not None else ())
+        return frame.path + (len(frame.container),)
+
+    def _fail(self, message: str, events: List[JSONEvent]) -> None:
+        self.error = message
+        events.append(JSONEvent("error", self._path(), message))
+
+    def _handle(self, ch: str, events: List[JSONEvent]) -> None:
+        if not self._stack:
+            self._start_value(ch, events)
+            return
+
+        frame = self._stack[-1]
+        expect = frame.expect
+        if isinstance(frame.container, dict):
+            if expect in ("key_or_end", "key") and ch == '"':
+                self._in_string = True
+                self._string_is_key = True
+                self._string_parts = []
+            elif expect in ("key_or_end", "comma_or_end") and ch == "}":
+                self._close(events)
+            elif expect == "colon" and ch == ":":
+                frame.expect = "value"
+            elif expect == "value":
+                self._start_value(ch, events)
+            elif expect == "comma_or_end" and ch == ",":
+                frame.expect = "key"
+                frame.key = None
+            else:
+                self._fail(f"Unexpected character {ch!r} in object", events)
+        else:
+            if expect in ("value_or_end", "comma_or_end") and ch == "]":
+                self._close(events)
+            elif expect in ("value_or_end", "value"):
+                self._start_value(ch, events)
+            elif expect == "comma_or_end" and ch == ",":
+                frame.expect = "value"
+            else:
+                self._fail(f"Unexpected character {ch!r} in array", events)
+
+    def _start_value(self, ch: str, events: List[JSONEvent]) -> None:
+        if ch in "{[":
+            container: Dict[str, Any] | List[Any] = {} if ch == "{" else []
+            if self._stack:
+                path = self._attach(self._stack[-1], container)
+            else:
+                self._root = container
+                path = ()
+            self._stack.append(_Frame(container, path))
+        elif ch == '"':
+            self._in_string = True
+            self._string_is_key = False
+            self._string_parts = []
+        elif ch in "-0123456789tfn":
+            self._literal_parts = [ch]
+        else:
+            self._fail(f"Unexpected character {ch!r}, expected a value", events)
+
+    def _attach(self, frame: _Frame, value: Any) -> JSONPath:
+        if isinstance(frame.container, dict):
+            assert frame.key is not None
+            frame.container[frame.key] = value
+            return frame.path + (frame.key,)
+        frame.container.append(value)
+        return frame.path + (len(frame.container) - 1,)
+
+    def _complete_value(self, value: Any, events: List[JSONEvent]) -> None:
+        frame = self._stack[-1]
+        path = self._attach(frame, value)
+        frame.expect = "comma_or_end"
+        event_type = "field" if isinstance(frame.container, dict) else "item"
+        events.append(JSONEvent(event_type, path, value))
+
+    def _close(self, events: List[JSONEvent]) -> None:
+        frame = self._stack.pop()
+        if not self._stack:
+            self.done = True
+            events.append(JSONEvent("done", (), self._root))
+            return
+        parent = self._stack[-1]
+        parent.expect = "comma_or_end"
+        event_type = "field" if isinstance(parent.container, dict) else "item"
+        events.append(JSONEvent(event_type, frame.path, frame.container))
+
+    def _scan_string(self, text: str, i: int, events: List[JSONEvent]) -> int:
+        """Consume string contents from `text[i:]`, returning the index after them."""
+        n = len(text)
+        j = i
+        if self._escape_pending:
+            # the previous fragment ended with a backslash, skip the escaped character
+            self._escape_pending = False
+            j += 1
+        while True:
+            match = _STRING_SPECIAL.search(text, j)
+            if match is None:
+                self._string_parts.append(text[i:])
+                return n
+            k = match.start()
+            if text[k] == "\\":
+                if k + 1 < n:
+                    j = k + 2
+                    continue
+                self._string_parts.append(text[i:])
+                self._escape_pending = True
+                return n
+            self._string_parts.append(text[i:k])
+            self._in_string = False
+            self._finish_string(events)
+            return k + 1
+
+    def _finish_string(self, events: List[JSONEvent]) -> None:
+        raw = "".join(self._string_parts)
+        self._string_parts = []
+        try:
+            value = json.loads(f'"{raw}"', strict=False)
+        except ValueError as e:
+            self._fail(f"Invalid string: {e}", events)
+            return
+
+        if self._string_is_key:
+            frame = self._stack[-1]
+            frame.key = value
+            frame.expect = "colon"
+        else:
+            self._complete_value(value, events)
+
+    def _decode_partial_string(self) -> str:
+        raw = "".join(self._string_parts)
+        # drop an escape sequence that is cut in the middle
+        backslash = raw.rfind("\\", max(len(raw) - 6, 0))
+        for candidate in (raw, raw[:backslash] if backslash >= 0 else raw):
+            try:
+                decoded: str = json.loads(f'"{candidate}"', strict=False)
+                return decoded
+            except ValueError:
+                continue
+        return ""
+
+    def _finish_literal(self, events: List[JSONEvent]) -> None:
+        assert self._literal_parts is not None
+        literal = "".join(self._literal_parts)
+        self._literal_parts = None
+        try:
+            value = json.loads(literal)
+        except ValueError:
+            self._fail(f"Invalid literal {literal!r}", events)
+            return
+        self._complete_value(value, events)
@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import itertools
+import json
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import numpy as np
+from tqdm import tqdm
+
+from together.constants import LOSS_IGNORE_INDEX, PACKING_SHARD_SIZE
+from together.utils.files import read_jsonl_lines, split_jsonl_ranges
+
+
+T = TypeVar("T")
+
+# Tokenizers loaded in the current process, keyed by name
+_TOKENIZERS: Dict[str, Any] = {}
+
+
+def pack_sequences(
+    sequences: Sequence[Sequence[int] | np.ndarray],
+    max_seq_len: int,
+    pad_token_id: int,
+    eos_token_id: int | None = None,
+    add_labels: bool = True,
+    drop_incomplete: bool = True,
+    mask_document_boundaries: bool = False,
+) -> Dict[str, np.ndarray]:
+    """Concatenate tokenized documents and split them into rows of `max_seq_len` tokens.
+
+    Example, with `max_seq_len=8`:
+        Row 1: ['<s>', '▁usually', '▁,', '▁he', '▁would', '▁be', '▁t', 'earing']
+        Row 2: ['▁around', '▁the', '▁living', '▁room', '▁,', '▁playing', '▁with', '▁his']
+        Row 3: ['▁toys', '▁.', '</s>', '<s>', '▁but', '▁just', '▁one', '▁look']
+
+    Args:
+        sequences (Sequence[Sequence[int] | np.ndarray]): Token ids of each document.
+        max_seq_len (int): Number of tokens in each packed row.
+        pad_token_id (int): Token used to fill the last row if it is kept.
+        eos_token_id (int, optional): Token appended to the end of every document.
+            Defaults to None, which appends nothing.
+        add_labels (bool, optional): Add a `labels` column where padding is set to
+            `LOSS_IGNORE_INDEX`. Defaults to True.
+        drop_incomplete (bool, optional): Drop the trailing tokens that don't fill a row
+            instead of padding them. Defaults to True.
+        mask_document_boundaries (bool, optional): Exclude the first token of each document
+            from the loss, so that no document is trained to follow the previous one.
+            Defaults to False.
+
+    Returns:
+        Dict[str, np.ndarray]: `input_ids`, `attention_mask` and optionally `labels`, each of
+            shape `(num_rows, max_seq_len)`.
+    """
+    if max_seq_len <= 0:
+        raise ValueError(f"max_seq_len must be positive, got {max_seq_len}")
+
+    lengths = np.fromiter((len(s) for s in sequences), dtype=np.int64)
+    if len(sequences) > 0:
+        tokens = np.concatenate(
+            [np.asarray(s, dtype=np.int64).reshape(-1) for s in sequences]
+        )
+    else:
+        tokens = np.empty(0, dtype=np.int64)
+
+    doc_ends = np.cumsum(lengths)
+    if eos_token_id is not None:
+        tokens = np.insert(tokens, doc_ends, eos_token_id)
+        # every document gained one token, so shift the ends of the following ones
+        doc_ends = doc_ends + np.arange(1, len(lengths) + 1)
+    doc_starts = doc_ends - lengths - (1 if eos_token_id is not None else 0)
+
+    num_tokens = len(tokens)
+    num_rows, remainder = divmod(num_tokens, max_seq_len)
+    is_real = np.ones(num_tokens, dtype=bool)
+    if remainder and not drop_incomplete:
+        num_rows += 1
+        padding = max_seq_len - remainder
+        tokens = np.concatenate([tokens, np.full(padding, pad_token_id, np.int64)])
+        is_real = np.concatenate([is_real, np.zeros(padding, dtype=bool)])
+
+    size = num_rows * max_seq_len
+    input_ids = tokens[:size].reshape(num_rows, max_seq_len)
+    # the mask is based on positions, so real tokens equal to `pad_token_id` are kept
+    attention_mask = is_real[:size].reshape(num_rows, max_seq_len)
+
+    output: Dict[str, np.ndarray] = {
+        "input_ids": input_ids.astype(np.int32),
+        "attention_mask": attention_mask.astype(np.int8),
+    }
+
+    if add_labels:
+        labels = np.where(is_real, tokens, LOSS_IGNORE_INDEX)
+        if mask_document_boundaries:
+            starts = doc_starts[(doc_starts > 0) & (doc_starts < len(labels))]
+            labels[starts] = LOSS_IGNORE_INDEX
+        output["labels"] = labels[:size].reshape(num_rows, max_seq_len).astype(np.int32)
+
+    return output
+
+
+def packed_to_table(packed: Dict[str, np.ndarray]) -> Any:
+    """Convert the output of `pack_sequences` to a `pyarrow.Table` of list columns.
+
+    Columns are built from the flat token buffers and row offsets without copying
+    rows one by one.
+    """
+    import pyarrow as pa
+
+    num_rows, max_seq_len = packed["input_ids"].shape
+    offsets = pa.array(
+        np.arange(0, num_rows * max_seq_len + 1, max_seq_len, dtype=np.int32)
+    )
+    return pa.table(
+        {
+            name: pa.ListArray.from_arrays(offsets, pa.array(values.reshape(-1)))
+            for name, values in packed.items()
+        }
+    )
+
+
+def _get_tokenizer(name: str) -> Any:
+    if name not in _TOKENIZERS:
+        try:
+            from transformers import AutoTokenizer  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "transformers is not installed and is required to tokenize text. "
+                "Please install it via `pip install transformers`"
+            )
+        _TOKENIZERS[name] = AutoTokenizer.from_pretrained(name)
+    return _TOKENIZERS[name]
+
+
+def _read_documents(
+    file: Path,
+    shard: Tuple[int, int],
+    tokenizer: str | None,
+    text_field: str,
+    add_special_tokens: bool,
+) -> List[Any]:
+    """Read the token ids of the documents in one shard of a JSONL or Parquet file.
+
+    For JSONL files a shard is a byte range, for Parquet files it is a row group index.
+    """
+    if file.suffix == ".parquet":
+        from pyarrow import parquet
+
+        table = parquet.ParquetFile(str(file)).read_row_group(shard[0])
+        if "input_ids" in table.column_names:
+            column = table.column("input_ids").combine_chunks()
+            offsets = column.offsets.to_numpy()
+            values = column.values.to_numpy()
+            return [values[start:end] for start, end in zip(offsets, offsets[1:])]
+        if text_field not in table.column_names:
+            raise ValueError(
+                f"{file} has neither an `input_ids` nor a `{text_field}` column."
+            )
+        texts = table.column(text_field).to_pylist()
+    else:
+        documents = []
+        texts = []
+        for idx, line in enumerate(
+            read_jsonl_lines(file, start=shard[0], end=shard[1])
+        ):
+            if not line.strip():
+                continue
+            sample = json.loads(line)
+            if "input_ids" in sample:
+                documents.append(sample["input_ids"])
+            elif text_field in sample:
+                texts.append(sample[text_field])
+            else:
+                # lines before the shard are only counted to report the error
+                line_number = sum(1 for _ in read_jsonl_lines(file, end=shard[0]))
+                raise ValueError(
+                    f"Line {line_number + idx + 1} of {file} has neither an `input_ids` "
+                    f"nor a `{text_field}` field."
+                )
+        if not texts:
+            return documents
+        if documents:
+            raise ValueError(
+                f"{file} mixes tokenized (`input_ids`) and text (`{text_field}`) samples."
+            )
+
+    if tokenizer is None:
+        raise ValueError(
+            f"Found `{text_field}` instead of `input_ids` in {file}, a tokenizer is required to pack text."
+        )
+    encoded = _get_tokenizer(tokenizer)(
+        texts, add_special_tokens=add_special_tokens, truncation=False
+    )
+    return list(encoded["input_ids"])
+
+
+def _pack_shard(
+    shard: Tuple[int, int],
+    file: Path,
+    tokenizer: str | None,
+    text_field: str,
+    add_special_tokens: bool,
+    pack_kwargs: Dict[str, Any],
+) -> Tuple[Dict[str, np.ndarray], int, int]:
+    """Pack one shard. Runs in a worker process."""
+    documents = _read_documents(file, shard, tokenizer, text_field, add_special_tokens)
+    packed = pack_sequences(documents, **pack_kwargs)
+    return packed, len(documents), shard[1] - shard[0]
+
+
+def _map_bounded(
+    executor: Executor, fn: Callable[[Any], T], items: Iterable[Any], max_pending: int
+) -> Iterator[T]:
+    """Like `executor.map`, but with at most `max_pending` items submitted at a time, so
+    that results do not pile up in memory while the caller is slower than the workers.
+    """
+    items = iter(items)
+    pending: Deque[Future[T]] = deque(
+        executor.submit(fn, item) for item in itertools.islice(items, max_pending)
+    )
+    while pending:
+        result = pending.popleft().result()
+        for item in itertools.islice(items, 1):
+            pending.append(executor.submit(fn, item))
+        yield result
+
+
+def _get_shards(file: Path, shard_size: int) -> List[Tuple[int, int]]:
+    """Split a dataset into independent shards of roughly `shard_size` bytes."""
+    if file.suffix == ".parquet":
+        from pyarrow import parquet
+
+        num_row_groups = parquet.ParquetFile(str(file)).num_row_groups
+        return [(i, i + 1) for i in range(num_row_groups)]
+
+    num_shards = max(1, -(-file.stat().st_size // shard_size))
+    return split_jsonl_ranges(file, num_shards)
+
+
+def pack_dataset(
+    input_file: Path | str,
+    output_file: Path | str,
+    max_seq_len: int,
+    pad_token_id: int | None = None,
+    eos_token_id: int | None = None,
+    tokenizer: str | None = None,
+    text_field: str = "text",
+    add_special_tokens: bool = True,
+    add_labels: bool = True,
+    drop_incomplete: bool = True,
+    mask_document_boundaries: bool = False,
+    num_workers: int = 1,
+    shard_size: int = PACKING_SHARD_SIZE,
+) -> Dict[str, int]:
+    """Pack a dataset into a Parquet file that can be uploaded for fine-tuning.
+
+    The input is a JSONL file with an `input_ids` or a text field per line, or a Parquet
+    file with an `input_ids` or a text column. It is split into shards (byte ranges of
+    roughly `shard_size` for JSONL, row groups for Parquet) that are tokenized and packed
+    independently by `num_workers` processes. Each packed shard is written to the output
+    as one row group as soon as it is ready, and at most two shards per worker are packed
+    ahead of the writer, so the output never has to fit in memory.
+
+    Since shards are packed independently, each shard drops (or pads) its own trailing
+    partial row.
+
+    Args:
+        input_file (Path | str): JSONL or Parquet dataset.
+        output_file (Path | str): Parquet file to write.
+        max_seq_len (int): Number of tokens in each packed row.
+        pad_token_id (int, optional): Padding token. Defaults to the EOS token.
+        eos_token_id (int, optional): Token appended to each document. Defaults to the
+            tokenizer's EOS token if a tokenizer is given.
+        tokenizer (str, optional): Hugging Face tokenizer used to tokenize text.
+            Requires `transformers`. Defaults to None.
+        text_field (str, optional): Field holding the text. Defaults to "text".
+        add_special_tokens (bool, optional): Passed to the tokenizer. Defaults to True.
+        add_labels (bool, optional): Write a `labels` column. Defaults to True.
+        drop_incomplete (bool, optional): Drop partial rows instead of padding them.
+            Defaults to True.
+        mask_document_boundaries (bool, optional): Exclude the first token of each document
+            from the loss. Defaults to False.
+        num_workers (int, optional): Number of processes. Defaults to 1.
+        shard_size (int, optional): Approximate size of a JSONL shard in bytes.
+
+    Returns:
+        Dict[str, int]: Number of documents read and rows and tokens written.
+    """
+    from pyarrow import parquet
+
+    input_file = Path(input_file)
+    output_file = Path(output_file)
+
+    if output_file.suffix != ".parquet":
+        raise ValueError(f"Output file {output_file} must have the .parquet extension")
+
+    if tokenizer is not None and eos_token_id is None:
+        eos_token_id = _get_tokenizer(tokenizer).eos_token_id
+    if pad_token_id is None:
+        if eos_token_id is None:
+            raise ValueError("pad_token_id is required when there is no EOS token")
+        pad_token_id = eos_token_id
+
+    pack_shard = partial(
+        _pack_shard,
+        file=input_file,
+        tokenizer=tokenizer,
+        text_field=text_field,
+        add_special_tokens=add_special_tokens,
+        pack_kwargs={
+            "max_seq_len": max_seq_len,
+            "pad_token_id": pad_token_id,
+            "eos_token_id": eos_token_id,
+            "add_labels": add_labels,
+            "drop_incomplete": drop_incomplete,
+            "mask_document_boundaries": mask_document_boundaries,
+        },
+    )
+    shards = _get_shards(input_file, shard_size)
+
+    stats = {"num_documents": 0, "num_rows": 0, "num_tokens": 0}
+    writer = None
+    executor = ProcessPoolExecutor(num_workers) if num_workers > 1 else None
+    results: Iterator[Tuple[Dict[str, np.ndarray], int, int]] = (
+        _map_bounded(executor, pack_shard, shards, num_workers * 2)
+        if executor
+        else map(pack_shard, shards)
+    )
+    try:
+        with tqdm(
+            total=shards[-1][1] - shards[0][0] if shards else 0,
+            desc="Packing",
+            disable=len(shards) < 2,
+        ) as pbar:
+            for packed, num_documents, shard_length in results:
+                stats["num_documents"] += num_documents
+                stats["num_rows"] += len(packed["input_ids"])
+                stats["num_tokens"] += int(packed["attention_mask"].sum())
+                if len(packed["input_ids"]) > 0:
+                    table = packed_to_table(packed)
+                    if writer is None:
+                        writer = parquet.ParquetWriter(str(output_file), table.schema)
+                    writer.write_table(table)
+                pbar.update(shard_length)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        raise ValueError(
+            f"Packing {input_file} produced no rows of {max_seq_len} tokens"
+        )
+
+    return stats
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict
+
+from together.constants import (
+    VALIDATION_CACHE_FINGERPRINT_BLOCK_SIZE,
+    VALIDATION_CACHE_FINGERPRINT_BLOCKS,
+    VALIDATION_CACHE_MAX_ENTRIES,
+    VALIDATOR_VERSION,
+)
+from together.utils._log import log_debug
+from together.version import VERSION
+
+
+@dataclass(frozen=True)
+class FileIdentity:
+    """Identifies the exact contents of a file without reading all of it."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    inode: int
+    fingerprint: str
+
+
+def default_cache_path() -> Path:
+    """Location of the validation cache database.
+
+    Uses `TOGETHER_CACHE_DIR` if set, otherwise `$XDG_CACHE_HOME/together`
+    or `~/.cache/together`.
+    """
+    cache_dir = os.environ.get("TOGETHER_CACHE_DIR")
+    if not cache_dir:
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(xdg_cache_home, "together")
+    return Path(cache_dir) / "validation.sqlite3"
+
+
+def file_fingerprint(file: Path, size: int) -> str:
+    """Hash the size and a fixed set of blocks spread over the file.
+
+    Reads at most `VALIDATION_CACHE_FINGERPRINT_BLOCKS` blocks, always including the
+    first and the last one, so it is fast even for very large files.
+    """
+    block_size = VALIDATION_CACHE_FINGERPRINT_BLOCK_SIZE
+    num_blocks = VALIDATION_CACHE_FINGERPRINT_BLOCKS
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+
+    with file.open("rb") as f:
+        if size <= block_size * num_blocks:
+            offsets = [0]
+            block_size = size
+        else:
+            step = (size - block_size) // (num_blocks - 1)
+            offsets = [i * step for i in range(num_blocks)]
+        for offset in offsets:
+            f.seek(offset)
+            digest.update(f.read(block_size))
+
+    return digest.hexdigest()
+
+
+def get_file_identity(file: Path) -> FileIdentity:
+    file_stat = os.stat(file)
+    return FileIdentity(
+        path=str(file.resolve()),
+        size=file_stat.st_size,
+        mtime_ns=file_stat.st_mtime_ns,
+        inode=file_stat.st_ino,
+        fingerprint=file_fingerprint(file, file_stat.st_size),
+    )
+
+
+class ValidationCache:
+    """SQLite store of `check_file` reports keyed on file identity, purpose and validator version.
+
+    Errors from the database are logged and treated as cache misses, so a broken or
+    read-only cache never prevents a file from being validated.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.validator_version = f"{VERSION}+{VALIDATOR_VERSION}"
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS reports ("
+            "path TEXT NOT NULL, "
+            "purpose TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "inode INTEGER NOT NULL, "
+            "fingerprint TEXT NOT NULL, "
+            "validator_version TEXT NOT NULL, "
+            "report TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, "
+            "PRIMARY KEY (path, purpose))"
+        )
+        return conn
+
+    def get(self, identity: FileIdentity, purpose: str) -> Dict[str, Any] | None:
+        """Return the cached report, or None if the file or the validator changed."""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT size, mtime_ns, inode, fingerprint, validator_version, report "
+                    "FROM reports WHERE path = ? AND purpose = ?",
+                    (identity.path, purpose),
+                ).fetchone()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            log_debug("Validation cache unavailable", error=e)
+            return None
+
+        if row is None:
+            return None
+
+        size, mtime_ns, inode, fingerprint, validator_version, report = row
+        if (size, mtime_ns, inode, fingerprint, validator_version) != (
+            identity.size,
+            identity.mtime_ns,
+            identity.inode,
+            identity.fingerprint,
+            self.validator_version,
+        ):
+            return None
+
+        try:
+            cached_report = json.loads(report)
+        except (TypeError, ValueError):
+            cached_report = None
+        if not isinstance(cached_report, dict):
+            log_debug("Dropping corrupt validation cache entry", path=identity.path)
+            self._delete(identity, purpose)
+            return None
+        return cached_report
+
+    def _delete(self, identity: FileIdentity, purpose: str) -> None:
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "DELETE FROM reports WHERE path = ? AND purpose = ?",
+                        (identity.path, purpose),
+                    )
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            log_debug("Could not write to validation cache", error=e)
+
+    def set(self, identity: FileIdentity, purpose: str, report: Dict[str, Any]) -> None:
+        """Store a report, replacing any previous report for the same path and purpose."""
+        try:
+            serialized_report = json.dumps(report)
+        except (TypeError, ValueError):
+            return
+
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            identity.path,
+                            purpose,
+                            identity.size,
+                            identity.mtime_ns,
+                            identity.inode,
+                            identity.fingerprint,
+                            self.validator_version,
+                            serialized_report,
+                            time.time(),
+                        ),
+                    )
+                    # Keep the database small by evicting the least recently written reports.
+                    conn.execute(
+                        "DELETE FROM reports WHERE rowid NOT IN "
+                        "(SELECT rowid FROM reports ORDER BY updated_at DESC LIMIT ?)",
+                        (VALIDATION_CACHE_MAX_ENTRIES,),
+                    )
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            log_debug("Could not write to validation cache", error=e)
+
+    def clear(self) -> None:
+        """Remove all cached reports."""
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM reports")
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as e:
+            log_debug("Could not clear validation cache", error=e)
@@ -0,0 +1,464 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+from together.abstract.api_requestor import parse_retry_after_header
+from together.constants import WAITER_CONCURRENCY
+from together.error import (
+    APIConnectionError,
+    JobStateError,
+    RateLimitError,
+    ServiceUnavailableError,
+    Timeout,
+    WaitTimeoutError,
+)
+from together.types.finetune import COMPLETED_STATUSES
+
+
+T = TypeVar("T")
+
+# errors from a status request after which the job is polled again
+_TRANSIENT_ERRORS = (
+    RateLimitError,
+    ServiceUnavailableError,
+    APIConnectionError,
+    Timeout,
+)
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """
+    How often the status of a job is requested.
+
+    The first polls after a job is added, or after its state changes, are `initial_interval`
+    apart, so that short steps are noticed quickly. After that the interval grows by
+    `backoff` on every poll, up to `max_interval`.
+
+    Args:
+        initial_interval (float, optional): Seconds between the first polls.
+        max_interval (float, optional): Longest time between two polls, in seconds.
+        backoff (float, optional): Growth of the interval after the fast polls.
+        fast_polls (int, optional): Number of polls at `initial_interval`.
+        jitter (float, optional): Random fraction added to or removed from each interval,
+            so that jobs added together are not polled together.
+    """
+
+    initial_interval: float = 1.0
+    max_interval: float = 30.0
+    backoff: float = 1.5
+    fast_polls: int = 5
+    jitter: float = 0.1
+
+    def interval(self, attempt: int) -> float:
+        """Seconds before the poll following poll number `attempt` in the current state."""
+        interval = min(
+            self.initial_interval * self.backoff ** max(attempt - self.fast_polls, 0),
+            self.max_interval,
+        )
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+@dataclass(frozen=True)
+class JobKind:
+    """
+    States of a type of job.
+
+    Args:
+        name (str): Name of the type of job, for error messages.
+        final_states (FrozenSet[str]): States the job never leaves.
+        policy (PollingPolicy): Default polling policy.
+        settled_states (FrozenSet[str], optional): States waited for by `wait`. Defaults to
+            `final_states`.
+        transitional_states (FrozenSet[str], optional): States the job passes through
+            between settled states. When set, `wait` only stops at a settled state that is
+            not final once one of them has been seen, so that waiting right after a change
+            is requested does not return the state from before it.
+        state_attribute (str, optional): Attribute of the job holding its state.
+    """
+
+    name: str
+    final_states: FrozenSet[str]
+    policy: PollingPolicy = field(default_factory=PollingPolicy)
+    settled_states: FrozenSet[str] | None = None
+    transitional_states: FrozenSet[str] = frozenset()
+    state_attribute: str = "status"
+
+    def state(self, job: Any) -> str:
+        value = getattr(job, self.state_attribute)
+        return str(value.value if isinstance(value, Enum) else value)
+
+
+FINE_TUNE_JOB = JobKind(
+    name="fine-tuning",
+    final_states=frozenset(status.value for status in COMPLETED_STATUSES),
+    policy=PollingPolicy(initial_interval=5.0, max_interval=60.0),
+)
+BATCH_JOB = JobKind(
+    name="batch",
+    final_states=frozenset({"COMPLETED", "FAILED", "EXPIRED", "CANCELLED"}),
+    policy=PollingPolicy(initial_interval=2.0, max_interval=60.0),
+)
+EVALUATION_JOB = JobKind(
+    name="evaluation",
+    final_states=frozenset({"completed", "error", "user_error"}),
+    policy=PollingPolicy(initial_interval=2.0, max_interval=30.0),
+)
+VIDEO_JOB = JobKind(
+    name="video",
+    final_states=frozenset({"completed", "failed", "cancelled"}),
+    policy=PollingPolicy(initial_interval=1.0, max_interval=10.0),
+)
+# endpoints are started and stopped again, so only failures are final
+ENDPOINT = JobKind(
+    name="endpoint",
+    final_states=frozenset({"FAILED", "ERROR"}),
+    settled_states=frozenset({"STARTED", "STOPPED", "FAILED", "ERROR"}),
+    transitional_states=frozenset({"PENDING", "STARTING", "STOPPING"}),
+    state_attribute="state",
+    policy=PollingPolicy(initial_interval=2.0, max_interval=15.0),
+)
+
+
+@dataclass
+class _Job:
+    job_id: str
+    retrieve: Callable[[str], Any]
+    kind: JobKind
+    targets: FrozenSet[str]
+    policy: PollingPolicy
+    # whether the targets only count once the job has been in a transitional state
+    needs_transition: bool = False
+    attempt: int = 0
+    state: str | None = None
+
+
+def _targets(kind: JobKind, until: str | Iterable[str] | None) -> FrozenSet[str]:
+    if until is None:
+        return kind.settled_states or kind.final_states
+    if isinstance(until, str):
+        return frozenset({until})
+    return frozenset(
+        str(state.value if isinstance(state, Enum) else state) for state in until
+    )
+
+
+class _WaiterBase:
+    def __init__(self, max_concurrency: int = WAITER_CONCURRENCY) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._jobs: Dict[str, _Job] = {}
+        # (time of the next poll, insertion order, job ID)
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _add(
+        self,
+        job_id: str,
+        retrieve: Callable[[str], Any],
+        kind: JobKind,
+        until: str | Iterable[str] | None,
+        policy: PollingPolicy | None,
+    ) -> None:
+        if job_id in self._jobs:
+            raise ValueError(f"Already waiting for {kind.name} {job_id}")
+        self._jobs[job_id] = _Job(
+            job_id=job_id,
+            retrieve=retrieve,
+            kind=kind,
+            targets=_targets(kind, until),
+            policy=policy or kind.policy,
+            needs_transition=until is None and bool(kind.transitional_states),
+        )
+        self._schedule_poll(job_id, 0.0)
+
+    def _schedule_poll(self, job_id: str, delay: float) -> None:
+        heapq.heappush(
+            self._schedule, (time.monotonic() + delay, next(self._counter), job_id)
+        )
+
+    def _due_jobs(self, running: int) -> Iterator[_Job]:
+        now = time.monotonic()
+        while (
+            self._schedule
+            and self._schedule[0][0] <= now
+            and running < self.max_concurrency
+        ):
+            _, _, job_id = heapq.heappop(self._schedule)
+            running += 1
+            yield self._jobs[job_id]
+
+    def _wait_time(self, running: int, deadline: float | None) -> float | None:
+        """Seconds until the next poll or the deadline, or None to wait for running polls."""
+        now = time.monotonic()
+        wait_time = None
+        if self._schedule and running < self.max_concurrency:
+            wait_time = max(self._schedule[0][0] - now, 0.0)
+        if deadline is not None:
+            if now >= deadline:
+                pending = ", ".join(sorted(self._jobs))
+                raise WaitTimeoutError(f"Timed out waiting for {pending}")
+            remaining = deadline - now
+            wait_time = remaining if wait_time is None else min(wait_time, remaining)
+        return wait_time
+
+    def _record(self, job: _Job, result: Any, error: BaseException | None) -> bool:
+        """Handle the result of a poll, and return whether the job is done."""
+        if error is not None:
+            if not isinstance(error, _TRANSIENT_ERRORS):
+                raise error
+            headers = error.headers if hasattr(error.headers, "get") else None
+            retry_after = parse_retry_after_header(headers) or 0.0  # type: ignore[arg-type]
+            job.attempt += 1
+            self._schedule_poll(
+                job.job_id, max(retry_after, job.policy.interval(job.attempt))
+            )
+            return False
+
+        state = job.kind.state(result)
+        if state != job.state:
+            job.state = state
+            job.attempt = 0
+        if state in job.kind.transitional_states:
+            job.needs_transition = False
+        if (
+            state in job.targets and not job.needs_transition
+        ) or state in job.kind.final_states:
+            del self._jobs[job.job_id]
+            return True
+
+        job.attempt += 1
+        self._schedule_poll(job.job_id, job.policy.interval(job.attempt))
+        return False
+
+
+class Waiter(_WaiterBase):
+    """
+    Waits for many jobs at once from a single loop.
+
+    Jobs are polled in the order their next poll is due, with at most `max_concurrency`
+    status requests in flight, so waiting for thousands of jobs takes a handful of threads.
+    Rate limit and connection errors are retried, honouring the Retry-After header.
+
+    Args:
+        max_concurrency (int, optional): Status requests sent at the same time.
+    """
+
+    def add(
+        self,
+        job_id: str,
+        retrieve: Callable[[str], Any],
+        kind: JobKind,
+        until: str | Iterable[str] | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> None:
+        """
+        Add a job to wait for.
+
+        Args:
+            job_id (str): ID of the job.
+            retrieve (Callable[[str], Any]): Function returning the job for its ID, like
+                `client.fine_tuning.retrieve`.
+            kind (JobKind): Type of the job, like `FINE_TUNE_JOB`.
+            until (str | Iterable[str], optional): States to wait for. Defaults to the
+                settled states of `kind`. Final states always end the wait.
+            policy (PollingPolicy, optional): Polling policy. Defaults to the one of `kind`.
+        """
+        self._add(job_id, retrieve, kind, until, policy)
+
+    def as_completed(self, timeout: float | None = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Wait for the jobs.
+
+        Args:
+            timeout (float, optional): Seconds to wait for all jobs. Defaults to no limit.
+
+        Yields:
+            Tuple[str, Any]: ID and last retrieved version of each job, as soon as it is in
+                one of the states waited for or in a final state.
+
+        Raises:
+            WaitTimeoutError: If the jobs are not done within `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        running: Dict[Future[Any], _Job] = {}
+        try:
+            while self._schedule or running:
+                for job in self._due_jobs(len(running)):
+                    running[executor.submit(job.retrieve, job.job_id)] = job
+
+                wait_time = self._wait_time(len(running), deadline)
+                if not running:
+                    time.sleep(wait_time or 0.0)
+                    continue
+
+                done, _ = wait(running, timeout=wait_time, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    error = future.exception()
+                    result = None if error is not None else future.result()
+                    if self._record(job, result, error):
+                        yield job.job_id, result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def wait(self, timeout: float | None = None) -> Dict[str, Any]:
+        """Wait for all jobs, see `as_completed`, and return the jobs by ID."""
+        return dict(self.as_completed(timeout=timeout))
+
+
+class AsyncWaiter(_WaiterBase):
+    """
+    Waits for many jobs at once from a single task, see `Waiter`.
+
+    Args:
+        max_concurrency (int, optional): Status requests sent at the same time.
+    """
+
+    def add(
+        self,
+        job_id: str,
+        retrieve: Callable[[str], Awaitable[Any]],
+        kind: JobKind,
+        until: str | Iterable[str] | None = None,
+        policy: PollingPolicy | None = None,
+    ) -> None:
+        """
+        Add a job to wait for, see `Waiter.add`.
+
+        Args:
+            job_id (str): ID of the job.
+            retrieve (Callable[[str], Awaitable[Any]]): Coroutine function returning the
+                job for its ID, like `async_client.fine_tuning.retrieve`.
+            kind (JobKind): Type of the job.
+            until (str | Iterable[str], optional): States to wait for.
+            policy (PollingPolicy, optional): Polling policy.
+        """
+        self._add(job_id, retrieve, kind, until, policy)
+
+    async def as_completed(
+        self, timeout: float | None = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Wait for the jobs, see `Waiter.as_completed`.
+
+        Args:
+            timeout (float, optional): Seconds to wait for all jobs. Defaults to no limit.
+
+        Yields:
+            Tuple[str, Any]: ID and last retrieved version of each job when it is done.
+
+        Raises:
+            WaitTimeoutError: If the jobs are not done within `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        running: Dict[asyncio.Future[Any], _Job] = {}
+        try:
+            while self._schedule or running:
+                for job in self._due_jobs(len(running)):
+                    running[asyncio.ensure_future(job.retrieve(job.job_id))] = job
+
+                wait_time = self._wait_time(len(running), deadline)
+                if not running:
+                    await asyncio.sleep(wait_time or 0.0)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    running, timeout=wait_time, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    job = running.pop(task)
+                    error = task.exception()
+                    result = None if error is not None else task.result()
+                    if self._record(job, result, error):
+                        yield job.job_id, result
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def wait(self, timeout: float | None = None) -> Dict[str, Any]:
+        """Wait for all jobs, see `as_completed`, and return the jobs by ID."""
+        return {job_id: job async for job_id, job in self.as_completed(timeout=timeout)}
+
+
+def _check_state(job_id: str, job: T, kind: JobKind, until: Any) -> T:
+    state = kind.state(job)
+    targets = _targets(kind, until)
+    if state not in targets:
+        raise JobStateError(
+            f"{kind.name} {job_id} is {state}, expected {' or '.join(sorted(targets))}"
+        )
+    return job
+
+
+def wait_for_job(
+    job_id: str,
+    retrieve: Callable[[str], T],
+    kind: JobKind,
+    until: str | Iterable[str] | None = None,
+    timeout: float | None = None,
+    policy: PollingPolicy | None = None,
+) -> T:
+    """
+    Wait for a single job.
+
+    Args:
+        job_id (str): ID of the job.
+        retrieve (Callable[[str], T]): Function returning the job for its ID.
+        kind (JobKind): Type of the job.
+        until (str | Iterable[str], optional): States to wait for. Defaults to the settled
+            states of `kind`.
+        timeout (float, optional): Seconds to wait. Defaults to no limit.
+        policy (PollingPolicy, optional): Polling policy. Defaults to the one of `kind`.
+
+    Returns:
+        T: The job in one of the states waited for, as returned by `retrieve`.
+
+    Raises:
+        JobStateError: If the job reaches a final state that is not waited for.
+        WaitTimeoutError: If the job is not done within `timeout`.
+    """
+    waiter = Waiter(max_concurrency=1)
+    waiter.add(job_id, retrieve, kind, until=until, policy=policy)
+    job: T = waiter.wait(timeout=timeout)[job_id]
+    return _check_state(job_id, job, kind, until)
+
+
+async def async_wait_for_job(
+    job_id: str,
+    retrieve: Callable[[str], Awaitable[T]],
+    kind: JobKind,
+    until: str | Iterable[str] | None = None,
+    timeout: float | None = None,
+    policy: PollingPolicy | None = None,
+) -> T:
+    """Wait for a single job, see `wait_for_job`."""
+    waiter = AsyncWaiter(max_concurrency=1)
+    waiter.add(job_id, retrieve, kind, until=until, policy=policy)
+    job: T = (await waiter.wait(timeout=timeout))[job_id]
+    return _check_state(job_id, job, kind, until)
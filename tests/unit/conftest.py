@@ -0,0 +1,36 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep validation reports cached by `check_file` out of the user's cache directory"""
+    monkeypatch.setenv("TOGETHER_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+
+
+@pytest.fixture
+def serve():
+    """
+    Start local HTTP servers answering with a `BaseHTTPRequestHandler` class, without
+    logging requests. Calling `serve(Handler, path)` returns the URL of `path` on a new
+    server. The servers are shut down and their sockets closed after the test.
+    """
+    servers = []
+
+    def start(handler, path="/v1/"):
+        quiet = type(handler.__name__, (handler,), {"log_message": lambda *args: None})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), quiet)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        servers.append((server, thread))
+        return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+    yield start
+    for server, thread in servers:
+        server.shutdown()
+        server.server_close()
+        thread.join()
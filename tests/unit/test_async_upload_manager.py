@@ -0,0 +1,181 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from together.filemanager import AsyncMultipartUploadManager, AsyncUploadManager
+from together.resources.files import AsyncFiles
+from together.types import FilePurpose, TogetherClient
+
+
+class FakeFilesServer:
+    """Minimal stand-in for the files API and presigned storage URLs"""
+
+    def __init__(self) -> None:
+        self.uploads = {}
+        self.upload_headers = {}
+        self.completed = None
+        self.aborted = False
+        self.fail_part = None
+        self.base_url = ""
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/files", self.get_upload_url)
+        app.router.add_put("/storage/{name}", self.put_object)
+        app.router.add_post("/v1/files/{file_id}/preprocess", self.preprocess)
+        app.router.add_post("/v1/files/multipart/initiate", self.initiate)
+        app.router.add_post("/v1/files/multipart/complete", self.complete)
+        app.router.add_post("/v1/files/multipart/abort", self.abort)
+        return app
+
+    async def get_upload_url(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        assert form["purpose"] == "fine-tune"
+        return web.Response(
+            status=302,
+            headers={
+                "Location": f"{self.base_url}/storage/single",
+                "X-Together-File-Id": "file-123",
+            },
+        )
+
+    async def put_object(self, request: web.Request) -> web.Response:
+        name = request.match_info["name"]
+        if name == self.fail_part:
+            return web.Response(status=500)
+        self.upload_headers[name] = dict(request.headers)
+        self.uploads[name] = await request.read()
+        return web.Response(headers={"ETag": f'"etag-{name}"'})
+
+    async def preprocess(self, request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "id": request.match_info["file_id"],
+                "object": "file",
+                "filename": "data.jsonl",
+                "bytes": len(self.uploads["single"]),
+            }
+        )
+
+    async def initiate(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        parts = [
+            {"PartNumber": i, "URL": f"{self.base_url}/storage/part-{i}", "Headers": {}}
+            for i in range(1, payload["num_parts"] + 1)
+        ]
+        return web.json_response(
+            {"upload_id": "upload-1", "file_id": "file-456", "parts": parts}
+        )
+
+    async def complete(self, request: web.Request) -> web.Response:
+        self.completed = await request.json()
+        return web.json_response(
+            {"file": {"id": "file-456", "object": "file", "filename": "data.jsonl"}}
+        )
+
+    async def abort(self, request: web.Request) -> web.Response:
+        self.aborted = True
+        return web.json_response({})
+
+
+@pytest_asyncio.fixture
+async def files_server():
+    server = FakeFilesServer()
+    runner = web.AppRunner(server.app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    server.base_url = f"http://127.0.0.1:{port}"
+    yield server
+    await runner.cleanup()
+
+
+@pytest.fixture
+def client(files_server):
+    return TogetherClient(
+        api_key="fake_api_key", base_url=f"{files_server.base_url}/v1/", max_retries=0
+    )
+
+
+@pytest.fixture
+def data_file(tmp_path: Path) -> Path:
+    file = tmp_path / "data.jsonl"
+    with file.open("w") as f:
+        for i in range(2000):
+            f.write(json.dumps({"text": f"sample {i}"}) + "\n")
+    return file
+
+
+@pytest.mark.asyncio
+async def test_redirect_upload_streams_file(files_server, client, data_file):
+    progress = []
+
+    response = await AsyncUploadManager(client).upload(
+        "files",
+        data_file,
+        purpose=FilePurpose.FineTune,
+        redirect=True,
+        progress_callback=progress.append,
+    )
+
+    assert response.id == "file-123"
+    assert files_server.uploads["single"] == data_file.read_bytes()
+    # presigned URLs reject chunked transfer encoding
+    headers = files_server.upload_headers["single"]
+    assert headers["Content-Length"] == str(data_file.stat().st_size)
+    assert "Transfer-Encoding" not in headers
+    assert sum(progress) == data_file.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_async_files_upload_checks_file(files_server, client, tmp_path):
+    bad_file = tmp_path / "bad.jsonl"
+    bad_file.write_text("not json\n")
+
+    with pytest.raises(Exception, match="Invalid file supplied"):
+        await AsyncFiles(client).upload(bad_file)
+
+    assert files_server.uploads == {}
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_concurrent_parts(files_server, client, data_file):
+    file_size = data_file.stat().st_size
+    part_size = file_size // 3 + 1
+    manager = AsyncMultipartUploadManager(client)
+    manager.max_concurrent_parts = 2
+    progress = []
+
+    with patch.object(manager, "_calculate_parts", return_value=(part_size, 3)):
+        response = await manager.upload(
+            "files", data_file, FilePurpose.FineTune, progress_callback=progress.append
+        )
+
+    assert response.id == "file-456"
+    assert files_server.completed["parts"] == [
+        {"part_number": i, "etag": f"etag-part-{i}"} for i in (1, 2, 3)
+    ]
+    uploaded = b"".join(files_server.uploads[f"part-{i}"] for i in (1, 2, 3))
+    assert uploaded == data_file.read_bytes()
+    assert sum(progress) == file_size
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_aborts_on_part_failure(files_server, client, data_file):
+    file_size = data_file.stat().st_size
+    manager = AsyncMultipartUploadManager(client)
+    files_server.fail_part = "part-2"
+
+    with patch.object(
+        manager, "_calculate_parts", return_value=(file_size // 2 + 1, 2)
+    ):
+        with pytest.raises(Exception, match="Failed to upload part 2"):
+            await manager.upload("files", data_file, FilePurpose.FineTune)
+
+    assert files_server.aborted
+    assert files_server.completed is None
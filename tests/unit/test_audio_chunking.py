@@ -0,0 +1,151 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from together import AsyncTogether, Together
+from together.types import AudioTranscriptionVerboseResponse
+from together.utils.audio import (
+    AudioChunk,
+    merge_transcriptions,
+    read_audio_chunk,
+    split_audio,
+)
+
+
+RATE = 8000
+
+
+def _write_wav(path, seconds, silences=()):
+    t = np.arange(int(seconds * RATE)) / RATE
+    samples = 0.5 * np.sin(2 * np.pi * 440 * t)
+    for start, end in silences:
+        samples[int(start * RATE) : int(end * RATE)] = 0
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(RATE)
+        f.writeframes((samples * 32767).astype("<i2").tobytes())
+
+
+def _word(word, start, speaker=None):
+    return {"word": word, "start": start, "end": start + 0.2, "speaker_id": speaker}
+
+
+def test_split_audio_cuts_at_silence(tmp_path):
+    path = tmp_path / "audio.wav"
+    _write_wav(path, 25, silences=[(8.0, 8.3), (17.0, 17.2)])
+
+    chunks = split_audio(path, chunk_duration=10, overlap=1)
+
+    assert len(chunks) == 3
+    assert 8.0 <= chunks[0].keep_end <= 8.3
+    assert 17.0 <= chunks[1].keep_end <= 17.2
+    assert chunks[1].keep_start == chunks[0].keep_end
+    assert chunks[1].start == pytest.approx(chunks[1].keep_start - 0.5)
+    assert chunks[-1].end == 25
+
+
+def test_split_audio_fixed_windows(tmp_path):
+    path = tmp_path / "audio.wav"
+    _write_wav(path, 25)
+
+    chunks = split_audio(path, chunk_duration=10, overlap=0, split_on_silence=False)
+
+    assert [(c.start, c.end) for c in chunks] == [(0, 10), (10, 20), (20, 25)]
+    with wave.open(io.BytesIO(read_audio_chunk(path, chunks[2]))) as f:
+        assert f.getnframes() == 5 * RATE
+        assert f.getframerate() == RATE
+
+
+def test_merge_transcriptions_offsets_and_speakers():
+    chunks = [AudioChunk(0, 0, 11, 0, 10), AudioChunk(1, 9, 20, 10, 20)]
+    first = AudioTranscriptionVerboseResponse(
+        language="en",
+        text="hello there general kenobi",
+        segments=[
+            {"id": 0, "start": 0, "end": 5, "text": " hello there"},
+            {"id": 1, "start": 9.5, "end": 10.8, "text": " general kenobi"},
+        ],
+        words=[
+            _word("hello", 0, "A"),
+            _word("there", 1, "A"),
+            _word("general", 9.5, "B"),
+            _word("kenobi", 10.5, "B"),
+        ],
+    )
+    # speakers are numbered independently in each chunk
+    second = AudioTranscriptionVerboseResponse(
+        text="general kenobi you are bold",
+        segments=[
+            {"id": 0, "start": 0.5, "end": 1.8, "text": " general kenobi"},
+            {"id": 1, "start": 2, "end": 5, "text": " you are bold"},
+        ],
+        words=[
+            _word("general", 0.5, "A"),
+            _word("kenobi", 1.5, "A"),
+            _word("you", 2, "C"),
+            _word("are", 3, "C"),
+        ],
+    )
+
+    merged = merge_transcriptions(chunks, [first, second])
+
+    assert merged.text == "hello there general kenobi you are bold"
+    assert [s.start for s in merged.segments] == [0, 9.5, 11]
+    assert [s.id for s in merged.segments] == [0, 1, 2]
+    assert [(w.word, w.start, w.speaker_id) for w in merged.words] == [
+        ("hello", 0, "A"),
+        ("there", 1, "A"),
+        ("general", 9.5, "B"),
+        ("kenobi", 10.5, "B"),
+        ("you", 11, "C-1"),
+        ("are", 12, "C-1"),
+    ]
+    assert merged.language == "en"
+    assert merged.duration == 20
+
+
+def _fake_transcription(file, **kwargs):
+    assert kwargs["response_format"] == "verbose_json"
+    with wave.open(file) as f:
+        duration = f.getnframes() / f.getframerate()
+    index = int(file.name.split("_")[1].split(".")[0])
+    return AudioTranscriptionVerboseResponse(
+        text=f"chunk {index}",
+        segments=[{"id": 0, "start": 0.6, "end": duration, "text": f"chunk {index}"}],
+    )
+
+
+def test_create_long(tmp_path, monkeypatch):
+    path = tmp_path / "audio.wav"
+    _write_wav(path, 25)
+    transcriptions = Together(api_key="fake").audio.transcriptions
+    monkeypatch.setattr(transcriptions, "create", _fake_transcription)
+
+    result = transcriptions.create_long(
+        file=str(path), chunk_duration=10, overlap=0, split_on_silence=False
+    )
+
+    assert result.text == "chunk 0 chunk 1 chunk 2"
+    assert [s.start for s in result.segments] == pytest.approx([0.6, 10.6, 20.6])
+
+
+@pytest.mark.asyncio
+async def test_async_create_long(tmp_path, monkeypatch):
+    path = tmp_path / "audio.wav"
+    _write_wav(path, 25)
+    transcriptions = AsyncTogether(api_key="fake").audio.transcriptions
+
+    async def fake(file, **kwargs):
+        return _fake_transcription(file, **kwargs)
+
+    monkeypatch.setattr(transcriptions, "create", fake)
+
+    with open(path, "rb") as f:
+        result = await transcriptions.create_long(
+            file=f, chunk_duration=10, overlap=0, split_on_silence=False
+        )
+
+    assert result.text == "chunk 0 chunk 1 chunk 2"
@@ -0,0 +1,122 @@
+import base64
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from together.together_response import TogetherResponse
+from together.types import AudioSpeechStreamResponse
+from together.types.audio_speech import _g711_table
+
+
+def _binary_stream(data: bytes, chunk_size: int):
+    for i in range(0, len(data), chunk_size):
+        yield TogetherResponse(data[i : i + chunk_size], {})
+
+
+def _event_stream(data: bytes, chunk_size: int):
+    for i in range(0, len(data), chunk_size):
+        b64 = base64.b64encode(data[i : i + chunk_size]).decode()
+        yield TogetherResponse(
+            {"object": "audio.tts.chunk", "model": "m", "b64": b64}, {}
+        )
+    yield TogetherResponse("[DONE]", {})
+
+
+def test_stream_to_file_writes_wav_header_for_request_format(tmp_path):
+    samples = np.linspace(-1, 1, 1001, dtype=np.float32)
+    response = AudioSpeechStreamResponse(
+        response=_event_stream(samples.tobytes(), 333),
+        response_encoding="pcm_f32le",
+        sample_rate=44100,
+    )
+
+    path = tmp_path / "speech.wav"
+    response.stream_to_file(str(path))
+
+    data = path.read_bytes()
+    riff_size, audio_format, channels, sample_rate, _, _, bits, data_size = (
+        struct.unpack_from("<4xI12xHHIIHH4xI", data)
+    )
+    assert riff_size == len(data) - 8
+    assert (audio_format, channels, sample_rate, bits) == (3, 1, 44100, 32)
+    assert data_size == samples.nbytes
+    assert data[44:] == samples.tobytes()
+
+
+def test_stream_to_file_s16le_is_readable(tmp_path):
+    samples = np.arange(-500, 500, dtype=np.int16)
+    response = AudioSpeechStreamResponse(
+        response=_binary_stream(samples.tobytes(), 301),
+        response_encoding="pcm_s16le",
+        sample_rate=24000,
+    )
+
+    path = tmp_path / "speech.wav"
+    response.stream_to_file(str(path))
+
+    with wave.open(str(path)) as f:
+        assert f.getframerate() == 24000
+        assert f.getsampwidth() == 2
+        assert f.readframes(f.getnframes()) == samples.tobytes()
+
+
+def test_stream_to_file_rejects_invalid_mp3(tmp_path):
+    response = AudioSpeechStreamResponse(response=_binary_stream(b"\x00" * 8, 4))
+
+    with pytest.raises(ValueError, match="Invalid MP3"):
+        response.stream_to_file(str(tmp_path / "speech.mp3"))
+
+
+@pytest.mark.parametrize("frame_size", [None, 100])
+def test_iter_pcm_frames_carries_partial_samples(frame_size):
+    samples = np.linspace(-1, 1, 1000, dtype=np.float32)
+    # chunks of 7 bytes split samples across chunk boundaries
+    response = AudioSpeechStreamResponse(
+        response=_binary_stream(samples.tobytes(), 7), response_encoding="pcm_f32le"
+    )
+
+    frames = list(response.iter_pcm_frames(frame_size))
+
+    assert all(frame.dtype == np.float32 for frame in frames)
+    if frame_size is not None:
+        assert [len(frame) for frame in frames] == [100] * 10
+    np.testing.assert_array_equal(np.concatenate(frames), samples)
+
+
+def test_iter_pcm_frames_skips_wav_header():
+    samples = np.arange(300, dtype=np.int16)
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        0xFFFFFFFF,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        24000,
+        48000,
+        2,
+        16,
+        b"data",
+        0xFFFFFFFF,
+    )
+    response = AudioSpeechStreamResponse(
+        response=_binary_stream(header + samples.tobytes(), 10),
+        response_encoding="pcm_s16le",
+    )
+
+    frames = list(response.iter_pcm_frames())
+
+    np.testing.assert_array_equal(np.concatenate(frames), samples)
+
+
+def test_g711_tables():
+    mulaw = _g711_table("pcm_mulaw")
+    alaw = _g711_table("pcm_alaw")
+
+    # silence, and the extremes of each code
+    assert mulaw[0xFF] == 0 and mulaw[0x80] == 32124 and mulaw[0x00] == -32124
+    assert alaw[0xD5] == 8 and alaw[0x55] == -8 and alaw[0xAA] == 32256
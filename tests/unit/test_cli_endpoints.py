@@ -0,0 +1,25 @@
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from together.cli.api.endpoints import endpoints
+from together.error import JobStateError
+
+
+@pytest.mark.parametrize(
+    "args, state",
+    [(["start", "endpoint-1"], "STARTED"), (["stop", "endpoint-1"], "STOPPED")],
+)
+def test_wait_reports_failed_endpoint(args, state):
+    client = Mock()
+    client.endpoints.wait_until.side_effect = JobStateError(
+        f"endpoint endpoint-1 is FAILED, expected {state}"
+    )
+
+    result = CliRunner().invoke(endpoints, args, obj=client)
+
+    assert result.exit_code == 1
+    client.endpoints.wait_until.assert_called_once_with("endpoint-1", state)
+    assert f"Error: endpoint endpoint-1 is FAILED, expected {state}" in result.output
+    assert "unexpected error" not in result.output
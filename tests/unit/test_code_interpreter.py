@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+
 import pytest
 from pydantic import ValidationError
 
-from together.resources.code_interpreter import CodeInterpreter
+from together.resources.code_interpreter import (
+    AsyncCodeInterpreter,
+    AsyncCodeInterpreterSessionPool,
+    CodeInterpreter,
+    CodeInterpreterSessionPool,
+)
 from together.together_response import TogetherResponse
 from together.types.code_interpreter import (
     ExecuteResponse,
@@ -451,3 +460,177 @@ def test_code_interpreter_run_with_invalid_file_list_item(mocker):
             language="python",
             files=invalid_files,
         )
+
+
+@pytest.mark.asyncio
+async def test_async_code_interpreter_run(mocker):
+    mock_requestor = mocker.MagicMock()
+    response_data = {
+        "data": {
+            "session_id": "test_session",
+            "status": "success",
+            "outputs": [{"type": "stdout", "data": "Hello, world!"}],
+        }
+    }
+    mock_requestor.arequest = mocker.AsyncMock(
+        return_value=(TogetherResponse(data=response_data, headers={}), None, None)
+    )
+    mocker.patch(
+        "together.abstract.api_requestor.APIRequestor", return_value=mock_requestor
+    )
+    interpreter = AsyncCodeInterpreter(mocker.MagicMock())
+
+    response = await interpreter.run(
+        code='print("Hello, world!")',
+        language="python",
+        files=[{"name": "a.txt", "encoding": "string", "content": "a"}],
+    )
+
+    assert response.data.outputs[0].data == "Hello, world!"
+    request_options = mock_requestor.arequest.call_args[1]["options"]
+    assert request_options.url == "/tci/execute"
+    assert request_options.params["files"] == [
+        {"name": "a.txt", "encoding": "string", "content": "a"}
+    ]
+
+
+class FakeInterpreter:
+    def __init__(self):
+        self.calls = []
+        self.sessions = 0
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        # sessions the server has ended, replaced by new ones when used
+        self.expired = set()
+
+    def _response(self, session_id):
+        if session_id is None or session_id in self.expired:
+            with self.lock:
+                self.sessions += 1
+                session_id = f"session-{self.sessions}"
+        return ExecuteResponse(data=ExecuteResponseData(session_id=session_id))
+
+    def run(self, code, language, session_id=None, files=None):
+        with self.lock:
+            self.calls.append((code, session_id, [f["name"] for f in files or []]))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.02)
+        with self.lock:
+            self.running -= 1
+        return self._response(session_id)
+
+
+class AsyncFakeInterpreter(FakeInterpreter):
+    async def run(self, code, language, session_id=None, files=None):
+        self.calls.append((code, session_id, [f["name"] for f in files or []]))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return self._response(session_id)
+
+
+DATA_FILE = {"name": "data.csv", "encoding": "string", "content": "a,b\n1,2\n"}
+
+
+def test_session_pool_reuses_sessions_and_uploads_files_once():
+    interpreter = FakeInterpreter()
+    pool = CodeInterpreterSessionPool(interpreter, max_sessions_per_key=2)
+
+    pool.run("x = 1", key="a", files=[DATA_FILE])
+    pool.run("x = 2", key="a", files=[DATA_FILE])
+    pool.run("x = 3", key="b", files=[DATA_FILE])
+
+    assert interpreter.calls == [
+        ("x = 1", None, ["data.csv"]),
+        ("x = 2", "session-1", []),
+        ("x = 3", None, ["data.csv"]),
+    ]
+
+
+def test_session_pool_run_many_limits_sessions_per_key():
+    interpreter = FakeInterpreter()
+    pool = CodeInterpreterSessionPool(interpreter, max_sessions_per_key=3)
+
+    results = pool.run_many([f"x = {i}" for i in range(12)], files=[DATA_FILE])
+
+    assert len(results) == 12
+    assert interpreter.sessions <= 3
+    assert interpreter.max_running <= 3
+    # each session received the file exactly once
+    uploads = [call for call in interpreter.calls if call[2]]
+    assert len(uploads) == interpreter.sessions
+
+
+def test_session_pool_affinity_and_failures():
+    interpreter = FakeInterpreter()
+    pool = CodeInterpreterSessionPool(interpreter, max_sessions_per_key=1)
+
+    with pool.session() as session:
+        session.run("x = 1")
+        session.run("print(x)")
+        assert session.session_id == "session-1"
+
+    with pytest.raises(RuntimeError):
+        with pool.session() as session:
+            raise RuntimeError("lost the session")
+
+    # the failed session was dropped, so the key can open a new one
+    pool.run("y = 1")
+    assert interpreter.calls[-1] == ("y = 1", None, [])
+
+
+OTHER_FILE = {"name": "other.csv", "encoding": "string", "content": "c\n3\n"}
+
+
+def test_session_pool_reuploads_files_to_replaced_sessions():
+    interpreter = FakeInterpreter()
+    pool = CodeInterpreterSessionPool(interpreter)
+    pool.run("x = 1", files=[DATA_FILE])
+    interpreter.expired.add("session-1")
+
+    response = pool.run("x = 2", files=[DATA_FILE, OTHER_FILE])
+    pool.run("x = 3", files=[DATA_FILE, OTHER_FILE])
+
+    assert response.data.session_id == "session-2"
+    assert interpreter.calls[1:] == [
+        ("x = 2", "session-1", ["other.csv"]),
+        ("x = 2", "session-2", ["data.csv", "other.csv"]),
+        ("x = 3", "session-2", []),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_session_pool_reuploads_files_to_replaced_sessions():
+    interpreter = AsyncFakeInterpreter()
+    pool = AsyncCodeInterpreterSessionPool(interpreter)
+    await pool.run("x = 1", files=[DATA_FILE])
+    interpreter.expired.add("session-1")
+
+    await pool.run("x = 2", files=[DATA_FILE])
+
+    assert interpreter.calls[1:] == [
+        ("x = 2", "session-1", []),
+        ("x = 2", "session-2", ["data.csv"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_session_pool_run_many():
+    interpreter = AsyncFakeInterpreter()
+    pool = AsyncCodeInterpreterSessionPool(interpreter, max_sessions_per_key=2)
+
+    results = await pool.run_many(
+        [f"x = {i}" for i in range(6)], key="a", files=[DATA_FILE]
+    )
+
+    assert len(results) == 6
+    assert interpreter.sessions == 2
+    assert interpreter.max_running == 2
+    assert sum(1 for call in interpreter.calls if call[2]) == 2
+
+    async with pool.session("a") as session:
+        await session.run("print(x)", files=[DATA_FILE])
+    assert interpreter.calls[-1][2] == []
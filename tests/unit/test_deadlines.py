@@ -0,0 +1,208 @@
+import json
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.error import (
+    DeadlineExceededError,
+    FirstEventTimeoutError,
+    StreamIdleTimeoutError,
+)
+from together.types import Deadlines
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def _event(content):
+    chunk = {"id": "1", "choices": [{"index": 0, "delta": {"content": content}}]}
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # seconds to wait before each event, by model name
+    delays = {
+        "fast": [0, 0, 0],
+        "slow-start": [0.5, 0],
+        "stall": [0, 0, 0.5],
+    }
+    attempts = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        model = body["model"]
+        if model == "overloaded":
+            Handler.attempts += 1
+            self._json(503, {"error": {"message": "overloaded"}})
+            return
+        if not body.get("stream"):
+            time.sleep(0.5 if model == "slow" else 0)
+            self._json(200, {"id": "1", "choices": [{"message": {"content": "hi"}}]})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for i, delay in enumerate(self.delays[model]):
+                time.sleep(delay)
+                self._chunk(_event(str(i)))
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _json(self, status, data):
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def base_url(serve):
+    Handler.attempts = 0
+    return serve(Handler)
+
+
+def _contents(stream):
+    return [chunk.choices[0].delta.content for chunk in stream]
+
+
+def test_stream_within_deadlines(base_url):
+    client = Together(
+        api_key="fake",
+        base_url=base_url,
+        deadlines=Deadlines(total=5, first_event=1, idle=1),
+    )
+
+    stream = client.chat.completions.create(
+        model="fast", messages=MESSAGES, stream=True
+    )
+
+    assert _contents(stream) == ["0", "1", "2"]
+
+
+@pytest.mark.parametrize(
+    "model, deadlines, exception",
+    [
+        ("slow-start", Deadlines(first_event=0.2), FirstEventTimeoutError),
+        ("stall", Deadlines(first_event=0.2, idle=0.2), StreamIdleTimeoutError),
+        ("stall", Deadlines(total=0.3), DeadlineExceededError),
+    ],
+)
+def test_stream_deadlines(base_url, model, deadlines, exception):
+    client = Together(api_key="fake", base_url=base_url)
+
+    start = time.monotonic()
+    with pytest.raises(exception):
+        stream = client.chat.completions.create(
+            model=model, messages=MESSAGES, stream=True, deadlines=deadlines
+        )
+        _contents(stream)
+
+    assert time.monotonic() - start < 0.45
+
+
+def test_first_event_deadline_without_stream(base_url):
+    client = Together(api_key="fake", base_url=base_url, max_retries=2)
+
+    with pytest.raises(FirstEventTimeoutError):
+        client.chat.completions.create(
+            model="slow", messages=MESSAGES, deadlines=Deadlines(first_event=0.2)
+        )
+
+
+def test_total_deadline_covers_retries(base_url):
+    client = Together(api_key="fake", base_url=base_url, deadlines=Deadlines(total=0.3))
+
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        client.chat.completions.create(model="overloaded", messages=MESSAGES)
+
+    # retries are given up as soon as their delay would pass the deadline
+    assert time.monotonic() - start < 0.3
+    assert Handler.attempts == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "model, deadlines, exception",
+    [
+        ("fast", Deadlines(total=5, first_event=1, idle=1), None),
+        ("slow-start", Deadlines(first_event=0.2), FirstEventTimeoutError),
+        ("stall", Deadlines(idle=0.2), StreamIdleTimeoutError),
+        ("stall", Deadlines(total=0.3), DeadlineExceededError),
+    ],
+)
+async def test_async_stream_deadlines(base_url, model, deadlines, exception):
+    client = AsyncTogether(api_key="fake", base_url=base_url)
+
+    async def run():
+        stream = await client.chat.completions.create(
+            model=model, messages=MESSAGES, stream=True, deadlines=deadlines
+        )
+        return [chunk.choices[0].delta.content async for chunk in stream]
+
+    if exception is None:
+        assert await run() == ["0", "1", "2"]
+        return
+    start = time.monotonic()
+    with pytest.raises(exception):
+        await run()
+    assert time.monotonic() - start < 0.45
+
+
+@pytest.mark.parametrize(
+    "model, deadlines, exception",
+    [
+        ("slow-start", Deadlines(first_event=0.2), FirstEventTimeoutError),
+        ("stall", Deadlines(idle=0.2), StreamIdleTimeoutError),
+        ("stall", Deadlines(total=0.3), DeadlineExceededError),
+    ],
+)
+def test_raw_stream_deadlines(base_url, model, deadlines, exception):
+    client = Together(api_key="fake", base_url=base_url)
+    body = json.dumps({"model": model, "messages": MESSAGES, "stream": True})
+
+    start = time.monotonic()
+    with pytest.raises(exception):
+        response = client.chat.completions.create_raw(
+            body, stream=True, deadlines=deadlines
+        )
+        list(response.chunks)
+
+    assert time.monotonic() - start < 0.45
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "model, deadlines, exception",
+    [
+        ("slow-start", Deadlines(first_event=0.2), FirstEventTimeoutError),
+        ("stall", Deadlines(idle=0.2), StreamIdleTimeoutError),
+        ("stall", Deadlines(total=0.3), DeadlineExceededError),
+    ],
+)
+async def test_async_raw_stream_deadlines(base_url, model, deadlines, exception):
+    client = AsyncTogether(api_key="fake", base_url=base_url)
+    body = json.dumps({"model": model, "messages": MESSAGES, "stream": True})
+
+    start = time.monotonic()
+    with pytest.raises(exception):
+        response = await client.chat.completions.create_raw(
+            body, stream=True, deadlines=deadlines
+        )
+        [chunk async for chunk in response.chunks]
+
+    assert time.monotonic() - start < 0.45
@@ -2,7 +2,15 @@ import csv
 import json
 from pathlib import Path
 
-from together.utils.files import FilePurpose, check_file
+import pytest
+
+from together.utils.files import (
+    FilePurpose,
+    _check_jsonl,
+    _check_jsonl_parallel,
+    check_file,
+    split_jsonl_ranges,
+)
 
 
 def test_check_jsonl_valid_general(tmp_path: Path):
@@ -219,6 +227,32 @@ def test_check_jsonl_non_utf8(tmp_path: Path):
     assert "File is not UTF-8 encoded." in report["message"]
 
 
+def test_check_jsonl_non_utf8_after_invalid_line(tmp_path: Path):
+    # Encoding errors are reported even when an earlier line is already invalid
+    file = tmp_path / "non_utf8_late.jsonl"
+    lines = [b'{"text": "Hello"}', b"not json"] + [b'{"text": "ok"}'] * 1000
+    file.write_bytes(b"\n".join(lines + [b'{"text": "\xff"}']))
+
+    report = check_file(file)
+
+    assert not report["is_check_passed"]
+    assert not report["utf8"]
+    assert "File is not UTF-8 encoded." in report["message"]
+
+
+def test_check_jsonl_line_numbers_with_crlf(tmp_path: Path):
+    # Line numbers follow universal newlines, as when reading the file in text mode
+    file = tmp_path / "crlf.jsonl"
+    lines = [json.dumps({"text": f"sample {i}"}) for i in range(3)]
+    file.write_bytes(("\r\n".join(lines) + "\r\n" + '{"txt": "bad"}\r\n').encode())
+
+    report = check_file(file)
+
+    assert not report["is_check_passed"]
+    assert report["utf8"]
+    assert report["line_number"] == 4
+
+
 def test_check_jsonl_invalid_json(tmp_path: Path):
     # Create a JSONL file with invalid JSON
     file = tmp_path / "invalid_json.jsonl"
@@ -577,3 +611,160 @@ def test_check_csv_invalid_column(tmp_path: Path):
     report = check_file(file)
 
     assert not report["is_check_passed"]
+
+
+def _write_parallel_dataset(file: Path, bad_line: str | None = None) -> None:
+    lines = [json.dumps({"prompt": f"p{i}", "completion": f"c{i}"}) for i in range(500)]
+    if bad_line is not None:
+        lines[377] = bad_line
+    file.write_text("\n".join(lines))
+
+
+def test_check_jsonl_parallel_matches_serial(tmp_path: Path, monkeypatch):
+    file = tmp_path / "parallel.jsonl"
+    _write_parallel_dataset(file)
+
+    serial_report = check_file(file, use_cache=False)
+    monkeypatch.setattr("together.utils.files.VALIDATION_BLOCK_SIZE", 0)
+    parallel_report = check_file(file, num_workers=2, use_cache=False)
+
+    assert parallel_report == serial_report
+    assert parallel_report["is_check_passed"]
+    assert parallel_report["num_samples"] == 500
+
+
+def test_check_jsonl_parallel_reports_global_line_number(tmp_path: Path, monkeypatch):
+    file = tmp_path / "parallel_invalid.jsonl"
+    _write_parallel_dataset(file, bad_line="Invalid JSON Line")
+
+    monkeypatch.setattr("together.utils.files.VALIDATION_BLOCK_SIZE", 0)
+    report = check_file(file, num_workers=3, use_cache=False)
+
+    assert not report["is_check_passed"]
+    assert not report["load_json"]
+    assert report["message"] == (
+        "Error parsing json payload. Unexpected format on line 378."
+    )
+
+
+def test_check_jsonl_parallel_mixed_formats(tmp_path: Path, monkeypatch):
+    # The format of every range is compared with the first sample of the whole file
+    file = tmp_path / "parallel_mixed.jsonl"
+    lines = [json.dumps({"text": "hello"})] * 100
+    lines += [json.dumps({"prompt": "p", "completion": "c"})] * 400
+    file.write_text("\n".join(lines))
+
+    serial_report = check_file(file, use_cache=False)
+    monkeypatch.setattr("together.utils.files.VALIDATION_BLOCK_SIZE", 0)
+    parallel_report = check_file(file, num_workers=4, use_cache=False)
+
+    assert parallel_report == serial_report
+    assert parallel_report["line_number"] == 101
+    assert not parallel_report["format"]
+
+
+def test_check_jsonl_parallel_invalid_first_line_of_range(tmp_path: Path, monkeypatch):
+    # A range starting with invalid JSON and followed by samples of another format
+    # reports the JSON error, as the serial check does
+    file = tmp_path / "parallel_range_start.jsonl"
+    # all lines have the same length, so that the ranges do not move
+    other_format = json.dumps({"prompt": "p", "completion": "c"})
+    lines = [json.dumps({"text": "h" * 22})] * 200
+    file.write_text("\n".join(lines))
+    first = file.read_bytes()[: split_jsonl_ranges(file, 8)[1][0]].count(b"\n")
+    lines[first:] = ["Invalid JSON Line".ljust(len(other_format))] + [other_format] * (
+        len(lines) - first - 1
+    )
+    file.write_text("\n".join(lines))
+    assert len(set(map(len, lines))) == 1
+
+    monkeypatch.setattr("together.utils.files.VALIDATION_BLOCK_SIZE", 0)
+    serial_report = _check_jsonl(file, FilePurpose.FineTune)
+    parallel_report = _check_jsonl_parallel(file, FilePurpose.FineTune, 2)
+
+    assert parallel_report == serial_report
+    assert parallel_report["message"] == (
+        f"Error parsing json payload. Unexpected format on line {first + 1}."
+    )
+
+
+def _write_parquet_dataset(file: Path, num_rows: int = 30, **overrides):
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+
+    data = {
+        "input_ids": [[i + 1, i + 2, i + 3, 0] for i in range(num_rows)],
+        "attention_mask": [[1, 1, 1, 0] for _ in range(num_rows)],
+        "labels": [[i + 1, i + 2, i + 3, -100] for i in range(num_rows)],
+    }
+    for column, rows in overrides.items():
+        for idx, value in rows.items():
+            data[column][idx] = value
+    # small row groups so errors are located across several of them
+    parquet.write_table(pa.table(data), file, row_group_size=10)
+
+
+def test_check_parquet_valid(tmp_path: Path):
+    file = tmp_path / "valid.parquet"
+    _write_parquet_dataset(file)
+
+    report = check_file(file)
+
+    assert report["is_check_passed"]
+    assert report["num_samples"] == 30
+    assert report["max_sequence_length"] == 4
+
+
+def test_check_parquet_long_sequence(tmp_path: Path):
+    # the maximum length depends on the model, so it is reported rather than checked
+    file = tmp_path / "long.parquet"
+    length = 200_000
+    _write_parquet_dataset(
+        file,
+        input_ids={5: list(range(1, length + 1))},
+        attention_mask={5: [1] * length},
+        labels={5: list(range(1, length + 1))},
+    )
+
+    report = check_file(file)
+
+    assert report["is_check_passed"], report
+    assert report["max_sequence_length"] == length
+
+
+@pytest.mark.parametrize(
+    "overrides, message",
+    [
+        ({"attention_mask": {23: [1, 1, 1]}}, "different lengths"),
+        ({"attention_mask": {23: [1, 2, 1, 0]}}, "must only contain 0 and 1"),
+        ({"labels": {23: [24, 25, 7, -100]}}, "must be equal to `input_ids`"),
+        (
+            {"input_ids": {23: []}, "attention_mask": {23: []}, "labels": {23: []}},
+            "is empty",
+        ),
+        ({"labels": {23: None}}, "`labels` is null"),
+    ],
+)
+def test_check_parquet_invalid_row(tmp_path: Path, overrides, message):
+    file = tmp_path / "invalid.parquet"
+    _write_parquet_dataset(file, **overrides)
+
+    report = check_file(file)
+
+    assert not report["is_check_passed"]
+    assert message in report["message"]
+    assert report["line_number"] == 24
+    assert report["row_group"] == 2
+    assert "on row 24 (row group 2)" in report["message"]
+
+
+def test_check_parquet_non_integer_column(tmp_path: Path):
+    pa = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    file = tmp_path / "floats.parquet"
+    parquet.write_table(pa.table({"input_ids": [[1.0, 2.0]]}), file)
+
+    report = check_file(file)
+
+    assert not report["is_check_passed"]
+    assert "must be a list of integers" in report["message"]
@@ -1,16 +1,20 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock
 
 import pytest
 
 from together.client import Together
-from together.resources.finetune import create_finetune_request
+from together.resources.finetune import _EventCursor, create_finetune_request
 from together.together_response import TogetherResponse
 from together.types import TogetherRequest
 from together.types.finetune import (
+    FinetuneEvent,
     FinetuneFullTrainingLimits,
+    FinetuneListEvents,
     FinetuneLoraTrainingLimits,
     FinetuneTrainingLimits,
 )
+from together.utils.waiters import PollingPolicy
 
 
 _MODEL_NAME = "meta-llama/Meta-Llama-3.1-8B-Instruct-Reference"
@@ -453,3 +457,51 @@ def test_create_ft_job(mocker):
 
     assert mock_requestor.request.call_count == 5
     assert response.id == _DUMMY_ID
+
+
+def _event(second, message, hash=None):
+    return FinetuneEvent(
+        object="fine-tune-event",
+        created_at=f"2024-01-01T00:00:{second:02d}.000Z",
+        message=message,
+        hash=hash,
+    )
+
+
+def test_event_cursor_skips_seen_events():
+    cursor = _EventCursor(window=2)
+    first = [_event(1, "a", "h1"), _event(2, "b", "h2")]
+
+    assert cursor.new_events(first) == first
+    # same second as the latest event, but a new hash
+    later = [*first, _event(2, "c", "h3"), _event(3, "d")]
+    assert [e.message for e in cursor.new_events(later)] == ["c", "d"]
+    assert cursor.new_events(later) == []
+    assert len(cursor._seen) == 2
+
+
+def test_follow_events(monkeypatch):
+    polls = [
+        [_event(1, "a", "h1")],
+        [_event(1, "a", "h1"), _event(2, "b", "h2")],
+        [_event(1, "a", "h1"), _event(2, "b", "h2")],
+        [_event(1, "a", "h1"), _event(2, "b", "h2"), _event(3, "done", "h3")],
+    ]
+    fine_tuning = Together(api_key="fake_api_key").fine_tuning
+    statuses = iter(["running", "completed"])
+    monkeypatch.setattr(
+        fine_tuning,
+        "list_events",
+        lambda id: FinetuneListEvents(
+            data=polls.pop(0) if len(polls) > 1 else polls[0]
+        ),
+    )
+    monkeypatch.setattr(
+        fine_tuning, "retrieve", lambda id: SimpleNamespace(status=next(statuses))
+    )
+
+    events = fine_tuning.follow_events(
+        _DUMMY_ID, policy=PollingPolicy(initial_interval=0.01, jitter=0)
+    )
+
+    assert [e.message for e in events] == ["a", "b", "done"]
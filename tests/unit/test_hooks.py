@@ -0,0 +1,181 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.abstract.api_requestor import APIRequestor
+from together.error import InvalidRequestError
+from together.hooks import RequestHooks
+from together.types import TogetherClient, TogetherRequest
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body["model"] == "missing":
+            self._json(404, {"error": {"message": "model not found"}})
+        elif Handler.failures:
+            Handler.failures -= 1
+            self._json(503, {}, {"retry-after-ms": "10"})
+        elif body.get("stream"):
+            self._stream()
+        else:
+            self._json(
+                200,
+                {
+                    "id": "1",
+                    "choices": [{"message": {"role": "assistant", "content": "hi"}}],
+                },
+            )
+
+    def _stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(3):
+            chunk = {"id": "1", "choices": [{"index": 0, "delta": {"content": str(i)}}]}
+            self._chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _json(self, status, data, headers=None):
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("x-total-time", "12.5")
+        self.send_header("cf-ray", "ray-1")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def base_url(serve):
+    Handler.failures = 0
+    return serve(Handler)
+
+
+def _recorder():
+    hooks = RequestHooks()
+    events = []
+    for name in ["on_request", "on_response", "on_retry", "on_stream_event"]:
+        getattr(hooks, name)(lambda event, name=name: events.append((name, event)))
+    hooks.on_error(lambda event: events.append(("on_error", event)))
+    return hooks, events
+
+
+def test_hooks_time_request(base_url):
+    hooks, events = _recorder()
+    client = Together(api_key="fake", base_url=base_url, hooks=hooks)
+
+    client.chat.completions.create(model="model", messages=MESSAGES)
+
+    assert [name for name, _ in events] == ["on_request", "on_response"]
+    event = events[-1][1]
+    assert event.method == "POST"
+    assert event.url == base_url + "chat/completions"
+    assert (event.status_code, event.request_id) == (200, "ray-1")
+    timing = event.timing
+    assert timing.connect is not None and timing.tls is None
+    assert 0 < timing.time_to_first_byte <= timing.total
+    assert timing.transfer == pytest.approx(timing.total - timing.time_to_first_byte)
+    assert timing.server_time == 0.0125
+    assert timing.client_overhead == timing.total - 0.0125
+
+
+def test_hooks_on_retry(base_url):
+    Handler.failures = 2
+    hooks, events = _recorder()
+    client = Together(api_key="fake", base_url=base_url, hooks=hooks)
+
+    client.chat.completions.create(model="model", messages=MESSAGES)
+
+    assert [name for name, _ in events] == [
+        "on_request",
+        "on_retry",
+        "on_request",
+        "on_retry",
+        "on_request",
+        "on_response",
+    ]
+    retry = events[1][1]
+    assert (retry.attempt, retry.status_code, retry.retry_delay) == (0, 503, 0.01)
+    assert events[-1][1].attempt == events[-1][1].timing.retries == 2
+
+
+def test_hooks_on_stream_event(base_url):
+    hooks, events = _recorder()
+    client = Together(api_key="fake", base_url=base_url)
+    # registered on the client after creating it
+    client.hooks.on_stream_event(hooks.hooks["on_stream_event"][0])
+    client.hooks.on_response(hooks.hooks["on_response"][0])
+
+    stream = client.chat.completions.create(
+        model="model", messages=MESSAGES, stream=True
+    )
+    assert [name for name, _ in events] == []
+    list(stream)
+
+    assert [name for name, _ in events] == ["on_stream_event"] * 3 + ["on_response"]
+    assert [event.stream_event for _, event in events[:3]] == [0, 1, 2]
+    assert events[-1][1].timing.transfer is not None
+
+
+def test_hooks_on_error(base_url):
+    hooks, events = _recorder()
+    hooks.on_request(lambda event: 1 / 0)  # errors of hooks are ignored
+    client = Together(api_key="fake", base_url=base_url, hooks=hooks)
+
+    with pytest.raises(InvalidRequestError):
+        client.chat.completions.create(model="missing", messages=MESSAGES)
+
+    assert [name for name, _ in events] == ["on_request", "on_error"]
+    assert isinstance(events[-1][1].error, InvalidRequestError)
+    assert events[-1][1].status_code == 404
+
+
+def test_no_trace_without_hooks():
+    requestor = APIRequestor(TogetherClient(api_key="fake", hooks=RequestHooks()))
+
+    assert requestor._trace(TogetherRequest(method="GET", url="models")) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_async_hooks(base_url, stream):
+    hooks, events = _recorder()
+    client = AsyncTogether(api_key="fake", base_url=base_url, hooks=hooks)
+
+    response = await client.chat.completions.create(
+        model="model", messages=MESSAGES, stream=stream
+    )
+    if stream:
+        [chunk async for chunk in response]
+
+    names = [name for name, _ in events]
+    assert names == ["on_request"] + ["on_stream_event"] * (3 * stream) + [
+        "on_response"
+    ]
+    timing = events[-1][1].timing
+    assert timing.connect is not None
+    assert 0 < timing.time_to_first_byte <= timing.total
+    if not stream:
+        assert timing.server_time == 0.0125
+
+    events.clear()
+    with pytest.raises(InvalidRequestError):
+        await client.chat.completions.create(model="missing", messages=MESSAGES)
+    assert [name for name, _ in events] == ["on_request", "on_error"]
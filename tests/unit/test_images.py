@@ -0,0 +1,170 @@
+import base64
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.types import ImageResponse
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(64))
+JPEG = b"\xff\xd8\xff\xe0" + bytes(64)
+
+
+def _response(prompt, seed, n):
+    return ImageResponse(
+        data=[
+            {"index": i, "b64_json": base64.b64encode(PNG + prompt.encode()).decode()}
+            for i in range(n)
+        ]
+    )
+
+
+def test_generate_many_writes_files(tmp_path, monkeypatch):
+    images = Together(api_key="fake").images
+    calls = []
+
+    def generate(*, prompt, model, seed, n, **kwargs):
+        calls.append((prompt, seed))
+        if prompt == "bad":
+            raise ValueError("rejected")
+        return _response(prompt, seed, n)
+
+    monkeypatch.setattr(images, "generate", generate)
+    seen = []
+
+    prompts = [f"cat {i}" for i in range(11)] + ["bad"]
+    results = images.generate_many(
+        prompts,
+        model="m",
+        output_dir=tmp_path / "out",
+        callback=seen.append,
+        seed=100,
+        n=2,
+        max_concurrency=3,
+    )
+
+    assert sorted(calls) == sorted((p, 100 + i) for i, p in enumerate(prompts))
+    assert len(results) == 23 and len(seen) == 23
+    assert [(r.prompt_index, r.image_index) for r in results[:3]] == [
+        (0, 0),
+        (0, 1),
+        (1, 0),
+    ]
+    assert results[-1].error == "rejected" and results[-1].path is None
+    assert results[3].path == str(tmp_path / "out" / "01-seed101-1.png")
+    assert (tmp_path / "out" / "01-seed101-1.png").read_bytes() == PNG + b"cat 1"
+    assert all(r.data is None for r in results)
+
+
+class Handler(BaseHTTPRequestHandler):
+    headers_seen = []
+
+    def do_GET(self):
+        Handler.headers_seen.append(dict(self.headers))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(JPEG)))
+        self.end_headers()
+        if self.path == "/truncated.jpg":
+            # the connection closes before the announced length is sent
+            self.wfile.write(JPEG[:10])
+            self.close_connection = True
+            return
+        self.wfile.write(JPEG)
+
+
+@pytest.fixture
+def image_url(serve):
+    Handler.headers_seen = []
+    return serve(Handler, "/image.jpg")
+
+
+def test_generate_many_downloads_urls(tmp_path, monkeypatch, image_url):
+    images = Together(api_key="fake").images
+    monkeypatch.setattr(
+        images,
+        "generate",
+        lambda **kwargs: ImageResponse(data=[{"index": 0, "url": image_url}]),
+    )
+
+    results = images.generate_many(["a", "b"], model="m", output_dir=tmp_path)
+    in_memory = images.generate_many(["a"], model="m")
+
+    assert [r.path for r in results] == [
+        str(tmp_path / "0-0.jpg"),
+        str(tmp_path / "1-0.jpg"),
+    ]
+    assert (tmp_path / "1-0.jpg").read_bytes() == JPEG
+    assert in_memory[0].data == JPEG
+    # the API key is not sent to the image host
+    assert all("Authorization" not in headers for headers in Handler.headers_seen)
+
+
+def test_generate_many_removes_failed_downloads(tmp_path, monkeypatch, image_url):
+    images = Together(api_key="fake", max_retries=0).images
+    url = image_url.replace("image.jpg", "truncated.jpg")
+    # small blocks, so that the file is created before the download fails
+    monkeypatch.setattr("together.resources.images.DOWNLOAD_BLOCK_SIZE", 4)
+    monkeypatch.setattr(
+        images,
+        "generate",
+        lambda **kwargs: ImageResponse(data=[{"index": 0, "url": url}]),
+    )
+
+    results = images.generate_many(["a"], model="m", output_dir=tmp_path)
+
+    assert results[0].error and results[0].path is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_async_generate_many(tmp_path, monkeypatch, image_url):
+    images = AsyncTogether(api_key="fake").images
+
+    async def generate(*, prompt, model, seed, n, **kwargs):
+        if prompt == "url":
+            return ImageResponse(data=[{"index": 0, "url": image_url}])
+        return _response(prompt, seed, n)
+
+    monkeypatch.setattr(images, "generate", generate)
+    seen = []
+
+    async def callback(image):
+        seen.append(image.prompt_index)
+
+    results = await images.generate_many(
+        ["a", "url", "c"],
+        model="m",
+        output_dir=tmp_path,
+        callback=callback,
+        seed=[7, 8, 9],
+        max_concurrency=2,
+    )
+
+    assert sorted(seen) == [0, 1, 2]
+    assert [r.path for r in results] == [
+        str(tmp_path / "0-seed7-0.png"),
+        str(tmp_path / "1-seed8-0.jpg"),
+        str(tmp_path / "2-seed9-0.png"),
+    ]
+    assert (tmp_path / "1-seed8-0.jpg").read_bytes() == JPEG
+
+
+@pytest.mark.asyncio
+async def test_async_generate_many_removes_failed_downloads(
+    tmp_path, monkeypatch, image_url
+):
+    images = AsyncTogether(api_key="fake").images
+    url = image_url.replace("image.jpg", "truncated.jpg")
+    monkeypatch.setattr("together.resources.images.DOWNLOAD_BLOCK_SIZE", 4)
+
+    async def generate(**kwargs):
+        return ImageResponse(data=[{"index": 0, "url": url}])
+
+    monkeypatch.setattr(images, "generate", generate)
+
+    results = await images.generate_many(["a"], model="m", output_dir=tmp_path)
+
+    assert results[0].error is not None and results[0].path is None
+    assert list(tmp_path.iterdir()) == []
+    assert all("Authorization" not in headers for headers in Handler.headers_seen)
@@ -1,5 +1,7 @@
 import glob
 import importlib
+import subprocess
+import sys
 from pathlib import Path
 
 
@@ -13,3 +15,12 @@ def test_importable_all() -> None:
         all_ = getattr(module, "__all__", [])
         for cls_ in all_:
             getattr(module, cls_)
+
+
+def test_import_does_not_load_numpy() -> None:
+    # numpy is only needed by a few audio helpers, and takes long to import
+    code = "import sys, together; print('numpy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,223 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.error import InvalidRequestError, RateLimitError
+from together.metrics import HistogramSnapshot, MetricsRegistry, _Histogram
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+USAGE = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    rate_limited = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body["model"] == "missing":
+            self._json(404, {"error": {"message": "model not found"}})
+        elif Handler.rate_limited:
+            Handler.rate_limited -= 1
+            self._json(
+                429, {"error": {"message": "rate limited"}}, {"retry-after-ms": "10"}
+            )
+        elif body.get("stream"):
+            self._stream()
+        else:
+            self._json(
+                200,
+                {
+                    "id": "1",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "text": "hi",
+                            "message": {"role": "assistant", "content": "hi"},
+                        }
+                    ],
+                    "usage": USAGE,
+                },
+            )
+
+    def _stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(3):
+            chunk = {
+                "id": "1",
+                "choices": [{"index": 0, "delta": {"content": str(i)}}],
+                "usage": USAGE if i == 2 else None,
+            }
+            self._chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _json(self, status, data, headers=None):
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def base_url(serve):
+    Handler.rate_limited = 0
+    return serve(Handler)
+
+
+def _series(client):
+    return {
+        (series.resource, series.model, series.status): series
+        for series in client.metrics.snapshot()
+    }
+
+
+def test_metrics_disabled_by_default(base_url):
+    client = Together(api_key="fake", base_url=base_url)
+
+    assert client.metrics is None
+    assert not client.hooks
+
+
+def test_call_metrics(base_url):
+    client = Together(api_key="fake", base_url=base_url, metrics=True)
+
+    for _ in range(2):
+        client.chat.completions.create(model="my-model", messages=MESSAGES)
+    with pytest.raises(InvalidRequestError):
+        client.chat.completions.create(model="missing", messages=MESSAGES)
+
+    series = _series(client)
+    assert set(series) == {
+        ("chat/completions", "my-model", "200"),
+        ("chat/completions", "missing", "404"),
+    }
+    ok = series["chat/completions", "my-model", "200"]
+    assert (ok.requests, ok.retries, ok.rate_limited) == (2, 0, 0)
+    assert ok.latency.count == 2
+    assert 0 < ok.latency.min <= ok.latency.percentile(50) <= ok.latency.max
+    assert ok.pool_wait.count == 2
+    assert ok.time_to_first_token.count == 0
+    assert series["chat/completions", "missing", "404"].requests == 1
+
+
+def test_stream_metrics(base_url):
+    client = Together(api_key="fake", base_url=base_url, metrics=True)
+
+    list(
+        client.chat.completions.create(model="my-model", messages=MESSAGES, stream=True)
+    )
+
+    (series,) = client.metrics.snapshot()
+    assert series.time_to_first_token.count == 1
+    assert series.inter_token_latency.count == 2
+    assert series.output_tokens_per_second.count == 1
+    assert series.time_to_first_token.max <= series.latency.max
+
+
+def test_rate_limited_metrics(base_url):
+    Handler.rate_limited = 2
+    client = Together(api_key="fake", base_url=base_url, metrics=True)
+
+    client.chat.completions.create(model="my-model", messages=MESSAGES)
+
+    (series,) = client.metrics.snapshot()
+    assert (series.requests, series.retries, series.rate_limited) == (1, 2, 2)
+    assert series.rate_limited_ratio == pytest.approx(2 / 3)
+    assert series.pool_wait.count == 3
+
+
+def test_shared_registry_across_threads(base_url):
+    registry = MetricsRegistry()
+    clients = [
+        Together(api_key="fake", base_url=base_url, metrics=registry) for _ in range(2)
+    ]
+    threads = [
+        threading.Thread(
+            target=client.completions.create,
+            kwargs={"model": "my-model", "prompt": "hi"},
+        )
+        for client in clients
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    (series,) = registry.snapshot()
+    assert series.resource == "completions"
+    assert series.requests == 6
+    assert len(registry._shards) == 6
+
+
+def test_histogram_percentiles():
+    histogram = _Histogram()
+    for value in range(1, 1001):
+        histogram.record(value / 1000)
+    snapshot = HistogramSnapshot()
+    snapshot._merge(histogram)
+
+    assert (snapshot.count, snapshot.min, snapshot.max) == (1000, 0.001, 1.0)
+    assert snapshot.mean == pytest.approx(0.5005)
+    for percentile in [1, 50, 90, 99]:
+        assert snapshot.percentile(percentile) == pytest.approx(
+            percentile / 100, rel=1 / 32
+        )
+    assert snapshot.percentile(100) == 1.0
+    assert HistogramSnapshot().percentile(50) is None
+
+
+def test_prometheus_export(base_url):
+    client = Together(api_key="fake", base_url=base_url, metrics=True)
+    client.chat.completions.create(model='my"model', messages=MESSAGES)
+
+    text = client.metrics.to_prometheus()
+
+    labels = 'resource="chat/completions",model="my\\"model",status="200"'
+    assert "# TYPE together_client_requests_total counter\n" in text
+    assert f"together_client_requests_total{{{labels}}} 1\n" in text
+    assert "# TYPE together_client_request_duration_seconds summary\n" in text
+    assert (
+        f'together_client_request_duration_seconds{{{labels},quantile="0.99"}}' in text
+    )
+    assert f"together_client_request_duration_seconds_count{{{labels}}} 1\n" in text
+    # streams only
+    assert "together_client_time_to_first_token_seconds{" not in text
+
+
+@pytest.mark.asyncio
+async def test_async_client(base_url):
+    client = AsyncTogether(api_key="fake", base_url=base_url, metrics=True)
+
+    await client.completions.create(model="my-model", prompt="hi")
+    stream = await client.chat.completions.create(
+        model="my-model", messages=MESSAGES, stream=True
+    )
+    [chunk async for chunk in stream]
+    Handler.rate_limited = 1
+    with pytest.raises(RateLimitError):
+        await client.completions.create(model="my-model", prompt="hi")
+
+    series = _series(client)
+    assert series["completions", "my-model", "200"].requests == 1
+    rate_limited = series["completions", "my-model", "429"]
+    assert (rate_limited.requests, rate_limited.rate_limited) == (1, 1)
+    chat = series["chat/completions", "my-model", "200"]
+    assert chat.time_to_first_token.count == 1
+    assert chat.output_tokens_per_second.count == 1
@@ -0,0 +1,136 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from together import AsyncTogether, Together
+from together.abstract.multipart import MultipartEncoder
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests = []
+    # requests answered with a 503 before the first success
+    failures = 0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        Handler.requests.append((dict(self.headers), body))
+        if len(Handler.requests) <= Handler.failures:
+            self.send_response(503)
+            self.send_header("retry-after-ms", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        content = json.dumps({"text": "hello"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def base_url(serve):
+    Handler.requests = []
+    Handler.failures = 0
+    return serve(Handler)
+
+
+def _files(tmp_path):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(bytes(range(256)) * 40)
+    return {
+        "file": open(audio, "rb"),
+        "url": (None, "https://example.com/a.mp3"),
+        "meta": ("meta.json", b'{"a": 1}', "application/json", {"X-Extra": "1"}),
+    }
+
+
+def test_matches_requests_encoding(tmp_path):
+    fields = {
+        "model": "whisper",
+        "temperature": 0.0,
+        "diarize": True,
+        "tags": ["a", "b"],
+    }
+    files = _files(tmp_path)
+    expected, content_type = requests.models.RequestEncodingMixin._encode_files(
+        files, fields
+    )
+    for value in files.values():
+        if hasattr(value, "seek"):
+            value.seek(0)
+
+    encoder = MultipartEncoder(
+        files, fields, block_size=1000, boundary=content_type.split("boundary=")[1]
+    )
+
+    body = b"".join(encoder)
+    assert body == expected
+    assert len(encoder) == len(body)
+    # iterating again, as on a retry, resends the file from the same position
+    assert b"".join(encoder) == body
+    files["file"].close()
+
+
+@pytest.mark.asyncio
+async def test_aiter_matches_iter(tmp_path):
+    files = _files(tmp_path)
+    files["file"].read(10)  # sent from the current position
+    encoder = MultipartEncoder(files, {"model": "whisper"}, block_size=1000)
+
+    body = b"".join([chunk async for chunk in encoder.aiter()])
+
+    assert body == b"".join(encoder)
+    assert bytes(range(10, 256)) in body
+    assert len(encoder) == len(body)
+    files["file"].close()
+
+
+def _check_upload(audio_bytes, index=0):
+    headers, body = Handler.requests[index]
+    assert "Transfer-Encoding" not in headers
+    assert int(headers["Content-Length"]) == len(body)
+    assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert b'name="model"\r\n\r\nopenai/whisper-large-v3\r\n' in body
+    assert b'filename="audio.wav"\r\n\r\n' + audio_bytes + b"\r\n" in body
+
+
+def test_transcription_upload_is_streamed(tmp_path, base_url):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"RIFF" + bytes(100_000))
+    client = Together(api_key="fake", base_url=base_url, max_retries=0)
+
+    response = client.audio.transcriptions.create(file=str(audio))
+
+    assert response.text == "hello"
+    _check_upload(audio.read_bytes())
+
+
+def test_retried_upload_resends_file(tmp_path, base_url):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"RIFF" + bytes(range(256)) * 400)
+    Handler.failures = 2
+    client = Together(api_key="fake", base_url=base_url, max_retries=2)
+
+    with open(audio, "rb") as f:
+        response = client.audio.transcriptions.create(file=f)
+
+    assert response.text == "hello"
+    assert len(Handler.requests) == 3
+    for index in range(3):
+        _check_upload(audio.read_bytes(), index)
+
+
+@pytest.mark.asyncio
+async def test_async_transcription_upload_is_streamed(tmp_path, base_url):
+    audio = tmp_path / "audio.wav"
+    audio.write_bytes(b"RIFF" + bytes(100_000))
+    client = AsyncTogether(api_key="fake", base_url=base_url, max_retries=0)
+
+    with open(audio, "rb") as f:
+        response = await client.audio.transcriptions.create(file=f)
+
+    assert response.text == "hello"
+    _check_upload(audio.read_bytes())
@@ -0,0 +1,215 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.error import InvalidRequestError
+
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+
+from together.otel import instrument  # noqa: E402
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+USAGE = {"prompt_tokens": 5, "completion_tokens": 3, "total_tokens": 8}
+FILE = b'{"text": "hello"}\n' * 100
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._send(200, FILE, "application/octet-stream")
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body["model"] == "missing":
+            self._json(404, {"error": {"message": "model not found"}})
+        elif body.get("stream"):
+            self._stream()
+        else:
+            self._json(
+                200,
+                {
+                    "id": "resp-1",
+                    "model": "served-model",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "text": "hi",
+                            "message": {"role": "assistant", "content": "hi"},
+                        }
+                    ],
+                    "usage": USAGE,
+                },
+            )
+
+    def _stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(3):
+            chunk = {
+                "id": "resp-2",
+                "model": "served-model",
+                "choices": [{"index": 0, "delta": {"content": str(i)}}],
+                "usage": USAGE if i == 2 else None,
+            }
+            self._chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _json(self, status, data):
+        self._send(status, json.dumps(data).encode(), "application/json")
+
+    def _send(self, status, content, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("cf-ray", "ray-1")
+        self.send_header("x-hostname", "host-1")
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def base_url(serve):
+    return serve(Handler)
+
+
+@pytest.fixture
+def telemetry():
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(metric_readers=[reader])
+    return exporter, reader, tracer_provider, meter_provider
+
+
+def _metrics(reader):
+    points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                points[metric.name] = metric.data.data_points
+    return points
+
+
+def _instrument(client, telemetry):
+    _, _, tracer_provider, meter_provider = telemetry
+    return instrument(
+        client, tracer_provider=tracer_provider, meter_provider=meter_provider
+    )
+
+
+def test_span_and_metrics_of_call(base_url, telemetry):
+    exporter, reader, _, _ = telemetry
+    client = Together(api_key="fake", base_url=base_url)
+    _instrument(client, telemetry)
+
+    client.chat.completions.create(model="my-model", messages=MESSAGES)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "chat my-model"
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes["gen_ai.provider.name"] == "together_ai"
+    assert span.attributes["gen_ai.operation.name"] == "chat"
+    assert span.attributes["gen_ai.request.model"] == "my-model"
+    assert span.attributes["gen_ai.response.model"] == "served-model"
+    assert span.attributes["gen_ai.response.id"] == "resp-1"
+    assert span.attributes["gen_ai.usage.input_tokens"] == 5
+    assert span.attributes["gen_ai.usage.output_tokens"] == 3
+    assert span.attributes["http.request.method"] == "POST"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["together.request_id"] == "ray-1"
+    assert span.attributes["together.processed_by"] == "host-1"
+
+    points = _metrics(reader)
+    (duration,) = points["gen_ai.client.operation.duration"]
+    assert duration.count == 1
+    assert duration.attributes["gen_ai.request.model"] == "my-model"
+    tokens = {
+        point.attributes["gen_ai.token.type"]: point.sum
+        for point in points["gen_ai.client.token.usage"]
+    }
+    assert tokens == {"input": 5, "output": 3}
+    assert "together.client.time_to_first_token" not in points
+
+
+def test_stream_metrics(base_url, telemetry):
+    exporter, reader, _, _ = telemetry
+    client = Together(api_key="fake", base_url=base_url)
+    _instrument(client, telemetry)
+
+    list(
+        client.chat.completions.create(model="my-model", messages=MESSAGES, stream=True)
+    )
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["gen_ai.response.id"] == "resp-2"
+    assert span.attributes["gen_ai.usage.output_tokens"] == 3
+    points = _metrics(reader)
+    assert points["together.client.time_to_first_token"][0].count == 1
+    assert points["together.client.output_tokens_per_second"][0].count == 1
+
+
+def test_error_span(base_url, telemetry):
+    exporter, reader, _, _ = telemetry
+    client = Together(api_key="fake", base_url=base_url)
+    instrumentor = _instrument(client, telemetry)
+    instrumentor.instrument(client)  # instrumenting twice records calls once
+
+    with pytest.raises(InvalidRequestError):
+        client.chat.completions.create(model="missing", messages=MESSAGES)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.attributes["error.type"] == "InvalidRequestError"
+    assert span.attributes["http.response.status_code"] == 404
+    (duration,) = _metrics(reader)["gen_ai.client.operation.duration"]
+    assert duration.attributes["error.type"] == "InvalidRequestError"
+
+    instrumentor.uninstrument(client)
+    assert not client.hooks
+
+
+def test_file_download_bytes(base_url, telemetry, tmp_path):
+    _, reader, _, _ = telemetry
+    client = Together(api_key="fake", base_url=base_url)
+    _instrument(client, telemetry)
+
+    client.files.retrieve_content("file-1", output=tmp_path / "file.jsonl")
+
+    (transferred,) = _metrics(reader)["together.client.file.transferred"]
+    assert transferred.value == len(FILE)
+    assert transferred.attributes["together.file.direction"] == "download"
+
+
+@pytest.mark.asyncio
+async def test_async_client(base_url, telemetry):
+    exporter, reader, _, _ = telemetry
+    client = AsyncTogether(api_key="fake", base_url=base_url)
+    _instrument(client, telemetry)
+
+    await client.completions.create(model="my-model", prompt="hi")
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "text_completion my-model"
+    assert span.attributes["gen_ai.usage.input_tokens"] == 5
@@ -0,0 +1,134 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from together.utils import check_file
+from together.utils.packing import _map_bounded, pack_dataset, pack_sequences
+
+
+PAD = 0
+EOS = 2
+
+
+def _reference_pack(sequences, max_seq_len, drop_incomplete):
+    buffer = []
+    for sequence in sequences:
+        buffer.extend(sequence)
+        buffer.append(EOS)
+    rows = [buffer[i : i + max_seq_len] for i in range(0, len(buffer), max_seq_len)]
+    if rows and len(rows[-1]) < max_seq_len:
+        if drop_incomplete:
+            rows.pop()
+        else:
+            rows[-1] = rows[-1] + [PAD] * (max_seq_len - len(rows[-1]))
+    return rows
+
+
+@pytest.mark.parametrize("drop_incomplete", [True, False])
+def test_pack_sequences_matches_reference(drop_incomplete):
+    rng = np.random.default_rng(0)
+    sequences = [
+        rng.integers(3, 1000, size=rng.integers(0, 40)).tolist() for _ in range(50)
+    ]
+
+    packed = pack_sequences(sequences, 16, PAD, EOS, drop_incomplete=drop_incomplete)
+
+    expected = _reference_pack(sequences, 16, drop_incomplete)
+    assert packed["input_ids"].tolist() == expected
+    assert packed["input_ids"].shape == (len(expected), 16)
+    num_real = sum(len(s) + 1 for s in sequences)
+    assert packed["attention_mask"].sum() == min(num_real, len(expected) * 16)
+    assert (packed["labels"] == -100).sum() == len(expected) * 16 - min(
+        num_real, len(expected) * 16
+    )
+
+
+def test_pack_sequences_keeps_real_pad_tokens():
+    # EOS is commonly used as the pad token, it must not be masked inside documents
+    packed = pack_sequences(
+        [[5, 6], [7]], 4, pad_token_id=EOS, eos_token_id=EOS, drop_incomplete=False
+    )
+
+    assert packed["input_ids"].tolist() == [[5, 6, EOS, 7], [EOS, EOS, EOS, EOS]]
+    assert packed["attention_mask"].tolist() == [[1, 1, 1, 1], [1, 0, 0, 0]]
+    assert packed["labels"].tolist() == [[5, 6, EOS, 7], [EOS, -100, -100, -100]]
+
+
+def test_pack_sequences_document_boundaries():
+    packed = pack_sequences(
+        [[5, 6], [7, 8], [9]], 4, PAD, EOS, mask_document_boundaries=True
+    )
+
+    assert packed["input_ids"].tolist() == [[5, 6, EOS, 7], [8, EOS, 9, EOS]]
+    assert packed["labels"].tolist() == [[5, 6, EOS, -100], [8, EOS, -100, EOS]]
+    assert packed["attention_mask"].all()
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_pack_dataset_writes_valid_parquet(tmp_path: Path, num_workers):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    input_file = tmp_path / "tokens.jsonl"
+    sequences = [[3 + (i % 50)] * (1 + i % 13) for i in range(400)]
+    input_file.write_text(
+        "\n".join(json.dumps({"input_ids": s}) for s in sequences) + "\n"
+    )
+    output_file = tmp_path / "packed.parquet"
+
+    stats = pack_dataset(
+        input_file,
+        output_file,
+        max_seq_len=32,
+        pad_token_id=PAD,
+        eos_token_id=EOS,
+        num_workers=num_workers,
+        shard_size=512,
+    )
+
+    table = parquet.read_table(output_file)
+    assert stats["num_documents"] == 400
+    assert stats["num_rows"] == len(table) > 1
+    assert parquet.ParquetFile(output_file).num_row_groups > 1
+    assert table.column_names == ["input_ids", "attention_mask", "labels"]
+    report = check_file(output_file)
+    assert report["is_check_passed"], report
+    assert report["max_sequence_length"] == 32
+
+
+def test_pack_dataset_requires_tokenizer_for_text(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    input_file = tmp_path / "text.jsonl"
+    input_file.write_text(json.dumps({"text": "hello"}) + "\n")
+
+    with pytest.raises(ValueError, match="a tokenizer is required"):
+        pack_dataset(input_file, tmp_path / "out.parquet", 8, PAD, EOS)
+
+
+def test_pack_dataset_reports_missing_text_field(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    input_file = tmp_path / "tokens.jsonl"
+    lines = [{"input_ids": [5, 6, 7]}] * 30 + [{"content": "hello"}]
+    input_file.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+    with pytest.raises(ValueError, match="Line 31 of .* `text` field"):
+        pack_dataset(input_file, tmp_path / "out.parquet", 8, PAD, EOS, shard_size=128)
+
+
+def test_map_bounded_limits_pending_items():
+    submitted = []
+
+    def square(x):
+        return x * x
+
+    def items():
+        for i in range(20):
+            submitted.append(i)
+            yield i
+
+    with ThreadPoolExecutor(2) as executor:
+        results = _map_bounded(executor, square, items(), max_pending=4)
+        assert next(results) == 0
+        assert len(submitted) == 5
+        assert list(results) == [i * i for i in range(1, 20)]
@@ -0,0 +1,172 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from together import AsyncTogether, Together, profiling
+from together.error import InvalidRequestError
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+# SDK phases of a call that is not streamed
+SYNC_PHASES = {
+    "call",
+    "build_request",
+    "session",
+    "encode_body",
+    "build_headers",
+    "send",
+    "decode_response",
+    "parse_response",
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._json(200, [])
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if body["model"] == "missing":
+            self._json(404, {"error": {"message": "model not found"}})
+        elif body.get("stream"):
+            self._stream()
+        else:
+            self._json(
+                200,
+                {
+                    "id": "1",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "finish_reason": "stop",
+                            "text": "hi",
+                            "message": {"role": "assistant", "content": "hi"},
+                        }
+                    ],
+                },
+            )
+
+    def _stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(3):
+            chunk = {"id": "1", "choices": [{"index": 0, "delta": {"content": str(i)}}]}
+            self._chunk(f"data: {json.dumps(chunk)}\n\n".encode())
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def _json(self, status, data):
+        content = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def base_url(serve):
+    return serve(Handler)
+
+
+def test_disabled_by_default(base_url):
+    client = Together(api_key="fake", base_url=base_url)
+
+    client.chat.completions.create(model="my-model", messages=MESSAGES)
+
+    assert not profiling.enabled
+    assert profiling.get_profiler() is None
+
+
+def test_phases_of_call(base_url):
+    client = Together(api_key="fake", base_url=base_url)
+
+    with profiling.profile() as profiler:
+        for _ in range(2):
+            client.chat.completions.create(model="my-model", messages=MESSAGES)
+        client.models.list()
+    assert not profiling.enabled
+
+    stats = profiler.stats()
+    phases = stats["chat.completions.create"]
+    assert set(phases) == SYNC_PHASES
+    assert all(phase.count == 2 for phase in phases.values())
+    call = phases["call"]
+    assert 0 < call.min_ns <= call.mean_ns <= call.max_ns
+    assert phases["send"].total_ns < call.total_ns
+    assert 0 < profiler.overhead_ns("chat.completions.create") < call.mean_ns
+    # calls of methods that are not profiled
+    assert "send" in stats[profiling.OTHER]
+
+    report = profiler.report()
+    assert "chat.completions.create" in report
+    assert "sdk overhead" in report
+
+
+def test_stream_phases(base_url):
+    client = Together(api_key="fake", base_url=base_url)
+
+    with profiling.profile() as profiler:
+        stream = client.chat.completions.create(
+            model="my-model", messages=MESSAGES, stream=True
+        )
+        assert len(list(stream)) == 3
+
+    phases = profiler.stats()["chat.completions.create"]
+    assert phases["call"].count == 1
+    # read after the method returned
+    assert phases["decode_response"].count == 3
+    assert phases["parse_response"].count == 3
+
+
+def test_failed_call(base_url):
+    client = Together(api_key="fake", base_url=base_url)
+
+    with profiling.profile() as profiler:
+        with pytest.raises(InvalidRequestError):
+            client.chat.completions.create(model="missing", messages=MESSAGES)
+
+    phases = profiler.stats()["chat.completions.create"]
+    assert phases["call"].count == phases["decode_response"].count == 1
+    assert "parse_response" not in phases
+
+
+def test_nested_profiles(base_url):
+    client = Together(api_key="fake", base_url=base_url)
+
+    with profiling.profile() as outer:
+        with profiling.profile() as inner:
+            client.completions.create(model="my-model", prompt="hi")
+        assert profiling.get_profiler() is outer
+        client.completions.create(model="my-model", prompt="hi")
+
+    assert inner.stats()["completions.create"]["call"].count == 1
+    assert outer.stats()["completions.create"]["call"].count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream", [False, True])
+async def test_async_phases(base_url, stream):
+    client = AsyncTogether(api_key="fake", base_url=base_url)
+
+    with profiling.profile() as profiler:
+        response = await client.chat.completions.create(
+            model="my-model", messages=MESSAGES, stream=stream
+        )
+        if stream:
+            [chunk async for chunk in response]
+
+    phases = profiler.stats()["chat.completions.create"]
+    assert phases["call"].count == 1
+    assert phases["session"].count == phases["send"].count == 1
+    assert phases["parse_response"].count == (3 if stream else 1)
+    assert ("receive_body" in phases) is not stream
@@ -0,0 +1,121 @@
+import json
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.error import InvalidRequestError
+
+
+SSE_BODY = (
+    b'data: {"id": "1", "choices": [{"index": 0, "delta": {"content": "Hi"}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests = []
+    # 503 responses sent before answering requests for the "flaky" model
+    failures = 0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        Handler.requests.append((self.path, dict(self.headers), body))
+        payload = json.loads(body)
+
+        if payload.get("model") == "flaky" and Handler.failures:
+            Handler.failures -= 1
+            content = b'{"error": {"message": "overloaded"}}'
+            self.send_response(503)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("retry-after-ms", "1")
+        elif payload.get("model") == "missing":
+            content = json.dumps(
+                {
+                    "error": {
+                        "message": "model not found",
+                        "type": "invalid_request_error",
+                    }
+                }
+            ).encode()
+            self.send_response(400)
+            self.send_header("Content-Type", "application/json")
+        elif payload.get("stream"):
+            content = SSE_BODY
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+        else:
+            content = b'{"id": "1", "choices": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+@pytest.fixture
+def base_url(serve):
+    Handler.requests = []
+    Handler.failures = 0
+    return serve(Handler)
+
+
+def test_create_raw_forwards_body(base_url):
+    client = Together(api_key="fake_api_key", base_url=base_url, max_retries=0)
+    body = b'{"model": "m", "messages": [{"role": "user", "content": "hi"}]}'
+
+    response = client.chat.completions.create_raw(body)
+
+    assert response.status_code == 200
+    assert response.content == b'{"id": "1", "choices": []}'
+    assert response.chunks is None
+    path, headers, sent = Handler.requests[0]
+    assert path == "/v1/chat/completions"
+    assert sent == body
+    assert headers["Authorization"] == "Bearer fake_api_key"
+    assert headers["Content-Type"] == "application/json"
+
+
+def test_create_raw_stream(base_url):
+    client = Together(api_key="fake_api_key", base_url=base_url, max_retries=0)
+
+    response = client.completions.create_raw(
+        '{"model": "m", "prompt": "hi", "stream": true}', stream=True
+    )
+
+    assert response.headers["Content-Type"] == "text/event-stream"
+    assert b"".join(response.chunks) == SSE_BODY
+
+
+def test_create_raw_raises_api_errors(base_url):
+    client = Together(api_key="fake_api_key", base_url=base_url, max_retries=0)
+
+    with pytest.raises(InvalidRequestError, match="model not found"):
+        client.chat.completions.create_raw(b'{"model": "missing"}')
+
+
+def test_create_raw_retries_server_errors(base_url):
+    Handler.failures = 1
+    client = Together(api_key="fake_api_key", base_url=base_url, max_retries=2)
+
+    response = client.chat.completions.create_raw(b'{"model": "flaky"}')
+
+    assert response.status_code == 200
+    assert response.content == b'{"id": "1", "choices": []}'
+    assert len(Handler.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_create_raw(base_url):
+    client = AsyncTogether(api_key="fake_api_key", base_url=base_url, max_retries=0)
+
+    response = await client.chat.completions.create_raw(b'{"model": "m"}')
+    assert response.content == b'{"id": "1", "choices": []}'
+
+    response = await client.chat.completions.create_raw(
+        b'{"model": "m", "stream": true}', stream=True
+    )
+    assert b"".join([chunk async for chunk in response.chunks]) == SSE_BODY
+
+    with pytest.raises(InvalidRequestError):
+        await client.chat.completions.create_raw(b'{"model": "missing"}')
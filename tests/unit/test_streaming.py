@@ -0,0 +1,441 @@
+import asyncio
+import gc
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.error import Timeout
+from together.streaming import (
+    AsyncChatCompletionStreamAccumulator,
+    AsyncStreamMultiplexer,
+    ChatCompletionStreamAccumulator,
+    PrefetchingStream,
+    aiter_json_events,
+    iter_json_events,
+)
+from together.together_response import TogetherResponse
+from together.types import ChatCompletionChunk
+from together.utils.incremental_json import IncrementalJSONParser
+
+
+def _chunks():
+    payloads = [
+        {
+            "id": "req-1",
+            "created": 1,
+            "model": "model",
+            "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}}],
+        },
+        {"id": "req-1", "choices": [{"index": 0, "delta": {"content": "Hel"}}]},
+        {"id": "req-1", "choices": [{"index": 1, "delta": {"content": "Bye"}}]},
+        {"id": "req-1", "choices": [{"index": 0, "delta": {"content": "lo"}}]},
+        {
+            "id": "req-1",
+            "choices": [
+                {
+                    "index": 1,
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call-1",
+                                "type": "function",
+                                "function": {"name": "get_weather", "arguments": ""},
+                            }
+                        ]
+                    },
+                }
+            ],
+        },
+        {
+            "id": "req-1",
+            "choices": [
+                {
+                    "index": 1,
+                    "delta": {
+                        "tool_calls": [
+                            {"index": 0, "function": {"arguments": '{"city": '}}
+                        ]
+                    },
+                }
+            ],
+        },
+        {
+            "id": "req-1",
+            "choices": [
+                {
+                    "index": 1,
+                    "delta": {
+                        "tool_calls": [
+                            {"index": 0, "function": {"arguments": '"Paris"}'}}
+                        ]
+                    },
+                    "finish_reason": "tool_calls",
+                }
+            ],
+        },
+        {
+            "id": "req-1",
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 5, "total_tokens": 8},
+        },
+    ]
+    return [ChatCompletionChunk(**payload) for payload in payloads]
+
+
+def _check_response(accumulator, chunks, forwarded):
+    assert forwarded == chunks
+    response = accumulator.response
+    assert response.id == "req-1"
+    assert response.model == "model"
+    assert response.usage.total_tokens == 8
+
+    first, second = response.choices
+    assert first.message.content == "Hello"
+    assert first.message.role == "assistant"
+    assert first.finish_reason == "stop"
+    assert second.message.content == "Bye"
+    assert second.finish_reason == "tool_calls"
+    (tool_call,) = second.message.tool_calls
+    assert tool_call.id == "call-1"
+    assert tool_call.function.name == "get_weather"
+    assert tool_call.function.arguments == '{"city": "Paris"}'
+
+    stats = accumulator.stats
+    assert stats.num_chunks == len(chunks)
+    assert stats.time_to_first_token is not None
+    # "Hel", "Bye", "lo" and three tool call fragments carry tokens
+    assert len(stats.inter_token_latencies) == 5
+    assert stats.total_time >= stats.time_to_first_token
+    assert stats.completion_tokens == 5
+
+
+def test_stream_accumulator():
+    chunks = _chunks()
+    accumulator = ChatCompletionStreamAccumulator(iter(chunks))
+
+    forwarded = list(accumulator)
+
+    _check_response(accumulator, chunks, forwarded)
+
+
+def test_stream_accumulator_consume():
+    chunks = _chunks()
+    accumulator = ChatCompletionStreamAccumulator(iter(chunks))
+    forwarded = [next(iter(accumulator))]
+
+    # only the first chunk was consumed so far
+    assert accumulator.response.choices[0].message.content == ""
+
+    response = accumulator.consume()
+    assert response.choices[0].message.content == "Hello"
+    assert forwarded == chunks[:1]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_accumulator():
+    chunks = _chunks()
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    accumulator = AsyncChatCompletionStreamAccumulator(stream())
+    forwarded = [chunk async for chunk in accumulator]
+
+    _check_response(accumulator, chunks, forwarded)
+
+
+def _json_chunks(text, size=3):
+    return [
+        ChatCompletionChunk(
+            choices=[{"index": 0, "delta": {"content": text[i : i + size]}}]
+        )
+        for i in range(0, len(text), size)
+    ]
+
+
+def test_iter_json_events():
+    content = (
+        '```json\n{"name": "Ada \\"L\\"", "langs": ["en", "fr"], "meta": {"n": 2}}\n```'
+    )
+    parser = IncrementalJSONParser()
+    partials = []
+
+    events = []
+    for event in iter_json_events(_json_chunks(content), parser=parser):
+        events.append(event)
+        partials.append(parser.partial)
+
+    assert [(e.type, e.path) for e in events] == [
+        ("field", ("name",)),
+        ("item", ("langs", 0)),
+        ("item", ("langs", 1)),
+        ("field", ("langs",)),
+        ("field", ("meta", "n")),
+        ("field", ("meta",)),
+        ("done", ()),
+    ]
+    assert events[0].value == 'Ada "L"'
+    assert partials[1] == {"name": 'Ada "L"', "langs": ["en"]}
+    assert parser.value == {"name": 'Ada "L"', "langs": ["en", "fr"], "meta": {"n": 2}}
+
+
+def test_iter_json_events_partial_strings():
+    parser = IncrementalJSONParser()
+
+    parser.feed('{"text": "Hel')
+    assert parser.partial == {"text": "Hel"}
+    parser.feed("lo \\u00e9")
+    assert parser.partial == {"text": "Hello é"}
+
+
+@pytest.mark.parametrize(
+    "content, path",
+    [
+        ('{"a": 1, "b": tru }', ("b",)),
+        ('{"a": [1, 2', ("a", 1)),
+        ('{"a" 1}', ("a",)),
+    ],
+)
+def test_iter_json_events_malformed(content, path):
+    events = list(iter_json_events(_json_chunks(content)))
+
+    assert events[-1].type == "error"
+    assert events[-1].path == path
+    assert [e.type for e in events].count("error") == 1
+
+
+@pytest.mark.asyncio
+async def test_aiter_json_events():
+    async def stream():
+        for chunk in _json_chunks('{"items": [1, {"x": null}]}', size=2):
+            yield chunk
+
+    events = [event async for event in aiter_json_events(stream())]
+
+    assert events[-1].type == "done"
+    assert events[-1].value == {"items": [1, {"x": None}]}
+
+
+class _FakeStream:
+    def __init__(self, name, delays):
+        self.name = name
+        self.delays = delays
+        self.closed = False
+
+    async def __aiter__(self):
+        try:
+            for i, delay in enumerate(self.delays):
+                await asyncio.sleep(delay)
+                yield f"{self.name}{i}"
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_yields_chunks_as_they_arrive():
+    fast = _FakeStream("f", [0.04] * 4)
+    slow = _FakeStream("s", [0.105, 0.2])
+
+    async def create():
+        await asyncio.sleep(0.005)
+        return fast
+
+    async with AsyncStreamMultiplexer() as streams:
+        streams.add("slow", slow)
+        streams.add("fast", create())
+        received = [item async for item in streams]
+
+    assert received == [
+        ("fast", "f0"),
+        ("fast", "f1"),
+        ("slow", "s0"),
+        ("fast", "f2"),
+        ("fast", "f3"),
+        ("slow", "s1"),
+    ]
+    assert fast.closed and slow.closed
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_cancel_and_early_stop_close_streams():
+    first = _FakeStream("a", [0.01] * 100)
+    second = _FakeStream("b", [0.01] * 100)
+
+    async with AsyncStreamMultiplexer() as streams:
+        streams.add("a", first)
+        streams.add("b", second)
+        received = []
+        async for key, chunk in streams:
+            received.append(key)
+            if key == "a":
+                await streams.cancel("a")
+            if len(received) == 5:
+                break
+        assert first.closed
+        assert "a" not in streams
+
+    assert received.count("a") == 1
+    assert second.closed
+    assert len(streams) == 0
+
+
+@pytest.mark.asyncio
+async def test_multiplexer_deadline():
+    slow = _FakeStream("s", [0.01, 1])
+    fast = _FakeStream("f", [0.01, 0.05])
+
+    streams = AsyncStreamMultiplexer(return_exceptions=True)
+    streams.add("slow", slow, timeout=0.03)
+    streams.add("fast", fast)
+    received = [item async for item in streams]
+
+    assert received[:2] in (
+        [("slow", "s0"), ("fast", "f0")],
+        [("fast", "f0"), ("slow", "s0")],
+    )
+    assert received[2][0] == "slow" and isinstance(received[2][1], Timeout)
+    assert received[3] == ("fast", "f1")
+    assert slow.closed
+
+    streams = AsyncStreamMultiplexer()
+    streams.add("slow", _FakeStream("s", [1]), timeout=0.01)
+    other = _FakeStream("o", [1])
+    streams.add("other", other)
+    with pytest.raises(Timeout):
+        async for _ in streams:
+            pass
+    assert other.closed
+
+
+@pytest.mark.asyncio
+async def test_async_chat_stream_closes_response(mocker):
+    closed = False
+
+    async def lines():
+        nonlocal closed
+        try:
+            for content in ["a", "b", "c"]:
+                yield TogetherResponse(
+                    data={"choices": [{"index": 0, "delta": {"content": content}}]},
+                    headers={},
+                )
+        finally:
+            closed = True
+
+    requestor = Mock()
+    requestor.arequest = AsyncMock(return_value=(lines(), True, "key"))
+    mocker.patch("together.abstract.api_requestor.APIRequestor", return_value=requestor)
+    client = AsyncTogether(api_key="fake")
+
+    stream = await client.chat.completions.create(
+        model="model", messages=[{"role": "user", "content": "hi"}], stream=True
+    )
+    chunk = await stream.__anext__()
+    await stream.aclose()
+
+    assert chunk.choices[0].delta.content == "a"
+    assert closed
+
+
+class _Source:
+    def __init__(self, n, error=None):
+        self.n = n
+        self.error = error
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        try:
+            for i in range(self.n):
+                yield i
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.closed.set()
+
+
+def test_prefetching_stream_reads_ahead():
+    source = _Source(10)
+    stalls = []
+
+    with PrefetchingStream(source, max_buffered=3, on_stall=stalls.append) as stream:
+        time.sleep(0.05)
+        assert stream.stats.buffered == 3
+        assert list(stream) == list(range(10))
+
+    assert source.closed.wait(1)
+    assert stream.stats.max_buffered == 3
+    assert stream.stats.stalls >= 1
+    assert stalls and stalls[0] is stream.stats
+
+
+def test_prefetching_stream_raises_errors_after_chunks():
+    stream = PrefetchingStream(_Source(2, error=ValueError("broken")))
+
+    assert next(stream) == 0
+    assert next(stream) == 1
+    with pytest.raises(ValueError, match="broken"):
+        next(stream)
+    assert list(stream) == []
+
+
+def test_prefetching_stream_raises_on_stall_errors():
+    def on_stall(stats):
+        raise RuntimeError("callback failed")
+
+    source = _Source(10)
+    stream = PrefetchingStream(source, max_buffered=2, on_stall=on_stall)
+
+    assert next(stream) == 0
+    assert next(stream) == 1
+    with pytest.raises(RuntimeError, match="callback failed"):
+        next(stream)
+    assert list(stream) == []
+    assert source.closed.wait(1)
+
+
+def test_prefetching_stream_stops_when_abandoned():
+    closed_source = _Source(1000)
+    stream = PrefetchingStream(closed_source, max_buffered=2)
+    next(stream)
+    stream.close(timeout=1)
+    assert closed_source.closed.is_set()
+    assert list(stream) == []
+
+    abandoned_source = _Source(1000)
+    stream = PrefetchingStream(abandoned_source, max_buffered=2)
+    next(stream)
+    del stream
+    gc.collect()
+    assert abandoned_source.closed.wait(1)
+
+
+def test_chat_stream_closes_response(mocker):
+    closed = threading.Event()
+
+    def lines():
+        try:
+            for content in ["a", "b", "c"]:
+                yield TogetherResponse(
+                    data={"choices": [{"index": 0, "delta": {"content": content}}]},
+                    headers={},
+                )
+        finally:
+            closed.set()
+
+    requestor = Mock()
+    requestor.request = Mock(return_value=(lines(), True, "key"))
+    mocker.patch("together.abstract.api_requestor.APIRequestor", return_value=requestor)
+    client = Together(api_key="fake")
+
+    stream = client.chat.completions.create(
+        model="model", messages=[{"role": "user", "content": "hi"}], stream=True
+    )
+    with PrefetchingStream(stream, max_buffered=1) as chunks:
+        assert next(chunks).choices[0].delta.content == "a"
+
+    assert closed.wait(1)
@@ -0,0 +1,51 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from together.abstract.api_requestor import APIRequestor
+from together.error import APIError
+from together.together_response import TogetherResponse
+from together.types import ChatCompletionChunk, EmbeddingResponse, TogetherClient
+
+
+CHUNK = {
+    "id": "req-1",
+    "object": "chat.completion.chunk",
+    "choices": [{"index": 0, "delta": {"content": "Hi", "role": "assistant"}}],
+    "extra_field": {"kept": True},
+}
+
+
+def test_successful_json_body_is_decoded_lazily():
+    requestor = APIRequestor(client=TogetherClient(api_key="fake_api_key"))
+
+    response = requestor._interpret_response_line(
+        json.dumps(CHUNK), 200, {"Content-Type": "application/json"}, stream=True
+    )
+
+    assert response.text == json.dumps(CHUNK)
+    assert response.data == CHUNK
+
+
+def test_parse_matches_validation():
+    response = TogetherResponse.from_json(json.dumps(CHUNK), {})
+
+    parsed = response.parse(ChatCompletionChunk)
+
+    assert parsed == ChatCompletionChunk(**CHUNK)
+    assert parsed.extra_field == {"kept": True}
+
+
+def test_parse_raises_validation_errors():
+    response = TogetherResponse.from_json(json.dumps({"data": "not a list"}), {})
+
+    with pytest.raises(ValidationError):
+        response.parse(EmbeddingResponse)
+
+
+def test_invalid_json_raises_api_error():
+    response = TogetherResponse.from_json("{not json", {})
+
+    with pytest.raises(APIError, match="Invalid JSON"):
+        response.parse(ChatCompletionChunk)
@@ -0,0 +1,114 @@
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from together.types import FilePurpose
+from together.utils.files import check_file
+from together.utils.validation_cache import (
+    ValidationCache,
+    default_cache_path,
+    get_file_identity,
+)
+
+
+@pytest.fixture
+def dataset(tmp_path: Path) -> Path:
+    file = tmp_path / "data.jsonl"
+    file.write_text("\n".join(json.dumps({"text": f"sample {i}"}) for i in range(10)))
+    return file
+
+
+def test_default_cache_path_uses_env(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("TOGETHER_CACHE_DIR", str(tmp_path))
+    assert default_cache_path() == tmp_path / "validation.sqlite3"
+
+
+def test_repeat_check_uses_cached_report(dataset: Path):
+    report = check_file(dataset)
+
+    with patch("together.utils.files._check_jsonl") as mock_check_jsonl:
+        cached_report = check_file(dataset)
+
+    mock_check_jsonl.assert_not_called()
+    assert cached_report == report
+    assert cached_report["num_samples"] == 10
+
+
+def test_modified_file_invalidates_cache(dataset: Path):
+    check_file(dataset)
+
+    with dataset.open("a") as f:
+        f.write("\n" + json.dumps({"text": "one more"}))
+
+    report = check_file(dataset)
+
+    assert report["num_samples"] == 11
+
+
+def test_same_size_change_invalidates_cache(dataset: Path):
+    check_file(dataset)
+    stat = os.stat(dataset)
+
+    # Same size and mtime, different content: only the fingerprint differs
+    dataset.write_text(dataset.read_text().replace("sample 0", "sample X"))
+    os.utime(dataset, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    with patch(
+        "together.utils.files._check_jsonl", return_value={"num_samples": 0}
+    ) as mock_check_jsonl:
+        check_file(dataset)
+
+    mock_check_jsonl.assert_called_once()
+
+
+def test_cache_is_keyed_on_purpose(dataset: Path):
+    check_file(dataset, purpose=FilePurpose.FineTune)
+
+    with patch(
+        "together.utils.files._check_jsonl", return_value={}
+    ) as mock_check_jsonl:
+        check_file(dataset, purpose=FilePurpose.Eval)
+
+    mock_check_jsonl.assert_called_once()
+
+
+def test_validator_version_change_invalidates_cache(dataset: Path):
+    cache = ValidationCache()
+    identity = get_file_identity(dataset)
+    cache.set(identity, "fine-tune", {"is_check_passed": True})
+
+    assert cache.get(identity, "fine-tune") == {"is_check_passed": True}
+
+    cache.validator_version = "other"
+    assert cache.get(identity, "fine-tune") is None
+
+
+def test_unusable_cache_falls_back_to_validation(dataset: Path, tmp_path: Path):
+    cache = ValidationCache(tmp_path / "not-a-dir" / "validation.sqlite3")
+    (tmp_path / "not-a-dir").write_text("")
+
+    identity = get_file_identity(dataset)
+    cache.set(identity, "fine-tune", {"is_check_passed": True})
+
+    assert cache.get(identity, "fine-tune") is None
+
+
+@pytest.mark.parametrize("report", ["{not json", "[1, 2]", b"\xff"])
+def test_corrupt_report_is_dropped(dataset: Path, report):
+    cache = ValidationCache()
+    identity = get_file_identity(dataset)
+    cache.set(identity, "fine-tune", {"is_check_passed": True})
+
+    conn = cache._connect()
+    with conn:
+        conn.execute("UPDATE reports SET report = ?", (report,))
+    conn.close()
+
+    assert cache.get(identity, "fine-tune") is None
+    conn = cache._connect()
+    assert conn.execute("SELECT COUNT(*) FROM reports").fetchone() == (0,)
+    conn.close()
+    assert check_file(dataset)["num_samples"] == 10
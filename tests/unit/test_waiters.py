@@ -0,0 +1,203 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from together import AsyncTogether, Together
+from together.error import (
+    InvalidRequestError,
+    JobStateError,
+    RateLimitError,
+    WaitTimeoutError,
+)
+from together.resources import AsyncEndpoints
+from together.types.batch import BatchJobStatus
+from together.utils.waiters import (
+    BATCH_JOB,
+    VIDEO_JOB,
+    AsyncWaiter,
+    PollingPolicy,
+    Waiter,
+)
+
+
+FAST = PollingPolicy(initial_interval=0.01, max_interval=0.05, jitter=0)
+
+
+class FakeJobs:
+    """Jobs going through a list of statuses, one per poll."""
+
+    def __init__(self, statuses, attribute="status"):
+        self.statuses = statuses
+        self.attribute = attribute
+        self.polls = {}
+        self.errors = {}
+        self.lock = threading.Lock()
+
+    def _next(self, job_id):
+        with self.lock:
+            if self.errors.get(job_id):
+                raise self.errors[job_id].pop(0)
+            poll = self.polls.get(job_id, 0)
+            self.polls[job_id] = poll + 1
+        status = self.statuses[min(poll, len(self.statuses) - 1)]
+        return SimpleNamespace(id=job_id, **{self.attribute: status})
+
+    def retrieve(self, job_id):
+        return self._next(job_id)
+
+    async def aretrieve(self, job_id):
+        return self._next(job_id)
+
+
+def test_polling_policy_backs_off():
+    policy = PollingPolicy(
+        initial_interval=1, max_interval=5, backoff=2, fast_polls=2, jitter=0
+    )
+
+    assert [policy.interval(attempt) for attempt in range(7)] == [1, 1, 1, 2, 4, 5, 5]
+
+
+def test_waiter_multiplexes_many_jobs():
+    jobs = FakeJobs(
+        [
+            BatchJobStatus.VALIDATING,
+            BatchJobStatus.IN_PROGRESS,
+            BatchJobStatus.COMPLETED,
+        ]
+    )
+    waiter = Waiter(max_concurrency=4)
+    for i in range(200):
+        waiter.add(f"batch-{i}", jobs.retrieve, BATCH_JOB, policy=FAST)
+    threads = threading.active_count()
+
+    results = waiter.wait(timeout=10)
+
+    assert len(results) == 200
+    assert all(job.status == BatchJobStatus.COMPLETED for job in results.values())
+    assert all(polls == 3 for polls in jobs.polls.values())
+    assert threading.active_count() <= threads + 4
+
+
+def test_waiter_stops_at_requested_or_final_state():
+    jobs = FakeJobs(["VALIDATING", "IN_PROGRESS", "FAILED"])
+    waiter = Waiter()
+    waiter.add("running", jobs.retrieve, BATCH_JOB, until="IN_PROGRESS", policy=FAST)
+    waiter.add("done", jobs.retrieve, BATCH_JOB, policy=FAST)
+
+    results = waiter.wait(timeout=5)
+
+    assert results["running"].status == "IN_PROGRESS"
+    assert results["done"].status == "FAILED"
+
+
+def test_waiter_retries_rate_limits_after_retry_after():
+    jobs = FakeJobs(["COMPLETED"])
+    jobs.errors["job"] = [
+        RateLimitError("slow down", headers={"retry-after-ms": "200"})
+    ]
+    waiter = Waiter()
+    waiter.add("job", jobs.retrieve, BATCH_JOB, policy=FAST)
+
+    start = time.monotonic()
+    waiter.wait(timeout=5)
+
+    assert time.monotonic() - start >= 0.2
+    assert jobs.polls["job"] == 1
+
+
+def test_waiter_raises_other_errors():
+    jobs = FakeJobs(["COMPLETED"])
+    jobs.errors["job"] = [InvalidRequestError("not found")]
+    waiter = Waiter()
+    waiter.add("job", jobs.retrieve, BATCH_JOB, policy=FAST)
+
+    with pytest.raises(InvalidRequestError):
+        waiter.wait(timeout=5)
+
+
+def test_waiter_timeout():
+    jobs = FakeJobs(["IN_PROGRESS"])
+    waiter = Waiter()
+    waiter.add("job", jobs.retrieve, BATCH_JOB, policy=FAST)
+
+    with pytest.raises(WaitTimeoutError, match="job"):
+        waiter.wait(timeout=0.1)
+
+
+def test_endpoint_wait_until(monkeypatch):
+    jobs = FakeJobs(["STOPPED", "PENDING", "STARTING", "STARTED"], attribute="state")
+    endpoints = Together(api_key="fake").endpoints
+    monkeypatch.setattr(endpoints, "get", jobs.retrieve)
+
+    endpoint = endpoints.wait_until("endpoint-1", "STARTED", policy=FAST)
+
+    assert endpoint.state == "STARTED"
+    assert jobs.polls["endpoint-1"] == 4
+
+
+def test_endpoint_wait_after_start(monkeypatch):
+    jobs = FakeJobs(["STOPPED", "STARTING", "STARTED"], attribute="state")
+    endpoints = Together(api_key="fake").endpoints
+    monkeypatch.setattr(endpoints, "get", jobs.retrieve)
+
+    endpoint = endpoints.wait("endpoint-1", policy=FAST)
+
+    assert endpoint.state == "STARTED"
+    assert jobs.polls["endpoint-1"] == 3
+
+
+def test_endpoint_wait_stops_at_failure(monkeypatch):
+    jobs = FakeJobs(["STOPPED", "FAILED"], attribute="state")
+    endpoints = Together(api_key="fake").endpoints
+    monkeypatch.setattr(endpoints, "get", jobs.retrieve)
+
+    assert endpoints.wait("endpoint-1", policy=FAST).state == "FAILED"
+
+
+@pytest.mark.asyncio
+async def test_async_endpoint_wait_after_stop(monkeypatch):
+    jobs = FakeJobs(["STARTED", "STOPPING", "STOPPED"], attribute="state")
+    endpoints = AsyncEndpoints(AsyncTogether(api_key="fake").client)
+    monkeypatch.setattr(endpoints, "get", jobs.aretrieve)
+
+    endpoint = await endpoints.wait("endpoint-1", policy=FAST)
+
+    assert endpoint.state == "STOPPED"
+    assert jobs.polls["endpoint-1"] == 3
+
+
+def test_wait_until_raises_on_other_final_state(monkeypatch):
+    jobs = FakeJobs(["running", "user_error"])
+    fine_tuning = Together(api_key="fake").fine_tuning
+    monkeypatch.setattr(fine_tuning, "retrieve", jobs.retrieve)
+
+    with pytest.raises(JobStateError, match="user_error"):
+        fine_tuning.wait_until("ft-1", "completed", policy=FAST)
+    assert fine_tuning.wait("ft-1", policy=FAST).status == "user_error"
+
+
+@pytest.mark.asyncio
+async def test_async_waiter():
+    jobs = FakeJobs(["queued", "in_progress", "completed"])
+    waiter = AsyncWaiter(max_concurrency=3)
+    for i in range(20):
+        waiter.add(f"video-{i}", jobs.aretrieve, VIDEO_JOB, policy=FAST)
+
+    done = [job_id async for job_id, _ in waiter.as_completed(timeout=5)]
+
+    assert sorted(done) == sorted(f"video-{i}" for i in range(20))
+
+
+@pytest.mark.asyncio
+async def test_async_resource_wait(monkeypatch):
+    jobs = FakeJobs(["queued", "in_progress", "cancelled"])
+    videos = AsyncTogether(api_key="fake").videos
+    monkeypatch.setattr(videos, "retrieve", jobs.aretrieve)
+
+    job = await videos.wait("video-1", policy=FAST)
+
+    assert job.status == "cancelled"
+    with pytest.raises(JobStateError):
+        await videos.wait_until("video-2", ["completed"], policy=FAST)